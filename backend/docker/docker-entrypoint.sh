@@ -172,6 +172,8 @@ gunicorn-wsgi       : Same as gunicorn but runs a wsgi server which does not sup
 celery-worker       : Start the celery worker queue which runs important async tasks
 celery-exportworker : Start the celery worker queue which runs slower async tasks
 celery-beat         : Start the celery beat service used to schedule periodic jobs
+webhook-delivery-worker : Start the async worker that delivers webhook calls, only
+                          used if BASEROW_WEBHOOKS_DELIVERY_WORKER_ENABLED is set
 
 HEALTHCHECK COMMANDS (exit with non zero when unhealthy, zero when healthy)
 backend-healthcheck             : Checks the gunicorn/django-dev service health
@@ -392,6 +394,10 @@ case "$1" in
       echo "Running celery export worker healthcheck..."
       exec celery -A baserow inspect ping -d "export-worker@$HOSTNAME" -t 10 "${@:2}"
     ;;
+    webhook-delivery-worker)
+      export OTEL_SERVICE_NAME="webhook-delivery-worker"
+      exec python3 /baserow/backend/src/baserow/manage.py run_webhook_delivery_worker "${@:2}"
+    ;;
     celery-beat)
       # Delay the beat startup as there seems to be bug where the other celery workers
       # starting up interfere with or break the lock obtained by it. Without this the
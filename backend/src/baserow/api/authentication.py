@@ -7,6 +7,7 @@ from rest_framework_simplejwt.exceptions import InvalidToken
 from rest_framework_simplejwt.settings import api_settings as jwt_settings
 
 from baserow.api.user.errors import ERROR_INVALID_ACCESS_TOKEN
+from baserow.config.db_routers import set_db_state_user
 from baserow.core.sentry import setup_user_in_sentry
 from baserow.core.telemetry.utils import setup_user_in_baggage_and_spans
 from baserow.core.user.exceptions import DeactivatedUserException
@@ -65,6 +66,7 @@ class JSONWebTokenAuthentication(JWTAuthentication):
             )
 
         set_user_session_data_from_request(user, request)
+        set_db_state_user(user.id)
         with setup_user_in_baggage_and_spans(user, request):
             setup_user_in_sentry(user)
             return user, token
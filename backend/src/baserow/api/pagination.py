@@ -1,6 +1,8 @@
-from typing import Protocol
+from typing import Callable, Optional, Protocol
 
 from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
 
 from rest_framework.exceptions import APIException
 from rest_framework.pagination import (
@@ -37,6 +39,38 @@ class Paginator(DjangoPaginator):
     total number of results is slow.
     """
 
+    def __init__(
+        self,
+        *args,
+        count_function: Optional[Callable[[QuerySet], int]] = None,
+        **kwargs,
+    ):
+        """
+        :param count_function: Optionally a function that returns the total number of
+            results of the object list. Can be used to replace the default count query
+            by a cheaper one.
+        """
+
+        super().__init__(*args, **kwargs)
+        self.count_function = count_function
+
+    @cached_property
+    def count(self):
+        if self.count_function is not None:
+            return self.count_function(self.object_list)
+        return super().count
+
+    def page(self, number):
+        if self.count_function is None:
+            return super().page(number)
+
+        # The count function might return an estimated or capped count, so it can't
+        # be used to limit the number of results of the page.
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        return self._get_page(self.object_list[bottom:top], number, self)
+
     def validate_number(self, number):
         """
         Validates the 1-based page number, without raising exceptions. Returns 1 (the
@@ -59,12 +93,15 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
     # web-frontend/modules/core/components/helpers/InfiniteScroll.vue
     page_size = 100
     page_size_query_param = "size"
-    django_paginator_class = Paginator
 
-    def __init__(self, limit_page_size=None, *args, **kwargs):
+    def __init__(self, limit_page_size=None, count_function=None, *args, **kwargs):
         self.limit_page_size = limit_page_size
+        self.count_function = count_function
         super().__init__(*args, **kwargs)
 
+    def django_paginator_class(self, *args, **kwargs):
+        return Paginator(*args, count_function=self.count_function, **kwargs)
+
     def get_page_size(self, request):
         page_size = super().get_page_size(request)
 
@@ -120,6 +157,15 @@ class PageNumberPaginationWithoutCount(PageNumberPagination):
 class LimitOffsetPagination(RestFrameworkLimitOffsetPagination):
     default_limit = 100
 
+    def __init__(self, count_function=None, *args, **kwargs):
+        self.count_function = count_function
+        super().__init__(*args, **kwargs)
+
+    def get_count(self, queryset):
+        if self.count_function is not None:
+            return self.count_function(queryset)
+        return super().get_count(queryset)
+
     def paginate_queryset(self, queryset, request, view=None):
         return super().paginate_queryset(queryset, request, view)
 
@@ -1,11 +1,40 @@
 import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
 
 from asgiref.local import Local
+from loguru import logger
 
 DATABASE_READ_REPLICAS = settings.DATABASE_READ_REPLICAS
 DEFAULT_DB_ALIAS = "default"
+USER_MIN_LSN_CACHE_KEY_PREFIX = "db_router_min_lsn_user"
+
+# Returns whether the node is a replica, the LSN up to which the replica has replayed
+# the primary WAL as an integer, and the replay lag in seconds. If the replica has
+# replayed everything it received, then it's not lagging even though the last replayed
+# transaction can be old because nothing has been written to the primary.
+REPLICA_STATE_SQL = """
+    SELECT
+        pg_is_in_recovery(),
+        CASE WHEN pg_is_in_recovery()
+            THEN pg_last_wal_replay_lsn()
+            ELSE pg_current_wal_lsn()
+        END - '0/0'::pg_lsn,
+        CASE WHEN NOT pg_is_in_recovery()
+            OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            THEN 0
+            ELSE COALESCE(
+                EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+            )
+        END
+"""
+PRIMARY_LSN_SQL = "SELECT pg_current_wal_lsn() - '0/0'::pg_lsn"
 
 _db_state = Local()
 
@@ -18,11 +47,137 @@ def is_write_mode():
     return getattr(_db_state, "pinned", False)
 
 
+def _get_user_min_lsn_cache_key(user_id: int) -> str:
+    return f"{USER_MIN_LSN_CACHE_KEY_PREFIX}_{user_id}"
+
+
+def set_db_state_user(user_id: int):
+    """
+    Should be called when the user of the request or task is known. If the user
+    recently made changes, then the reads are only routed to replicas that have
+    already replayed those changes, so that the user can always read their own writes.
+    """
+
+    if not DATABASE_READ_REPLICAS:
+        return
+
+    _db_state.user_id = user_id
+    _db_state.min_lsn = cache.get(_get_user_min_lsn_cache_key(user_id))
+
+
+def _remember_user_writes():
+    """
+    Stores the current LSN of the primary for the user that made writes, so that
+    their next requests only read from replicas that are at least at that position.
+    """
+
+    user_id = getattr(_db_state, "user_id", None)
+    if not DATABASE_READ_REPLICAS or user_id is None or not is_write_mode():
+        return
+
+    try:
+        with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+            cursor.execute(PRIMARY_LSN_SQL)
+            lsn = int(cursor.fetchone()[0])
+    except DatabaseError:
+        logger.exception("Could not get the current LSN of the primary database.")
+        return
+
+    cache.set(
+        _get_user_min_lsn_cache_key(user_id),
+        lsn,
+        timeout=settings.DATABASE_READ_YOUR_WRITES_TTL_SECONDS,
+    )
+
+
 def clear_db_state():
     """Should be called when a request or celery finishes."""
 
-    if hasattr(_db_state, "pinned"):
-        del _db_state.pinned
+    _remember_user_writes()
+
+    for attr in ["pinned", "user_id", "min_lsn"]:
+        if hasattr(_db_state, attr):
+            delattr(_db_state, attr)
+
+
+@dataclass
+class ReplicaState:
+    checked_at: float
+    healthy: bool
+    lag: float = 0
+    replay_lsn: int = 0
+
+
+class ReplicaMonitor:
+    """
+    Keeps track of the replay lag and position of every read replica. The state of a
+    replica is refreshed at most once every
+    `DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS` per process, so checking it
+    doesn't add a query to every read.
+    """
+
+    def __init__(self):
+        self._states: Dict[str, ReplicaState] = {}
+        self._lock = threading.Lock()
+
+    def _check_replica(self, alias: str) -> ReplicaState:
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute(REPLICA_STATE_SQL)
+                _, replay_lsn, lag = cursor.fetchone()
+        except DatabaseError:
+            logger.exception(f"Could not check the state of read replica {alias}.")
+            return ReplicaState(checked_at=time.monotonic(), healthy=False)
+
+        return ReplicaState(
+            checked_at=time.monotonic(),
+            healthy=True,
+            lag=float(lag),
+            replay_lsn=int(replay_lsn or 0),
+        )
+
+    def get_state(self, alias: str) -> ReplicaState:
+        interval = settings.DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS
+        state = self._states.get(alias)
+        if state is None or time.monotonic() - state.checked_at >= interval:
+            with self._lock:
+                state = self._states.get(alias)
+                if state is None or time.monotonic() - state.checked_at >= interval:
+                    state = self._check_replica(alias)
+                    self._states[alias] = state
+        return state
+
+    def get_eligible_replicas(
+        self, replicas: List[str], min_lsn: Optional[int] = None
+    ) -> Dict[str, float]:
+        """
+        Returns the replicas that can be used to read from with their weight. A replica
+        is excluded if it's unreachable, lags more than
+        `DATABASE_READ_REPLICA_MAX_LAG_SECONDS` or hasn't replayed `min_lsn` yet. The
+        weight is lower for replicas with more lag.
+
+        :param replicas: The aliases of the replicas to choose from.
+        :param min_lsn: If provided, the replica must have replayed at least this LSN.
+        :return: A dict with the alias as key and the weight as value.
+        """
+
+        max_lag = settings.DATABASE_READ_REPLICA_MAX_LAG_SECONDS
+        eligible = {}
+        for alias in replicas:
+            state = self.get_state(alias)
+            if not state.healthy or state.lag > max_lag:
+                continue
+            if min_lsn is not None and state.replay_lsn < min_lsn:
+                continue
+            eligible[alias] = 1 / (1 + state.lag)
+        return eligible
+
+    def reset(self):
+        with self._lock:
+            self._states = {}
+
+
+replica_monitor = ReplicaMonitor()
 
 
 class ReadReplicaRouter:
@@ -32,13 +187,24 @@ class ReadReplicaRouter:
     is must be executed, then it switches to the write node, and sticks with it until
     the db state is cleared. That is currently happening when a request or celery task
     is completed.
+
+    Replicas that are unreachable or lag too much are excluded, and the others are
+    weighted by their lag. After a user made changes, their reads in the next requests
+    only use replicas that have replayed those changes, or the write node otherwise.
     """
 
     def db_for_read(self, model, **hints):
         if is_write_mode():
             return DEFAULT_DB_ALIAS
         if DATABASE_READ_REPLICAS:
-            read = random.choice(DATABASE_READ_REPLICAS)  # nosec
+            eligible = replica_monitor.get_eligible_replicas(
+                DATABASE_READ_REPLICAS, getattr(_db_state, "min_lsn", None)
+            )
+            if not eligible:
+                return DEFAULT_DB_ALIAS
+            read = random.choices(  # nosec
+                list(eligible.keys()), weights=list(eligible.values())
+            )[0]
             return read
         return DEFAULT_DB_ALIAS
 
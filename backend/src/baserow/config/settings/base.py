@@ -271,6 +271,20 @@ for key, value in os.environ.items():
 
         DATABASE_READ_REPLICAS.append(db_key)
 
+# Read replicas lagging more than this number of seconds behind the primary are not
+# used until they have caught up.
+DATABASE_READ_REPLICA_MAX_LAG_SECONDS = int(
+    os.getenv("BASEROW_DATABASE_READ_REPLICA_MAX_LAG_SECONDS") or 5
+)
+# How often every process checks the replay lag of the read replicas.
+DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS = int(
+    os.getenv("BASEROW_DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS") or 2
+)
+# After a user made changes, their reads only use the read replicas that have replayed
+# those changes for this number of seconds.
+DATABASE_READ_YOUR_WRITES_TTL_SECONDS = int(
+    os.getenv("BASEROW_DATABASE_READ_YOUR_WRITES_TTL_SECONDS") or 60
+)
 
 DATABASE_ROUTERS = ["baserow.config.db_routers.ReadReplicaRouter"]
 
@@ -303,6 +317,12 @@ BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = int(
     os.getenv("BASEROW_BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS")
     or 300
 )
+# The maximum number of independent data sources of a page that are dispatched at the
+# same time. Every concurrent dispatch uses its own database connection. Set to 1 to
+# dispatch the data sources one after the other.
+BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS = int(
+    os.getenv("BASEROW_BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS") or 4
+)
 
 
 CELERY_SINGLETON_BACKEND_CLASS = (
@@ -806,6 +826,23 @@ AUTOMATION_WORKFLOW_RATE_LIMIT_CACHE_EXPIRY_SECONDS = int(
 AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS = int(
     os.getenv("BASEROW_AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS", 5)
 )
+# The maximum number of iterator items of a workflow run dispatched at the same time.
+# 1 dispatches them one after the other.
+AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES = int(
+    os.getenv("BASEROW_AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES") or 4
+)
+# The number of days after which the workflow history is deleted. 0 keeps it forever.
+AUTOMATION_HISTORY_RETENTION_DAYS = int(
+    os.getenv("BASEROW_AUTOMATION_HISTORY_RETENTION_DAYS") or 0
+)
+AUTOMATION_HISTORY_CLEANUP_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_AUTOMATION_HISTORY_CLEANUP_INTERVAL_MINUTES") or 30
+)
+# How long the index of the tables watched by the row event triggers is cached. It's
+# invalidated when a workflow changes. 0 disables the cache.
+AUTOMATION_TRIGGER_INDEX_CACHE_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_AUTOMATION_TRIGGER_INDEX_CACHE_TIMEOUT_SECONDS") or 300
+)
 
 TRASH_PAGE_SIZE_LIMIT = 200  # How many trash entries can be requested at once.
 
@@ -823,6 +860,10 @@ BASEROW_INITIAL_CREATE_SYNC_TABLE_DATA_LIMIT = int(
     os.getenv("BASEROW_INITIAL_CREATE_SYNC_TABLE_DATA_LIMIT", 5000)
 )
 
+# The number of data sync rows that are compared with the synced table, and
+# created, updated, or deleted at once. Limits the memory usage of a sync.
+BASEROW_DATA_SYNC_CHUNK_SIZE = int(os.getenv("BASEROW_DATA_SYNC_CHUNK_SIZE", 1000))
+
 MEDIA_URL_PATH = "/media/"
 MEDIA_URL = os.getenv("MEDIA_URL", urljoin(PUBLIC_BACKEND_URL, MEDIA_URL_PATH))
 MEDIA_ROOT = os.getenv("MEDIA_ROOT", "/baserow/media")
@@ -970,6 +1011,22 @@ HOURS_UNTIL_TRASH_PERMANENTLY_DELETED = int(
     os.getenv("HOURS_UNTIL_TRASH_PERMANENTLY_DELETED", 24 * 3)
 )
 OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES = 5
+# The trash entries marked for permanent deletion are deleted in batches of at most
+# this number of entries per transaction.
+BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE = int(
+    os.getenv("BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE") or 500
+)
+# The estimated number of tables that can be dropped or locked in a single permanent
+# deletion transaction. Must stay well below the PostgreSQL
+# `max_locks_per_transaction` setting.
+BASEROW_TRASH_PERMANENT_DELETION_MAX_LOCKS_PER_BATCH = int(
+    os.getenv("BASEROW_TRASH_PERMANENT_DELETION_MAX_LOCKS_PER_BATCH") or 32
+)
+# If set, the permanent deletion sleeps between the batches to not delete more than
+# this number of trashed rows per second on average.
+BASEROW_TRASH_PERMANENT_DELETION_MAX_ROWS_PER_SECOND = int(
+    os.getenv("BASEROW_TRASH_PERMANENT_DELETION_MAX_ROWS_PER_SECOND") or 0
+)
 
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
@@ -1035,6 +1092,23 @@ BASEROW_MAX_WEBHOOK_CALLS_IN_QUEUE_PER_WEBHOOK = (
     int(os.getenv("BASEROW_MAX_WEBHOOK_CALLS_IN_QUEUE_PER_WEBHOOK", "0")) or None
 )
 BASEROW_WEBHOOKS_BATCH_LIMIT = int(os.getenv("BASEROW_WEBHOOKS_BATCH_LIMIT", 5))
+# If enabled, the webhook calls are delivered by the `run_webhook_delivery_worker`
+# management command instead of a Celery task per call.
+BASEROW_WEBHOOKS_DELIVERY_WORKER_ENABLED = str_to_bool(
+    os.getenv("BASEROW_WEBHOOKS_DELIVERY_WORKER_ENABLED", "false")
+)
+BASEROW_WEBHOOKS_DELIVERY_WORKER_CONCURRENCY = int(
+    os.getenv("BASEROW_WEBHOOKS_DELIVERY_WORKER_CONCURRENCY") or 100
+)
+BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK") or 1
+)
+BASEROW_WEBHOOKS_DELIVERY_PRESERVE_ORDER = str_to_bool(
+    os.getenv("BASEROW_WEBHOOKS_DELIVERY_PRESERVE_ORDER", "false")
+)
+BASEROW_WEBHOOKS_MAX_CONNECTIONS_PER_HOST = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_CONNECTIONS_PER_HOST") or 10
+)
 BASEROW_WEBHOOK_ROWS_ENTER_VIEW_BATCH_SIZE = int(
     os.getenv("BASEROW_WEBHOOK_ROWS_ENTER_VIEW_BATCH_SIZE", BATCH_ROWS_SIZE_LIMIT)
 )
@@ -1091,6 +1165,32 @@ BASEROW_ROW_HISTORY_CLEANUP_INTERVAL_MINUTES = int(
 BASEROW_ROW_HISTORY_RETENTION_DAYS = int(
     os.getenv("BASEROW_ROW_HISTORY_RETENTION_DAYS", 180)
 )
+# Comma separated list of write-behind buffers to enable, e.g. `row_history,audit_log`.
+# The entries of an enabled buffer are not inserted in the request transaction, but
+# appended to a Redis stream and bulk inserted by a periodic celery task.
+BASEROW_WRITE_BEHIND_BUFFERS = [
+    buffer.strip()
+    for buffer in os.getenv("BASEROW_WRITE_BEHIND_BUFFERS", "").split(",")
+    if buffer.strip()
+]
+BASEROW_WRITE_BEHIND_FLUSH_INTERVAL_SECONDS = int(
+    os.getenv("BASEROW_WRITE_BEHIND_FLUSH_INTERVAL_SECONDS") or 5
+)
+BASEROW_WRITE_BEHIND_FLUSH_BATCH_SIZE = int(
+    os.getenv("BASEROW_WRITE_BEHIND_FLUSH_BATCH_SIZE") or 500
+)
+BASEROW_WRITE_BEHIND_MAX_LAG_SECONDS = int(
+    os.getenv("BASEROW_WRITE_BEHIND_MAX_LAG_SECONDS") or 60
+)
+# The row history, audit log and automation history tables are partitioned by month.
+# Partitions are created this many months ahead, so that rows never end up in the
+# default partition.
+BASEROW_PARTITIONS_CREATE_MONTHS_AHEAD = int(
+    os.getenv("BASEROW_PARTITIONS_CREATE_MONTHS_AHEAD") or 3
+)
+BASEROW_PARTITIONS_CREATE_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_PARTITIONS_CREATE_INTERVAL_MINUTES") or 60 * 6
+)
 BASEROW_MAX_ROW_REPORT_ERROR_COUNT = int(
     os.getenv("BASEROW_MAX_ROW_REPORT_ERROR_COUNT", 30)
 )
@@ -1209,6 +1309,18 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of fully generated table models every process keeps in memory.
+BASEROW_TABLE_MODEL_LRU_CACHE_SIZE = int(
+    os.getenv("BASEROW_TABLE_MODEL_LRU_CACHE_SIZE") or 128
+)
+# The number of times a cached view footer aggregation like a count or a sum is
+# updated incrementally after row changes before it's computed again from all rows.
+BASEROW_VIEW_AGGREGATION_MAX_INCREMENTAL_UPDATES = int(
+    os.getenv("BASEROW_VIEW_AGGREGATION_MAX_INCREMENTAL_UPDATES") or 1000
+)
+# The number of rows counted at most when listing the rows of a view with the
+# `capped` count mode. If there are more rows, this number is returned instead.
+BASEROW_ROW_COUNT_CAP = int(os.getenv("BASEROW_ROW_COUNT_CAP") or 10000)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
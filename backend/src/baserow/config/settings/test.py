@@ -89,8 +89,19 @@ REST_FRAMEWORK["DEFAULT_THROTTLE_CLASSES"] = []
 
 BUILDER_PUBLICLY_USED_PROPERTIES_CACHE_TTL_SECONDS = 10
 BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = 300
+# Data sources and workflow branches dispatched in other threads use another
+# database connection, which can't see the data created in the transaction of a test.
+BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS = 1
+AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES = 1
 
 AUTO_INDEX_VIEW_ENABLED = False
+# The role permission snapshots are only invalidated by signals, which the fixtures
+# creating role assignments directly don't send.
+BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS = 0
+# Same for the index of the tables watched by the row event triggers, which isn't
+# invalidated by the fixtures creating workflows directly.
+AUTOMATION_TRIGGER_INDEX_CACHE_TIMEOUT_SECONDS = 0
+
 # For ease of testing tests assume this setting is set to this. Set it explicitly to
 # prevent any dev env config from breaking the tests.
 BASEROW_PERSONAL_VIEW_LOWEST_ROLE_ALLOWED = "VIEWER"
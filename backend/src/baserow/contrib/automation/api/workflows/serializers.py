@@ -90,4 +90,5 @@ class AutomationWorkflowHistorySerializer(serializers.ModelSerializer):
             "is_test_run",
             "message",
             "status",
+            "node_timings",
         )
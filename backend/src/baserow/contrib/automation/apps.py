@@ -195,15 +195,18 @@ class AutomationConfig(AppConfig):
 
         # The signals must always be imported last because they use
         # the registries which need to be filled first.
+        import baserow.contrib.automation.history.tasks  # noqa: F401
         import baserow.contrib.automation.nodes.ws.signals  # noqa: F403, F401
         import baserow.contrib.automation.workflows.signals  # noqa: F403, F401
         import baserow.contrib.automation.workflows.ws.signals  # noqa: F403, F401
         import baserow.contrib.integrations.tasks  # noqa: F403, F401
         from baserow.contrib.automation.nodes.receivers import (
             connect_to_node_pre_delete_signal,
+            connect_to_trigger_index_signals,
         )
 
         connect_to_node_pre_delete_signal()
+        connect_to_trigger_index_signals()
 
         from baserow.contrib.automation.search_types import AutomationSearchType
         from baserow.core.search.registries import workspace_search_registry
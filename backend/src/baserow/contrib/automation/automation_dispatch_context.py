@@ -1,5 +1,8 @@
+import threading
 from typing import Any, Dict, List, Optional, Union
 
+from django.conf import settings
+
 from baserow.contrib.automation.data_providers.registries import (
     automation_data_provider_type_registry,
 )
@@ -37,6 +40,13 @@ class AutomationDispatchContext(DispatchContext):
         self.dispatch_history: List[int] = []
         self.simulate_until_node = simulate_until_node
         self.current_iterations: Dict[int, int] = {}
+        # The timing of every dispatched node, shared by all the clones.
+        self.node_timings: List[Dict[str, Any]] = []
+        # The number of branches that can still be dispatched in other threads, shared
+        # by all the clones so that the limit applies to the whole workflow run.
+        self.branch_slots = threading.BoundedSemaphore(
+            max(settings.AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES - 1, 0)
+        )
 
         services = (
             [self.simulate_until_node.service.specific]
@@ -62,6 +72,8 @@ class AutomationDispatchContext(DispatchContext):
         new_context.previous_nodes_results = {**self.previous_nodes_results}
         new_context.current_iterations = {**self.current_iterations}
         new_context.dispatch_history = list(self.dispatch_history)
+        new_context.node_timings = self.node_timings
+        new_context.branch_slots = self.branch_slots
 
         return new_context
 
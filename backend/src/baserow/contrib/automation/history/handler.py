@@ -6,6 +6,7 @@ from django.db.models import QuerySet
 from baserow.contrib.automation.history.constants import HistoryStatusChoices
 from baserow.contrib.automation.history.models import AutomationWorkflowHistory
 from baserow.contrib.automation.workflows.models import AutomationWorkflow
+from baserow.core.partitioning.utils import drop_partitions_older_than
 
 
 class AutomationHistoryHandler:
@@ -35,3 +36,15 @@ class AutomationHistoryHandler:
             is_test_run=is_test_run,
             status=HistoryStatusChoices.STARTED,
         )
+
+    def delete_entries_older_than(self, cutoff: datetime):
+        """
+        Deletes all the workflow history entries that started before the cutoff. The
+        monthly partitions that are entirely older than the cutoff are dropped
+        instead of deleting their entries.
+
+        :param cutoff: The date and time before which all entries will be deleted.
+        """
+
+        drop_partitions_older_than(AutomationWorkflowHistory._meta.db_table, cutoff)
+        AutomationWorkflowHistory.objects.filter(started_on__lt=cutoff).delete()
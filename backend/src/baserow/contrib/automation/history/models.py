@@ -27,3 +27,8 @@ class AutomationWorkflowHistory(AutomationHistory):
         on_delete=models.CASCADE,
         related_name="workflow_history",
     )
+    node_timings = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="The start time and duration of every node dispatched by the run.",
+    )
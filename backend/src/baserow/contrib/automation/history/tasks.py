@@ -0,0 +1,30 @@
+from datetime import datetime, time, timedelta, timezone
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def clean_up_automation_history_entries(self):
+    """
+    Deletes the workflow history entries that are older than the retention period.
+    """
+
+    from .handler import AutomationHistoryHandler
+
+    older_than_days = timedelta(days=settings.AUTOMATION_HISTORY_RETENTION_DAYS)
+    cutoff_datetime = datetime.combine(
+        datetime.now(tz=timezone.utc) - older_than_days, time.min
+    )
+    AutomationHistoryHandler().delete_entries_older_than(cutoff_datetime)
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_automation_history_tasks(sender, **kwargs):
+    if not settings.AUTOMATION_HISTORY_RETENTION_DAYS:
+        return
+
+    every = timedelta(minutes=settings.AUTOMATION_HISTORY_CLEANUP_INTERVAL_MINUTES)
+    sender.add_periodic_task(every, clean_up_automation_history_entries.s())
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.db import migrations
+
+from baserow.core.partitioning.utils import convert_to_monthly_partitioned_table
+
+
+def forward(apps, schema_editor):
+    AutomationWorkflowHistory = apps.get_model(
+        "automation", "AutomationWorkflowHistory"
+    )
+
+    convert_to_monthly_partitioned_table(
+        AutomationWorkflowHistory._meta.db_table,
+        "started_on",
+        settings.BASEROW_PARTITIONS_CREATE_MONTHS_AHEAD,
+        connection=schema_editor.connection,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("automation", "0023_slack_write_message_node"),
+    ]
+
+    operations = [
+        # The partitioned table is compatible with the model, so it's not converted
+        # back when reversing.
+        migrations.RunPython(forward, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.14 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("automation", "0024_partition_automationworkflowhistory_by_month"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="automationworkflowhistory",
+            name="node_timings",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text="The start time and duration of every node dispatched by "
+                "the run.",
+            ),
+        ),
+    ]
@@ -1,8 +1,14 @@
-from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+import contextvars
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import connections
 from django.db.models import QuerySet
+from django.utils import timezone
 
 from opentelemetry import trace
 
@@ -376,7 +382,7 @@ class AutomationNodeHandler(metaclass=baserow_trace_methods(tracer)):
 
         node_type: Type[AutomationNodeActionNodeType] = node.get_type()
         try:
-            dispatch_result = node_type.dispatch(node, dispatch_context)
+            dispatch_result = self._dispatch_timed(node_type, node, dispatch_context)
             dispatch_context.after_dispatch(node, dispatch_result)
 
             # Return early if this is a simulated dispatch
@@ -392,15 +398,20 @@ class AutomationNodeHandler(metaclass=baserow_trace_methods(tracer)):
                 else:
                     iterations = range(len(node_data))
 
+                branches = []
                 for index in iterations:
                     sub_dispatch_context = dispatch_context.clone()
                     sub_dispatch_context.set_current_iteration(node, index)
-
-                    # dispatch context build
-                    for child in children:
-                        self.dispatch_node(
-                            child, sub_dispatch_context, allowed_nodes=allowed_nodes
-                        )
+                    branches.append((children, sub_dispatch_context))
+
+                self._dispatch_branches(
+                    branches,
+                    dispatch_context,
+                    allowed_nodes=allowed_nodes,
+                    concurrently=self._can_dispatch_concurrently(
+                        children, dispatch_context
+                    ),
+                )
 
             next_nodes = node.get_next_nodes(dispatch_result.output_uid)
 
@@ -412,3 +423,134 @@ class AutomationNodeHandler(metaclass=baserow_trace_methods(tracer)):
             raise AutomationNodeMisconfiguredService(
                 f"The node {node.id} is misconfigured and cannot be dispatched. {str(e)}"
             ) from e
+
+    def _dispatch_timed(
+        self,
+        node_type: AutomationNodeActionNodeType,
+        node: AutomationNode,
+        dispatch_context: AutomationDispatchContext,
+    ):
+        """
+        Dispatches the node and records how long it took in the dispatch context,
+        even if the dispatch failed.
+        """
+
+        started_on = timezone.now()
+        start = time.perf_counter()
+        try:
+            return node_type.dispatch(node, dispatch_context)
+        finally:
+            dispatch_context.node_timings.append(
+                {
+                    "node_id": node.id,
+                    "started_on": started_on.isoformat(),
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                }
+            )
+
+    def _can_dispatch_concurrently(
+        self,
+        nodes: List[AutomationNode],
+        dispatch_context: AutomationDispatchContext,
+    ) -> bool:
+        """
+        Returns whether the iterations of the given children can be dispatched in
+        other threads, which is the case if every node that follows them, or that
+        they contain, can be dispatched concurrently. Simulations are always
+        dispatched sequentially.
+
+        :param nodes: The children of the iterator node.
+        :param dispatch_context: The context the workflow is dispatched with.
+        """
+
+        if (
+            settings.AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES <= 1
+            or dispatch_context.simulate_until_node
+        ):
+            return False
+
+        graph = dispatch_context.workflow.get_graph()
+        to_check = list(nodes)
+        checked = set()
+        while to_check:
+            node = to_check.pop()
+            if node.id in checked:
+                continue
+            checked.add(node.id)
+
+            if not node.get_type().can_be_dispatched_concurrently:
+                return False
+
+            to_check.extend(graph.get_next_nodes(node))
+            to_check.extend(graph.get_children(node))
+
+        return True
+
+    def _dispatch_branches(
+        self,
+        branches: List[Tuple[List[AutomationNode], AutomationDispatchContext]],
+        dispatch_context: AutomationDispatchContext,
+        allowed_nodes=None,
+        concurrently: bool = False,
+    ):
+        """
+        Dispatches the nodes of every branch, one after the other, with the dispatch
+        context of the branch. A branch is an iteration of the children of an
+        iterator node. If the branches can be dispatched concurrently, they are shared
+        between the current thread and as many other threads as the workflow run has
+        branch slots left.
+
+        :param branches: The nodes and the dispatch context of every branch.
+        :param dispatch_context: The context the parent node was dispatched with.
+        :param allowed_nodes: if set, only the nodes from the list will be dispatched.
+        :param concurrently: Whether the branches can be dispatched at the same time.
+        :raises Exception: The first error raised by a branch, once all the started
+            branches are done. The branches that haven't started yet are skipped.
+        """
+
+        pending_branches = deque(branches)
+        errors = []
+
+        def dispatch_pending_branches():
+            while not errors:
+                try:
+                    nodes, branch_context = pending_branches.popleft()
+                except IndexError:
+                    return
+
+                try:
+                    for node in nodes:
+                        self.dispatch_node(
+                            node, branch_context, allowed_nodes=allowed_nodes
+                        )
+                except Exception as e:
+                    errors.append(e)
+
+        def dispatch_pending_branches_in_thread():
+            try:
+                dispatch_pending_branches()
+            finally:
+                dispatch_context.branch_slots.release()
+                # The thread has its own database connections which must be closed.
+                connections.close_all()
+
+        workers = 0
+        if concurrently:
+            while workers < len(branches) - 1 and dispatch_context.branch_slots.acquire(
+                blocking=False
+            ):
+                workers += 1
+
+        if workers:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in range(workers):
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        dispatch_pending_branches_in_thread,
+                    )
+                dispatch_pending_branches()
+        else:
+            dispatch_pending_branches()
+
+        if errors:
+            raise errors[0]
@@ -171,30 +171,35 @@ class CoreHttpRequestNodeType(AutomationNodeActionNodeType):
     type = "http_request"
     model_class = CoreHTTPRequestActionNode
     service_type = CoreHTTPRequestServiceType.type
+    can_be_dispatched_concurrently = True
 
 
 class CoreIteratorNodeType(ContainerNodeTypeMixin, AutomationNodeActionNodeType):
     type = "iterator"
     model_class = CoreIteratorActionNode
     service_type = CoreIteratorServiceType.type
+    can_be_dispatched_concurrently = True
 
 
 class CoreSMTPEmailNodeType(AutomationNodeActionNodeType):
     type = "smtp_email"
     model_class = CoreSMTPEmailActionNode
     service_type = CoreSMTPEmailServiceType.type
+    can_be_dispatched_concurrently = True
 
 
 class AIAgentActionNodeType(AutomationNodeActionNodeType):
     type = "ai_agent"
     model_class = AIAgentActionNode
     service_type = AIAgentServiceType.type
+    can_be_dispatched_concurrently = True
 
 
 class CoreRouterActionNodeType(AutomationNodeActionNodeType):
     type = "router"
     model_class = CoreRouterActionNode
     service_type = CoreRouterServiceType.type
+    can_be_dispatched_concurrently = True
 
     def has_node_on_edge(self, node: CoreRouterActionNode) -> bool:
         """
@@ -303,7 +308,9 @@ class AutomationNodeTriggerType(AutomationNodeType):
     is_workflow_trigger = True
 
     def after_register(self):
-        service_type_registry.get(self.service_type).start_listening(self.on_event)
+        service_type_registry.get(self.service_type).start_listening(
+            self.on_event, services_filter=self.get_services_filter()
+        )
         return super().after_register()
 
     def before_unregister(self):
@@ -338,6 +345,19 @@ class AutomationNodeTriggerType(AutomationNodeType):
     ):
         raise AutomationNodeNotMovable("Trigger nodes cannot be moved.")
 
+    def get_services_filter(self) -> Q:
+        """
+        Matches the services of the triggers that can currently start their
+        workflow: the published ones and the ones waiting for a test run or a
+        simulation. The expiration of the test runs is checked by `on_event`.
+        """
+
+        return Q(
+            Q(automation_workflow_node__workflow__state=WorkflowState.LIVE)
+            | Q(automation_workflow_node__workflow__allow_test_run_until__isnull=False)
+            | Q(automation_workflow_node__workflow__simulate_until_node__isnull=False)
+        )
+
     def on_event(
         self,
         services: QuerySet[Service],
@@ -417,3 +437,4 @@ class SlackWriteMessageActionNodeType(AutomationNodeActionNodeType):
     type = "slack_write_message"
     model_class = SlackWriteMessageActionNode
     service_type = SlackWriteMessageServiceType.type
+    can_be_dispatched_concurrently = True
@@ -1,6 +1,21 @@
+from django.db import transaction
 from django.db.models.signals import post_delete
 
 from baserow.contrib.automation.nodes.models import AutomationNode
+from baserow.contrib.automation.nodes.signals import (
+    automation_node_created,
+    automation_node_deleted,
+    automation_node_updated,
+)
+from baserow.contrib.automation.workflows.signals import (
+    automation_workflow_created,
+    automation_workflow_deleted,
+    automation_workflow_published,
+    automation_workflow_updated,
+)
+from baserow.contrib.integrations.local_baserow.service_types import (
+    LocalBaserowRowsSignalServiceType,
+)
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
 
@@ -24,3 +39,28 @@ def after_permanently_deleted(sender, instance, **kwargs):
 
 def connect_to_node_pre_delete_signal():
     post_delete.connect(after_permanently_deleted, AutomationNode)
+
+
+def invalidate_trigger_index(sender, **kwargs):
+    """
+    Invalidates the index of the tables watched by the row event triggers because
+    a workflow might have been published, unpublished or switched to a test run. It's
+    invalidated again once committed because the index can be rebuilt from the
+    previous data in the meantime.
+    """
+
+    LocalBaserowRowsSignalServiceType.invalidate_trigger_index()
+    transaction.on_commit(LocalBaserowRowsSignalServiceType.invalidate_trigger_index)
+
+
+def connect_to_trigger_index_signals():
+    for signal in [
+        automation_workflow_created,
+        automation_workflow_deleted,
+        automation_workflow_updated,
+        automation_workflow_published,
+        automation_node_created,
+        automation_node_updated,
+        automation_node_deleted,
+    ]:
+        signal.connect(invalidate_trigger_index)
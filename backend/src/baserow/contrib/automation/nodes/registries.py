@@ -46,6 +46,11 @@ class AutomationNodeType(
 
     is_container = False
 
+    # Whether the nodes of this type can be dispatched in another thread, at the same
+    # time as the other iterations of an iterator node. The other threads use their own
+    # database connection, so they can't see the changes made by the workflow run.
+    can_be_dispatched_concurrently = False
+
     class SerializedDict(AutomationNodeDict):
         ...
 
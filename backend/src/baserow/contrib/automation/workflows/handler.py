@@ -953,6 +953,7 @@ class AutomationWorkflowHandler(metaclass=baserow_trace_methods(tracer)):
                 history.completed_on = timezone.now()
                 history.message = history_message
                 history.status = history_status
+                history.node_timings = dispatch_context.node_timings
                 history.save()
             else:
                 # sample_data was updated as it's a simulation we should tell to
@@ -1,7 +1,13 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
+import contextvars
+import hashlib
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Union
 from zipfile import ZipFile
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import connections
 from django.db.models import QuerySet
 from django.db.utils import DatabaseError, IntegrityError
 
@@ -16,7 +22,7 @@ from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.builder.formula_importer import import_formula
 from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.builder.types import DataSourceDict
-from baserow.core.cache import local_cache
+from baserow.core.cache import global_cache, local_cache
 from baserow.core.integrations.models import Integration
 from baserow.core.integrations.registries import integration_type_registry
 from baserow.core.services.exceptions import (
@@ -33,11 +39,30 @@ from .types import DataSourceForUpdate
 if TYPE_CHECKING:
     from baserow.contrib.builder.models import Builder
 
+PUBLIC_DISPATCH_CACHE_KEY_PREFIX = "data_source_public_dispatch"
+
 
 class DataSourceHandler:
     def __init__(self):
         self.service_handler = ServiceHandler()
 
+    @classmethod
+    def _get_public_dispatch_table_invalidate_key(cls, table_id: int) -> str:
+        return f"{PUBLIC_DISPATCH_CACHE_KEY_PREFIX}_table_{table_id}"
+
+    @classmethod
+    def invalidate_public_dispatch_cache_for_table(cls, table_id: int):
+        """
+        Invalidates the cached public dispatch results of all the data sources using
+        the given table.
+
+        :param table_id: The ID of the table of which the data has changed.
+        """
+
+        global_cache.invalidate(
+            invalidate_key=cls._get_public_dispatch_table_invalidate_key(table_id)
+        )
+
     def get_data_source(
         self,
         data_source_id: int,
@@ -349,6 +374,7 @@ class DataSourceHandler:
         name: str,
         service_type: Optional[ServiceType] = None,
         before: Optional[DataSource] = None,
+        public_cache_ttl: int = 0,
         **kwargs,
     ) -> DataSource:
         """
@@ -358,6 +384,8 @@ class DataSourceHandler:
         :param name: The human name of the data_source.
         :param service_type: The type of the service related to the data_source.
         :param before: If set, the new data_source is inserted before this data_source.
+        :param public_cache_ttl: The number of seconds the public dispatch result is
+            cached. 0 disables the cache.
         :param kwargs: Additional attributes of the related service.
         :raises CannotCalculateIntermediateOrder: If it's not possible to find an
             intermediate order. The full order of the data_source of the page must be
@@ -379,7 +407,11 @@ class DataSourceHandler:
 
         try:
             data_source = DataSource.objects.create(
-                page=page, order=order, name=name, service=service
+                page=page,
+                order=order,
+                name=name,
+                service=service,
+                public_cache_ttl=public_cache_ttl,
             )
         except IntegrityError as error:
             # The only unique values are page and name, together.
@@ -397,6 +429,7 @@ class DataSourceHandler:
         service_type: Optional[ServiceType] = None,
         name: Optional[str] = None,
         page: Optional[Page] = None,
+        public_cache_ttl: Optional[int] = None,
         **kwargs,
     ) -> DataSource:
         """
@@ -406,6 +439,8 @@ class DataSourceHandler:
         :param service_type: The service type for the data_source's service.
         :param name: A new name for the data_source.
         :param page: The data source's page.
+        :param public_cache_ttl: The new number of seconds the public dispatch result
+            is cached.
         :param kwargs: The values that should be set on the data_source.
         :return: The updated data_source.
         """
@@ -457,6 +492,9 @@ class DataSourceHandler:
         if name is not None:
             data_source.name = name
 
+        if public_cache_ttl is not None:
+            data_source.public_cache_ttl = public_cache_ttl
+
         try:
             data_source.save()
         except DatabaseError:
@@ -491,6 +529,7 @@ class DataSourceHandler:
         """
 
         data_sources_dispatch = {}
+        data_sources_to_dispatch = []
         for data_source in data_sources:
             if (
                 dispatch_context.public_allowed_properties is not None
@@ -508,14 +547,141 @@ class DataSourceHandler:
                     data_sources_dispatch[data_source.id] = {}
                 continue
 
-            try:
-                data_sources_dispatch[data_source.id] = self.dispatch_data_source(
+            data_sources_to_dispatch.append(data_source)
+
+        max_workers = settings.BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS
+        if max_workers > 1 and len(data_sources_to_dispatch) > 1:
+            data_sources_dispatch.update(
+                self._dispatch_data_sources_concurrently(
+                    data_sources_to_dispatch, dispatch_context, max_workers
+                )
+            )
+        else:
+            for data_source in data_sources_to_dispatch:
+                data_sources_dispatch[
+                    data_source.id
+                ] = self._dispatch_data_source_or_exception(
                     data_source, dispatch_context
                 )
-            except Exception as e:
-                data_sources_dispatch[data_source.id] = e
 
-        return data_sources_dispatch
+        # Keep the results in the same order as the given data sources.
+        return {
+            data_source.id: data_sources_dispatch[data_source.id]
+            for data_source in data_sources
+        }
+
+    def _dispatch_data_source_or_exception(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Union[Any, Exception]:
+        try:
+            return self.dispatch_data_source(data_source, dispatch_context)
+        except Exception as e:
+            return e
+
+    def get_data_source_dependencies(
+        self, data_sources: List[DataSource]
+    ) -> Dict[int, Set[int]]:
+        """
+        Finds which of the given data sources are referenced in the formulas of each
+        data source. A data source can only be dispatched after the data sources it
+        depends on, because their result is needed to resolve its formulas.
+
+        :param data_sources: The data sources to compute the dependencies for.
+        :return: A dict where the key is the data source ID, and the value the IDs of
+            the given data sources it depends on. If the formulas of a data source
+            can't be analysed, then it depends on all the preceding data sources.
+        """
+
+        data_source_id_per_service_id = {
+            data_source.service_id: data_source.id
+            for data_source in data_sources
+            if data_source.service_id
+        }
+
+        dependencies = {}
+        for index, data_source in enumerate(data_sources):
+            try:
+                used_properties = data_source.extract_properties(data_source)
+            except Exception:
+                dependencies[data_source.id] = {d.id for d in data_sources[:index]}
+                continue
+
+            dependencies[data_source.id] = {
+                data_source_id_per_service_id[service_id]
+                for service_id in used_properties.keys()
+                if service_id in data_source_id_per_service_id
+                and data_source_id_per_service_id[service_id] != data_source.id
+            }
+
+        return dependencies
+
+    def _dispatch_data_sources_concurrently(
+        self,
+        data_sources: List[DataSource],
+        dispatch_context: BuilderDispatchContext,
+        max_workers: int,
+    ) -> Dict[int, Union[Any, Exception]]:
+        """
+        Dispatches the given data sources in a pool of threads. A data source is only
+        started once all the data sources it depends on have been dispatched, so that
+        it finds their results in the `dispatch_context.cache` instead of dispatching
+        them a second time. Independent data sources are dispatched at the same time.
+
+        :param data_sources: The data sources to be dispatched.
+        :param dispatch_context: The context used for the dispatch.
+        :param max_workers: The maximum number of data sources dispatched at once.
+        :return: The result of dispatching the data source mapped by data source ID.
+        """
+
+        dependencies = self.get_data_source_dependencies(data_sources)
+        pending = {data_source.id: data_source for data_source in data_sources}
+        running = {}
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                for data_source_id, data_source in list(pending.items()):
+                    if dependencies[data_source_id].issubset(results.keys()):
+                        del pending[data_source_id]
+                        # Every thread runs in a copy of the current context, so
+                        # that the request local cache is shared with the threads.
+                        future = executor.submit(
+                            contextvars.copy_context().run,
+                            self._dispatch_data_source_in_thread,
+                            data_source,
+                            dispatch_context,
+                        )
+                        running[future] = data_source_id
+
+                if not running:
+                    # The remaining data sources depend on each other. They're
+                    # dispatched one by one so that the error is the same as when
+                    # they're dispatched sequentially.
+                    for data_source in pending.values():
+                        results[
+                            data_source.id
+                        ] = self._dispatch_data_source_or_exception(
+                            data_source, dispatch_context
+                        )
+                    break
+
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+
+        return results
+
+    def _dispatch_data_source_in_thread(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Union[Any, Exception]:
+        try:
+            return self._dispatch_data_source_or_exception(
+                data_source, dispatch_context
+            )
+        finally:
+            # The database connections are bound to the thread, so they must be
+            # closed before the thread is discarded.
+            connections.close_all()
 
     def dispatch_data_source(
         self, data_source: DataSource, dispatch_context: BuilderDispatchContext
@@ -556,16 +722,95 @@ class DataSourceHandler:
         cloned_dispatch_context.add_call(data_source.id)
 
         if data_source.id not in cache.setdefault("data_source_contents", {}):
-            service_dispatch = self.service_handler.dispatch_service(
-                data_source.service.specific, cloned_dispatch_context
-            )
+
+            def dispatch():
+                return self.service_handler.dispatch_service(
+                    data_source.service.specific, cloned_dispatch_context
+                ).data
+
+            if self._can_use_public_dispatch_cache(data_source, dispatch_context):
+                # The results of the data sources of a table are invalidated together
+                # when the rows of that table change.
+                table_id = getattr(data_source.service.specific, "table_id", None)
+                invalidate_key = (
+                    self._get_public_dispatch_table_invalidate_key(table_id)
+                    if table_id
+                    else None
+                )
+                data = global_cache.get(
+                    self._get_public_dispatch_cache_key(
+                        data_source, cloned_dispatch_context
+                    ),
+                    default=dispatch,
+                    invalidate_key=invalidate_key,
+                    timeout=data_source.public_cache_ttl,
+                )
+            else:
+                data = dispatch()
 
             # Cache the dispatch in the formula cache if we have formulas that need
             # it later
-            cache["data_source_contents"][data_source.id] = service_dispatch.data
+            cache["data_source_contents"][data_source.id] = data
 
         return cache["data_source_contents"][data_source.id]
 
+    def _can_use_public_dispatch_cache(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> bool:
+        """
+        Checks whether the result of the data source can be shared between the
+        visitors of a published application. This is only the case if it's enabled
+        for the data source, and if the formulas of the data source don't reference
+        other data sources, because their results are not part of the cache key.
+        """
+
+        if (
+            not data_source.public_cache_ttl
+            or not dispatch_context.only_expose_public_allowed_properties
+            or dispatch_context.page.builder.workspace_id is not None
+        ):
+            return False
+
+        try:
+            used_properties = data_source.extract_properties(data_source)
+        except Exception:
+            return False
+
+        return all(
+            service_id == data_source.service_id for service_id in used_properties
+        )
+
+    def _get_public_dispatch_cache_key(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> str:
+        """
+        Computes the cache key of a public dispatch. It contains everything the
+        result can depend on: the data source, the data provider values sent by the
+        frontend, the adhoc refinements and pagination, and the visitor because the
+        user data provider and the public allowed properties depend on it.
+        """
+
+        request = dispatch_context.request
+        user = request.user_source_user
+        inputs = {
+            "metadata": getattr(request, "data", {}).get("metadata"),
+            "query": sorted(request.GET.lists()),
+            "range": [dispatch_context.offset, dispatch_context.count],
+            "only_record_id": dispatch_context.only_record_id,
+            "user": None
+            if user.is_anonymous
+            else [user.user_source_id, user.id, user.role],
+        }
+        inputs_hash = hashlib.blake2b(
+            json.dumps(inputs, sort_keys=True, default=str).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+        return (
+            f"{PUBLIC_DISPATCH_CACHE_KEY_PREFIX}_{data_source.id}_"
+            f"{data_source.service_id}_{inputs_hash}"
+        )
+
     def move_data_source(
         self, data_source: DataSourceForUpdate, before: Optional[DataSource] = None
     ) -> DataSource:
@@ -630,6 +875,7 @@ class DataSourceHandler:
             id=data_source.id,
             name=data_source.name,
             order=str(data_source.order),
+            public_cache_ttl=data_source.public_cache_ttl,
             service=serialized_service,
         )
 
@@ -687,6 +933,7 @@ class DataSourceHandler:
             service=service,
             order=serialized_data_source["order"],
             name=serialized_data_source["name"],
+            public_cache_ttl=serialized_data_source.get("public_cache_ttl", 0),
         )
 
         id_mapping["builder_data_sources"][
@@ -121,6 +121,7 @@ class DataSourceService:
         service_type: ServiceType,
         name: Optional[str] = None,
         before: Optional[DataSource] = None,
+        public_cache_ttl: int = 0,
         **kwargs,
     ) -> DataSource:
         """
@@ -130,6 +131,8 @@ class DataSourceService:
         :param page: The page the data_source exists in.
         :param service_type: The type of the related service.
         :param before: If set, the new data_source is inserted before this data_source.
+        :param public_cache_ttl: The number of seconds the public dispatch result is
+            cached. 0 disables the cache.
         :param kwargs: Additional attributes of the data_source and the service.
         :return: The created data_source.
         """
@@ -163,6 +166,7 @@ class DataSourceService:
                 service_type=service_type,
                 before=before,
                 name=name,
+                public_cache_ttl=public_cache_ttl,
                 **prepared_values,
             )
         except CannotCalculateIntermediateOrder:
@@ -178,6 +182,7 @@ class DataSourceService:
                 service_type=service_type,
                 before=before,
                 name=name,
+                public_cache_ttl=public_cache_ttl,
                 **prepared_values,
             )
 
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("builder", "0067_slackwritemessageworkflowaction"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasource",
+            name="public_cache_ttl",
+            field=models.PositiveIntegerField(
+                db_default=0,
+                default=0,
+                help_text="The number of seconds the result of the data source is "
+                "shared between the visitors of the published application. 0 disables "
+                "the cache.",
+            ),
+        ),
+    ]
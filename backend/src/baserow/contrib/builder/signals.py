@@ -1,11 +1,15 @@
+from django.db import transaction
 from django.dispatch import receiver
 
 from baserow.contrib.builder.data_sources import signals as ds_signals
+from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.elements import signals as element_signals
 from baserow.contrib.builder.handler import BuilderHandler
 from baserow.contrib.builder.models import Builder
 from baserow.contrib.builder.pages import signals as page_signals
 from baserow.contrib.builder.workflow_actions import signals as wa_signals
+from baserow.contrib.database.fields import signals as field_signals
+from baserow.contrib.database.rows import signals as row_signals
 from baserow.core.user_sources import signals as us_signals
 
 __all__ = [
@@ -21,6 +25,13 @@ __all__ = [
     "ds_deleted",
     "page_deleted",
     "page_updated",
+    "rows_created",
+    "rows_updated",
+    "rows_deleted",
+    "field_created",
+    "field_restored",
+    "field_updated",
+    "field_deleted",
 ]
 
 # Elements
@@ -128,3 +139,63 @@ def us_deleted(sender, user_source_id, application, user, **kwargs):
         BuilderHandler().invalidate_builder_public_properties_cache(
             application.specific
         )
+
+
+# Database tables
+
+
+def invalidate_public_dispatch_cache_for_tables(table_ids):
+    def invalidate():
+        for table_id in table_ids:
+            DataSourceHandler.invalidate_public_dispatch_cache_for_table(table_id)
+
+    # The cache must only be invalidated once the changes are visible to the other
+    # transactions, otherwise a concurrent dispatch could cache the old results again.
+    transaction.on_commit(invalidate)
+
+
+@receiver(row_signals.rows_created)
+def rows_created(sender, rows, user, table, **kwargs):
+    invalidate_public_dispatch_cache_for_tables([table.id])
+
+
+@receiver(row_signals.rows_updated)
+def rows_updated(sender, rows, user, table, **kwargs):
+    invalidate_public_dispatch_cache_for_tables([table.id])
+
+
+@receiver(row_signals.rows_deleted)
+def rows_deleted(sender, rows, user, table, **kwargs):
+    invalidate_public_dispatch_cache_for_tables([table.id])
+
+
+def _get_table_ids_of_fields(field, related_fields):
+    return {field.table_id, *[f.table_id for f in related_fields]}
+
+
+@receiver(field_signals.field_created)
+def field_created(sender, field, related_fields, user, **kwargs):
+    invalidate_public_dispatch_cache_for_tables(
+        _get_table_ids_of_fields(field, related_fields)
+    )
+
+
+@receiver(field_signals.field_restored)
+def field_restored(sender, field, related_fields, user, **kwargs):
+    invalidate_public_dispatch_cache_for_tables(
+        _get_table_ids_of_fields(field, related_fields)
+    )
+
+
+@receiver(field_signals.field_updated)
+def field_updated(sender, field, related_fields, user, **kwargs):
+    invalidate_public_dispatch_cache_for_tables(
+        _get_table_ids_of_fields(field, related_fields)
+    )
+
+
+@receiver(field_signals.field_deleted)
+def field_deleted(sender, field_id, field, related_fields, user, **kwargs):
+    invalidate_public_dispatch_cache_for_tables(
+        _get_table_ids_of_fields(field, related_fields)
+    )
@@ -50,6 +50,7 @@ class DataSourceDict(TypedDict):
     id: int
     name: str
     order: int
+    public_cache_ttl: int
     service: Optional[ServiceDictSubClass]
 
 
@@ -7,6 +7,7 @@ from drf_spectacular.utils import OpenApiParameter
 
 from baserow.contrib.database.search.handler import SearchMode
 from baserow.contrib.database.views.registries import view_filter_type_registry
+from baserow.contrib.database.views.utils import ALL_ROW_COUNT_MODES
 
 PUBLIC_PLACEHOLDER_ENTITY_ID = 0
 SEARCH_MODE_API_PARAM = OpenApiParameter(
@@ -48,6 +49,21 @@ EXCLUDE_COUNT_API_PARAM = OpenApiParameter(
         "number of results is slow."
     ),
 )
+COUNT_MODE_API_PARAM = OpenApiParameter(
+    name="count_mode",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    enum=ALL_ROW_COUNT_MODES,
+    description=(
+        "Determines how the total number of rows is counted. `exact` (the default) "
+        "counts all matching rows. `estimate` returns the estimated count of the "
+        "database query planner, which is fast, but not accurate. `capped` counts at "
+        "most `BASEROW_ROW_COUNT_CAP` rows and returns that number if there are more. "
+        "If the rows are not filtered or searched, the count is always exact and it "
+        "doesn't require counting the rows. The used mode is returned in the "
+        "`count_mode` property of the response if this parameter is provided."
+    ),
+)
 INCLUDE_OPERATION_METADATA = OpenApiParameter(
     name="include_metadata",
     location=OpenApiParameter.QUERY,
@@ -4,6 +4,7 @@ from rest_framework.authentication import BaseAuthentication, get_authorization_
 from rest_framework.exceptions import AuthenticationFailed
 
 from baserow.api.sessions import set_user_remote_addr_ip_from_request
+from baserow.config.db_routers import set_db_state_user
 from baserow.contrib.database.tokens.exceptions import TokenDoesNotExist
 from baserow.contrib.database.tokens.handler import TokenHandler
 from baserow.core.exceptions import UserNotInWorkspace
@@ -60,6 +61,7 @@ class TokenAuthentication(BaseAuthentication):
 
         request.user_token = token
         set_user_remote_addr_ip_from_request(token.user, request)
+        set_db_state_user(token.user.id)
         with setup_user_in_baggage_and_spans(token.user, request):
             setup_user_in_sentry(token.user)
             return token.user, token
@@ -20,6 +20,8 @@ from baserow.contrib.database.api.constants import (
     ADHOC_FILTERS_API_PARAMS,
     ADHOC_FILTERS_API_PARAMS_NO_COMBINE,
     EXCLUDE_COUNT_API_PARAM,
+    EXCLUDE_FIELDS_API_PARAM,
+    INCLUDE_FIELDS_API_PARAM,
     LIMIT_LINKED_ITEMS_API_PARAM,
     ONLY_COUNT_API_PARAM,
     SEARCH_MODE_API_PARAM,
@@ -36,6 +38,7 @@ from baserow.contrib.database.api.rows.serializers import (
     get_example_row_serializer_class,
     get_row_serializer_class,
 )
+from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.api.views.errors import (
     ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW,
     ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST,
@@ -47,6 +50,8 @@ from baserow.contrib.database.api.views.gallery.serializers import (
 from baserow.contrib.database.api.views.serializers import FieldOptionsField
 from baserow.contrib.database.api.views.utils import (
     get_public_view_authorization_token,
+    get_public_view_filtered_queryset,
+    get_view_table_model,
     parse_limit_linked_items_params,
 )
 from baserow.contrib.database.fields.exceptions import (
@@ -133,6 +138,8 @@ class GalleryViewView(APIView):
                 "query are going to be returned.",
             ),
             *ADHOC_FILTERS_API_PARAMS_NO_COMBINE,
+            INCLUDE_FIELDS_API_PARAM,
+            EXCLUDE_FIELDS_API_PARAM,
             SEARCH_MODE_API_PARAM,
             LIMIT_LINKED_ITEMS_API_PARAM,
         ],
@@ -168,13 +175,16 @@ class GalleryViewView(APIView):
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                 ]
             ),
-            404: get_error_schema(["ERROR_GALLERY_DOES_NOT_EXIST"]),
+            404: get_error_schema(
+                ["ERROR_GALLERY_DOES_NOT_EXIST", "ERROR_FIELD_DOES_NOT_EXIST"]
+            ),
         },
     )
     @map_exceptions(
         {
             UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
             ViewDoesNotExist: ERROR_GALLERY_DOES_NOT_EXIST,
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
             FilterFieldNotFound: ERROR_FILTER_FIELD_NOT_FOUND,
             ViewFilterTypeDoesNotExist: ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST,
             ViewFilterTypeNotAllowedForField: ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD,
@@ -194,6 +204,8 @@ class GalleryViewView(APIView):
     ):
         """Lists the rows for the gallery view."""
 
+        include_fields = request.GET.get("include_fields")
+        exclude_fields = request.GET.get("exclude_fields")
         adhoc_filters = AdHocFilters.from_request(request)
 
         order_by = request.GET.get("order_by")
@@ -217,7 +229,18 @@ class GalleryViewView(APIView):
         search = query_params.get("search")
         search_mode = query_params.get("search_mode")
 
-        model = view.table.get_model()
+        field_ids = get_include_exclude_field_ids(
+            view.table, include_fields, exclude_fields
+        )
+        # The field options are serialized for all the fields of the model, so the
+        # full model is needed if they're included.
+        model = get_view_table_model(
+            view,
+            None if field_options else field_ids,
+            adhoc_filters,
+            order_by,
+            search,
+        )
         queryset = view_handler.get_queryset(
             view,
             search,
@@ -245,6 +268,7 @@ class GalleryViewView(APIView):
             model,
             RowSerializer,
             is_response=True,
+            field_ids=field_ids,
             extra_kwargs=serializer_extra_kwargs,
         )
         serializer = serializer_class(page, many=True)
@@ -448,13 +472,6 @@ class PublicGalleryViewRowsView(APIView):
         `field_options` are provided in the include GET parameter.
         """
 
-        search = query_params.get("search")
-        search_mode = query_params.get("search_mode")
-        order_by = request.GET.get("order_by")
-        include_fields = request.GET.get("include_fields")
-        exclude_fields = request.GET.get("exclude_fields")
-        adhoc_filters = AdHocFilters.from_request(request)
-
         count = "count" in request.GET
 
         view_handler = ViewHandler()
@@ -465,23 +482,13 @@ class PublicGalleryViewRowsView(APIView):
             authorization_token=get_public_view_authorization_token(request),
         )
         view_type = view_type_registry.get_by_model(view)
-        model = view.table.get_model()
 
         (
             queryset,
             field_ids,
             publicly_visible_field_options,
-        ) = ViewHandler().get_public_rows_queryset_and_field_ids(
-            view,
-            search=search,
-            order_by=order_by,
-            include_fields=include_fields,
-            exclude_fields=exclude_fields,
-            adhoc_filters=adhoc_filters,
-            table_model=model,
-            view_type=view_type,
-            search_mode=search_mode,
-        )
+        ) = get_public_view_filtered_queryset(view, request, query_params)
+        model = queryset.model
 
         if count:
             return Response({"count": queryset.count()})
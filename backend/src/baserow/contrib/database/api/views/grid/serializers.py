@@ -2,8 +2,10 @@ from django.utils.functional import lazy
 
 from rest_framework import serializers
 
+from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.contrib.database.views.models import GridViewFieldOptions
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.utils import ALL_ROW_COUNT_MODES
 
 
 def get_allowed_aggregation_types():
@@ -18,6 +20,14 @@ def get_allowed_aggregation_types():
     ]
 
 
+class GridViewRowsQueryParamSerializer(SearchQueryParamSerializer):
+    count_mode = serializers.ChoiceField(
+        required=False,
+        default=None,
+        choices=ALL_ROW_COUNT_MODES,
+    )
+
+
 class GridViewFieldOptionsSerializer(serializers.ModelSerializer):
     aggregation_raw_type = serializers.ChoiceField(
         choices=lazy(get_allowed_aggregation_types, list)(),
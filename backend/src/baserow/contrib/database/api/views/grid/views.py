@@ -23,6 +23,7 @@ from baserow.contrib.database.api.constants import (
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION,
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION_NO_COMBINE,
     ADHOC_SORTING_API_PARAM,
+    COUNT_MODE_API_PARAM,
     EXCLUDE_COUNT_API_PARAM,
     EXCLUDE_FIELDS_API_PARAM,
     INCLUDE_FIELDS_API_PARAM,
@@ -54,12 +55,16 @@ from baserow.contrib.database.api.views.errors import (
 )
 from baserow.contrib.database.api.views.grid.serializers import (
     GridViewFieldOptionsSerializer,
+    GridViewRowsQueryParamSerializer,
 )
 from baserow.contrib.database.api.views.serializers import FieldOptionsField
 from baserow.contrib.database.api.views.utils import (
+    count_view_rows_response,
     get_public_view_authorization_token,
     get_public_view_filtered_queryset,
     get_view_filtered_queryset,
+    get_view_rows_counter,
+    get_view_table_model,
     paginate_and_serialize_queryset,
     serialize_group_by_fields_metadata,
     serialize_rows_metadata,
@@ -139,6 +144,7 @@ class GridViewView(APIView):
             ),
             ONLY_COUNT_API_PARAM,
             EXCLUDE_COUNT_API_PARAM,
+            COUNT_MODE_API_PARAM,
             *PAGINATION_API_PARAMS,
             *ADHOC_FILTERS_API_PARAMS_NO_COMBINE,
             ADHOC_SORTING_API_PARAM,
@@ -209,7 +215,7 @@ class GridViewView(APIView):
         }
     )
     @allowed_includes("field_options", "row_metadata")
-    @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
+    @validate_query_parameters(GridViewRowsQueryParamSerializer, return_validated=True)
     def get(self, request, view_id, field_options, row_metadata, query_params):
         """
         Lists all the rows of a grid view, paginated either by a page or offset/limit.
@@ -247,17 +253,33 @@ class GridViewView(APIView):
             view.table, include_fields, exclude_fields
         )
 
+        # The field options are serialized for all the fields of the model, so the
+        # full model is needed if they're included.
+        model = get_view_table_model(
+            view,
+            None if field_options else field_ids,
+            adhoc_filters,
+            order_by,
+            query_params.get("search"),
+        )
         queryset = get_view_filtered_queryset(
-            view, adhoc_filters, order_by, query_params
+            view, adhoc_filters, order_by, query_params, model=model
+        )
+
+        row_counter = get_view_rows_counter(
+            view,
+            query_params,
+            bool(adhoc_filters.has_any_filters or query_params.get("search")),
         )
-        model = queryset.model
 
         if ONLY_COUNT_API_PARAM.name in request.GET:
-            return Response({"count": queryset.count()})
+            return count_view_rows_response(queryset, row_counter)
 
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids
+            queryset, request, field_ids, count_function=row_counter
         )
+        if row_counter is not None and row_counter.mode is not None:
+            response.data.update(count_mode=row_counter.mode.value)
 
         if view_type.can_group_by and view.viewgroupby_set.all():
             group_by_fields = [
@@ -709,6 +731,7 @@ class PublicGridViewRowsView(APIView):
             ),
             ONLY_COUNT_API_PARAM,
             EXCLUDE_COUNT_API_PARAM,
+            COUNT_MODE_API_PARAM,
             *PAGINATION_API_PARAMS,
             ADHOC_SORTING_API_PARAM,
             INCLUDE_FIELDS_API_PARAM,
@@ -785,7 +808,7 @@ class PublicGridViewRowsView(APIView):
         }
     )
     @allowed_includes("field_options")
-    @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
+    @validate_query_parameters(GridViewRowsQueryParamSerializer, return_validated=True)
     def get(
         self, request: Request, slug: str, field_options: bool, query_params
     ) -> Response:
@@ -813,12 +836,23 @@ class PublicGridViewRowsView(APIView):
         ) = get_public_view_filtered_queryset(view, request, query_params)
         model = queryset.model
 
+        row_counter = get_view_rows_counter(
+            view,
+            query_params,
+            bool(
+                AdHocFilters.from_request(request).has_any_filters
+                or query_params.get("search")
+            ),
+        )
+
         if ONLY_COUNT_API_PARAM.name in request.GET:
-            return Response({"count": queryset.count()})
+            return count_view_rows_response(queryset, row_counter)
 
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids
+            queryset, request, field_ids, count_function=row_counter
         )
+        if row_counter is not None and row_counter.mode is not None:
+            response.data.update(count_mode=row_counter.mode.value)
 
         if field_options:
             context = {"field_options": publicly_visible_field_options}
@@ -1,8 +1,9 @@
 from dataclasses import Field
-from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Type
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Type
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.db.models import prefetch_related_objects
 from django.db.models.query import QuerySet
 
 from rest_framework.request import Request
@@ -23,11 +24,12 @@ from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
     get_row_serializer_class,
 )
+from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.api.views.serializers import serialize_group_by_metadata
 from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.contrib.database.views.filters import AdHocFilters
-from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.handler import RowCountMode, ViewHandler
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import view_type_registry
 
@@ -48,6 +50,54 @@ def get_public_view_authorization_token(request: Request) -> Optional[str]:
     return token
 
 
+def get_view_table_model(
+    view: Type[View],
+    field_ids: Optional[Iterable[int]] = None,
+    filters: Optional[AdHocFilters] = None,
+    order_by: Optional[str] = None,
+    search: Optional[str] = None,
+    include_view_sort_fields: bool = True,
+) -> Type[GeneratedTableModel]:
+    """
+    Returns the model that must be used to list the rows of the view. If only a
+    subset of the fields is requested, then a model that only contains those fields
+    and the fields that the view filters, sorts and groups by is returned, so that
+    the other columns are not selected. Searching, ad hoc filters and ad hoc sorts
+    can reference any field, so the full model is returned if one of them is used.
+
+    :param view: The view of which the rows are going to be listed.
+    :param field_ids: The ids of the requested fields, or None if all the fields are
+        requested.
+    :param filters: The ad hoc filters that are going to be applied.
+    :param order_by: The ad hoc order by string that is going to be applied.
+    :param search: The search value that is going to be applied.
+    :param include_view_sort_fields: Whether the sorts and group bys of the view are
+        going to be applied, and their fields must be in the model.
+    :return: The generated model of the view's table.
+    """
+
+    table = view.table
+    if (
+        field_ids is None
+        or search
+        or order_by
+        or (filters is not None and filters.has_any_filters)
+    ):
+        return table.get_model()
+
+    field_ids = set(field_ids)
+    lookups = [] if view.filters_disabled else ["viewfilter_set"]
+    if include_view_sort_fields:
+        lookups += ["viewsort_set", "viewgroupby_set"]
+    # Already prefetched lookups are skipped, and the other ones are cached on the view
+    # so that applying the sorts and filters later doesn't query them again.
+    prefetch_related_objects([view], *lookups)
+    for lookup in lookups:
+        field_ids.update(related.field_id for related in getattr(view, lookup).all())
+
+    return table.get_projected_model(field_ids)
+
+
 def get_view_filtered_queryset(
     view: Type[View],
     filters: Optional[AdHocFilters] = None,
@@ -123,7 +173,15 @@ def get_public_view_filtered_queryset(
     exclude_fields = request.GET.get("exclude_fields")
     adhoc_filters = AdHocFilters.from_request(request)
     view_type = view_type_registry.get_by_model(view)
-    model = view.table.get_model()
+    # The sorts of the view are not applied to the rows of a public view.
+    model = get_view_table_model(
+        view,
+        get_include_exclude_field_ids(view.table, include_fields, exclude_fields),
+        adhoc_filters,
+        order_by or group_by,
+        search,
+        include_view_sort_fields=False,
+    )
 
     (
         queryset,
@@ -154,11 +212,84 @@ class PaginatedData(NamedTuple):
     paginator: Pageable
 
 
-def _get_paginator(request: Request) -> Pageable:
+class ViewRowsCounter:
+    """
+    Counts the rows of a view queryset with the provided count mode, so that it can
+    be used as count function of the paginators. The mode that was actually used to
+    compute the count is stored in the `mode` attribute once the rows are counted.
+    """
+
+    def __init__(
+        self,
+        view: View,
+        count_mode: RowCountMode,
+        only_view_filters: bool = True,
+    ):
+        self.view = view
+        self.count_mode = count_mode
+        self.only_view_filters = only_view_filters
+        self.mode: Optional[RowCountMode] = None
+
+    def __call__(self, queryset: QuerySet) -> int:
+        count, self.mode = ViewHandler().count_view_rows(
+            self.view,
+            queryset,
+            count_mode=self.count_mode,
+            only_view_filters=self.only_view_filters,
+        )
+        return count
+
+
+def get_view_rows_counter(
+    view: View, query_params: Dict[str, Any], has_adhoc_filters: bool
+) -> Optional[ViewRowsCounter]:
+    """
+    Returns the counter that must be used to count the rows of the view if a count
+    mode has been provided in the query parameters.
+
+    :param view: The view of which the rows are going to be counted.
+    :param query_params: The validated query parameters containing the count mode.
+    :param has_adhoc_filters: Indicates whether the rows are filtered or searched
+        on top of the filters of the view.
+    :return: The counter or None if the rows must be counted as usual.
+    """
+
+    count_mode = query_params.get("count_mode")
+    if not count_mode:
+        return None
+    return ViewRowsCounter(
+        view, RowCountMode(count_mode), only_view_filters=not has_adhoc_filters
+    )
+
+
+def count_view_rows_response(
+    queryset: QuerySet, row_counter: Optional[ViewRowsCounter]
+) -> Response:
+    """
+    Returns the response containing only the number of rows of the queryset. The
+    used count mode is included if a row counter is provided.
+
+    :param queryset: The queryset to count the rows of.
+    :param row_counter: The optional counter to count the rows with.
+    :return: The response containing the count.
+    """
+
+    if row_counter is None:
+        return Response({"count": queryset.count()})
+
+    count = row_counter(queryset)
+    return Response({"count": count, "count_mode": row_counter.mode.value})
+
+
+def _get_paginator(
+    request: Request, count_function: Optional[Callable[[QuerySet], int]] = None
+) -> Pageable:
     """
     Returns the paginator to use based on the request query parameters.
 
     :param request: The request containing the pagination query parameters.
+    :param count_function: Optionally a function that counts the rows of the
+        queryset instead of the default count query.
     :return: The paginator to use.
     """
 
@@ -169,9 +300,9 @@ def _get_paginator(request: Request) -> Pageable:
             paginator = PageNumberPaginationWithoutCount()
     else:
         if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
+            paginator = LimitOffsetPagination(count_function=count_function)
         else:
-            paginator = PageNumberPagination()
+            paginator = PageNumberPagination(count_function=count_function)
     return paginator
 
 
@@ -200,6 +331,7 @@ def paginate_and_serialize_queryset(
     queryset: QuerySet[GeneratedTableModel],
     request: Request,
     field_ids: Optional[Iterable[int]],
+    count_function: Optional[Callable[[QuerySet], int]] = None,
 ) -> PaginatedData:
     """
     Paginate and serialize the data for the provided queryset and view.
@@ -207,11 +339,13 @@ def paginate_and_serialize_queryset(
     :param queryset: The queryset to paginate and serialize.
     :param request: The request containing the pagination query parameters.
     :param field_ids: The (optional) field IDs to restrict the serialized data to.
+    :param count_function: Optionally a function that counts the rows of the
+        queryset instead of the default count query, like a `ViewRowsCounter`.
     :return: The paginated data containing the paginator, the page of results, and
         response containing the serialized data.
     """
 
-    paginator = _get_paginator(request)
+    paginator = _get_paginator(request, count_function)
     page = paginator.paginate_queryset(queryset, request)
 
     limit_linked_items = parse_limit_linked_items_params(request)
@@ -10,7 +10,7 @@ from django.contrib.auth.models import AbstractUser
 from django.core.files.storage import Storage
 from django.core.management.color import no_style
 from django.db import connection, models
-from django.db.models import Prefetch, QuerySet
+from django.db.models import Count, Prefetch, QuerySet
 from django.db.transaction import Atomic
 from django.urls import include, path
 from django.utils import translation
@@ -23,7 +23,7 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.fields.utils.field_constraint import (
     build_django_field_constraints,
 )
-from baserow.contrib.database.models import Database, Field, View
+from baserow.contrib.database.models import Database, Field, LinkRowField, View
 from baserow.contrib.database.operations import ListTablesDatabaseTableOperationType
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.views.registries import view_type_registry
@@ -91,6 +91,35 @@ class DatabaseApplicationType(ApplicationType):
         for table in database_tables:
             TrashHandler.permanently_delete(table)
 
+    def get_permanent_deletion_lock_counts(
+        self, application_ids: List[int]
+    ) -> Dict[int, int]:
+        """
+        Deleting a database drops all of its tables, including the through tables of
+        their link row fields.
+        """
+
+        table_counts = dict(
+            Table.objects_and_trash.filter(database_id__in=application_ids)
+            .values("database_id")
+            .annotate(count=Count("id"))
+            .values_list("database_id", "count")
+        )
+        link_row_field_counts = dict(
+            LinkRowField.objects_and_trash.filter(
+                table__database_id__in=application_ids
+            )
+            .values("table__database_id")
+            .annotate(count=Count("id"))
+            .values_list("table__database_id", "count")
+        )
+        return {
+            application_id: 1
+            + table_counts.get(application_id, 0)
+            + link_row_field_counts.get(application_id, 0)
+            for application_id in application_ids
+        }
+
     def get_api_urls(self):
         from .api import urls as api_urls
 
@@ -1052,6 +1052,15 @@ class DatabaseConfig(AppConfig):
         row_history_provider_registry.register(UpdateRowsHistoryProvider())
         row_history_provider_registry.register(RestoreFromTrashHistoryProvider())
 
+        from baserow.contrib.database.rows.history import (
+            RowHistoryWriteBehindBufferType,
+        )
+        from baserow.core.write_behind.registries import (
+            write_behind_buffer_type_registry,
+        )
+
+        write_behind_buffer_type_registry.register(RowHistoryWriteBehindBufferType())
+
         from baserow.core.search.registries import workspace_search_registry
 
         from .search_types import (
@@ -1,9 +1,12 @@
 from copy import deepcopy
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.cache import cache
-from django.db.models import Prefetch, QuerySet
+from django.db import transaction
+from django.db.models import Index, Prefetch, Q, QuerySet
 from django.utils import timezone, translation
 from django.utils.translation import gettext as _
 
@@ -15,18 +18,19 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.models import Database
 from baserow.contrib.database.operations import CreateTableDatabaseTableOperationType
 from baserow.contrib.database.rows.handler import RowHandler
-from baserow.contrib.database.rows.types import CreatedRowsData
 from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.table.operations import UpdateDatabaseTableOperationType
 from baserow.contrib.database.table.signals import table_created, table_updated
 from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.row_id_set import CompactRowIdSet
 from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.db import specific_queryset
 from baserow.core.handler import CoreHandler
 from baserow.core.utils import (
     ChildProgressBuilder,
     extract_allowed,
+    grouper,
     remove_duplicates,
     set_allowed_attrs,
 )
@@ -39,9 +43,35 @@ from .exceptions import (
     TwoWayDataSyncNotSupported,
     UniquePrimaryPropertyNotFound,
 )
-from .models import DataSync, DataSyncSyncedProperty
+from .models import DataSync, DataSyncRowFingerprint, DataSyncSyncedProperty
 from .operations import SyncTableOperationType
 from .registries import data_sync_type_registry, two_way_sync_strategy_type_registry
+from .utils import get_row_fingerprint
+
+
+@dataclass
+class DataSyncTableSyncContext:
+    """
+    Holds the state of a running table sync that must be shared between the
+    chunks of rows being synced.
+    """
+
+    user: AbstractUser
+    data_sync: DataSync
+    model: Any
+    unique_primary_keys: List[str]
+    enabled_properties: List[DataSyncSyncedProperty]
+    key_to_property: Dict[str, Any]
+    key_to_field_id: Dict[str, str] = field(init=False)
+    synced_row_ids: CompactRowIdSet = field(default_factory=CompactRowIdSet)
+    """The ids of the rows in the table that match a row in the data sync."""
+    changed_row_ids: CompactRowIdSet = field(default_factory=CompactRowIdSet)
+    """The ids of the rows in the table that were created or updated."""
+
+    def __post_init__(self):
+        self.key_to_field_id = {
+            p.key: f"field_{p.field_id}" for p in self.enabled_properties
+        }
 
 
 class DataSyncHandler:
@@ -326,12 +356,17 @@ class DataSyncHandler:
                 )
 
             try:
-                self._do_sync_table(user, data_sync, progress_builder)
+                # The rows are written chunk by chunk while they're being fetched. The
+                # savepoint makes sure that nothing is written if fetching fails
+                # halfway.
+                with transaction.atomic():
+                    self._do_sync_table(user, data_sync, progress_builder)
             finally:
                 cache.delete(lock_key)
         # If calling `get_all_rows` fails with a `SyncError`, then it's an expected
         # error, and it shouldn't fail hard. We do want to store the error in the
-        # database to expose via the API.
+        # database to expose via the API. All the rows written before the error have
+        # been rolled back.
         except SyncError as e:
             data_sync.last_error = str(e)
             data_sync.save(update_fields=("last_error",))
@@ -384,137 +419,310 @@ class DataSyncHandler:
         )
         progress.increment(by=1)  # makes the total `1`
 
-        model = data_sync.table.get_model()
-        unique_primary_keys = [p.key for p in all_properties if p.unique_primary]
-        # Fetch the data sync properties again because they could have been changed
-        # after calling `set_data_sync_synced_properties`.
-        enabled_properties = DataSyncSyncedProperty.objects.filter(data_sync=data_sync)
-        key_to_field_id = {p.key: f"field_{p.field_id}" for p in enabled_properties}
-        key_to_property = {p.key: p for p in all_properties}
+        sync_context = DataSyncTableSyncContext(
+            user=user,
+            data_sync=data_sync,
+            model=data_sync.table.get_model(),
+            unique_primary_keys=[p.key for p in all_properties if p.unique_primary],
+            # Fetch the data sync properties again because they could have been
+            # changed after calling `set_data_sync_synced_properties`.
+            enabled_properties=list(
+                DataSyncSyncedProperty.objects.filter(data_sync=data_sync)
+            ),
+            key_to_property={p.key: p for p in all_properties},
+        )
         progress.increment(by=1)  # makes the total `2`
 
-        existing_rows_queryset = model.objects.all().values(
-            # There is no need to fetch the rows cell values from the row because we
-            # don't need them.
-            *["id"]
-            + list(key_to_field_id.values())
+        # The rows of the data sync are streamed in chunks, and every chunk is
+        # immediately compared with the matching rows in the table. This means that
+        # neither the data sync rows nor the table rows ever have to be in memory
+        # all at once. The rows are fetched lazily, so the progress of fetching them
+        # also represents the progress of creating and updating the rows.
+        rows_of_data_sync = data_sync_type.get_all_rows(
+            data_sync,
+            progress_builder=progress.create_child_builder(
+                represents_progress=80  # makes the total `82`
+            ),
         )
-        progress.increment(by=6)  # makes the total `9`
-
-        existing_rows_in_table = {
-            tuple(row[key_to_field_id[key]] for key in unique_primary_keys): row
-            for row in existing_rows_queryset
-            # Unique primaries can't be empty. If they are, then they're left dangling
-            # because the primary was removed. They will be deleted later.
-            if all(row[key_to_field_id[key]] for key in unique_primary_keys)
-        }
-        progress.increment(by=1)  # makes the total `10`
+        # Every chunk looks up the table rows by their unique primary key. Without
+        # an index, that would be a full scan of the table per chunk.
+        key_index = self._get_unique_primary_key_index(sync_context)
+        with safe_django_schema_editor() as schema_editor:
+            schema_editor.add_index(sync_context.model, key_index)
+        for chunk in grouper(settings.BASEROW_DATA_SYNC_CHUNK_SIZE, rows_of_data_sync):
+            self._sync_rows_chunk(sync_context, chunk)
+        # If the sync fails, the index is removed when the savepoint is rolled back.
+        with safe_django_schema_editor() as schema_editor:
+            schema_editor.remove_index(sync_context.model, key_index)
+
+        # Rows are only deleted after all the rows of the data sync have been
+        # processed, so that if fetching the rows fails halfway, no row is deleted
+        # because it simply hasn't been fetched yet.
+        self._delete_rows_not_in_data_sync(
+            sync_context,
+            progress_builder=progress.create_child_builder(
+                represents_progress=18  # makes the total `100`
+            ),
+        )
+
+        if len(sync_context.changed_row_ids) > 0:
+            # No need to include this in the progress as it triggers a celery task.
+            # If many rows have changed, it's cheaper to update the search data of
+            # the whole table than to pass on all the row ids.
+            changed_row_ids = (
+                list(sync_context.changed_row_ids)
+                if len(sync_context.changed_row_ids)
+                <= settings.BASEROW_DATA_SYNC_CHUNK_SIZE
+                else None
+            )
+            SearchHandler.schedule_update_search_data(
+                data_sync.table,
+                fields=[p.field for p in sync_context.enabled_properties],
+                row_ids=changed_row_ids,
+            )
+
+    def _get_unique_primary_key_index(
+        self, sync_context: DataSyncTableSyncContext
+    ) -> Index:
+        """
+        Returns the index on the unique primary key fields of the synced table. It
+        only exists while the rows are being synced.
 
-        rows_of_data_sync = {
+        :param sync_context: The context of the running sync.
+        :return: The index that must be created.
+        """
+
+        return Index(
+            fields=[
+                sync_context.key_to_field_id[key]
+                for key in sync_context.unique_primary_keys
+            ],
+            name=f"tbl_{sync_context.data_sync.table_id}_sync_key",
+        )
+
+    def _get_existing_rows_for_keys(
+        self, sync_context: DataSyncTableSyncContext, keys: List[tuple]
+    ) -> Dict[tuple, int]:
+        """
+        Fetches the ids of the rows in the synced table matching the provided unique
+        primary keys. If multiple rows have the same key, then the one with the lowest
+        id is returned, the others won't be marked as synced and will therefore be
+        deleted.
+
+        :param sync_context: The context of the running sync.
+        :param keys: The unique primary key tuples of the rows that must be fetched.
+        :return: A dict where the key is the unique primary key tuple and the value
+            the row id.
+        """
+
+        key_field_names = [
+            sync_context.key_to_field_id[key]
+            for key in sync_context.unique_primary_keys
+        ]
+        if len(key_field_names) == 1:
+            q = Q(**{f"{key_field_names[0]}__in": [key[0] for key in keys]})
+        else:
+            q = Q()
+            for key in keys:
+                q |= Q(**dict(zip(key_field_names, key)))
+
+        existing_rows = (
+            sync_context.model.objects.filter(q).order_by("-id")
+            # Only the primary values are fetched because the other values are only
+            # needed if the fingerprint of the row has changed.
+            .values_list("id", *key_field_names)
+        )
+        return {tuple(row[1:]): row[0] for row in existing_rows}
+
+    def _sync_rows_chunk(
+        self, sync_context: DataSyncTableSyncContext, rows_of_data_sync: Iterable
+    ):
+        """
+        Creates the data sync rows that don't exist in the synced table yet, and
+        updates the ones that have changed. The ids of all the rows that match a data
+        sync row are stored in the `synced_row_ids` of the context.
+
+        Rows of which the fingerprint is equal to the one stored during the previous
+        sync are skipped without fetching their values. Only the remaining rows are
+        compared value by value.
+
+        :param sync_context: The context of the running sync.
+        :param rows_of_data_sync: A chunk of the rows returned by `get_all_rows`.
+        """
+
+        data_sync = sync_context.data_sync
+        unique_primary_keys = sync_context.unique_primary_keys
+        rows_by_key = {
             tuple(row[key] for key in unique_primary_keys): row
-            for row in data_sync_type.get_all_rows(
-                data_sync,
-                progress_builder=progress.create_child_builder(
-                    represents_progress=56  # makes the total `66`
-                ),
+            for row in rows_of_data_sync
+        }
+        fingerprints_by_key = {
+            key: get_row_fingerprint(
+                [data[p.key] for p in sync_context.enabled_properties]
             )
+            for key, data in rows_by_key.items()
         }
+        existing_row_ids = self._get_existing_rows_for_keys(
+            sync_context, list(rows_by_key.keys())
+        )
+        stored_fingerprints = dict(
+            DataSyncRowFingerprint.objects.filter(
+                data_sync=data_sync, row_id__in=existing_row_ids.values()
+            ).values_list("row_id", "fingerprint")
+        )
 
-        rows_to_create = []
-        for new_id, data in rows_of_data_sync.items():
-            if new_id not in existing_rows_in_table:
-                rows_to_create.append(
-                    {
-                        f"field_{property.field_id}": data[property.key]
-                        for property in enabled_properties
-                    }
-                )
-        progress.increment(by=1)  # makes the total `67`
+        keys_to_create = []
+        keys_to_compare = {}
+        for key in rows_by_key.keys():
+            row_id = existing_row_ids.get(key)
+            if row_id is None:
+                keys_to_create.append(key)
+                continue
+
+            sync_context.synced_row_ids.add(row_id)
+            fingerprint = fingerprints_by_key[key]
+            if fingerprint is None or stored_fingerprints.get(row_id) != fingerprint:
+                keys_to_compare[row_id] = key
 
         rows_to_update = []
-        for existing_id, existing_record in existing_rows_in_table.items():
-            if existing_id in rows_of_data_sync:
-                new_record_data = rows_of_data_sync[existing_id]
+        if len(keys_to_compare) > 0:
+            existing_records = sync_context.model.objects.filter(
+                id__in=keys_to_compare.keys()
+            ).values("id", *sync_context.key_to_field_id.values())
+            for existing_record in existing_records:
+                data = rows_by_key[keys_to_compare[existing_record["id"]]]
                 changed = False
-                for enabled_property in enabled_properties:
+                for enabled_property in sync_context.enabled_properties:
                     key = enabled_property.key
-                    value = new_record_data[key]
-                    baserow_row_value = existing_record[key_to_field_id[key]]
-                    data_sync_property = key_to_property[key]
-                    if not data_sync_property.is_equal(baserow_row_value, value):
-                        existing_record[key_to_field_id[key]] = value
+                    field_name = sync_context.key_to_field_id[key]
+                    value = data[key]
+                    data_sync_property = sync_context.key_to_property[key]
+                    if not data_sync_property.is_equal(
+                        existing_record[field_name], value
+                    ):
+                        existing_record[field_name] = value
                         changed = True
                 if changed:
                     rows_to_update.append(existing_record)
-        progress.increment(by=2)  # makes the total `69`
-
-        row_ids_to_delete = []
-        for existing_id in existing_rows_in_table.keys():
-            if existing_id is None or existing_id not in rows_of_data_sync:
-                row_ids_to_delete.append(existing_rows_in_table[existing_id]["id"])
-        # Loop over the dangling rows and delete those because they can't be identified
-        # anymore.
-        for row in existing_rows_queryset:
-            if any(not row[key_to_field_id[key]] for key in unique_primary_keys):
-                row_ids_to_delete.append(row["id"])
-        progress.increment(by=1)  # makes the total `70`
-
-        created_rows = CreatedRowsData([], {}, [], None)
-        if len(rows_to_create) > 0:
+
+        new_fingerprints = {
+            row_id: fingerprints_by_key[key] for row_id, key in keys_to_compare.items()
+        }
+
+        if len(keys_to_create) > 0:
             created_rows = RowHandler().create_rows(
-                user=user,
+                user=sync_context.user,
                 table=data_sync.table,
-                model=model,
-                rows_values=rows_to_create,
+                model=sync_context.model,
+                rows_values=[
+                    {
+                        f"field_{property.field_id}": rows_by_key[key][property.key]
+                        for property in sync_context.enabled_properties
+                    }
+                    for key in keys_to_create
+                ],
                 generate_error_report=False,
                 send_realtime_update=False,
                 send_webhook_events=False,
                 skip_search_update=True,
                 signal_params={"skip_two_way_sync": True},
             )
-        progress.increment(by=10)  # makes the total `80`
+            created_row_ids = [row.id for row in created_rows.created_rows]
+            sync_context.synced_row_ids.update(created_row_ids)
+            sync_context.changed_row_ids.update(created_row_ids)
+            new_fingerprints.update(
+                {
+                    row_id: fingerprints_by_key[key]
+                    for row_id, key in zip(created_row_ids, keys_to_create)
+                }
+            )
 
         if len(rows_to_update) > 0:
             RowHandler().update_rows(
-                user=user,
+                user=sync_context.user,
                 table=data_sync.table,
                 rows_values=rows_to_update,
-                model=model,
+                model=sync_context.model,
                 send_realtime_update=False,
                 send_webhook_events=False,
                 skip_search_update=True,
                 signal_params={"skip_two_way_sync": True},
             )
-        progress.increment(by=10)  # makes the total `90`
+            sync_context.changed_row_ids.update(row["id"] for row in rows_to_update)
+
+        # The fingerprints are stored after the rows have been written, so that they
+        # always describe the values that are in the table.
+        DataSyncRowFingerprint.objects.bulk_create(
+            [
+                DataSyncRowFingerprint(
+                    data_sync=data_sync, row_id=row_id, fingerprint=fingerprint
+                )
+                for row_id, fingerprint in new_fingerprints.items()
+                if fingerprint is not None
+            ],
+            update_conflicts=True,
+            unique_fields=["data_sync", "row_id"],
+            update_fields=["fingerprint"],
+        )
 
-        if len(row_ids_to_delete) > 0:
-            RowHandler().delete_rows(
-                user=user,
-                table=data_sync.table,
-                row_ids=row_ids_to_delete,
-                model=model,
-                send_realtime_update=False,
-                send_webhook_events=False,
-                # The rows should not be trashed
-                permanently_delete=True,
-                signal_params={"skip_two_way_sync": True},
-            )
-        progress.increment(by=10)  # makes the total `100`
+    def _delete_rows_not_in_data_sync(
+        self,
+        sync_context: DataSyncTableSyncContext,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ):
+        """
+        Permanently deletes all the rows of the synced table that did not match a row
+        in the data sync. This includes the dangling rows having an empty unique
+        primary value because the primary was removed. The table is walked by id in
+        chunks, so that not all the row ids have to be fetched at once.
 
-        if (
-            len(rows_to_create) > 0
-            or len(rows_to_update) > 0
-            or len(row_ids_to_delete) > 0
-        ):
-            # No need to include this in the progress as it triggers a celery task
-            row_ids = [r["id"] for r in rows_to_update] + [
-                r.id for r in created_rows.created_rows
-            ]
-            SearchHandler.schedule_update_search_data(
-                data_sync.table,
-                fields=[p.field for p in enabled_properties],
-                row_ids=row_ids,
+        :param sync_context: The context of the running sync.
+        :param progress_builder: Optionally indicate the progress.
+        """
+
+        model = sync_context.model
+        chunk_size = settings.BASEROW_DATA_SYNC_CHUNK_SIZE
+        progress = ChildProgressBuilder.build(
+            progress_builder,
+            child_total=max(model.objects.count(), 1),
+        )
+
+        last_row_id = 0
+        while True:
+            row_ids = list(
+                model.objects.filter(id__gt=last_row_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:chunk_size]
             )
+            if len(row_ids) == 0:
+                break
+
+            last_row_id = row_ids[-1]
+            row_ids_to_delete = [
+                row_id
+                for row_id in row_ids
+                if row_id not in sync_context.synced_row_ids
+            ]
+            if len(row_ids_to_delete) > 0:
+                RowHandler().delete_rows(
+                    user=sync_context.user,
+                    table=sync_context.data_sync.table,
+                    row_ids=row_ids_to_delete,
+                    model=model,
+                    send_realtime_update=False,
+                    send_webhook_events=False,
+                    # The rows should not be trashed
+                    permanently_delete=True,
+                    signal_params={"skip_two_way_sync": True},
+                )
+            progress.increment(by=len(row_ids))
+
+        # Remove the fingerprints of rows that don't exist anymore, for example
+        # because they were deleted above or permanently deleted by a user. Trashed
+        # rows keep their fingerprint because they can still be restored.
+        DataSyncRowFingerprint.objects.filter(data_sync=sync_context.data_sync).exclude(
+            row_id__in=model.objects_and_trash.values("id")
+        ).delete()
 
     def set_data_sync_synced_properties(
         self,
@@ -621,6 +829,16 @@ class DataSyncHandler:
             if enabled_property.key not in synced_properties:
                 properties_to_be_removed.append(enabled_property)
 
+        # The stored row fingerprints are only valid for the fields that they were
+        # computed for. If any of them changes, the next sync must compare all the
+        # values again.
+        if (
+            properties_to_be_removed
+            or properties_to_be_added
+            or properties_to_be_updated
+        ):
+            DataSyncRowFingerprint.objects.filter(data_sync=data_sync).delete()
+
         handler = FieldHandler()
 
         for data_sync_property_instance in properties_to_be_removed:
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import advocate
 from advocate.exceptions import UnacceptableAddressException
@@ -80,7 +80,7 @@ class ICalCalendarDataSyncType(DataSyncType):
         self,
         instance,
         progress_builder: Optional[ChildProgressBuilder] = None,
-    ) -> List[Dict]:
+    ) -> Iterator[Dict]:
         # The progress bar is difficult to setup because there are only three steps
         # that must completed. We're therefore using working with a total of three
         # because it gives some sense of what's going on.
@@ -103,16 +103,12 @@ class ICalCalendarDataSyncType(DataSyncType):
             raise SyncError(f"Could not read calendar file: {str(e)}")
         progress.increment(by=1)  # makes the total `2`
 
-        events = [
-            {
-                "uid": str(component.get("uid")),
-                "dtstart": getattr(component.get("dtstart"), "dt", None),
-                "dtend": getattr(component.get("dtend"), "dt", None),
-                "summary": str(component.get("summary") or ""),
-            }
-            for component in calendar.walk()
-            if component.name == "VEVENT"
-        ]
+        for component in calendar.walk():
+            if component.name == "VEVENT":
+                yield {
+                    "uid": str(component.get("uid")),
+                    "dtstart": getattr(component.get("dtstart"), "dt", None),
+                    "dtend": getattr(component.get("dtend"), "dt", None),
+                    "summary": str(component.get("summary") or ""),
+                }
         progress.increment(by=1)  # makes the total `3`
-
-        return events
@@ -95,6 +95,28 @@ class DataSyncSyncedProperty(models.Model):
     )
 
 
+class DataSyncRowFingerprint(models.Model):
+    """
+    Holds a hash of the data sync values that were last written to a row in the synced
+    table. If the hash of the same row in the data sync is unchanged on the next sync,
+    then the row can be skipped without fetching and comparing all the cell values.
+    """
+
+    data_sync = models.ForeignKey(
+        DataSync, on_delete=models.CASCADE, related_name="row_fingerprints"
+    )
+    row_id = models.PositiveIntegerField(
+        help_text="The id of the row in the synced table."
+    )
+    fingerprint = models.CharField(
+        max_length=32,
+        help_text="The hash of the enabled property values of the data sync row.",
+    )
+
+    class Meta:
+        unique_together = [("data_sync", "row_id")]
+
+
 class SyncDataSyncTableJob(Job):
     data_sync = models.ForeignKey(
         DataSync,
@@ -1,5 +1,5 @@
 import contextlib
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from django.conf import settings
 from django.db import DEFAULT_DB_ALIAS
@@ -151,7 +151,16 @@ class PostgreSQLDataSyncType(DataSyncType):
     ]
 
     @contextlib.contextmanager
-    def _connection(self, instance):
+    def _connection(self, instance, cursor_name: Optional[str] = None):
+        """
+        Opens a connection to the PostgreSQL database of the data sync and yields a
+        cursor.
+
+        :param instance: The PostgreSQL data sync instance.
+        :param cursor_name: If provided, a named server side cursor is created, which
+            allows fetching the results of a query in chunks.
+        """
+
         cursor = None
         connection = None
 
@@ -177,7 +186,11 @@ class PostgreSQLDataSyncType(DataSyncType):
                 port=instance.postgresql_port,
                 sslmode=instance.postgresql_sslmode,
             )
-            cursor = connection.cursor()
+            cursor = (
+                connection.cursor(name=cursor_name)
+                if cursor_name
+                else connection.cursor()
+            )
             yield cursor
         except psycopg.Error as e:
             raise SyncError(str(e))
@@ -287,7 +300,7 @@ class PostgreSQLDataSyncType(DataSyncType):
         self,
         instance,
         progress_builder: Optional[ChildProgressBuilder] = None,
-    ) -> List[Dict]:
+    ) -> Iterator[Dict]:
         schema_name = f"{instance.postgresql_schema}"
         table_name = f"{instance.postgresql_table}"
         properties = self.get_properties(instance)
@@ -301,10 +314,15 @@ class PostgreSQLDataSyncType(DataSyncType):
             cursor.execute(count_query)
             count = cursor.fetchone()[0]
 
-            limit = settings.INITIAL_TABLE_DATA_LIMIT
-            if limit and count > settings.INITIAL_TABLE_DATA_LIMIT:
-                raise SyncError(f"The table can't contain more than {limit} records.")
+        limit = settings.INITIAL_TABLE_DATA_LIMIT
+        if limit and count > settings.INITIAL_TABLE_DATA_LIMIT:
+            raise SyncError(f"The table can't contain more than {limit} records.")
+
+        progress = ChildProgressBuilder.build(progress_builder, child_total=count)
 
+        # A server side cursor is used, so that the records can be fetched in chunks
+        # instead of loading the whole table into memory.
+        with self._connection(instance, cursor_name="baserow_data_sync") as cursor:
             select_query = sql.SQL("SELECT {} FROM {}.{} ORDER BY {}").format(
                 sql.SQL(", ").join(map(sql.Identifier, column_names)),
                 sql.Identifier(schema_name),
@@ -313,12 +331,14 @@ class PostgreSQLDataSyncType(DataSyncType):
             )
 
             cursor.execute(select_query)
-            records = cursor.fetchall()
-
-        return [
-            {
-                p.key: p.prepare_value(record[index])
-                for index, p in enumerate(properties)
-            }
-            for record in records
-        ]
+            while True:
+                records = cursor.fetchmany(settings.BASEROW_DATA_SYNC_CHUNK_SIZE)
+                if not records:
+                    break
+
+                for record in records:
+                    yield {
+                        p.key: p.prepare_value(record[index])
+                        for index, p in enumerate(properties)
+                    }
+                progress.increment(by=len(records))
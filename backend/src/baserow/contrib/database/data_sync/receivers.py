@@ -8,6 +8,7 @@ from baserow.contrib.database.rows.signals import (
     rows_updated,
 )
 
+from .models import DataSyncRowFingerprint
 from .tasks import (
     two_way_sync_row_created,
     two_way_sync_row_deleted,
@@ -84,6 +85,12 @@ def rows_updated_receiver(
     if not any_synced_property_updated:
         return
 
+    # The values of the rows don't match the fingerprints of the last sync anymore,
+    # so they must be compared value by value during the next sync.
+    DataSyncRowFingerprint.objects.filter(
+        data_sync_id=table.data_sync.id, row_id__in=[row.id for row in rows]
+    ).delete()
+
     transaction.on_commit(
         lambda: two_way_sync_row_updated.delay(
             serialized_rows=serialize_rows_for_response(rows, model),
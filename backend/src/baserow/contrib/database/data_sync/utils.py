@@ -1,6 +1,10 @@
+import hashlib
+import json
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
-from typing import List
+from typing import Any, List, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
 
 from baserow.contrib.database.fields.models import Field, SelectOption
 
@@ -31,6 +35,26 @@ def compare_date(date1, date2):
     return date1 == date2
 
 
+def get_row_fingerprint(values: List[Any]) -> Optional[str]:
+    """
+    Computes a hash of the provided data sync row values. It's used to detect if a
+    row has changed since the last sync without comparing every value.
+
+    :param values: The values of the enabled properties of one data sync row, always
+        in the same order.
+    :return: The hex encoded hash, or `None` if the values can't be serialized. In
+        that case, the row must always be compared value by value.
+    """
+
+    try:
+        serialized = json.dumps(
+            values, cls=DjangoJSONEncoder, sort_keys=True, separators=(",", ":")
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+
+
 @dataclass
 class SourceOption:
     id: int
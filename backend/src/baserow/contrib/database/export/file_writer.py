@@ -1,9 +1,9 @@
 import abc
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator, Tuple
 
 from django.core.paginator import Paginator
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
 
 import unicodecsv as csv
 
@@ -12,6 +12,8 @@ from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.filters import AdHocFilters
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import estimate_queryset_count
+from baserow.core.utils import grouper
 
 
 class FileWriter(abc.ABC):
@@ -154,6 +156,121 @@ class PaginatedExportJobFileWriter(FileWriter):
                 self.job.save()
 
 
+class StreamingExportJobFileWriter(PaginatedExportJobFileWriter):
+    """
+    Writes querysets to files without ever counting or offsetting them. Querysets
+    that are ordered by the default `order, id` ordering of a table are walked using
+    keyset pagination, any other ordering is streamed through a server side cursor.
+    In both cases the time needed per page and the memory usage stay constant no
+    matter how far into the queryset we are. Because the exact number of rows is
+    unknown upfront, the progress is computed using the row estimate of the query
+    planner.
+    """
+
+    CHUNK_SIZE = 2000
+    KEYSET_ORDERING = ("order", "id")
+
+    def write_rows(self, queryset, write_row, progress_weight=100):
+        """
+        Writes the queryset to the file using the provided write_row callback. Will
+        check if the job has been cancelled every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS
+        and raise a ExportJobCanceledException if that's the case.
+
+        :param queryset: The queryset to write to the file.
+        :param write_row: A callable function which takes each row from the queryset in
+            turn and writes to the file.
+        :param progress_weight: Indicates how much of the progress should count for
+            writing the rows in total.
+        """
+
+        self.update_check()
+        queryset = queryset.all()
+        estimated_count = estimate_queryset_count(queryset)
+
+        if self._can_use_keyset_pagination(queryset):
+            rows = self._iterate_by_keyset(queryset)
+        else:
+            rows = self._iterate_with_server_side_cursor(queryset)
+
+        i = 0
+        results = []
+        for row, is_last_row in self._iterate_with_last_row_flag(rows):
+            i = i + 1
+            result = write_row(row, is_last_row)
+            if result is not None:
+                results.append(result)
+            # The estimate can be off in both directions, so we make sure that the
+            # total only equals the current row when the last row has been written.
+            total_rows = i if is_last_row else max(estimated_count, i + 1)
+            self._check_and_update_job(i, total_rows, progress_weight)
+        return results
+
+    def _can_use_keyset_pagination(self, queryset: QuerySet) -> bool:
+        """
+        Keyset pagination is only possible if the queryset is ordered by the unique
+        `order, id` combination, either explicitly or via the model default ordering.
+        """
+
+        order_by = tuple(str(o) for o in queryset.query.order_by)
+        if not order_by and queryset.query.default_ordering:
+            order_by = tuple(queryset.model._meta.ordering)
+        return order_by == self.KEYSET_ORDERING
+
+    def _iterate_by_keyset(self, queryset: QuerySet) -> Iterator[Any]:
+        """
+        Yields all the rows of the queryset in chunks of CHUNK_SIZE by filtering on
+        the `order, id` values of the last row of the previous chunk.
+        """
+
+        page = queryset
+        while True:
+            rows = list(page[: self.CHUNK_SIZE])
+            yield from rows
+            if len(rows) < self.CHUNK_SIZE:
+                break
+            last = rows[-1]
+            page = queryset.filter(
+                Q(order__gt=last.order) | Q(order=last.order, id__gt=last.id)
+            )
+
+    def _iterate_with_server_side_cursor(self, queryset: QuerySet) -> Iterator[Any]:
+        """
+        Yields all the rows of the queryset using a server side cursor. The multi
+        field prefetches of the queryset are only applied when its results are
+        fetched all at once, so they're applied to every chunk of CHUNK_SIZE rows
+        here instead.
+        """
+
+        rows = queryset.iterator(chunk_size=self.CHUNK_SIZE)
+        multi_field_prefetches = getattr(
+            queryset, "get_multi_field_prefetches", lambda: []
+        )()
+        for chunk in grouper(self.CHUNK_SIZE, rows):
+            chunk = list(chunk)
+            for prefetch in multi_field_prefetches:
+                prefetch(queryset, chunk)
+            yield from chunk
+
+    @staticmethod
+    def _iterate_with_last_row_flag(
+        rows: Iterable[Any],
+    ) -> Iterator[Tuple[Any, bool]]:
+        """
+        Yields every row together with a boolean indicating whether it's the last one
+        by looking one row ahead.
+        """
+
+        iterator = iter(rows)
+        try:
+            previous = next(iterator)
+        except StopIteration:
+            return
+        for row in iterator:
+            yield previous, False
+            previous = row
+        yield previous, True
+
+
 class QuerysetSerializer(abc.ABC):
     """
     A class knows how to serialize a given queryset and the fields of said queryset to
@@ -36,7 +36,7 @@ from .exceptions import (
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
-from .file_writer import PaginatedExportJobFileWriter
+from .file_writer import StreamingExportJobFileWriter
 from .registries import TableExporter, table_exporter_registry
 from .utils import view_is_publicly_exportable
 
@@ -378,7 +378,7 @@ def _open_file_and_run_export(job: ExportJob) -> ExportJob:
             )
 
         serializer.write_to_file(
-            PaginatedExportJobFileWriter(file, job), **job.export_options
+            StreamingExportJobFileWriter(file, job), **job.export_options
         )
 
     return job
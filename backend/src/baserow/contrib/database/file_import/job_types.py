@@ -1,7 +1,8 @@
-import json
+from tempfile import SpooledTemporaryFile
 from typing import Any
 
-from django.core.files.base import ContentFile
+from django.conf import settings
+from django.core.files.base import File
 from django.db import transaction
 
 from rest_framework import serializers
@@ -30,7 +31,6 @@ from baserow.contrib.database.fields.exceptions import (
 )
 from baserow.contrib.database.rows.actions import ImportRowsActionType
 from baserow.contrib.database.rows.exceptions import ReportMaxErrorCountExceeded
-from baserow.contrib.database.rows.types import FileImportDict
 from baserow.contrib.database.table.actions import CreateTableActionType
 from baserow.contrib.database.table.exceptions import (
     InitialTableDataDuplicateName,
@@ -42,6 +42,7 @@ from baserow.core.jobs.registries import JobType
 
 from .models import FileImportJob
 from .serializers import ReportSerializer
+from .utils import read_import_data_file, write_import_data_file
 
 BATCH_SIZE = 1024
 
@@ -105,16 +106,17 @@ class FileImportJobType(JobType):
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. The rows are written one per
+        line, so that they can be imported without loading the whole file in memory.
         """
 
-        data_file = ContentFile(
-            json.dumps(
-                {"data": values["data"], "configuration": values.get("configuration")},
-                ensure_ascii=False,
-            ).encode("utf8")
-        )
-        job.data_file.save(None, data_file)
+        max_size = settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+        with SpooledTemporaryFile(max_size=max_size) as data_file:
+            write_import_data_file(
+                data_file, values["data"], configuration=values.get("configuration")
+            )
+            data_file.seek(0)
+            job.data_file.save(None, File(data_file))
 
     def before_delete(self, job):
         """
@@ -163,35 +165,40 @@ class FileImportJobType(JobType):
     def run(self, job, progress):
         """
         Fills the provided table with the normalized data that needs to be created upon
-        creation of the table.
+        creation of the table. When importing into an existing table, the rows are
+        streamed from the data file chunk by chunk.
         """
 
-        with job.data_file.open("r") as fin:
-            data: FileImportDict = json.load(fin)
         try:
-            if job.table is None:
-                new_table, error_report = action_type_registry.get_by_type(
-                    CreateTableActionType
-                ).do(
-                    job.user,
-                    job.database,
-                    name=job.name,
-                    data=data["data"],
-                    first_row_header=job.first_row_header,
-                    progress=progress,
-                )
-
-                job.table = new_table
-                job.save(update_fields=("table",))
-            else:
-                _, error_report = action_type_registry.get_by_type(
-                    ImportRowsActionType
-                ).do(
-                    job.user,
-                    table=job.table,
-                    data=data,
-                    progress=progress,
-                )
+            with job.data_file.open("r") as fin:
+                configuration, row_count, rows = read_import_data_file(fin)
+                if job.table is None:
+                    new_table, error_report = action_type_registry.get_by_type(
+                        CreateTableActionType
+                    ).do(
+                        job.user,
+                        job.database,
+                        name=job.name,
+                        data=list(rows) if rows is not None else None,
+                        first_row_header=job.first_row_header,
+                        progress=progress,
+                    )
+
+                    job.table = new_table
+                    job.save(update_fields=("table",))
+                else:
+                    _, error_report = action_type_registry.get_by_type(
+                        ImportRowsActionType
+                    ).do(
+                        job.user,
+                        table=job.table,
+                        data={
+                            "data": rows,
+                            "configuration": configuration,
+                            "row_count": row_count,
+                        },
+                        progress=progress,
+                    )
         # when a job handler fails, celery worker will not commit and `after_commit`
         # won't be called. That's why we need to catch this specific error and
         # perform a bit of cleanup on the job.
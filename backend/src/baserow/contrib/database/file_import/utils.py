@@ -0,0 +1,78 @@
+import json
+from typing import IO, Any, Iterable, Iterator, Optional, Tuple
+
+from baserow.contrib.database.rows.types import FileImportConfiguration
+
+
+def write_import_data_file(
+    fout: IO[bytes],
+    data: Optional[Iterable[list[Any]]],
+    configuration: Optional[FileImportConfiguration] = None,
+    row_count: Optional[int] = None,
+):
+    """
+    Writes the data of a file import in the JSON lines format. The first line
+    contains the configuration and the number of rows, and every following line
+    contains a single row. That allows the rows to be read back one by one with
+    `read_import_data_file`, instead of parsing the whole file at once.
+
+    :param fout: The binary file object where the data must be written.
+    :param data: The rows of the import, or None if there is no data, in which case
+        only the header is written.
+    :param configuration: The optional import configuration.
+    :param row_count: The number of rows in the data. Must be provided if the data
+        has no length.
+    """
+
+    if row_count is None and data is not None:
+        row_count = len(data)
+
+    header = {"configuration": configuration, "row_count": row_count}
+    fout.write(json.dumps(header, ensure_ascii=False).encode("utf8"))
+    fout.write(b"\n")
+    for row in data or []:
+        fout.write(json.dumps(row, ensure_ascii=False).encode("utf8"))
+        fout.write(b"\n")
+
+
+def read_import_data_file(
+    fin: IO[str],
+) -> Tuple[
+    Optional[FileImportConfiguration], Optional[int], Optional[Iterator[list[Any]]]
+]:
+    """
+    Reads a data file written by `write_import_data_file`. The rows are lazily read
+    from the file, so the file must stay open while they're consumed. Data files in
+    the previous format, where the whole import is a single JSON object, are still
+    supported, but are fully loaded in memory.
+
+    :param fin: The text file object to read the data from.
+    :return: The configuration, the number of rows and an iterator of the rows. The
+        number of rows and the rows are None if the import has no data.
+    """
+
+    try:
+        header = json.loads(fin.readline())
+    except ValueError:
+        header = None
+
+    if not isinstance(header, dict) or "row_count" not in header:
+        fin.seek(0)
+        legacy_data = json.load(fin)
+        rows = legacy_data.get("data")
+        if rows is None:
+            return legacy_data.get("configuration"), None, None
+        return legacy_data.get("configuration"), len(rows), iter(rows)
+
+    if header["row_count"] is None:
+        return header.get("configuration"), None, None
+
+    return header.get("configuration"), header["row_count"], _read_rows(fin)
+
+
+def _read_rows(fin: IO[str]) -> Iterator[list[Any]]:
+    # The lines are read with `readline` because iterating over a Django `File`
+    # seeks back to the start of the file, which would yield the header again.
+    for line in iter(fin.readline, fin.read(0)):
+        if line.strip():
+            yield json.loads(line)
@@ -0,0 +1,36 @@
+import asyncio
+import signal
+
+from django.core.management.base import BaseCommand
+
+from baserow.contrib.database.webhooks.delivery import WebhookDeliveryWorker
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs the async worker that delivers the webhook calls when "
+        "BASEROW_WEBHOOKS_DELIVERY_WORKER_ENABLED is set. It stops gracefully, after "
+        "completing the calls in flight, when receiving SIGINT or SIGTERM."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help="The maximum number of calls delivered concurrently by this worker. "
+            "Defaults to BASEROW_WEBHOOKS_DELIVERY_WORKER_CONCURRENCY.",
+        )
+
+    def handle(self, *args, **options):
+        asyncio.run(self.run_worker(options["concurrency"]))
+
+    async def run_worker(self, concurrency):
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, stop_event.set)
+
+        self.stdout.write("Webhook delivery worker started.")
+        await WebhookDeliveryWorker(max_concurrency=concurrency).run(stop_event)
+        self.stdout.write("Webhook delivery worker stopped.")
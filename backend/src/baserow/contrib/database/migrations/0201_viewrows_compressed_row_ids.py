@@ -0,0 +1,47 @@
+from django.db import migrations, models
+
+from baserow.contrib.database.views.row_id_set import CompactRowIdSet
+
+
+def forward(apps, schema_editor):
+    ViewRows = apps.get_model("database", "ViewRows")
+
+    for view_rows in ViewRows.objects.all().iterator(chunk_size=100):
+        view_rows.compressed_row_ids = CompactRowIdSet.from_ids(
+            view_rows.row_ids
+        ).to_bytes()
+        view_rows.save(update_fields=["compressed_row_ids"])
+
+
+def reverse(apps, schema_editor):
+    ViewRows = apps.get_model("database", "ViewRows")
+
+    for view_rows in ViewRows.objects.all().iterator(chunk_size=100):
+        view_rows.row_ids = list(
+            CompactRowIdSet.from_bytes(view_rows.compressed_row_ids)
+        )
+        view_rows.save(update_fields=["row_ids"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0200_fix_to_timestamptz_formula"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="viewrows",
+            name="compressed_row_ids",
+            field=models.BinaryField(
+                default=bytes,
+                help_text="The rows that are shown in the view, encoded as a "
+                "`CompactRowIdSet`. This set can be used by webhooks to determine "
+                "which rows have been changed since the last check.",
+            ),
+        ),
+        migrations.RunPython(forward, reverse),
+        migrations.RemoveField(
+            model_name="viewrows",
+            name="row_ids",
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.0.14 on 2026-10-16 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0201_viewrows_compressed_row_ids"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataSyncRowFingerprint",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "row_id",
+                    models.PositiveIntegerField(
+                        help_text="The id of the row in the synced table."
+                    ),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        help_text="The hash of the enabled property values of the "
+                        "data sync row.",
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "data_sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="row_fingerprints",
+                        to="database.datasync",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("data_sync", "row_id")},
+            },
+        ),
+    ]
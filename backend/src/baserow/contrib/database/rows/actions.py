@@ -329,7 +329,7 @@ class ImportRowsActionType(UndoableActionType):
         table: Table,
         data: FileImportDict,
         progress: Optional[Progress] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
+    ) -> Tuple[List[int], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
         belongs to the related workspace. It also calls the table_updated signal.
@@ -337,14 +337,15 @@ class ImportRowsActionType(UndoableActionType):
         it generates an import error report and allow to track the progress.
         Undoing this action trashes the rows and redoing restores them all.
         The new rows are appended to the existing rows.
-        See the baserow.contrib.database.rows.handler.RowHandler.import_rows
+        See the baserow.contrib.database.rows.handler.RowHandler.import_rows_in_chunks
         for more information.
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be imported.
-        :param data: List of rows values for rows that need to be created.
+        :param data: The rows values for rows that need to be created. The rows can
+            be any iterable, as long as the `row_count` is provided.
         :param progress: An optional progress object to track the task progress.
-        :return: The created list of rows instances and the error report.
+        :return: The ids of the created rows and the error report.
         """
 
         if table.is_read_only_data_synced_table:
@@ -352,12 +353,13 @@ class ImportRowsActionType(UndoableActionType):
                 "Can't create rows because it has a data sync."
             )
 
-        created_rows, error_report = RowHandler().import_rows(
+        created_row_ids, error_report = RowHandler().import_rows_in_chunks(
             user,
             table,
             data=data["data"],
             configuration=data.get("configuration") or {},
             progress=progress,
+            row_count=data.get("row_count"),
         )
         if error_report:
             logger.warning(f"Errors during rows import: {error_report}")
@@ -367,13 +369,13 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            created_row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
         )
 
-        return created_rows, error_report
+        return created_row_ids, error_report
 
     @classmethod
     def scope(cls, table_id) -> ActionScopeStr:
@@ -2,7 +2,7 @@ from collections import defaultdict
 from copy import deepcopy
 from decimal import Decimal
 from functools import cached_property
-from itertools import chain
+from itertools import chain, zip_longest
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -43,6 +43,7 @@ from baserow.contrib.database.fields.exceptions import (
     IncompatibleField,
 )
 from baserow.contrib.database.fields.field_cache import FieldCache
+from baserow.contrib.database.fields.fields import IntegerFieldWithSequence, SerialField
 from baserow.contrib.database.fields.operations import WriteFieldValuesOperationType
 from baserow.contrib.database.fields.registries import FieldType, field_type_registry
 from baserow.contrib.database.fields.utils import get_field_id_from_field_key
@@ -63,8 +64,11 @@ from baserow.contrib.database.table.operations import (
 from baserow.contrib.database.table.signals import table_updated
 from baserow.contrib.database.trash.models import TrashedRows
 from baserow.core.db import (
+    bulk_insert_with_copy,
+    copy_rows_into_table,
     get_highest_order_of_queryset,
     get_unique_orders_before_item,
+    rebalance_orders_before_item,
     recalculate_full_orders,
 )
 from baserow.core.exceptions import CannotCalculateIntermediateOrder, PermissionDenied
@@ -89,6 +93,7 @@ from .signals import (
     before_rows_create,
     before_rows_delete,
     before_rows_update,
+    row_orders_rebalanced,
     row_orders_recalculated,
     rows_created,
     rows_deleted,
@@ -425,8 +430,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         provided `before_row` or at the end of the table, depending on whether the
         `before_row` value is provided.
 
-        Note that this method can trigger an update of all the rows in the table in
-        the event all the orders must be recalculated.
+        Note that this method can trigger an update of the rows directly before the
+        `before_row` if there is no room left for the new orders, or even of all the
+        rows in the table in the event all the orders must be recalculated.
 
         :param before_row: The row instance where the before orders must be
             calculated for. If `None`, then it's assumed that the orders are for
@@ -447,9 +453,20 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             except CannotCalculateIntermediateOrder:
                 # If the `find_intermediate_order` fails with a
                 # `CannotCalculateIntermediateOrder`, it means that it's not possible
-                # calculate an intermediate fraction. Therefore, must reset all the
-                # orders of the table (while respecting their original order),
-                # so that we can then can find the fraction any many more after.
+                # calculate an intermediate fraction. We first try to make room by
+                # only spreading the orders of the rows directly before the
+                # `before_row`, which doesn't change the order of any other row.
+                pass
+
+            try:
+                self.rebalance_row_orders_before(model.baserow_table, before_row, model)
+                return get_unique_orders_before_item(
+                    before_row, queryset, amount=amount
+                )
+            except CannotCalculateIntermediateOrder:
+                # If that still isn't enough, we must reset all the orders of the
+                # table (while respecting their original order), so that we can then
+                # can find the fraction any many more after.
                 self.recalculate_row_orders(model.baserow_table, model)
                 # Refresh the row element as its order might have changed
                 before_row.refresh_from_db()
@@ -875,7 +892,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         from baserow.contrib.database.views.handler import ViewHandler
 
-        ViewHandler().field_value_updated(fields + dependant_fields)
+        ViewHandler().field_value_updated(
+            fields + dependant_fields, incremental_fields=fields
+        )
         SearchHandler.schedule_update_search_data(
             table, row_ids=[instance.id] + cascade_update.row_ids
         )
@@ -901,6 +920,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             m2m_change_tracker=m2m_change_tracker,
             fields=fields,
             dependant_fields=dependant_fields,
+            cascade_update=cascade_update,
             before_return=before_return,
         )
 
@@ -1088,7 +1108,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         from baserow.contrib.database.views.handler import ViewHandler
 
-        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        ViewHandler().field_value_updated(
+            updated_fields + dependant_fields, incremental_fields=updated_fields
+        )
         SearchHandler.schedule_update_search_data(
             table,
             fields=[f for f in updated_fields if f.id in updated_field_ids],
@@ -1190,6 +1212,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         generate_error_report: bool = False,
         skip_search_update: bool = False,
         signal_params: Optional[Dict] = None,
+        use_copy: bool = False,
     ) -> CreatedRowsData:
         """
         Creates new rows for a given table without checking permissions. It also calls
@@ -1211,6 +1234,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             cells update later on after many create_rows calls then set this to True
             but make sure you trigger it eventually.
         :param signal_params: Additional parameters that are added to the signal.
+        :param use_copy: If True, the rows are inserted with `COPY` instead of
+            `INSERT` when possible, which is a lot faster for many rows.
         :return: The created row instances.
 
         """
@@ -1280,7 +1305,12 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         try:
             with transaction.atomic():
-                inserted_rows = model.objects.bulk_create(rows)
+                if use_copy and self._can_insert_rows_with_copy(
+                    model, rows_relationships
+                ):
+                    inserted_rows = bulk_insert_with_copy(model, rows)
+                else:
+                    inserted_rows = model.objects.bulk_create(rows)
         except Exception as exc:
             inserted_rows = []
             if is_unique_violation_error(exc):
@@ -1329,7 +1359,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         updated_fields = [o["field"] for o in model._field_objects.values()]
         updated_field_ids = [f.id for f in updated_fields]
 
-        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        ViewHandler().field_value_updated(
+            updated_fields + dependant_fields, incremental_fields=updated_fields
+        )
         if not skip_search_update:
             SearchHandler.schedule_update_search_data(
                 table,
@@ -1384,6 +1416,29 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             rows_to_return, report, updated_field_ids, cascade_updated
         )
 
+    def _can_insert_rows_with_copy(
+        self,
+        model: Type[GeneratedTableModel],
+        rows_relationships: List[Tuple[GeneratedTableModel, Dict[str, Any]]],
+    ) -> bool:
+        """
+        Checks if the rows can be inserted with `COPY`. That's not the case if they
+        have many to many relationships, or if a value must be computed by the
+        database during the insert, like the next value of a sequence.
+
+        :param model: The model of the rows.
+        :param rows_relationships: The rows to insert with their relationships.
+        :return: True if the rows can be inserted with `COPY`.
+        """
+
+        if any(relations for _, relations in rows_relationships):
+            return False
+
+        return not any(
+            isinstance(field, (SerialField, IntegerFieldWithSequence))
+            for field in model._meta.concrete_fields
+        )
+
     def create_rows(
         self,
         user: AbstractUser,
@@ -1572,6 +1627,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         table: Table,
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Validates rows by batch and generates an error report.
@@ -1580,6 +1636,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param table: The table for which the rows should be created.
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
+        :param model: Optional model to prevent recomputing table model.
         :return: The error report.
         """
 
@@ -1595,7 +1652,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(state=ROW_IMPORT_VALIDATION)
 
-        model = table.get_model()
+        if model is None:
+            model = table.get_model()
         # Use serializer to validate incoming data
         validation_serializer = get_row_serializer_class(model)
         report = {}
@@ -1686,7 +1744,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         user: AbstractUser,
         table: Table,
         rows_values: List[Dict[str, Any]],
-        progress: Progress,
+        progress: Optional[Progress] = None,
         model: Optional[Type[GeneratedTableModel]] = None,
         signal_params: Optional[Dict] = None,
     ) -> Tuple[List[Dict[str, Any] | None], Dict[str, Dict[str, Any]]]:
@@ -1709,7 +1767,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if signal_params is None:
             signal_params = {}
 
-        progress.increment(state=ROW_IMPORT_CREATION)
+        if progress:
+            progress.increment(state=ROW_IMPORT_CREATION)
 
         if model is None:
             model = table.get_model()
@@ -1765,7 +1824,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         send_realtime_update parameter. The data are validated before the
         creation if validate is True. when a row fails to import, it doesn't
         stop the import. Instead an error report is created with the raised
-        error for each field of each failing rows.
+        error for each field of each failing rows. See `import_rows_in_chunks`
+        to import a large amount of rows without returning them.
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be created.
@@ -1782,6 +1842,58 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :return: The created row instances and the error report.
         """
 
+        created_row_ids, error_report = self.import_rows_in_chunks(
+            user,
+            table,
+            data,
+            configuration=configuration,
+            validate=validate,
+            progress=progress,
+            send_realtime_update=send_realtime_update,
+        )
+        created_rows = list(
+            table.get_model().objects.filter(id__in=created_row_ids).order_by("id")
+        )
+        return created_rows, error_report
+
+    def import_rows_in_chunks(
+        self,
+        user: AbstractUser,
+        table: Table,
+        data: Iterable[list[Any]],
+        configuration: FileImportConfiguration | None = None,
+        validate: bool = True,
+        progress: Optional[Progress] = None,
+        send_realtime_update: bool = True,
+        row_count: Optional[int] = None,
+    ) -> Tuple[List[int], Dict[int, Dict[str, Any]]]:
+        """
+        Imports the rows of the provided data chunk by chunk. Every chunk is reshaped,
+        validated and inserted before the next one is read from the data, which can
+        be any iterable like a generator reading the rows from a file, so that the
+        memory usage doesn't depend on the number of imported rows. New rows are
+        inserted with `COPY` when possible. A row that fails to import doesn't stop
+        the import, but only the errors are kept in the report and the import is
+        aborted if there are more than `BASEROW_MAX_ROW_REPORT_ERROR_COUNT`.
+
+        :param user: The user of whose behalf the rows are created.
+        :param table: The table for which the rows should be created.
+        :param data: An iterable of rows values for rows that need to be created.
+        :param configuration: Optional import configuration dict.
+        :param validate: If True the data are validated before the import.
+        :param progress: Give a progress instance to track the progress of the
+            import.
+        :param send_realtime_update: Indicates whether a table_updated signal should
+            be sent once all the rows have been imported.
+        :param row_count: The number of rows in the data, used to track the
+            progress. Must be provided if the data has no length.
+
+        :raises InvalidRowLength:
+        :raises ReportMaxErrorCountExceeded: If too many rows fail to import.
+
+        :return: The ids of the created rows and the error report.
+        """
+
         workspace = table.database.workspace
         CoreHandler().check_permissions(
             user,
@@ -1791,7 +1903,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         )
         model = table.get_model()
 
-        error_report = RowErrorReport(data)
+        if row_count is None:
+            row_count = len(data)
+
+        error_report = RowErrorReport()
         configuration = configuration or {}
         update_handler = UpsertRowsMappingHandler(
             table=table,
@@ -1820,135 +1935,129 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         # Sort by primary first (descending), then by order, then by id
         fields.sort(key=lambda f: (not f.primary, f.order, f.id))
-
-        for index, row in enumerate(data):
-            # Check row length
-            if len(row) > len(fields):
-                error_report.add_error(
-                    index,
-                    {"non_field_errors": ["Too many values in this line."]},
-                )
-            else:
-                new_row = list(row)
-                # Fill incomplete rows with empty values
-                new_row.extend([None] * (len(fields) - len(row)))
-
-                # Reshape data by field as expected by the import
-                error_report.update_row(
-                    index,
-                    {
-                        f"field_{fields[index].id}": value
-                        for index, value in enumerate(new_row)
-                    },
-                )
-
-        # STEP 1: pre-validate data with serializer
-        if validate:
-            (
-                valid_rows,
-                original_row_index_mapping,
-            ) = error_report.get_valid_rows_and_mapping()
-
-            validation_sub_progress = (
-                progress.create_child(50, len(valid_rows)) if progress else None
-            )
-
-            validation_report = self.validate_rows(
-                table, valid_rows, progress=validation_sub_progress
-            )
-
-            for index, error in validation_report.items():
-                error_report.add_error(original_row_index_mapping[int(index)], error)
-
-        (
-            valid_rows,
-            original_row_index_mapping,
-        ) = error_report.get_valid_rows_and_mapping()
-
-        # STEP 2: create rows in DB
-        creation_sub_progress = (
-            progress.create_child(50 if validate else 100, len(valid_rows))
-            if progress
-            else None
-        )
+        field_names = [f"field_{field.id}" for field in fields]
 
         # Make sure to exclude fields that cannot be written by the user.
-        # NOTE: all rows contain the same fields, so we can just check the first one
+        # NOTE: all rows contain the same fields, so we can check them only once.
         unwritable_fields = self._check_write_fields_values_permissions(
-            user, model, valid_rows[:1], raise_if_not_permitted=False
+            user,
+            model,
+            [dict.fromkeys(field_names)],
+            raise_if_not_permitted=False,
         )
         unwritable_field_names = set(f.db_column for f in unwritable_fields)
-        valid_rows = [
-            {k: v for k, v in row.items() if k not in unwritable_field_names}
-            for row in valid_rows
-        ]
+        skipped_field_names = {field.db_column for field in skipped_fields}
 
-        # split rows to insert and update lists. If there's no upsert field selected,
-        # this will not populate rows_values_to_update.
+        # Maps the index of the imported rows to the id of the row they must update.
+        # If there's no upsert field selected, all the rows are created.
         update_map = update_handler.process_map
 
-        rows_values_to_create = []
-        rows_values_to_update = []
-        if update_map:
-            skipped_field_names = set()
-
-            if skipped_fields:
-                skipped_field_names = {field.db_column for field in skipped_fields}
+        validation_sub_progress, creation_sub_progress = None, None
+        if progress:
+            if validate:
+                validation_sub_progress = progress.create_child(50, row_count)
+            creation_sub_progress = progress.create_child(
+                50 if validate else 100, row_count
+            )
 
-            for current_idx, import_idx in original_row_index_mapping.items():
-                row = valid_rows[current_idx]
-                if update_idx := update_map.get(import_idx):
+        created_row_ids = []
+        for chunk_index, chunk in enumerate(grouper(BATCH_SIZE, data)):
+            row_start_index = chunk_index * BATCH_SIZE
+
+            # STEP 1: reshape the rows and pre-validate them with the serializer
+            chunk_rows = {}
+            for index, row in enumerate(chunk, start=row_start_index):
+                if len(row) > len(fields):
+                    error_report.add_error(
+                        index,
+                        {"non_field_errors": ["Too many values in this line."]},
+                    )
+                else:
+                    # Fill incomplete rows with empty values and reshape the data by
+                    # field as expected by the import.
+                    chunk_rows[index] = dict(zip_longest(field_names, row))
+
+            if validate:
+                validation_report = self.validate_rows(
+                    table,
+                    list(chunk_rows.values()),
+                    progress=validation_sub_progress,
+                    model=model,
+                )
+                chunk_indexes = list(chunk_rows.keys())
+                for index, error in validation_report.items():
+                    error_report.add_error(chunk_indexes[int(index)], error)
+                # The rows with too many values are not validated.
+                not_validated_count = len(chunk) - len(chunk_rows)
+                if validation_sub_progress and not_validated_count:
+                    validation_sub_progress.increment(not_validated_count)
+
+            # STEP 2: split the valid rows to insert and update lists and write them
+            rows_values_to_create, create_indexes = [], []
+            rows_values_to_update, update_indexes = [], []
+            for index, row in chunk_rows.items():
+                if error_report.has_error(index):
+                    continue
+
+                row = {k: v for k, v in row.items() if k not in unwritable_field_names}
+                if update_id := update_map.get(index):
                     # For upsert operations, filter out skipped fields that were
                     # explicitly marked to be ignored during import. This ensures
                     # that existing values in those fields are preserved in the
                     # database rather than being overwritten.
-                    filtered_row = {
-                        k: v for k, v in row.items() if k not in skipped_field_names
-                    }
-                    filtered_row["id"] = update_idx
-                    rows_values_to_update.append(filtered_row)
+                    row = {k: v for k, v in row.items() if k not in skipped_field_names}
+                    row["id"] = update_id
+                    rows_values_to_update.append(row)
+                    update_indexes.append(index)
                 else:
                     rows_values_to_create.append(row)
-        else:
-            rows_values_to_create = valid_rows
-
-        created_rows, creation_report = self.force_create_rows_by_batch(
-            user,
-            table,
-            rows_values_to_create,
-            progress=creation_sub_progress,
-            model=model,
-        )
+                    create_indexes.append(index)
+
+            if creation_sub_progress:
+                creation_sub_progress.increment(by=0, state=ROW_IMPORT_CREATION)
+
+            if rows_values_to_create:
+                created_rows, creation_report, _, _ = self.force_create_rows(
+                    user=user,
+                    table=table,
+                    model=model,
+                    rows_values=rows_values_to_create,
+                    generate_error_report=True,
+                    send_realtime_update=False,
+                    send_webhook_events=False,
+                    # Don't trigger loads of search updates for every chunk of rows
+                    # we create but instead a single one for all the rows at the end.
+                    skip_search_update=True,
+                    use_copy=True,
+                )
+                created_row_ids.extend(row.id for row in created_rows)
+                for index, error in creation_report.items():
+                    error_report.add_error(
+                        create_indexes[int(index)], prepare_field_errors(error)
+                    )
 
-        if rows_values_to_update:
-            updated_rows, updated_report = self.force_update_rows_by_batch(
-                user,
-                table,
-                rows_values_to_update,
-                progress=creation_sub_progress,
-                model=model,
-            )
+            if rows_values_to_update:
+                _, update_report = self.force_update_rows_by_batch(
+                    user,
+                    table,
+                    rows_values_to_update,
+                    model=model,
+                )
+                for index, error in update_report.items():
+                    error_report.add_error(update_indexes[int(index)], error)
 
-        # Add errors to global report
-        for index, error in creation_report.items():
-            error_report.add_error(
-                original_row_index_mapping[int(index)],
-                error,
-            )
+            if creation_sub_progress:
+                creation_sub_progress.increment(len(chunk))
 
-        if rows_values_to_update:
-            for index, error in updated_report.items():
-                error_report.add_error(
-                    original_row_index_mapping[int(index)],
-                    error,
-                )
+        if created_row_ids:
+            SearchHandler.schedule_update_search_data(table, row_ids=created_row_ids)
 
         if send_realtime_update:
             # Just send a single table_updated here as realtime update instead
             # of rows_created because we might import a lot of rows.
             table_updated.send(self, table=table, user=user, force_table_refresh=True)
 
-        return created_rows, error_report.to_dict()
+        return created_row_ids, error_report.to_dict()
 
     def get_fields_metadata_for_row_history(
         self,
@@ -2342,7 +2451,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         from baserow.contrib.database.views.handler import ViewHandler
 
-        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        ViewHandler().field_value_updated(
+            updated_fields + dependant_fields, incremental_fields=updated_fields
+        )
         if not skip_search_update:
             SearchHandler.schedule_update_search_data(
                 table,
@@ -2615,7 +2726,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         from baserow.contrib.database.views.handler import ViewHandler
 
-        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        ViewHandler().field_value_updated(
+            updated_fields + dependant_fields, incremental_fields=updated_fields
+        )
 
         rows_updated.send(
             self,
@@ -2722,7 +2835,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         from baserow.contrib.database.views.handler import ViewHandler
 
-        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        ViewHandler().field_value_updated(
+            updated_fields + dependant_fields, incremental_fields=updated_fields
+        )
 
         rows_deleted.send(
             self,
@@ -2947,7 +3062,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         from baserow.contrib.database.views.handler import ViewHandler
 
-        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        ViewHandler().field_value_updated(
+            updated_fields + dependant_fields, incremental_fields=updated_fields
+        )
 
         rows_deleted.send(
             self,
@@ -2965,6 +3082,42 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return trashed_rows
 
+    def rebalance_row_orders_before(
+        self,
+        table: Table,
+        before_row: GeneratedTableModel,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> List[GeneratedTableModel]:
+        """
+        Spreads the orders of a window of rows directly before the provided
+        `before_row`, so that new orders can be calculated before it again. Contrary
+        to `recalculate_row_orders`, the position of the rows doesn't change and only
+        the rows in the window are updated, so the clients only need to receive their
+        new orders instead of refreshing the whole table.
+
+        :param table: The table object for which the rows orders must be rebalanced.
+        :param before_row: The row before which there must be room for new orders.
+        :param model: The already generated model if any.
+        :raises CannotCalculateIntermediateOrder: If the rows can't be rebalanced
+            locally, in which case all the orders must be recalculated.
+        :return: The rebalanced rows, including the trashed ones.
+        """
+
+        if model is None:
+            model = table.get_model()
+
+        rows = rebalance_orders_before_item(
+            before_row, model.objects_and_trash.only("id", "order", "trashed")
+        )
+
+        row_orders_rebalanced.send(
+            self,
+            table=table,
+            rows=[row for row in rows if not row.trashed],
+        )
+
+        return rows
+
     def recalculate_row_orders(self, table: Table, model: GeneratedTableModel = None):
         """
         Recalculates the order to whole numbers of all rows based on the existing
@@ -3044,10 +3197,19 @@ class UpsertFieldHandler:
     def prepare_value(self, value: str) -> Any:
         return self.field_type.prepare_value_for_db(self.field, value)
 
-    def get_field_concat_expression(self) -> sql.Composable:
+    def get_field_concat_expression(
+        self, value: Optional[sql.Composable] = None
+    ) -> sql.Composable:
+        """
+        Returns the expression normalizing a value of this field to text, so that it
+        can be compared with the values of the table.
+
+        :param value: The expression of the value. Defaults to a query placeholder.
+        """
+
         column_type = sql.SQL(self.get_column_type() or "text")
         return sql.SQL(" COALESCE(CAST({}::{} AS TEXT), '<NULL>')::TEXT ").format(
-            sql.Placeholder(), column_type
+            value or sql.Placeholder(), column_type
         )
 
     def get_column_type(self) -> str | None:
@@ -3077,18 +3239,35 @@ class UpsertRowsMappingHandler:
     # In this example:
     # - The first imported value ['a'] (index 0) corresponds to the row with ID 1.
     # - The second imported value ['b'] (index 1) corresponds to the row with ID 2.
+
+    By default, the imported values are loaded with a single `COPY` into a staging
+    table, and only the table rows having one of the imported values are compared,
+    so that the whole map is resolved with a constant number of queries.
     """
 
     SEPARATOR = sql.SQL(" || '__-__' || ")
     PER_CHUNK = 100
 
     def __init__(
-        self, table: Table, upsert_fields: list[int], upsert_values: list[list[Any]]
+        self,
+        table: Table,
+        upsert_fields: list[int],
+        upsert_values: list[list[Any]],
+        use_copy: bool = True,
     ):
+        """
+        :param table: The table where the rows are imported.
+        :param upsert_fields: The ids of the fields used to match the rows.
+        :param upsert_values: The values of the upsert fields for every imported row.
+        :param use_copy: If True, the imported values are loaded with `COPY`,
+            otherwise with one `INSERT` query per `PER_CHUNK` rows.
+        """
+
         self.table = table
         self.table_name = table.get_database_table_name()
         self.import_fields = [UpsertFieldHandler(table, fidx) for fidx in upsert_fields]
         self.upsert_values = upsert_values
+        self.use_copy = use_copy
 
     def validate(self):
         """
@@ -3126,8 +3305,12 @@ class UpsertRowsMappingHandler:
         )
 
         self.execute(script_template)
-        self.insert_table_values()
         self.insert_imported_values()
+        self.insert_table_values()
+        # The temp tables are never analyzed automatically, so without fresh
+        # statistics the planner would expect them to be tiny and pick a nested
+        # loop instead of a hash join.
+        self.execute(sql.SQL("ANALYZE table_import; ANALYZE table_upsert_indexes;"))
         # this is just a list of pairs, not very usable.
         calculated = self.calculate_map()
 
@@ -3150,6 +3333,8 @@ class UpsertRowsMappingHandler:
         """
         Populates temp upsert comparison table with values from an exsisting table.
         Values from multiple source columns will be normalized to one text value.
+        Only the rows matching one of the imported values are kept, so the imported
+        values must be inserted first.
         """
 
         columns = self.SEPARATOR.join(
@@ -3167,7 +3352,9 @@ class UpsertRowsMappingHandler:
                 SELECT id, upsert_value, RANK()
                         OVER (PARTITION BY upsert_value ORDER BY id, upsert_value )
                         AS group_index
-                FROM subq ORDER BY id """
+                FROM subq
+                WHERE upsert_value IN (SELECT upsert_value FROM table_import)
+                ORDER BY id """
         ).format(
             columns, sql.Identifier(self.table_name)
         )  # nosec B608
@@ -3180,6 +3367,9 @@ class UpsertRowsMappingHandler:
         from import data.
         """
 
+        if self.use_copy:
+            return self.copy_imported_values()
+
         for _chunk in chunks(enumerate(self.upsert_values), self.PER_CHUNK):
             # put all params (processed values) for the query into a container
             query_params = []
@@ -3201,6 +3391,50 @@ class UpsertRowsMappingHandler:
             )  # nosec B608
             self.execute(script_template, query_params)
 
+    def copy_imported_values(self):
+        """
+        Loads the upsert values from the import data into a staging table with a
+        single `COPY`, and normalizes all of them to the comparison text value with
+        one query.
+        """
+
+        value_columns = [f"value_{index}" for index in range(len(self.import_fields))]
+        self.execute(
+            sql.SQL("CREATE TEMP TABLE table_import_values (id INT, {});").format(
+                sql.SQL(", ").join(
+                    sql.SQL("{} TEXT").format(sql.Identifier(column))
+                    for column in value_columns
+                )
+            )
+        )
+        copy_rows_into_table(
+            self.cursor,
+            "table_import_values",
+            ["id", *value_columns],
+            (
+                [
+                    rowidx,
+                    *(
+                        field.prepare_value(value)
+                        for value, field in zip(row, self.import_fields)
+                    ),
+                ]
+                for rowidx, row in enumerate(self.upsert_values)
+            ),
+        )
+
+        upsert_value = self.SEPARATOR.join(
+            field.get_field_concat_expression(sql.Identifier(column))
+            for field, column in zip(self.import_fields, value_columns)
+        )
+        self.execute(
+            sql.SQL(
+                """INSERT INTO table_import (id, upsert_value)
+                    SELECT id, {} FROM table_import_values;
+                DROP TABLE table_import_values;"""
+            ).format(upsert_value)
+        )
+
     def calculate_map(self) -> list[tuple[int, int]]:
         """
         Calculates a map between imported row index -> table row id
@@ -1,8 +1,9 @@
 from datetime import datetime
 from itertools import groupby
+from typing import List
 
 from django.conf import settings
-from django.db import router
+from django.db import connections, router
 from django.db.models import QuerySet
 from django.dispatch import receiver
 
@@ -18,8 +19,14 @@ from baserow.contrib.database.rows.signals import rows_history_updated
 from baserow.contrib.database.rows.types import ActionData
 from baserow.core.action.signals import action_done
 from baserow.core.models import Workspace
+from baserow.core.partitioning.utils import drop_partitions_older_than
 from baserow.core.telemetry.utils import baserow_trace
 from baserow.core.types import AnyUser
+from baserow.core.write_behind.handler import WriteBehindHandler
+from baserow.core.write_behind.registries import (
+    WriteBehindBufferType,
+    write_behind_buffer_type_registry,
+)
 
 tracer = trace.get_tracer(__name__)
 
@@ -35,16 +42,34 @@ class RowHistoryHandler:
     ):
         row_history_entries = row_history_provider.get_row_history(user, action)
 
-        if row_history_entries:
+        if not row_history_entries:
+            return
+
+        buffer_type = write_behind_buffer_type_registry.get(
+            RowHistoryWriteBehindBufferType.type
+        )
+        write_behind_handler = WriteBehindHandler()
+        if write_behind_handler.is_enabled(buffer_type):
+            write_behind_handler.add(buffer_type, row_history_entries)
+        else:
             row_history_entries = RowHistory.objects.bulk_create(row_history_entries)
-            for table_id, per_table_row_history_entries in groupby(
-                row_history_entries, lambda e: e.table_id
-            ):
-                rows_history_updated.send(
-                    RowHistoryHandler,
-                    table_id=table_id,
-                    row_history_entries=list(per_table_row_history_entries),
-                )
+            cls.send_rows_history_updated(row_history_entries)
+
+    @classmethod
+    def send_rows_history_updated(cls, row_history_entries: List[RowHistory]):
+        """
+        Sends the `rows_history_updated` signal for every table of the given saved
+        entries.
+        """
+
+        for table_id, per_table_row_history_entries in groupby(
+            row_history_entries, lambda e: e.table_id
+        ):
+            rows_history_updated.send(
+                RowHistoryHandler,
+                table_id=table_id,
+                row_history_entries=list(per_table_row_history_entries),
+            )
 
     @classmethod
     @baserow_trace(tracer)
@@ -71,12 +96,28 @@ class RowHistoryHandler:
     def delete_entries_older_than(cls, cutoff: datetime):
         """
         Deletes all row history entries that are older than the given cutoff date.
+        The monthly partitions that are entirely older than the cutoff are dropped,
+        so only the entries of the partition the cutoff falls in are deleted one by
+        one.
 
         :param cutoff: The date and time before which all entries will be deleted.
         """
 
+        using = router.db_for_write(RowHistory)
+        drop_partitions_older_than(
+            RowHistory._meta.db_table, cutoff, connection=connections[using]
+        )
+
         delete_qs = RowHistory.objects.filter(action_timestamp__lt=cutoff)
-        delete_qs._raw_delete(using=router.db_for_write(delete_qs.model))
+        delete_qs._raw_delete(using=using)
+
+
+class RowHistoryWriteBehindBufferType(WriteBehindBufferType):
+    type = "row_history"
+    model_class = RowHistory
+
+    def after_flush(self, instances: List[RowHistory]):
+        RowHistoryHandler.send_rows_history_updated(instances)
 
 
 @receiver(action_done)
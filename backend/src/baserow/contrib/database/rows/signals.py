@@ -13,5 +13,6 @@ rows_deleted = Signal()
 rows_ai_values_generation_error = Signal()
 
 row_orders_recalculated = Signal()
+row_orders_rebalanced = Signal()
 
 rows_history_updated = Signal()
@@ -23,9 +23,11 @@ class FileImportConfiguration(TypedDict):
     skipped_fields: list[int]
 
 
-class FileImportDict(TypedDict):
-    data: list[list[Any]]
+class FileImportDict(TypedDict, total=False):
+    data: Iterable[list[Any]]
     configuration: FileImportConfiguration | None
+    # Must be provided if `data` has no length, like when the rows are streamed.
+    row_count: int
 
 
 FieldsMetadata = NewType("FieldsMetadata", dict[str, Any])
@@ -12,23 +12,52 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of that, every process keeps the most recently used fully generated model
+classes in the `generated_model_lru_cache`. A model class is reused as long as the
+versions and the optional column flags of its table and of all the tables it's
+related to are unchanged, which is checked with a single query.
 """
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 
+from opentelemetry import metrics
+
 from baserow.core.cache import local_cache
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+meter = metrics.get_meter(__name__)
+model_lru_cache_hits_counter = meter.create_counter(
+    "baserow.table_model_lru_cache.hits",
+    unit="1",
+    description="The number of generated table models reused from the process cache.",
+)
+model_lru_cache_misses_counter = meter.create_counter(
+    "baserow.table_model_lru_cache.misses",
+    unit="1",
+    description="The number of table models that had to be generated because they "
+    "were missing or outdated in the process cache.",
+)
+model_lru_cache_evictions_counter = meter.create_counter(
+    "baserow.table_model_lru_cache.evictions",
+    unit="1",
+    description="The number of generated table models evicted from the process "
+    "cache because it was full.",
+)
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -53,8 +82,137 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+# The id of the table and the sorted ids of the fields of a projected model, or None
+# if the model contains all the fields.
+ModelCacheKey = Tuple[int, Optional[Tuple[int, ...]]]
+
+# The columns of a table that change its generated model. Adding the created by or
+# last modified by column, for example, doesn't bump the version of the table.
+MODEL_STATE_TABLE_COLUMNS = (
+    "version",
+    "needs_background_update_column_added",
+    "created_by_column_added",
+    "last_modified_by_column_added",
+    "field_rules_validity_column_added",
+)
+
+
+@dataclass
+class CachedTableModel:
+    model: Type["GeneratedTableModel"]
+    versions: Dict[int, Tuple[Any, ...]]
+    """
+    The `MODEL_STATE_TABLE_COLUMNS` values of the table and all the related tables at
+    the moment the model was generated.
+    """
+
+
+class GeneratedModelLRUCache:
+    """
+    A bounded, process wide, least recently used cache of generated table models. It
+    prevents regenerating the model class and running `_after_model_generation` for
+    every request to a hot table. The size is controlled by the
+    `BASEROW_TABLE_MODEL_LRU_CACHE_SIZE` setting.
+
+    Note that the cached model classes, and the field objects in them, are shared by
+    all the requests handled by the process, so they must not be mutated.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[ModelCacheKey, CachedTableModel]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_entry(self, key: ModelCacheKey) -> Optional[CachedTableModel]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _set_entry(self, key: ModelCacheKey, entry: CachedTableModel):
+        max_size = settings.BASEROW_TABLE_MODEL_LRU_CACHE_SIZE
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+                model_lru_cache_evictions_counter.add(1)
+
+    def _get_model_versions(
+        self, model: Type["GeneratedTableModel"]
+    ) -> Dict[int, Tuple[Any, ...]]:
+        related_models = [model, *model.baserow_models.values()]
+        return {
+            related_model.baserow_table_id: tuple(
+                getattr(related_model.baserow_table, column)
+                for column in MODEL_STATE_TABLE_COLUMNS
+            )
+            for related_model in related_models
+            if getattr(related_model, "baserow_table_id", None) is not None
+        }
+
+    def get_model(
+        self,
+        table: "Table",
+        generate_model: Callable[[], Type["GeneratedTableModel"]],
+        field_ids: Optional[Tuple[int, ...]] = None,
+    ) -> Type["GeneratedTableModel"]:
+        """
+        Returns the cached model of the table if neither the table nor any of the
+        related tables changed since it was generated. Otherwise, the model is
+        generated and cached.
+
+        :param table: The table to get the model for.
+        :param generate_model: Generates the model if it can't be reused.
+        :param field_ids: The sorted ids of the fields if the model only contains a
+            subset of the fields, or None for the full model.
+        :return: The generated model.
+        """
+
+        from baserow.contrib.database.table.models import Table
+
+        key = (table.id, field_ids)
+        entry = self._get_entry(key)
+        if entry is not None:
+            current_versions = {
+                table_id: tuple(state)
+                for table_id, *state in Table.objects_and_trash.filter(
+                    id__in=entry.versions.keys()
+                ).values_list("id", *MODEL_STATE_TABLE_COLUMNS)
+            }
+            if current_versions == entry.versions:
+                model_lru_cache_hits_counter.add(1)
+                for column, value in zip(
+                    MODEL_STATE_TABLE_COLUMNS, current_versions[table.id]
+                ):
+                    setattr(table, column, value)
+                # The version is up to date, so it doesn't have to be refreshed again
+                # if another model of this table is generated in this request.
+                local_cache.set(f"database_table_model_{table.id}_refreshed", True)
+                local_cache.set(f"database_table_model_{table.id}_table", table)
+                return entry.model
+
+        model_lru_cache_misses_counter.add(1)
+        model = generate_model()
+        self._set_entry(key, CachedTableModel(model, self._get_model_versions(model)))
+        return model
+
+    def delete(self, table_id: int):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == table_id]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+generated_model_lru_cache = GeneratedModelLRUCache()
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    generated_model_lru_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -76,6 +234,7 @@ def invalidate_table_in_model_cache(table_id: int):
 
     # Delete model local cache
     local_cache.delete(f"database_table_model_{table_id}*")
+    generated_model_lru_cache.delete(table_id)
 
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
@@ -3,6 +3,9 @@ USER_TABLE_DATABASE_NAME_PREFIX = "database_table_"
 MULTIPLE_COLLABORATOR_THROUGH_TABLE_PREFIX = "database_multiplecollaborators_"
 LINK_ROW_THROUGH_TABLE_PREFIX = "database_relation_"
 MULTIPLE_SELECT_THROUGH_TABLE_PREFIX = "database_multipleselect_"
+# The first key of the postgres advisory locks taken on a table id to prevent
+# counting its rows while a row count change is not committed yet.
+TABLE_ROW_COUNT_ADVISORY_LOCK_KEY = 8731
 
 
 def get_tsv_vector_field_name(field_id) -> str:
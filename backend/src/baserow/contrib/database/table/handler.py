@@ -3,8 +3,8 @@ from typing import Any, Dict, List, NewType, Optional, Tuple, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import DatabaseError, IntegrityError
-from django.db.models import Q, QuerySet, Sum
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models import OuterRef, Q, QuerySet, Subquery, Sum
 from django.db.models.functions import Coalesce, Now
 from django.utils import translation
 from django.utils.translation import gettext as _
@@ -49,6 +49,7 @@ from .constants import (
     CREATED_BY_COLUMN_NAME,
     LAST_MODIFIED_BY_COLUMN_NAME,
     TABLE_CREATION,
+    TABLE_ROW_COUNT_ADVISORY_LOCK_KEY,
 )
 from .exceptions import (
     FailedToLockTableDueToConflict,
@@ -109,24 +110,109 @@ class TableUsageHandler:
 
             raise integrity_exc
 
+    @classmethod
+    def record_row_count_change(
+        cls, table_id: int, row_count: int
+    ) -> Optional[TableUsageUpdate]:
+        """
+        Records a change of the row count of the table. It must be called in the
+        transaction creating or deleting the rows, because the shared lock it takes
+        prevents the rows of the table from being counted until this transaction is
+        committed, see `_lock_tables_row_count`. The lock doesn't conflict with the
+        other transactions changing the rows of the same table.
+
+        :param table_id: The id of the table whose rows have been created or deleted.
+        :param row_count: The change in row count, positive or negative.
+        :return: The created TableUsageUpdate object or None if the table_id is not
+            valid.
+        """
+
+        cls._lock_tables_row_count([table_id], shared=True)
+        return cls.mark_table_for_usage_update(table_id, row_count)
+
+    @classmethod
+    def _lock_tables_row_count(cls, table_ids: List[int], shared: bool = False):
+        """
+        Takes the advisory locks on the row count of the tables until the end of the
+        current transaction. The exclusive lock waits until all the transactions
+        holding the shared lock, and so recording a row count change, are committed.
+
+        :param table_ids: The ids of the tables to lock.
+        :param shared: Whether to take the shared or the exclusive lock.
+        """
+
+        lock_function = (
+            "pg_advisory_xact_lock_shared" if shared else "pg_advisory_xact_lock"
+        )
+        with connection.cursor() as cursor:
+            for table_id in sorted(table_ids):
+                cursor.execute(
+                    f"SELECT {lock_function}(%s::int, %s::int)",
+                    [TABLE_ROW_COUNT_ADVISORY_LOCK_KEY, table_id],
+                )
+
+    @classmethod
+    def get_table_row_count(cls, table_id: int) -> Optional[int]:
+        """
+        Returns the number of non-trashed rows of the table without counting them, by
+        adding the pending row count changes to the last row count of the table usage.
+        The changes are recorded in the same transaction as the rows and are consumed
+        atomically when the rows are counted again, so the result is exact as long as
+        the rows are created and deleted via the row signals.
+
+        :param table_id: The id of the table to get the row count for.
+        :return: The row count or None if the rows haven't been counted yet.
+        """
+
+        pending_row_count = (
+            TableUsageUpdate.objects.filter(
+                table_id=OuterRef("table_id"), row_count__isnull=False
+            )
+            .values("table_id")
+            .annotate(total=Sum("row_count"))
+            .values("total")[:1]
+        )
+        row_count = (
+            TableUsage.objects.filter(table_id=table_id, row_count__isnull=False)
+            .annotate(pending_row_count=Coalesce(Subquery(pending_row_count), 0))
+            .values_list("row_count", "pending_row_count")
+            .first()
+        )
+        if row_count is None:
+            return None
+        return max(row_count[0] + row_count[1], 0)
+
     @classmethod
     def create_tables_usage_for_new_database(cls, database_id: int):
         """
-        Creates a TableUsageUpdate entry for each table in the database so that the
-        usage can be tracked and updated.
+        Creates or updates the TableUsage entry of each table in the database, so
+        that the usage is tracked right away. The rows of a duplicated or imported
+        database don't send the `rows_created` signal, so their row count is not
+        recorded as a change and must be counted.
 
         :param database_id: The id of the database that needs to be updated.
         """
 
-        tables_in_database = TableHandler.get_tables().filter(database_id=database_id)
+        table_ids = TableHandler.get_tables().filter(database_id=database_id)
+        cls.refresh_tables_usage(list(table_ids.values_list("id", flat=True)))
 
-        entries = [
-            TableUsageUpdate(
-                table_id=table.id, row_count=BaserowTableRowCount(table.id)
-            )
-            for table in tables_in_database
-        ]
-        TableUsageUpdate.objects.bulk_create(entries, ignore_conflicts=True)
+    @classmethod
+    def refresh_tables_usage(cls, table_ids: List[int]) -> List[TableUsage]:
+        """
+        Counts the rows and the storage usage of the provided tables right away,
+        instead of waiting for the next periodic update. This must be called after
+        rows have been inserted without recording the row count change, like when a
+        table is duplicated or imported, so that `get_table_row_count` stays exact.
+        Tables of templates are skipped, as in `update_tables_usage`.
+
+        :param table_ids: The ids of the tables that need to be refreshed.
+        :return: The list of created or updated TableUsage objects.
+        """
+
+        table_ids = TableHandler.get_tables().filter(
+            id__in=table_ids, database__workspace__template__isnull=True
+        )
+        return cls._bulk_create_or_update(list(table_ids.values_list("id", flat=True)))
 
     @classmethod
     def update_tables_usage(cls) -> int:
@@ -159,35 +245,41 @@ class TableUsageHandler:
     @classmethod
     def _bulk_create_or_update(cls, table_ids: List[int]) -> List[TableUsage]:
         """
-        Creates or updates the table usage for the provided table ids. It uses
-        `bulk_create` to do this in a single query.
+        Creates or updates the table usage for the provided table ids, and deletes
+        their pending TableUsageUpdate entries. Every table is counted in its own
+        transaction while holding the exclusive row count lock, so that no row count
+        change can be committed between counting the rows and deleting the changes
+        already included in the count.
 
         :param table_ids: The ids of the tables that need to be updated.
         :return: The list of created or updated TableUsage objects.
         """
 
-        entries = []
+        table_usages = []
         for table_id in table_ids:
-            table_usage = TableUsage(
-                table_id=table_id,
-                row_count=BaserowTableRowCount(table_id),
-                row_count_updated_at=Now(),
-                storage_usage=cls.calculate_table_storage_usage(table_id),
-                storage_usage_updated_at=Now(),
-            )
-            entries.append(table_usage)
-
-        return TableUsage.objects.bulk_create(
-            entries,
-            update_conflicts=True,
-            update_fields=[
-                "row_count",
-                "row_count_updated_at",
-                "storage_usage",
-                "storage_usage_updated_at",
-            ],
-            unique_fields=["table_id"],
-        )
+            with transaction.atomic():
+                cls._lock_tables_row_count([table_id])
+                table_usage = TableUsage(
+                    table_id=table_id,
+                    row_count=BaserowTableRowCount(table_id),
+                    row_count_updated_at=Now(),
+                    storage_usage=cls.calculate_table_storage_usage(table_id),
+                    storage_usage_updated_at=Now(),
+                )
+                table_usages += TableUsage.objects.bulk_create(
+                    [table_usage],
+                    update_conflicts=True,
+                    update_fields=[
+                        "row_count",
+                        "row_count_updated_at",
+                        "storage_usage",
+                        "storage_usage_updated_at",
+                    ],
+                    unique_fields=["table_id"],
+                )
+                TableUsageUpdate.objects.filter(table_id=table_id).delete()
+
+        return table_usages
 
     @classmethod
     def _create_missing_tables_usage(
@@ -220,7 +312,7 @@ class TableUsageHandler:
     ) -> int:
         """
         Recalculates the row count and storage usage for the tables that have changed
-        and have a TableUsageUpdate entry, and then delete them.
+        and have a TableUsageUpdate entry, which are deleted at the same time.
 
         :param usage_update_qs: The queryset containing the table usage updates that
             need to be processed.
@@ -236,7 +328,6 @@ class TableUsageHandler:
             table_ids = [u["table_id"] for u in chunk]
 
             cls._bulk_create_or_update(table_ids)
-            TableUsageUpdate.objects.filter(table_id__in=table_ids).delete()
 
             total_tables_counted += len(table_ids)
 
@@ -416,7 +507,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
 
         table = self.create_table_and_fields(user, database, name, fields)
 
-        _, error_report = RowHandler().import_rows(
+        _, error_report = RowHandler().import_rows_in_chunks(
             user,
             table,
             data=data,
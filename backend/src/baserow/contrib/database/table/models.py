@@ -43,6 +43,8 @@ from baserow.contrib.database.search.handler import (
     SearchMode,
 )
 from baserow.contrib.database.table.cache import (
+    MODEL_STATE_TABLE_COLUMNS,
+    generated_model_lru_cache,
     get_cached_model_field_attrs,
     set_cached_model_field_attrs,
 )
@@ -468,6 +470,20 @@ class TableModelManager(TableModelTrashAndObjectsManager):
         return super().get_queryset().filter(trashed=False)
 
 
+class BaserowTableDescriptor:
+    """
+    Returns the table of a generated model. Because a generated model class can be
+    reused by multiple requests, the table instance of the request that last got the
+    model via `Table.get_model` is returned, so that it's never outdated.
+    """
+
+    def __get__(self, instance, owner):
+        return local_cache.get(
+            f"database_table_model_{owner.baserow_table_id}_table",
+            owner._baserow_table,
+        )
+
+
 class GeneratedTableModel(HierarchicalModelMixin, models.Model):
     """
     Mixed into Model classes which have been generated by Baserow.
@@ -475,6 +491,8 @@ class GeneratedTableModel(HierarchicalModelMixin, models.Model):
     like `isinstance(possible_baserow_model, GeneratedTableModel)`.
     """
 
+    baserow_table = BaserowTableDescriptor()
+
     @classmethod
     def info(cls):
         """
@@ -932,10 +950,70 @@ class Table(
 
         if are_kwargs_default(self._get_model, **kwargs):
             return local_cache.get(
-                f"database_table_model_{self.id}", lambda: self._get_model(**kwargs)
+                f"database_table_model_{self.id}", self._get_model_from_lru_cache
             )
         return self._get_model(**kwargs)
 
+    def _get_model_from_lru_cache(self) -> Type["GeneratedTableModel"]:
+        if (
+            settings.BASEROW_DISABLE_MODEL_CACHE
+            or settings.BASEROW_TABLE_MODEL_LRU_CACHE_SIZE <= 0
+        ):
+            return self._get_model()
+
+        return generated_model_lru_cache.get_model(self, self._get_model)
+
+    def get_projected_model(
+        self, field_ids: Iterable[int]
+    ) -> Type["GeneratedTableModel"]:
+        """
+        Returns a model that only contains the fields with the provided ids and the
+        fields they depend on. Selecting rows with it only reads those columns, which
+        is a lot cheaper for wide tables if only a few fields are needed. Like the
+        full model, it's cached for the request and in the process wide LRU cache.
+
+        Because the trashed fields and the other fields are missing, the model must
+        only be used to read rows, never to create or update them.
+
+        :param field_ids: The ids of the fields that must be in the model.
+        :return: The generated model.
+        """
+
+        field_ids = tuple(sorted(set(field_ids)))
+
+        def generate_model():
+            self._refresh_model_state()
+            return self._get_model(field_ids=list(field_ids))
+
+        def get_model_from_lru_cache():
+            if (
+                settings.BASEROW_DISABLE_MODEL_CACHE
+                or settings.BASEROW_TABLE_MODEL_LRU_CACHE_SIZE <= 0
+            ):
+                return generate_model()
+            return generated_model_lru_cache.get_model(
+                self, generate_model, field_ids=field_ids
+            )
+
+        return local_cache.get(
+            f"database_table_model_{self.id}_projected_"
+            f"{'_'.join(str(field_id) for field_id in field_ids)}",
+            get_model_from_lru_cache,
+        )
+
+    def _refresh_model_state(self):
+        """
+        Refreshes the version and the other columns that change the generated model,
+        so that the model is generated and cached for the latest state of the table.
+        We don't need to refresh them if they have already been refreshed for this
+        session.
+        """
+
+        local_cache.get(
+            f"database_table_model_{self.id}_refreshed",
+            lambda: self.refresh_from_db(fields=list(MODEL_STATE_TABLE_COLUMNS)),
+        )
+
     def _get_model(
         self,
         fields=None,
@@ -1043,7 +1121,7 @@ class Table(
             "__module__": "database.models",
             # An indication that the model is a generated table model.
             "_generated_table_model": True,
-            "baserow_table": self,
+            "_baserow_table": self,
             "baserow_table_id": self.id,
             "baserow_models": apps.baserow_models,
             # We are using our own table model manager to implement some queryset
@@ -1063,12 +1141,7 @@ class Table(
         )
 
         if use_cache:
-            # We don't need to refresh the version if it has already been refreshed for
-            # this session.
-            local_cache.get(
-                f"database_table_model_{self.id}_refreshed",
-                lambda: self.refresh_from_db(fields=["version"]),
-            )
+            self._refresh_model_state()
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -9,25 +9,40 @@ from baserow.contrib.database.rows.signals import (
     rows_deleted,
     rows_updated,
 )
-from baserow.contrib.database.table.signals import table_created, table_deleted
+from baserow.contrib.database.table.signals import (
+    table_created,
+    table_deleted,
+    table_usage_updated,
+)
 from baserow.core.registries import application_type_registry
 from baserow.core.signals import application_created
 
-from .tasks import create_tables_usage_for_new_database, update_table_usage
+from .handler import TableUsageHandler
+from .tasks import (
+    create_tables_usage_for_new_database,
+    refresh_tables_usage,
+    update_table_usage,
+)
 
 
-@receiver(rows_created)
-def on_rows_created(sender, rows, before, user, table, **kwargs):
+def _mark_table_row_count_changed(table, row_count):
+    # The change is recorded in the same transaction as the rows, so that the row
+    # count derived from the table usage is always exact. It replaces the
+    # `update_table_usage` task that inserted the same entry after the commit.
+    TableUsageHandler.record_row_count_change(table.id, row_count)
     transaction.on_commit(
-        lambda: update_table_usage.delay(table.id, row_count=len(rows))
+        lambda: table_usage_updated.send(sender=TableUsageHandler, table_id=table.id)
     )
 
 
+@receiver(rows_created)
+def on_rows_created(sender, rows, before, user, table, **kwargs):
+    _mark_table_row_count_changed(table, len(rows))
+
+
 @receiver(rows_deleted)
 def on_rows_deleted(sender, rows, user, table, **kwargs):
-    transaction.on_commit(
-        lambda: update_table_usage.delay(table.id, row_count=-len(rows))
-    )
+    _mark_table_row_count_changed(table, -len(rows))
 
 
 @receiver(rows_updated)
@@ -47,10 +62,10 @@ def on_rows_updated(
 # Table signals for row count
 @receiver(table_created)
 def on_table_created(sender, table, user, **kwargs):
-    # If rows have been created or imported, they will be counted in the `rows_created`
-    # signal, so let's only create an empty placehorder to make sure the table usage
-    # will be updated avoiding double counting.
-    transaction.on_commit(lambda: update_table_usage.delay(table.id, 0))
+    # A duplicated table is filled without sending the `rows_created` signal, so its
+    # rows are counted once committed. The row count changes recorded in the same
+    # transaction are included in the count and deleted, avoiding double counting.
+    transaction.on_commit(lambda: refresh_tables_usage.delay([table.id]))
 
 
 @receiver(table_deleted)
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from typing import List
 
 from django.db import transaction
 
@@ -141,3 +142,11 @@ def create_tables_usage_for_new_database(self, database_id: int):
     from baserow.contrib.database.table.handler import TableUsageHandler
 
     TableUsageHandler.create_tables_usage_for_new_database(database_id)
+
+
+@app.task(bind=True)
+def refresh_tables_usage(self, table_ids: List[int]):
+    from baserow.contrib.database.table.handler import TableUsageHandler
+
+    for table_usage in TableUsageHandler.refresh_tables_usage(table_ids):
+        table_usage_updated.send(sender=self, table_id=table_usage.table_id)
@@ -1,8 +1,10 @@
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.db import connection, router
+from django.db.models import Count
 
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.dependencies.update_collector import (
@@ -11,10 +13,11 @@ from baserow.contrib.database.fields.dependencies.update_collector import (
 from baserow.contrib.database.fields.exceptions import FieldDataConstraintException
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.signals import rows_created
+from baserow.contrib.database.table.handler import TableUsageHandler
 from baserow.contrib.database.table.models import (
     GeneratedTableModel,
     RichTextFieldMention,
@@ -46,6 +49,7 @@ User = get_user_model()
 class TableTrashableItemType(TrashableItemType):
     type = "table"
     model_class = Table
+    permanent_deletion_priority = 20
 
     def get_parent(self, trashed_item: Any) -> Optional[Any]:
         return trashed_item.database
@@ -146,6 +150,26 @@ class TableTrashableItemType(TrashableItemType):
 
         trashed_item.delete()
 
+    def get_permanent_deletion_lock_counts(
+        self, trashed_entries: List[TrashEntry]
+    ) -> Dict[int, int]:
+        """
+        Dropping a table also drops the through tables of its link row fields.
+        """
+
+        link_row_field_counts = dict(
+            LinkRowField.objects_and_trash.filter(
+                table_id__in=[entry.trash_item_id for entry in trashed_entries]
+            )
+            .values("table_id")
+            .annotate(count=Count("id"))
+            .values_list("table_id", "count")
+        )
+        return {
+            entry.id: 1 + link_row_field_counts.get(entry.trash_item_id, 0)
+            for entry in trashed_entries
+        }
+
     # noinspection PyMethodMayBeStatic
     def trash(
         self,
@@ -268,6 +292,7 @@ class FieldTrashableItemType(TrashableItemType):
 class RowTrashableItemType(TrashableItemType):
     type = "row"
     model_class = GeneratedTableModel
+    supports_batch_permanent_deletion = True
 
     @property
     def requires_parent_id(self) -> bool:
@@ -311,7 +336,9 @@ class RowTrashableItemType(TrashableItemType):
             model, rows_to_restore
         )
 
-        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        ViewHandler().field_value_updated(
+            updated_fields + dependant_fields, incremental_fields=updated_fields
+        )
         SearchHandler.schedule_update_search_data(table, row_ids=[trashed_item.id])
 
         rows_to_return = list(
@@ -334,6 +361,39 @@ class RowTrashableItemType(TrashableItemType):
         ).delete()
         row.delete()
 
+    def permanently_delete_items(self, rows, trash_item_lookup_cache=None):
+        """
+        Deletes the rows of every table, and their mentions, with a single statement
+        per table.
+        """
+
+        row_ids_per_model = defaultdict(list)
+        for row in rows:
+            row_ids_per_model[type(row)].append(row.id)
+
+        for model, row_ids in row_ids_per_model.items():
+            RichTextFieldMention.objects.filter(
+                table_id=model.baserow_table_id, row_id__in=row_ids
+            ).delete()
+            model.objects_and_trash.filter(id__in=row_ids).delete()
+
+    def get_permanent_deletion_lock_counts(
+        self, trashed_entries: List[TrashEntry]
+    ) -> Dict[int, int]:
+        """
+        Only the first row of every table adds locks to the transaction.
+        """
+
+        lock_counts = {}
+        table_ids = set()
+        for entry in trashed_entries:
+            lock_counts[entry.id] = int(entry.parent_trash_item_id not in table_ids)
+            table_ids.add(entry.parent_trash_item_id)
+        return lock_counts
+
+    def get_permanent_deletion_row_count(self, trashed_item: Any) -> int:
+        return 1
+
     def lookup_trashed_item(
         self, trashed_entry: TrashEntry, trash_item_lookup_cache=None
     ):
@@ -348,27 +408,54 @@ class RowTrashableItemType(TrashableItemType):
         :return: An instance of the model_class with trashed_item_id
         """
 
-        # Cache the expensive table.get_model function call if we are looking up
-        # many trash items at once.
-        if trash_item_lookup_cache is not None:
-            model_cache = trash_item_lookup_cache.setdefault(
-                "row_table_model_cache", {}
-            )
-            try:
-                model = model_cache[trashed_entry.parent_trash_item_id]
-            except KeyError:
-                model = model_cache.setdefault(
-                    trashed_entry.parent_trash_item_id,
-                    self._get_table_model(trashed_entry.parent_trash_item_id),
-                )
-        else:
-            model = self._get_table_model(trashed_entry.parent_trash_item_id)
+        model = self._get_cached_table_model(
+            trashed_entry.parent_trash_item_id, trash_item_lookup_cache
+        )
 
         try:
             return model.trash.get(id=trashed_entry.trash_item_id)
         except model.DoesNotExist:
             raise TrashItemDoesNotExist()
 
+    def lookup_trashed_items(
+        self, trashed_entries: List[TrashEntry], trash_item_lookup_cache=None
+    ) -> Dict[int, Any]:
+        """
+        Looks up the trashed rows with a single query per table.
+        """
+
+        entries_per_table_id = defaultdict(list)
+        for trashed_entry in trashed_entries:
+            entries_per_table_id[trashed_entry.parent_trash_item_id].append(
+                trashed_entry
+            )
+
+        trashed_items = {}
+        for table_id, entries in entries_per_table_id.items():
+            try:
+                model = self._get_cached_table_model(table_id, trash_item_lookup_cache)
+            except TrashItemDoesNotExist:
+                continue
+
+            rows = model.trash.in_bulk([entry.trash_item_id for entry in entries])
+            for entry in entries:
+                if entry.trash_item_id in rows:
+                    trashed_items[entry.id] = rows[entry.trash_item_id]
+
+        return trashed_items
+
+    def _get_cached_table_model(self, table_id, trash_item_lookup_cache=None):
+        # Cache the expensive table.get_model function call if we are looking up
+        # many trash items at once.
+        if trash_item_lookup_cache is None:
+            return self._get_table_model(table_id)
+
+        model_cache = trash_item_lookup_cache.setdefault("row_table_model_cache", {})
+        try:
+            return model_cache[table_id]
+        except KeyError:
+            return model_cache.setdefault(table_id, self._get_table_model(table_id))
+
     def _get_table_model(self, table_id):
         table = self._get_table(table_id)
         return table.get_model()
@@ -434,10 +521,16 @@ class RowsTrashableItemType(TrashableItemType):
             model, rows_to_restore
         )
 
-        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+        # The rows are only sent with the `rows_created` signal if there are not too
+        # many, otherwise the aggregations can't be updated incrementally.
+        send_rows_created = len(rows_to_restore) < 50
+        ViewHandler().field_value_updated(
+            updated_fields + dependant_fields,
+            incremental_fields=updated_fields if send_rows_created else None,
+        )
         SearchHandler.schedule_update_search_data(table, row_ids=trashed_item.row_ids)
 
-        if len(rows_to_restore) < 50:
+        if send_rows_created:
             rows_to_return = list(
                 model.objects.all()
                 .enhance_by_fields()
@@ -454,6 +547,9 @@ class RowsTrashableItemType(TrashableItemType):
                 dependant_fields=dependant_fields,
             )
         else:
+            # The `rows_created` signal normally records the row count change, so it
+            # must be done here to keep the table row count exact.
+            TableUsageHandler.record_row_count_change(table.id, len(rows_to_restore))
             # Use table signal here instead of row signal because we don't want
             # to send too many ids in the signal
             table_updated.send(self, table=table, user=None, force_table_refresh=True)
@@ -466,6 +562,9 @@ class RowsTrashableItemType(TrashableItemType):
         table_model = self._get_table_model(item_to_trash.table_id)
         table_model.objects.filter(id__in=item_to_trash.row_ids).update(trashed=True)
 
+    def get_permanent_deletion_row_count(self, trashed_item: Any) -> int:
+        return len(trashed_item.row_ids)
+
     def permanently_delete_item(self, trashed_item, trash_item_lookup_cache=None):
         table_model = self._get_table_model(trashed_item.table_id)
         delete_qs = table_model.objects_and_trash.filter(id__in=trashed_item.row_ids)
@@ -2,11 +2,23 @@ import dataclasses
 import itertools
 import re
 import traceback
+import uuid
 from collections import defaultdict, namedtuple
 from copy import deepcopy
 from dataclasses import dataclass
 from hashlib import shake_128
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
@@ -15,7 +27,7 @@ from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import connection
 from django.db import models as django_models
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, OuterRef, Q
 from django.db.models.expressions import OrderBy
 from django.db.models.query import QuerySet
 
@@ -84,7 +96,12 @@ from baserow.contrib.database.views.registries import (
     view_ownership_type_registry,
 )
 from baserow.contrib.database.views.view_filter_groups import ViewGroupedFiltersAdapter
-from baserow.core.db import specific_iterator, sql, transaction_atomic
+from baserow.core.db import (
+    estimate_queryset_count,
+    specific_iterator,
+    sql,
+    transaction_atomic,
+)
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Workspace
@@ -129,6 +146,7 @@ from .exceptions import (
 from .models import (
     DEFAULT_SORT_TYPE_KEY,
     OWNERSHIP_TYPE_COLLABORATIVE,
+    GridViewFieldOptions,
     View,
     ViewDecoration,
     ViewFilter,
@@ -170,7 +188,7 @@ from .signals import (
     view_updated,
     views_reordered,
 )
-from .utils import AnnotatedAggregation, DistributionAggregation
+from .utils import AnnotatedAggregation, DistributionAggregation, RowCountMode
 from .validators import value_is_empty_for_required_form_field
 
 FieldOptionsDict = Dict[int, Dict[str, Any]]
@@ -186,6 +204,13 @@ PerViewTableIndexUpdate = namedtuple(
 )
 
 
+class ViewRowsCount(NamedTuple):
+    count: int
+    # The mode that has effectively been used to compute the count. This is `exact`
+    # if the count is exact, even if another mode has been requested.
+    mode: RowCountMode
+
+
 @dataclasses.dataclass
 class UpdatedViewWithChangedAttributes:
     updated_view_instance: View
@@ -1459,23 +1484,46 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         ) in decorator_value_provider_type_registry.get_all():
             decorator_value_provider_type.after_fields_type_change(fields)
 
-    def field_value_updated(self, updated_fields: Union[Iterable[Field], Field]):
+    def field_value_updated(
+        self,
+        updated_fields: Union[Iterable[Field], Field],
+        incremental_fields: Optional[List[Field]] = None,
+    ):
         """
         Called after a field value has been modified because of a row creation,
         modification, deletion. This method is called for each directly or indirectly
         affected list of fields.
 
-        Calls the `.after_field_value_update(updated_fields)` of each view type.
+        Calls the `.after_field_value_update(updated_fields, incremental_fields)` of
+        each view type.
 
         :param updated_fields: The field or list of fields that are affected.
+        :param incremental_fields: The fields of `updated_fields` that only changed
+            for the rows that are going to be sent with the `rows_created`,
+            `rows_updated` or `rows_deleted` signal right after. Data related to
+            these fields can be updated incrementally using that signal. This is
+            ignored if another updated field belongs to the same table, because its
+            values can also have changed for other rows.
         """
 
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        if incremental_fields:
+            incremental_field_ids = {f.id for f in incremental_fields}
+            incremental_table_ids = {f.table_id for f in incremental_fields}
+            if any(
+                f.table_id in incremental_table_ids
+                for f in updated_fields
+                if f.id not in incremental_field_ids
+            ):
+                incremental_fields = None
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
-            view_type.after_field_value_update(updated_fields)
+            view_type.after_field_value_update(
+                updated_fields, incremental_fields=incremental_fields
+            )
 
     def field_updated(self, updated_fields: Union[Iterable[Field], Field]):
         """
@@ -2827,6 +2875,56 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             )
         return queryset
 
+    def count_view_rows(
+        self,
+        view: View,
+        queryset: QuerySet,
+        count_mode: RowCountMode = RowCountMode.EXACT,
+        only_view_filters: bool = True,
+    ) -> ViewRowsCount:
+        """
+        Counts the rows of a queryset of the view using the provided count mode. If the
+        queryset isn't filtered, the `estimate` and `capped` modes use the row count
+        of the table maintained in the table usage, which is exact and doesn't require
+        to scan the table. Otherwise, `estimate` returns the estimate of the query
+        planner and `capped` counts up to `BASEROW_ROW_COUNT_CAP` rows.
+
+        :param view: The view the queryset is generated for.
+        :param queryset: The queryset to count the rows of.
+        :param count_mode: The count mode to use.
+        :param only_view_filters: Indicates whether the queryset is only filtered by
+            the filters of the view. Must be False if ad hoc filters or a search term
+            have been applied to the queryset.
+        :return: The count and the mode that was used to compute it.
+        """
+
+        from baserow.contrib.database.table.handler import TableUsageHandler
+
+        if count_mode == RowCountMode.EXACT:
+            return ViewRowsCount(queryset.count(), RowCountMode.EXACT)
+
+        view_is_filtered = not only_view_filters or (
+            not view.filters_disabled
+            and ViewFilter.objects.filter(view_id=view.id).exists()
+        )
+
+        if not view_is_filtered:
+            row_count = TableUsageHandler.get_table_row_count(view.table_id)
+            if row_count is None:
+                row_count = queryset.count()
+            return ViewRowsCount(row_count, RowCountMode.EXACT)
+
+        if count_mode == RowCountMode.ESTIMATE:
+            return ViewRowsCount(
+                estimate_queryset_count(queryset), RowCountMode.ESTIMATE
+            )
+
+        cap = settings.BASEROW_ROW_COUNT_CAP
+        row_count = queryset.order_by().values("id")[: cap + 1].count()
+        if row_count > cap:
+            return ViewRowsCount(cap, RowCountMode.CAPPED)
+        return ViewRowsCount(row_count, RowCountMode.EXACT)
+
     def _get_aggregation_lock_cache_key(self, view: View):
         """
         Returns the aggregation lock cache key for the specified view.
@@ -3058,6 +3156,10 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                         to_cache[self._get_aggregation_value_cache_key(view, key)] = {
                             "value": value,
                             "version": need_computation[key]["version"],
+                            # Identifies this computation, so that an incremental
+                            # update can't be applied to a value that might
+                            # already include it.
+                            "computation_id": uuid.uuid4().hex,
                         }
 
                 # Let's cache the newly computed values
@@ -3076,6 +3178,284 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return values
 
+    def get_cached_incremental_aggregations(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        updated_field_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, Tuple[View, List[Tuple[Field, str]], Dict[str, str]]]:
+        """
+        Returns the incremental aggregations of the views of the table that currently
+        have a valid value in cache. Only those are worth updating incrementally when
+        rows change because the other ones are computed again when they're requested.
+        The version of the other ones is incremented, because the rows are about to
+        change. Views with a time-sensitive filter are left out, because the rows
+        matching their filters change over time, so their aggregations are
+        invalidated instead.
+
+        :param table: The table to get the view aggregations for.
+        :param model: The model of the table. Aggregations of fields that are not in
+            this model are ignored.
+        :param updated_field_ids: If provided, only the aggregations of views that
+            aggregate or filter by one of these fields are returned because the
+            aggregations of the other views can't have changed.
+        :return: A dict where the key is the view id and the value a tuple containing
+            the view, its list of (field, aggregation_type) couples and the
+            computation id of their cached values keyed by field name.
+        """
+
+        # This runs for every row change, so it starts with a single query that
+        # returns nothing if none of the views of the table has a footer aggregation.
+        field_options = (
+            GridViewFieldOptions.objects.filter(
+                grid_view__table=table, grid_view__trashed=False
+            )
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view", "field")
+        )
+        views = {}
+        aggregations_per_view = defaultdict(list)
+        for options in field_options:
+            if (
+                options.field_id in model._field_objects
+                and view_aggregation_type_registry.get(
+                    options.aggregation_raw_type
+                ).incremental
+            ):
+                views[options.grid_view_id] = options.grid_view
+                aggregations_per_view[options.grid_view_id].append(
+                    (options.field, options.aggregation_raw_type)
+                )
+        if not views:
+            return {}
+
+        time_sensitive_filter_types = (
+            view_filter_type_registry.get_time_sensitive_filter_types()
+        )
+        filters_q = Q(type__in=time_sensitive_filter_types)
+        if updated_field_ids is not None:
+            updated_field_ids = set(updated_field_ids)
+            filters_q |= Q(field_id__in=updated_field_ids)
+
+        time_sensitive_view_ids = set()
+        filtered_view_ids = set()
+        for view_id, field_id, filter_type in ViewFilter.objects.filter(
+            filters_q, view_id__in=views.keys()
+        ).values_list("view_id", "field_id", "type"):
+            if filter_type in time_sensitive_filter_types:
+                time_sensitive_view_ids.add(view_id)
+            if updated_field_ids is not None and field_id in updated_field_ids:
+                filtered_view_ids.add(view_id)
+
+        aggregations_per_view = {
+            view_id: [
+                (field, aggregation_type_name)
+                for field, aggregation_type_name in aggregations
+                if updated_field_ids is None
+                or field.id in updated_field_ids
+                or view_id in filtered_view_ids
+            ]
+            for view_id, aggregations in aggregations_per_view.items()
+            if view_id not in time_sensitive_view_ids
+        }
+
+        cache_keys = {
+            (view_id, field.db_column): (
+                self._get_aggregation_value_cache_key(views[view_id], field.db_column),
+                self._get_aggregation_version_cache_key(
+                    views[view_id], field.db_column
+                ),
+            )
+            for view_id, aggregations in aggregations_per_view.items()
+            for field, _ in aggregations
+        }
+        if not cache_keys:
+            return {}
+
+        cached = cache.get_many([key for keys in cache_keys.values() for key in keys])
+
+        views_aggregations = {}
+        for view_id, aggregations in aggregations_per_view.items():
+            cached_aggregations = []
+            computation_ids = {}
+            not_cached_names = []
+            for field, aggregation_type_name in aggregations:
+                value_key, version_key = cache_keys[(view_id, field.db_column)]
+                cached_value = cached.get(value_key, {"version": 0})
+                is_valid = cached_value["version"] == cached.get(version_key, 1)
+                # Values cached without a computation id, like the ones cached before
+                # upgrading, can't be told apart from a later computation.
+                if is_valid and cached_value.get("computation_id"):
+                    cached_aggregations.append((field, aggregation_type_name))
+                    computation_ids[field.db_column] = cached_value["computation_id"]
+                else:
+                    not_cached_names.append(field.db_column)
+            if cached_aggregations:
+                views_aggregations[view_id] = (
+                    views[view_id],
+                    cached_aggregations,
+                    computation_ids,
+                )
+            # A value that is being computed right now might not include the change,
+            # so its version is incremented to prevent it from being cached.
+            if not_cached_names:
+                self.clear_aggregation_cache(views[view_id], not_cached_names)
+
+        return views_aggregations
+
+    def get_rows_aggregations(
+        self,
+        model: GeneratedTableModel,
+        row_ids: List[int],
+        views_aggregations: Dict[
+            int, Tuple[View, List[Tuple[Field, str]], Dict[str, str]]
+        ],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Computes the aggregations of only the provided rows for every view. Rows that
+        are not visible in the view because of its filters are not aggregated.
+
+        :param model: The model of the table the rows belong to.
+        :param row_ids: The ids of the rows to aggregate.
+        :param views_aggregations: The views and aggregations as returned by
+            `get_cached_incremental_aggregations`.
+        :return: A dict where the key is the view id and the value the aggregation
+            values of the rows keyed by field name.
+        """
+
+        return {
+            view_id: self.get_field_aggregations(
+                None,
+                view,
+                aggregations,
+                model,
+                skip_perm_check=True,
+                only_row_ids=row_ids,
+            )
+            for view_id, (view, aggregations, _) in views_aggregations.items()
+        }
+
+    def apply_incremental_aggregation_updates(
+        self,
+        views_aggregations: Dict[
+            int, Tuple[View, List[Tuple[Field, str]], Dict[str, str]]
+        ],
+        removed_values: Dict[int, Dict[str, Any]],
+        added_values: Dict[int, Dict[str, Any]],
+    ):
+        """
+        Updates the cached values of incremental aggregations by subtracting the
+        aggregations of the changed rows before the change and adding their
+        aggregations after the change. Only values that are still valid in cache are
+        updated. If the values of a view are being computed at the same time, or have
+        been computed again since the rows were aggregated, they're invalidated
+        instead because it's unknown if the change is included. A value
+        is also invalidated after `BASEROW_VIEW_AGGREGATION_MAX_INCREMENTAL_UPDATES`
+        updates so that it's computed from all the rows again once in a while.
+
+        :param views_aggregations: The views and aggregations as returned by
+            `get_cached_incremental_aggregations`.
+        :param removed_values: The aggregation values of the rows before the change
+            keyed by view id, as returned by `get_rows_aggregations`.
+        :param added_values: The aggregation values of the rows after the change
+            keyed by view id, as returned by `get_rows_aggregations`.
+        """
+
+        max_updates = settings.BASEROW_VIEW_AGGREGATION_MAX_INCREMENTAL_UPDATES
+
+        for view_id, (
+            view,
+            aggregations,
+            computation_ids,
+        ) in views_aggregations.items():
+            names = [field.db_column for field, _ in aggregations]
+
+            cache_lock = None
+            if hasattr(cache, "lock"):
+                cache_lock = cache.lock(
+                    self._get_aggregation_lock_cache_key(view), timeout=10
+                )
+                # The values are being computed, the result might or might not
+                # include this change, so it's safer to compute them again.
+                if not cache_lock.acquire(blocking=False):
+                    self.clear_aggregation_cache(view, names)
+                    continue
+
+            value_keys = {
+                name: self._get_aggregation_value_cache_key(view, name)
+                for name in names
+            }
+            version_keys = {
+                name: self._get_aggregation_version_cache_key(view, name)
+                for name in names
+            }
+            cached = cache.get_many(
+                list(value_keys.values()) + list(version_keys.values())
+            )
+
+            to_cache = {}
+            to_clear = []
+            for field_instance, aggregation_type_name in aggregations:
+                name = field_instance.db_column
+                cached_value = cached.get(value_keys[name], {"version": 0})
+                cached_version = cached.get(version_keys[name], 1)
+                if cached_value["version"] != cached_version:
+                    continue
+
+                # The value has been computed again since the rows were aggregated,
+                # so it might already include this change.
+                if cached_value.get("computation_id") != computation_ids.get(name):
+                    to_clear.append(name)
+                    continue
+
+                updates = cached_value.get("incremental_updates", 0) + 1
+                if updates > max_updates:
+                    to_clear.append(name)
+                    continue
+
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation_type_name
+                )
+                to_cache[value_keys[name]] = {
+                    "value": aggregation_type.apply_incremental_update(
+                        cached_value["value"],
+                        removed_values.get(view_id, {}).get(name),
+                        added_values.get(view_id, {}).get(name),
+                    ),
+                    "version": cached_version,
+                    "computation_id": cached_value.get("computation_id"),
+                    "incremental_updates": updates,
+                }
+
+            cache.set_many(to_cache)
+            if to_clear:
+                self.clear_aggregation_cache(view, to_clear)
+
+            if cache_lock is not None:
+                try:
+                    cache_lock.release()
+                except LockNotOwnedError:
+                    pass
+
+    def clear_incremental_aggregations_cache(
+        self,
+        views_aggregations: Dict[
+            int, Tuple[View, List[Tuple[Field, str]], Dict[str, str]]
+        ],
+    ):
+        """
+        Invalidates the cached values of the provided aggregations. Used when rows
+        changed in a way that can't be applied incrementally.
+
+        :param views_aggregations: The views and aggregations as returned by
+            `get_cached_incremental_aggregations`.
+        """
+
+        for view, aggregations, _ in views_aggregations.values():
+            self.clear_aggregation_cache(
+                view, [field.db_column for field, _ in aggregations]
+            )
+
     def get_field_aggregations(
         self,
         user: AbstractUser,
@@ -3089,6 +3469,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         search_mode: Optional[SearchMode] = None,
         skip_perm_check: bool = False,
         restrict_to_field_ids: Optional[Set[int]] = None,
+        only_row_ids: Optional[Iterable[int]] = None,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -3112,6 +3493,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_perm_check: Skips the permission check if not necessary.
         :param restrict_to_field_ids: Restrict the aggregations only to certain
             fields, for example if the aggregation is requested for public views.
+        :param only_row_ids: If provided, only the rows with these ids are aggregated.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -3134,6 +3516,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             adhoc_filters = AdHocFilters()
 
         queryset = model.objects.all().enhance_by_fields()
+        if only_row_ids is not None:
+            queryset = queryset.filter(id__in=only_row_ids)
 
         view_type = view_type_registry.get_by_model(view.specific_class)
 
@@ -3764,6 +4148,7 @@ class CachingPublicViewRowChecker:
             .prefetch_related("viewfilter_set", "filter_groups")
             .all()
         )
+        self._model = model
         self._updated_field_ids = updated_field_ids
         self._views_with_filters = []
         self._always_visible_views = []
@@ -3811,18 +4196,12 @@ class CachingPublicViewRowChecker:
         :return: A list of views where the row is visible for this checkers table.
         """
 
-        views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                if row.id not in self._view_row_check_cache[view.id]:
-                    self._view_row_check_cache[view.id][
-                        row.id
-                    ] = self._check_row_visible(filter_qs, row)
-                if self._view_row_check_cache[view.id][row.id]:
-                    views.append(view)
-            elif self._check_row_visible(filter_qs, row):
-                views.append(view)
-
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view({row.id})
+        views = [
+            view
+            for view, _, _ in self._views_with_filters
+            if row.id in visible_row_ids_per_view[view.id]
+        ]
         return views + self._always_visible_views
 
     def get_public_views_where_rows_are_visible(self, rows) -> List[PublicViewRows]:
@@ -3842,25 +4221,13 @@ class CachingPublicViewRowChecker:
         """
 
         visible_views_rows = []
-        row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                for id in row_ids:
-                    if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                        for visible_id in visible_ids:
-                            self._view_row_check_cache[view.id][visible_id] = True
-                        break
-                else:
-                    visible_ids = row_ids
-
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
-
-            else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view(
+            {row.id for row in rows}
+        )
+        for view, _, _ in self._views_with_filters:
+            visible_ids = visible_row_ids_per_view[view.id]
+            if len(visible_ids) > 0:
+                visible_views_rows.append(PublicViewRows(view, visible_ids))
 
         for visible_view in self._always_visible_views:
             visible_views_rows.append(
@@ -3869,15 +4236,69 @@ class CachingPublicViewRowChecker:
 
         return visible_views_rows
 
-    # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
-        return filter_qs.filter(id=row.id).exists()
+    def _get_visible_row_ids_per_view(self, row_ids: Set[int]) -> Dict[int, Set[int]]:
+        """
+        Returns the ids of the provided rows that are visible in each view with
+        filters. The results cached for a view are used if all the rows have been
+        checked before, all the other views are checked together in one query.
+
+        :param row_ids: The ids of the rows to check.
+        :return: A dict containing the visible row ids keyed by the view id.
+        """
+
+        visible_row_ids_per_view = {}
+        views_to_check = []
+        for view, filter_qs, can_use_cache in self._views_with_filters:
+            view_cache = self._view_row_check_cache[view.id]
+            if can_use_cache and all(row_id in view_cache for row_id in row_ids):
+                visible_row_ids_per_view[view.id] = {
+                    row_id for row_id in row_ids if view_cache[row_id]
+                }
+            else:
+                views_to_check.append((view, filter_qs, can_use_cache))
+
+        checked_row_ids_per_view = self._check_rows_visible(views_to_check, row_ids)
+        for view, _, can_use_cache in views_to_check:
+            visible_ids = checked_row_ids_per_view[view.id]
+            if can_use_cache:
+                for row_id in row_ids:
+                    self._view_row_check_cache[view.id][row_id] = row_id in visible_ids
+            visible_row_ids_per_view[view.id] = visible_ids
 
-    # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
+        return visible_row_ids_per_view
+
+    def _check_rows_visible(self, views_with_filters, row_ids) -> Dict[int, Set[int]]:
+        """
+        Checks in which of the provided views the rows are visible using a single
+        query, which selects one boolean column per view for every row.
+
+        :param views_with_filters: The views to check, with their filtered querysets.
+        :param row_ids: The ids of the rows to check.
+        :return: A dict containing the visible row ids keyed by the view id.
+        """
+
+        visible_row_ids_per_view = {view.id: set() for view, _, _ in views_with_filters}
+        if len(views_with_filters) == 0 or len(row_ids) == 0:
+            return visible_row_ids_per_view
+
+        # The filters of a view can contain annotations and joins, so every view is
+        # checked in an `EXISTS` subquery instead of a condition on the rows.
+        visibility_annotations = {
+            f"visible_in_view_{view.id}": Exists(filter_qs.filter(id=OuterRef("id")))
+            for view, filter_qs, _ in views_with_filters
+        }
+        rows_visibility = (
+            self._model.objects_and_trash.filter(id__in=row_ids)
+            .order_by()
+            .annotate(**visibility_annotations)
+            .values_list("id", *visibility_annotations.keys())
         )
+        for row_id, *visible_in_views in rows_visibility:
+            for (view, _, _), visible in zip(views_with_filters, visible_in_views):
+                if visible:
+                    visible_row_ids_per_view[view.id].add(row_id)
+
+        return visible_row_ids_per_view
 
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
@@ -3960,7 +4381,10 @@ class ViewSubscriptionHandler:
 
     @classmethod
     def notify_table_views_updates(
-        cls, views: list[View], model: GeneratedTableModel | None = None
+        cls,
+        views: list[View],
+        model: GeneratedTableModel | None = None,
+        row_ids: Iterable[int] | None = None,
     ):
         """
         Verify if the views have subscribers and notify them of any changes in the view
@@ -3969,17 +4393,22 @@ class ViewSubscriptionHandler:
         :param views: The views to notify subscribers of.
         :param model: The table model to use for the views. If not provided, the model
             will be generated automatically.
+        :param row_ids: If provided, only these rows are checked for entering or
+            exiting the views. Must contain every row that could have changed.
         """
 
         view_ids_with_subscribers = ViewSubscription.objects.filter(
             view__in=views
         ).values_list("view_id", flat=True)
         if view_ids_with_subscribers:
-            cls.notify_table_views(view_ids_with_subscribers, model)
+            cls.notify_table_views(view_ids_with_subscribers, model, row_ids=row_ids)
 
     @classmethod
     def notify_table_views(
-        cls, view_ids: list[int], model: GeneratedTableModel | None = None
+        cls,
+        view_ids: list[int],
+        model: GeneratedTableModel | None = None,
+        row_ids: Iterable[int] | None = None,
     ):
         """
         Notify subscribers of any changes in the view results, emitting the appropriate
@@ -3988,8 +4417,14 @@ class ViewSubscriptionHandler:
         :param view_ids: The view ids to notify subscribers of.
         :param model: The table model to use for the views. If not provided, the model
             will be generated automatically
+        :param row_ids: If provided, only these rows are checked for entering or
+            exiting the views instead of re-evaluating the whole view. Must contain
+            every row that could have changed since the last check.
         """
 
+        if row_ids is not None:
+            row_ids = list(row_ids)
+
         view_rows = list(
             ViewRows.objects.select_related("view__table")
             .filter(view_id__in=view_ids)
@@ -4002,7 +4437,9 @@ class ViewSubscriptionHandler:
 
         for view_state in view_rows:
             view = view_state.view
-            new_row_ids, row_ids_entered, row_ids_exited = view_state.get_diff(model)
+            row_id_set, row_ids_entered, row_ids_exited = view_state.get_diff(
+                model, row_ids=row_ids
+            )
             changed = False
             if row_ids_entered:
                 rows_entered_view.send(
@@ -4015,5 +4452,5 @@ class ViewSubscriptionHandler:
                 )
                 changed = True
             if changed:
-                view_state.row_ids = new_row_ids
+                view_state.row_id_set = row_id_set
                 view_state.save()
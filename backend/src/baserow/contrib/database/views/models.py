@@ -6,7 +6,6 @@ from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.models import AnonymousUser, User
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.db.models import Q
 from django.db.models.query import Prefetch
@@ -25,6 +24,7 @@ from baserow.contrib.database.views.registries import (
     view_filter_type_registry,
     view_type_registry,
 )
+from baserow.contrib.database.views.row_id_set import CompactRowIdSet
 from baserow.core.db import specific_queryset
 from baserow.core.mixins import (
     CreatedAndUpdatedOnMixin,
@@ -970,13 +970,29 @@ class FormViewFieldOptionsCondition(HierarchicalModelMixin, models.Model):
 
 class ViewRows(CreatedAndUpdatedOnMixin, models.Model):
     view = models.OneToOneField(View, on_delete=models.CASCADE, related_name="rows")
-    row_ids = ArrayField(
-        models.PositiveIntegerField(),
-        default=list,
-        help_text="The rows that are shown in the view. This list can be used by webhooks "
-        "to determine which rows have been changed since the last check.",
+    compressed_row_ids = models.BinaryField(
+        default=bytes,
+        help_text="The rows that are shown in the view, encoded as a "
+        "`CompactRowIdSet`. This set can be used by webhooks to determine which rows "
+        "have been changed since the last check.",
     )
 
+    @property
+    def row_id_set(self) -> CompactRowIdSet:
+        return CompactRowIdSet.from_bytes(self.compressed_row_ids)
+
+    @row_id_set.setter
+    def row_id_set(self, value: CompactRowIdSet):
+        self.compressed_row_ids = value.to_bytes()
+
+    @property
+    def row_ids(self) -> list[int]:
+        return list(self.row_id_set)
+
+    @row_ids.setter
+    def row_ids(self, value: Iterable[int]):
+        self.row_id_set = CompactRowIdSet.from_ids(value)
+
     @classmethod
     def create_missing_for_views(cls, views: list[View], model=None):
         """
@@ -999,28 +1015,55 @@ class ViewRows(CreatedAndUpdatedOnMixin, models.Model):
             row_ids = (
                 ViewHandler()
                 .get_queryset(view, model=model, apply_sorts=False)
+                .order_by()
                 .values_list("id", flat=True)
             )
-            view_rows.append(ViewRows(view=view, row_ids=list(row_ids)))
+            view_rows.append(
+                ViewRows(view=view, row_ids=row_ids.iterator(chunk_size=2000))
+            )
 
         return ViewRows.objects.bulk_create(view_rows, ignore_conflicts=True)
 
-    def get_diff(self, model=None):
+    def get_diff(self, model=None, row_ids: Optional[Iterable[int]] = None):
         """
         Executes the view query and returns the current row IDs in the view,
         along with the differences between the current state and the last saved state.
+
+        If `row_ids` are provided, the view query is only executed for those rows
+        because they are the only ones that could have entered or exited the view.
+        This makes the cost of the check relative to the number of changed rows
+        instead of the number of rows in the table.
+
+        :param model: The table model to use for the view query.
+        :param row_ids: Optionally the ids of the rows that have been changed since
+            the last check.
+        :return: A `CompactRowIdSet` with the current rows in the view, and sorted
+            lists of the row ids that entered and exited the view.
         """
 
         from baserow.contrib.database.views.handler import ViewHandler
 
         rows = ViewHandler().get_queryset(self.view, model=model, apply_sorts=False)
-        previous_row_ids = set(self.row_ids)
-        new_row_ids = set(rows.order_by().values_list("id", flat=True))
-
-        row_ids_entered = new_row_ids - previous_row_ids
-        row_ids_exited = previous_row_ids - new_row_ids
+        row_id_set = self.row_id_set
+
+        if row_ids is None:
+            previous_row_ids = set(row_id_set)
+            new_row_ids = set(rows.order_by().values_list("id", flat=True))
+            row_ids_entered = new_row_ids - previous_row_ids
+            row_ids_exited = previous_row_ids - new_row_ids
+            row_id_set = CompactRowIdSet.from_ids(new_row_ids)
+        else:
+            row_ids = set(row_ids)
+            visible_row_ids = set(
+                rows.filter(id__in=row_ids).order_by().values_list("id", flat=True)
+            )
+            previous_row_ids = {row_id for row_id in row_ids if row_id in row_id_set}
+            row_ids_entered = visible_row_ids - previous_row_ids
+            row_ids_exited = previous_row_ids - visible_row_ids
+            row_id_set.update(row_ids_entered)
+            row_id_set.difference_update(row_ids_exited)
 
-        return list(new_row_ids), list(row_ids_entered), list(row_ids_exited)
+        return row_id_set, sorted(row_ids_entered), sorted(row_ids_exited)
 
 
 class ViewSubscription(models.Model):
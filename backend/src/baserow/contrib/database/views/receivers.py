@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.dispatch import receiver
 
 from baserow.contrib.database.fields.signals import (
@@ -6,6 +7,8 @@ from baserow.contrib.database.fields.signals import (
     field_updated,
 )
 from baserow.contrib.database.rows.signals import (
+    before_rows_delete,
+    before_rows_update,
     rows_created,
     rows_deleted,
     rows_updated,
@@ -22,20 +25,26 @@ from baserow.contrib.database.views.signals import (
     view_updated,
 )
 
-from .handler import ViewSubscriptionHandler
+from .handler import ViewHandler, ViewSubscriptionHandler
 
 
-def _notify_table_data_updated(table: Table, model: GeneratedTableModel | None = None):
+def _notify_table_data_updated(
+    table: Table,
+    model: GeneratedTableModel | None = None,
+    row_ids: list[int] | None = None,
+):
     """
     Notifies the table views that the table data has been updated. This will result in
     the table views to be updated and the subscribers to be notified.
 
     :param table: The table for which the data has been updated.
     :param model: The model that was updated if available.
+    :param row_ids: The ids of the rows that have been changed if known. Only those
+        rows will then be checked for entering or exiting the views.
     """
 
     ViewSubscriptionHandler.notify_table_views_updates(
-        table.view_set.all(), model=model
+        table.view_set.all(), model=model, row_ids=row_ids
     )
 
 
@@ -52,12 +61,16 @@ def _notify_view_results_updated(view: View):
 
 @receiver([rows_updated, rows_created, rows_deleted])
 def notify_rows_signals(sender, rows, user, table, model, dependant_fields, **kwargs):
-    _notify_table_data_updated(table, model)
-
     updated_tables = set()
     for field in dependant_fields:
         updated_tables.add(field.table)
-    for updated_table in updated_tables:
+
+    # Dependant fields in the same table can change other rows than the ones in the
+    # signal, in which case all the rows must be checked.
+    row_ids = None if table in updated_tables else [row.id for row in rows]
+    _notify_table_data_updated(table, model, row_ids=row_ids)
+
+    for updated_table in updated_tables - {table}:
         _notify_table_data_updated(updated_table)
 
 
@@ -96,3 +109,120 @@ def notify_field_updated(sender, field, related_fields, user, **kwargs):
 @receiver(field_deleted)
 def notify_field_deleted(sender, field_id, field, related_fields, user, **kwargs):
     _notify_tables_of_fields_updated_or_deleted(field, related_fields, user, **kwargs)
+
+
+def _rows_change_is_incremental(table, dependant_fields, cascade_update=None) -> bool:
+    """
+    Returns whether only the rows in the signal have changed in the table, which is
+    required to update the view aggregations incrementally. Dependant fields in the
+    same table and cascade updates can also change other rows.
+    """
+
+    if cascade_update is not None and cascade_update.row_ids:
+        return False
+    return not any(field.table_id == table.id for field in dependant_fields)
+
+
+def _update_view_aggregations(
+    table,
+    dependant_fields,
+    cascade_update,
+    views_aggregations,
+    removed_values,
+    added_values,
+):
+    handler = ViewHandler()
+    if not _rows_change_is_incremental(table, dependant_fields, cascade_update):
+        handler.clear_incremental_aggregations_cache(views_aggregations)
+        return
+
+    # The cache must not be updated before the change is visible to others.
+    transaction.on_commit(
+        lambda: handler.apply_incremental_aggregation_updates(
+            views_aggregations, removed_values, added_values
+        )
+    )
+
+
+@receiver([before_rows_update, before_rows_delete])
+def before_rows_change_aggregate_rows(
+    sender, rows, user, table, model, updated_field_ids=None, **kwargs
+):
+    handler = ViewHandler()
+    views_aggregations = handler.get_cached_incremental_aggregations(
+        table, model, updated_field_ids
+    )
+    row_ids = [row.id for row in rows]
+    return views_aggregations, handler.get_rows_aggregations(
+        model, row_ids, views_aggregations
+    )
+
+
+@receiver(rows_created)
+def update_view_aggregations_after_rows_created(
+    sender, rows, user, table, model, dependant_fields, **kwargs
+):
+    handler = ViewHandler()
+    views_aggregations = handler.get_cached_incremental_aggregations(table, model)
+    if not views_aggregations:
+        return
+
+    added_values = handler.get_rows_aggregations(
+        model, [row.id for row in rows], views_aggregations
+    )
+    _update_view_aggregations(
+        table,
+        dependant_fields,
+        kwargs.get("cascade_update"),
+        views_aggregations,
+        {},
+        added_values,
+    )
+
+
+@receiver(rows_updated)
+def update_view_aggregations_after_rows_updated(
+    sender, rows, user, table, model, before_return, dependant_fields, **kwargs
+):
+    handler = ViewHandler()
+    before = dict(before_return).get(before_rows_change_aggregate_rows)
+    if before is None:
+        # The values before the change are unknown, so the aggregations can only be
+        # computed again.
+        handler.clear_incremental_aggregations_cache(
+            handler.get_cached_incremental_aggregations(
+                table, model, kwargs.get("updated_field_ids")
+            )
+        )
+        return
+
+    views_aggregations, removed_values = before
+    if not views_aggregations:
+        return
+
+    added_values = handler.get_rows_aggregations(
+        model, [row.id for row in rows], views_aggregations
+    )
+    _update_view_aggregations(
+        table,
+        dependant_fields,
+        kwargs.get("cascade_update"),
+        views_aggregations,
+        removed_values,
+        added_values,
+    )
+
+
+@receiver(rows_deleted)
+def update_view_aggregations_after_rows_deleted(
+    sender, rows, user, table, model, before_return, dependant_fields, **kwargs
+):
+    views_aggregations, removed_values = dict(before_return)[
+        before_rows_change_aggregate_rows
+    ]
+    if not views_aggregations:
+        return
+
+    _update_view_aggregations(
+        table, dependant_fields, None, views_aggregations, removed_values, {}
+    )
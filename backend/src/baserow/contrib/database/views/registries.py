@@ -683,7 +683,9 @@ class ViewType(
         )
 
     def after_field_value_update(
-        self, updated_fields: Union[Iterable["Field"], "Field"]
+        self,
+        updated_fields: Union[Iterable["Field"], "Field"],
+        incremental_fields: Optional[Iterable["Field"]] = None,
     ):
         """
         Triggered for each field table value modification. This method is generally
@@ -693,6 +695,10 @@ class ViewType(
         opportunity to react on any value change for a field.
 
         :param updated_fields: a unique or a list of affected field.
+        :param incremental_fields: The affected fields of which only the values of the
+            rows in the `rows_created`, `rows_updated` or `rows_deleted` signal that
+            follows have changed. The view type can use that signal to update data
+            related to these fields incrementally.
         """
 
     def after_field_update(self, updated_fields: Union[Iterable["Field"], "Field"]):
@@ -1071,6 +1077,14 @@ class ViewAggregationType(Instance):
 
     allowed_in_view = True
 
+    incremental = False
+    """
+    Indicates whether the aggregation is distributive, meaning that the aggregated
+    value of a view can be kept up to date by adding the aggregation of the created
+    rows and subtracting the aggregation of the deleted rows, without having to
+    aggregate all the rows again.
+    """
+
     def get_aggregation(
         self,
         field_name: str,
@@ -1094,6 +1108,23 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def apply_incremental_update(self, value: Any, removed: Any, added: Any) -> Any:
+        """
+        Returns the new aggregated value after some rows have changed. Only used if
+        the aggregation type is `incremental`.
+
+        :param value: The currently known aggregated value of all the rows.
+        :param removed: The aggregated value of the changed rows before the change.
+        :param added: The aggregated value of the changed rows after the change.
+        :return: The aggregated value of all the rows after the change.
+        """
+
+        if added is not None:
+            value = added if value is None else value + added
+        if removed is not None:
+            value = -removed if value is None else value - removed
+        return value
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
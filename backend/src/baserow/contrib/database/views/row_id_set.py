@@ -0,0 +1,170 @@
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+# Increase when the binary format changes, so that older values can still be decoded.
+ROW_ID_SET_FORMAT_VERSION = 1
+
+
+def _encode_varint(value: int, buffer: bytearray):
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _decode_varints(data: bytes, offset: int) -> Iterator[int]:
+    value = 0
+    shift = 0
+    for byte in data[offset:]:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = 0
+            shift = 0
+
+
+class CompactRowIdSet:
+    """
+    A set of row ids stored as a sorted list of inclusive `(start, end)` runs. Because
+    row ids are mostly created sequentially, the rows visible in a view typically form
+    a small number of runs, which makes this much smaller than a list of every id.
+    Adding and removing ids only touches the affected runs, so keeping the set up to
+    date costs relative to the number of changed rows instead of the number of ids in
+    the set.
+
+    The binary representation is a version byte followed by varint encoded pairs of
+    the gap since the end of the previous run and the length of the run.
+    """
+
+    def __init__(self, runs: List[Tuple[int, int]] | None = None):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        for start, end in runs or []:
+            self._starts.append(start)
+            self._ends.append(end)
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> "CompactRowIdSet":
+        """
+        Creates a new set containing the provided ids.
+
+        :param ids: The ids to add, they don't have to be sorted or unique.
+        :return: The new set.
+        """
+
+        runs = []
+        for row_id in sorted(set(ids)):
+            if runs and runs[-1][1] == row_id - 1:
+                runs[-1][1] = row_id
+            else:
+                runs.append([row_id, row_id])
+        return cls([(start, end) for start, end in runs])
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview | None) -> "CompactRowIdSet":
+        """
+        Decodes a set previously encoded using `to_bytes`.
+
+        :param data: The encoded set. An empty value results in an empty set.
+        :return: The decoded set.
+        """
+
+        if not data:
+            return cls()
+
+        data = bytes(data)
+        if data[0] != ROW_ID_SET_FORMAT_VERSION:
+            raise ValueError(f"Unknown row id set format version {data[0]}.")
+
+        runs = []
+        previous_end = -1
+        values = _decode_varints(data, 1)
+        for gap, length in zip(values, values):
+            start = previous_end + gap + 1
+            previous_end = start + length
+            runs.append((start, previous_end))
+        return cls(runs)
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: The compact binary representation of this set.
+        """
+
+        buffer = bytearray([ROW_ID_SET_FORMAT_VERSION])
+        previous_end = -1
+        for start, end in zip(self._starts, self._ends):
+            _encode_varint(start - previous_end - 1, buffer)
+            _encode_varint(end - start, buffer)
+            previous_end = end
+        return bytes(buffer)
+
+    def add(self, row_id: int):
+        index = bisect_right(self._starts, row_id) - 1
+        if index >= 0 and self._ends[index] >= row_id:
+            return
+
+        extends_previous = index >= 0 and self._ends[index] == row_id - 1
+        next_index = index + 1
+        extends_next = (
+            next_index < len(self._starts) and self._starts[next_index] == row_id + 1
+        )
+
+        if extends_previous and extends_next:
+            self._ends[index] = self._ends[next_index]
+            del self._starts[next_index]
+            del self._ends[next_index]
+        elif extends_previous:
+            self._ends[index] = row_id
+        elif extends_next:
+            self._starts[next_index] = row_id
+        else:
+            self._starts.insert(next_index, row_id)
+            self._ends.insert(next_index, row_id)
+
+    def discard(self, row_id: int):
+        index = bisect_right(self._starts, row_id) - 1
+        if index < 0 or self._ends[index] < row_id:
+            return
+
+        start, end = self._starts[index], self._ends[index]
+        if start == end:
+            del self._starts[index]
+            del self._ends[index]
+        elif row_id == start:
+            self._starts[index] = row_id + 1
+        elif row_id == end:
+            self._ends[index] = row_id - 1
+        else:
+            self._ends[index] = row_id - 1
+            self._starts.insert(index + 1, row_id + 1)
+            self._ends.insert(index + 1, end)
+
+    def update(self, row_ids: Iterable[int]):
+        for row_id in row_ids:
+            self.add(row_id)
+
+    def difference_update(self, row_ids: Iterable[int]):
+        for row_id in row_ids:
+            self.discard(row_id)
+
+    def __contains__(self, row_id: int) -> bool:
+        index = bisect_right(self._starts, row_id) - 1
+        return index >= 0 and self._ends[index] >= row_id
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end + 1)
+
+    def __len__(self) -> int:
+        return sum(end - start + 1 for start, end in zip(self._starts, self._ends))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactRowIdSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __repr__(self) -> str:
+        runs = list(zip(self._starts, self._ends))
+        return f"CompactRowIdSet({runs})"
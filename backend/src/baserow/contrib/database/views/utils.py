@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import Any, Dict
 
 from django.db.models.aggregates import Aggregate, Count
@@ -50,3 +51,19 @@ class DistributionAggregation:
             .order_by("-count", self.group_by)
             .values_list(self.group_by, "count")[:limit]
         )
+
+
+class RowCountMode(str, Enum):
+    # Count all the rows of the queryset, which can be slow on large tables.
+    EXACT = "exact"
+
+    # Use the maintained row count of the table if the view isn't filtered, otherwise
+    # the estimate of the query planner.
+    ESTIMATE = "estimate"
+
+    # Use the maintained row count of the table if the view isn't filtered, otherwise
+    # count up to `BASEROW_ROW_COUNT_CAP` rows.
+    CAPPED = "capped"
+
+
+ALL_ROW_COUNT_MODES = [getattr(mode, "value") for mode in RowCountMode]
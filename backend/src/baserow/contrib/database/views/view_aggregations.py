@@ -79,6 +79,7 @@ class CountViewAggregationType(ViewAggregationType):
 
     type = "count"
     allowed_in_view = False
+    incremental = True
 
     compatible_field_types = [
         TextFieldType.type,
@@ -124,6 +125,7 @@ class EmptyCountViewAggregationType(ViewAggregationType):
     """
 
     type = "empty_count"
+    incremental = True
 
     compatible_field_types = [
         TextFieldType.type,
@@ -300,6 +302,7 @@ class SumViewAggregationType(ViewAggregationType):
     """
 
     type = "sum"
+    incremental = True
 
     compatible_field_types = [
         NumberFieldType.type,
@@ -69,6 +69,7 @@ from .models import (
     GridView,
     GridViewFieldOptions,
     View,
+    ViewFilter,
 )
 from .registries import ViewType, form_view_mode_registry, view_filter_type_registry
 
@@ -277,24 +278,44 @@ class GridViewType(ViewType):
         )
         return [(option.field, option.aggregation_raw_type) for option in field_options]
 
-    def after_field_value_update(self, updated_fields):
+    def after_field_value_update(self, updated_fields, incremental_fields=None):
         """
         When a field value change, we need to invalidate the aggregation cache for this
-        field.
+        field. Incremental aggregations of the `incremental_fields` are not
+        invalidated because they're updated using the rows signal that follows,
+        except in views with a time-sensitive filter.
         """
 
         to_clear = defaultdict(list)
         view_map = {}
+        incremental_field_ids = {f.id for f in incremental_fields or []}
 
-        field_options = (
+        field_options = list(
             GridViewFieldOptions.objects.filter(field__in=updated_fields)
             .exclude(aggregation_raw_type="")
             .select_related("grid_view", "field")
         )
 
+        time_sensitive_view_ids = set()
+        if incremental_field_ids and field_options:
+            time_sensitive_view_ids = set(
+                ViewFilter.objects.filter(
+                    view_id__in=[options.grid_view_id for options in field_options],
+                    type__in=view_filter_type_registry.get_time_sensitive_filter_types(),
+                ).values_list("view_id", flat=True)
+            )
+
         for options in field_options:
-            to_clear[options.grid_view.id].append(options.field.db_column)
             view_map[options.grid_view.id] = options.grid_view
+            if (
+                options.field_id in incremental_field_ids
+                and options.grid_view_id not in time_sensitive_view_ids
+                and view_aggregation_type_registry.get(
+                    options.aggregation_raw_type
+                ).incremental
+            ):
+                continue
+            to_clear[options.grid_view.id].append(options.field.db_column)
 
         view_handler = ViewHandler()
         for view_id, names in to_clear.items():
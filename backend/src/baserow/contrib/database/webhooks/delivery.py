@@ -0,0 +1,599 @@
+import asyncio
+import json
+import time
+import uuid
+from copy import deepcopy
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+import httpcore
+import httpx
+from advocate import AddrValidator, UnacceptableAddressException
+from advocate.connection import advocate_getaddrinfo
+from asgiref.sync import sync_to_async
+from channels.db import database_sync_to_async
+from django_redis import get_redis_connection
+from loguru import logger
+
+from baserow.core.redis import RedisQueue
+
+from .exceptions import WebhookPayloadTooLarge
+from .validators import get_advocate_address_validator
+
+WEBHOOK_DELIVERY_PENDING_WEBHOOKS_KEY = "webhook_delivery_pending_webhooks"
+WEBHOOK_DELIVERY_RETRIES_KEY = "webhook_delivery_retries"
+
+
+def _get_redis_client():
+    return get_redis_connection("default")
+
+
+class ValidatingAsyncNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that resolves the host itself and only connects to an address
+    that is accepted by advocate's address validator. Because the validation happens
+    for every new connection, it also applies to redirects and can't be bypassed by a
+    DNS record that changes between the validation and the connection. The original
+    hostname is still used for TLS, so certificates are verified as usual.
+    """
+
+    def __init__(self, validator: AddrValidator):
+        self.validator = validator
+        self.backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        if not self.validator.is_hostname_allowed(host):
+            raise UnacceptableAddressException(host)
+
+        loop = asyncio.get_running_loop()
+        addrinfo = await loop.run_in_executor(
+            None, advocate_getaddrinfo, host, port, True
+        )
+
+        error = UnacceptableAddressException(host)
+        for res in addrinfo:
+            if not self.validator.is_addrinfo_allowed(res):
+                error = UnacceptableAddressException(res[4])
+                continue
+            try:
+                return await self.backend.connect_tcp(
+                    res[4][0],
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except httpcore.ConnectError as e:
+                error = e
+        raise error
+
+    async def sleep(self, seconds: float):
+        await self.backend.sleep(seconds)
+
+
+class ValidatingAsyncHTTPTransport(httpx.AsyncHTTPTransport):
+    """
+    HTTP transport that only connects to addresses accepted by the provided address
+    validator. See `ValidatingAsyncNetworkBackend`.
+    """
+
+    def __init__(self, validator: AddrValidator, limits: httpx.Limits):
+        super().__init__(limits=limits)
+        # httpx doesn't allow changing the network backend of its connection pool, so
+        # the pool is replaced by an identical one using the validating backend.
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=ValidatingAsyncNetworkBackend(validator),
+        )
+
+
+class WebhookDeliveryClient:
+    """
+    Makes the webhook requests with a separate keep-alive connection pool per host,
+    so that the connections to a receiver are reused between calls, and a slow
+    receiver can't use up the connections of the others. In production mode, only
+    connections to addresses allowed by the advocate address validator can be made.
+    """
+
+    def __init__(self, max_connections_per_host: Optional[int] = None):
+        if max_connections_per_host is None:
+            max_connections_per_host = (
+                settings.BASEROW_WEBHOOKS_MAX_CONNECTIONS_PER_HOST
+            )
+
+        self.limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_connections_per_host,
+        )
+        self.clients: Dict[Tuple[str, str, Optional[int]], httpx.AsyncClient] = {}
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """
+        Returns the client of the host of the provided URL, and creates it if it
+        doesn't exist yet.
+        """
+
+        parsed_url = httpx.URL(url)
+        key = (parsed_url.scheme, parsed_url.host, parsed_url.port)
+        if key not in self.clients:
+            self.clients[key] = self._create_client()
+        return self.clients[key]
+
+    def _create_client(self) -> httpx.AsyncClient:
+        timeout = httpx.Timeout(settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS)
+
+        if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
+            return httpx.AsyncClient(
+                limits=self.limits, timeout=timeout, follow_redirects=True
+            )
+
+        # The environment is not trusted because requests made through a proxy would
+        # not be validated.
+        return httpx.AsyncClient(
+            transport=ValidatingAsyncHTTPTransport(
+                get_advocate_address_validator(), self.limits
+            ),
+            timeout=timeout,
+            follow_redirects=True,
+            trust_env=False,
+        )
+
+    async def request(
+        self, method: str, url: str, headers: dict, payload: dict
+    ) -> Tuple[httpx.Request, httpx.Response]:
+        """
+        Makes a request to the provided URL with the provided settings.
+
+        :param method: The HTTP request method that must be used.
+        :param url: The URL that must called.
+        :param headers: The headers that must be sent.
+        :param payload: The JSON payload as dict that must be sent.
+        :return: The first request and the final response as the tuple
+            (request, response).
+        """
+
+        client = self.get_client(url)
+        # If there is a redirect, response.request will point to the final request in
+        # the request chain, so the first request is kept.
+        first_request = client.build_request(method, url, headers=headers, json=payload)
+        try:
+            response = await client.send(first_request)
+        except httpx.RequestError as exception:
+            # The body of a redirected request is a stream that can't be read
+            # anymore, so the error is also reported with the first request.
+            exception.request = first_request
+            raise
+
+        return first_request, response
+
+    async def aclose(self):
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients = {}
+
+
+class WebhookDeliveryQueue:
+    """
+    Keeps the webhook calls that must be delivered by the `WebhookDeliveryWorker` in
+    Redis. Every webhook has its own queue, so that the calls of a webhook are
+    delivered in the order they were triggered, and the ids of the webhooks having
+    pending calls are kept in a set. Retries are kept in a sorted set by the time they
+    must be made, so that waiting for them doesn't block anything.
+    """
+
+    def __init__(self, redis_connection=None):
+        self.redis_connection = redis_connection or _get_redis_client()
+
+    def get_webhook_queue(self, webhook_id: int) -> RedisQueue:
+        return RedisQueue(
+            f"webhook_{webhook_id}_delivery_queue",
+            self.redis_connection,
+            max_length=settings.BASEROW_MAX_WEBHOOK_CALLS_IN_QUEUE_PER_WEBHOOK,
+        )
+
+    def enqueue(self, call: dict) -> bool:
+        """
+        Adds a call to the end of the queue of its webhook.
+
+        :param call: The call containing the same keys as the arguments of the
+            `call_webhook` task.
+        :return: Indicates whether the call was added. If `False`, the queue of the
+            webhook is full.
+        """
+
+        webhook_id = call["webhook_id"]
+        queue = self.get_webhook_queue(webhook_id)
+        if not queue.enqueue_task(call):
+            logger.warning(
+                f"Webhook call {call['event_id']} is not enqueued because webhook id "
+                f"{webhook_id} reached the limit of {queue.max_length}."
+            )
+            return False
+
+        self.redis_connection.sadd(WEBHOOK_DELIVERY_PENDING_WEBHOOKS_KEY, webhook_id)
+        return True
+
+    def push_front(self, call: dict):
+        """
+        Adds a call to the front of the queue of its webhook, so that it's the next
+        call of the webhook to be delivered.
+        """
+
+        webhook_id = call["webhook_id"]
+        self.get_webhook_queue(webhook_id).push_front(call)
+        self.redis_connection.sadd(WEBHOOK_DELIVERY_PENDING_WEBHOOKS_KEY, webhook_id)
+
+    def pop_next(self, webhook_id: int) -> Optional[dict]:
+        """
+        Pops the next call of the webhook. If there are no calls left, the webhook is
+        removed from the pending webhooks.
+        """
+
+        queue = self.get_webhook_queue(webhook_id)
+        call = queue.get_and_pop_next()
+        if call is None:
+            self.redis_connection.srem(
+                WEBHOOK_DELIVERY_PENDING_WEBHOOKS_KEY, webhook_id
+            )
+            # A call can be enqueued between popping and removing the webhook from
+            # the pending ones, in which case it must be added back.
+            if self.redis_connection.llen(queue.queue_key) > 0:
+                self.redis_connection.sadd(
+                    WEBHOOK_DELIVERY_PENDING_WEBHOOKS_KEY, webhook_id
+                )
+        return call
+
+    def get_pending_webhook_ids(self) -> List[int]:
+        return sorted(
+            int(webhook_id)
+            for webhook_id in self.redis_connection.smembers(
+                WEBHOOK_DELIVERY_PENDING_WEBHOOKS_KEY
+            )
+        )
+
+    def clear(self, webhook_id: int):
+        self.get_webhook_queue(webhook_id).clear()
+        self.redis_connection.srem(WEBHOOK_DELIVERY_PENDING_WEBHOOKS_KEY, webhook_id)
+
+    def schedule_retry(self, call: dict, countdown: float):
+        """
+        Schedules the call to be enqueued again after the countdown.
+        """
+
+        # The unique key makes sure that identical calls are not merged in the set.
+        member = json.dumps({"key": str(uuid.uuid4()), "call": call})
+        self.redis_connection.zadd(
+            WEBHOOK_DELIVERY_RETRIES_KEY, {member: time.time() + countdown}
+        )
+
+    def enqueue_due_retries(self) -> int:
+        """
+        Enqueues the retries of which the countdown has passed.
+
+        :return: The number of enqueued retries.
+        """
+
+        members = self.redis_connection.zrangebyscore(
+            WEBHOOK_DELIVERY_RETRIES_KEY, "-inf", time.time()
+        )
+        count = 0
+        for member in members:
+            # Only the worker that manages to remove the retry enqueues it.
+            if self.redis_connection.zrem(WEBHOOK_DELIVERY_RETRIES_KEY, member):
+                self.enqueue(json.loads(member)["call"])
+                count += 1
+        return count
+
+    def pause(self, webhook_id: int, countdown: float):
+        """
+        Prevents delivering the calls of the webhook until the countdown has passed.
+        """
+
+        self.redis_connection.set(
+            f"webhook_{webhook_id}_delivery_paused", 1, px=max(int(countdown * 1000), 1)
+        )
+
+    def acquire_slot(self, webhook_id: int, concurrency: int) -> Optional[str]:
+        """
+        Acquires one of the delivery slots of the webhook, which limit the number of
+        calls of the webhook that are delivered concurrently across all workers. The
+        slot expires automatically in case the worker holding it dies.
+
+        :param webhook_id: The id of the webhook.
+        :param concurrency: The number of slots of the webhook.
+        :return: The key of the acquired slot, or None if the webhook is paused or if
+            all the slots are taken.
+        """
+
+        if self.redis_connection.exists(f"webhook_{webhook_id}_delivery_paused"):
+            return None
+
+        # A call can follow a couple of redirects, and its result must be stored
+        # before the slot is released.
+        expiry = settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS * 10 + 60
+        for slot in range(concurrency):
+            slot_key = f"webhook_{webhook_id}_delivery_slot_{slot}"
+            if self.redis_connection.set(slot_key, 1, nx=True, ex=expiry):
+                return slot_key
+        return None
+
+    def release_slot(self, slot_key: str):
+        self.redis_connection.delete(slot_key)
+
+
+def _get_active_webhook(webhook_id: int):
+    from .models import TableWebhook
+
+    return TableWebhook.objects.filter(id=webhook_id, active=True).first()
+
+
+def _paginate_payload(webhook, event_id: str, event_type: str, payload: dict):
+    from .notification_types import WebhookPayloadTooLargeNotificationType
+    from .registries import webhook_event_type_registry
+
+    webhook_event_type = webhook_event_type_registry.get(event_type)
+    try:
+        return webhook_event_type.paginate_payload(webhook, event_id, deepcopy(payload))
+    except WebhookPayloadTooLarge:
+        WebhookPayloadTooLargeNotificationType.notify_admins_in_workspace(
+            webhook, event_id
+        )
+        return None, None
+
+
+def _save_webhook_call_result(*args):
+    from .tasks import save_webhook_call_result
+
+    with transaction.atomic():
+        save_webhook_call_result(*args)
+
+
+def _in_thread(func):
+    """
+    Runs a blocking function, like the Redis commands of the queue, in a thread, so
+    that it doesn't block the event loop and the calls in flight.
+    """
+
+    return sync_to_async(func, thread_sensitive=False)
+
+
+class WebhookDeliveryWorker:
+    """
+    Delivers the webhook calls enqueued in the `WebhookDeliveryQueue` concurrently
+    using asyncio, so that a slow receiver only holds one of the many concurrent
+    calls instead of a whole Celery worker. The calls of a webhook are delivered with
+    at most `BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK` at the same time,
+    which guarantees that they're delivered in order if it's set to 1. Failed calls
+    are retried with an exponential backoff without occupying a delivery slot.
+    """
+
+    def __init__(
+        self,
+        queue: Optional[WebhookDeliveryQueue] = None,
+        client: Optional[WebhookDeliveryClient] = None,
+        max_concurrency: Optional[int] = None,
+        max_concurrent_calls_per_webhook: Optional[int] = None,
+        preserve_order: Optional[bool] = None,
+        poll_interval: float = 0.5,
+    ):
+        """
+        :param queue: The queue containing the calls that must be delivered.
+        :param client: The client used to make the requests.
+        :param max_concurrency: The maximum number of calls delivered concurrently by
+            this worker.
+        :param max_concurrent_calls_per_webhook: The maximum number of calls of the
+            same webhook delivered concurrently by all workers.
+        :param preserve_order: If True, a failed call is retried before any other
+            call of the same webhook is delivered. Otherwise, the other calls are
+            delivered while the failed call waits for its retry.
+        :param poll_interval: The number of seconds to wait before checking for new
+            calls when there was nothing to deliver.
+        """
+
+        self.queue = queue or WebhookDeliveryQueue()
+        self.client = client or WebhookDeliveryClient()
+        self.max_concurrency = (
+            max_concurrency or settings.BASEROW_WEBHOOKS_DELIVERY_WORKER_CONCURRENCY
+        )
+        self.max_concurrent_calls_per_webhook = (
+            max_concurrent_calls_per_webhook
+            or settings.BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK
+        )
+        self.preserve_order = (
+            settings.BASEROW_WEBHOOKS_DELIVERY_PRESERVE_ORDER
+            if preserve_order is None
+            else preserve_order
+        )
+        self.poll_interval = poll_interval
+        self.in_flight: Set[asyncio.Task] = set()
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None):
+        """
+        Delivers the calls until the stop event is set, after which the calls in
+        flight are completed.
+        """
+
+        stop_event = stop_event or asyncio.Event()
+        try:
+            while not stop_event.is_set():
+                if await self.dispatch() == 0:
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            await self.wait_for_in_flight()
+            await self.client.aclose()
+
+    async def run_until_idle(self):
+        """
+        Delivers calls until there is nothing left to deliver right away. Retries that
+        are not due yet are not waited for.
+        """
+
+        while await self.dispatch() > 0 or self.in_flight:
+            await self.wait_for_in_flight()
+
+    async def wait_for_in_flight(self):
+        if self.in_flight:
+            await asyncio.gather(*self.in_flight, return_exceptions=True)
+
+    async def dispatch(self) -> int:
+        """
+        Starts delivering the pending calls for which a slot is available.
+
+        :return: The number of calls of which the delivery was started.
+        """
+
+        available = self.max_concurrency - len(self.in_flight)
+        if available <= 0:
+            return 0
+
+        claimed_calls = await _in_thread(self.claim_calls)(available)
+        for call, slot_key in claimed_calls:
+            task = asyncio.create_task(self.deliver(call, slot_key))
+            self.in_flight.add(task)
+            task.add_done_callback(self.in_flight.discard)
+        return len(claimed_calls)
+
+    def claim_calls(self, limit: int) -> List[Tuple[dict, str]]:
+        """
+        Pops the next calls of the pending webhooks for which a delivery slot can be
+        acquired. It makes blocking Redis requests, so it must run in a thread.
+
+        :param limit: The maximum number of calls to claim.
+        :return: The claimed calls with the key of their slot.
+        """
+
+        self.queue.enqueue_due_retries()
+
+        claimed_calls = []
+        for webhook_id in self.queue.get_pending_webhook_ids():
+            while len(claimed_calls) < limit:
+                slot_key = self.queue.acquire_slot(
+                    webhook_id, self.max_concurrent_calls_per_webhook
+                )
+                if slot_key is None:
+                    break
+
+                call = self.queue.pop_next(webhook_id)
+                if call is None:
+                    self.queue.release_slot(slot_key)
+                    break
+
+                claimed_calls.append((call, slot_key))
+        return claimed_calls
+
+    async def deliver(self, call: dict, slot_key: str):
+        try:
+            await self.deliver_call(call)
+        except Exception as e:
+            logger.exception(f"Webhook call {call['event_id']} failed: {e}")
+        finally:
+            await _in_thread(self.queue.release_slot)(slot_key)
+
+    async def deliver_call(self, call: dict) -> bool:
+        """
+        Makes the request of the call, stores its result and enqueues the remaining
+        payload or the retry of the call.
+
+        :param call: The call containing the same keys as the arguments of the
+            `call_webhook` task.
+        :return: Indicates whether the call was successful.
+        """
+
+        webhook_id = call["webhook_id"]
+        event_id = call["event_id"]
+
+        webhook = await database_sync_to_async(_get_active_webhook)(webhook_id)
+        if webhook is None:
+            # If the webhook has been deleted or disabled, the other calls don't have
+            # to be made anymore.
+            await _in_thread(self.queue.clear)(webhook_id)
+            return False
+
+        payload, remaining = await database_sync_to_async(_paginate_payload)(
+            webhook, event_id, call["event_type"], call["payload"]
+        )
+        if payload is None:
+            # The payload is too large, so trying again won't make a difference.
+            return False
+
+        request = None
+        response = None
+        error = ""
+        try:
+            request, response = await self.client.request(
+                call["method"], call["url"], call["headers"], payload
+            )
+        except httpx.HTTPError as exception:
+            # This includes the connection errors, timeouts and too many redirects.
+            try:
+                request = exception.request
+            except RuntimeError:
+                # The error has been raised before the request was made.
+                pass
+            error = str(exception) or exception.__class__.__name__
+        except httpx.InvalidURL as exception:
+            error = f"InvalidURL: {exception}"
+        except UnacceptableAddressException as exception:
+            error = f"UnacceptableAddressException: {exception}"
+
+        success = response is not None and not response.is_error
+        await database_sync_to_async(_save_webhook_call_result)(
+            webhook,
+            event_id,
+            call["event_type"],
+            call["url"],
+            payload,
+            request,
+            response,
+            error,
+            success,
+        )
+
+        await _in_thread(self.enqueue_follow_up_call)(call, success, remaining)
+
+        return success
+
+    def enqueue_follow_up_call(self, call: dict, success: bool, remaining: dict):
+        """
+        Enqueues the call with the remaining payload if the call succeeded, or its
+        retry if it failed. It makes blocking Redis requests, so it must run in a
+        thread.
+
+        :param call: The call that has been delivered.
+        :param success: Indicates whether the call was successful.
+        :param remaining: The remaining payload that must still be sent, if any.
+        """
+
+        webhook_id = call["webhook_id"]
+        retries = call.get("retries", 0)
+
+        if success:
+            if remaining:
+                next_call = {**call, "payload": remaining, "retries": 0}
+                if self.preserve_order:
+                    self.queue.push_front(next_call)
+                else:
+                    self.queue.enqueue(next_call)
+        elif retries < settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL:
+            retry_call = {**call, "retries": retries + 1}
+            countdown = 2**retries
+            if self.preserve_order:
+                self.queue.push_front(retry_call)
+                self.queue.pause(webhook_id, countdown)
+            else:
+                self.queue.schedule_retry(retry_call, countdown)
@@ -1,12 +1,13 @@
 import json
 import uuid
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from django.conf import settings
 from django.contrib.auth.models import User as DjangoUser
 from django.db.models import Q
 from django.db.models.query import QuerySet
 
+import httpx
 from requests import PreparedRequest, Response
 
 from baserow.contrib.database.fields.models import Field
@@ -510,22 +511,27 @@ class WebhookHandler:
 
         return self.make_request(webhook.request_method, webhook.url, headers, payload)
 
-    def format_request(self, request: PreparedRequest) -> str:
+    def format_request(self, request: Union[PreparedRequest, httpx.Request]) -> str:
         """
-        Helper function, which will format a requests request object.
+        Helper function, which will format a requests or httpx request object.
         """
 
+        if isinstance(request, httpx.Request):
+            body = request.content
+        else:
+            body = request.body
+
         return "{}\r\n{}\r\n\r\n{}".format(
-            request.method + " " + request.url,
+            request.method + " " + str(request.url),
             "\r\n".join("{}: {}".format(k, v) for k, v in request.headers.items()),
-            json.dumps(json.loads(request.body or "{}"), indent=4),
+            json.dumps(json.loads(body or "{}"), indent=4),
         )
 
-    def format_response(self, response: Response) -> str:
+    def format_response(self, response: Union[Response, httpx.Response]) -> str:
         """
-        Helper function, which will format a requests response. It will try to format
-        the response body as json and if it is not a valid json it will fallback to
-        text.
+        Helper function, which will format a requests or httpx response. It will try
+        to format the response body as json and if it is not a valid json it will
+        fallback to text.
         """
 
         try:
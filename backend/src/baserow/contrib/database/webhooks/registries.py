@@ -1,5 +1,6 @@
 import uuid
 
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 from django.db.models import Q
@@ -9,6 +10,7 @@ from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.webhooks.models import TableWebhook, TableWebhookEvent
 from baserow.core.registry import Instance, ModelRegistryMixin, Registry
 
+from .delivery import WebhookDeliveryQueue
 from .exceptions import SkipWebhookCall, WebhookPayloadTooLarge
 from .tasks import call_webhook
 
@@ -23,7 +25,8 @@ class WebhookEventType(Instance):
     The 'listener' function will be called for every received signal. The listener will
     generate a unique ID for every received signal, find all webhooks that need to be
     called and subsequently generates the payload for every webhook and runs a celery
-    task that will do the actually call to the endpoint.
+    task, or enqueues a call for the webhook delivery worker if enabled, that will do
+    the actually call to the endpoint.
     """
 
     signal = None
@@ -200,15 +203,19 @@ class WebhookEventType(Instance):
                 payload = self.get_payload(event_id, webhook, **kwargs)
                 headers = webhook.header_dict
                 headers.update(**webhook_handler.get_headers(self.type, event_id))
-                call_webhook.delay(
-                    webhook_id=webhook.id,
-                    event_id=str(event_id),
-                    event_type=self.type,
-                    method=webhook.request_method,
-                    url=webhook.url,
-                    headers=headers,
-                    payload=payload,
-                )
+                call = {
+                    "webhook_id": webhook.id,
+                    "event_id": str(event_id),
+                    "event_type": self.type,
+                    "method": webhook.request_method,
+                    "url": webhook.url,
+                    "headers": headers,
+                    "payload": payload,
+                }
+                if settings.BASEROW_WEBHOOKS_DELIVERY_WORKER_ENABLED:
+                    WebhookDeliveryQueue().enqueue(call)
+                else:
+                    call_webhook.delay(**call)
             # Raised if the webhook should be skipped for whatever reason. In that case
             # we don't want to fail, but rather don't do anything.
             except SkipWebhookCall:
@@ -181,8 +181,6 @@ def make_request_and_save_result(
     from requests import RequestException
 
     from .handler import WebhookHandler
-    from .models import TableWebhookCall
-    from .notification_types import WebhookDeactivatedNotificationType
 
     handler = WebhookHandler()
 
@@ -201,6 +199,38 @@ def make_request_and_save_result(
     except UnacceptableAddressException as exception:
         error = f"UnacceptableAddressException: {exception}"
 
+    save_webhook_call_result(
+        webhook, event_id, event_type, url, payload, request, response, error, success
+    )
+
+    return success
+
+
+def save_webhook_call_result(
+    webhook, event_id, event_type, url, payload, request, response, error, success
+):
+    """
+    Stores the result of a webhook call in the call log, and updates the failed
+    triggers of the webhook. The webhook is deactivated and the workspace admins are
+    notified if it failed too many times in a row.
+
+    :param webhook: The webhook that was called.
+    :param event_id: The unique event id of the call.
+    :param event_type: The event type related to the webhook trigger.
+    :param url: The URL that was called.
+    :param payload: The payload that was sent.
+    :param request: The request that was made, if any.
+    :param response: The response that was received, if any.
+    :param error: The error message if the request could not be made.
+    :param success: Indicates whether the call was successful.
+    """
+
+    from .handler import WebhookHandler
+    from .models import TableWebhookCall
+    from .notification_types import WebhookDeactivatedNotificationType
+
+    handler = WebhookHandler()
+
     TableWebhookCall.objects.update_or_create(
         event_id=event_id,
         batch_id=payload.get("batch_id", None),
@@ -251,5 +281,3 @@ def make_request_and_save_result(
                 webhook
             )
         )
-
-    return success
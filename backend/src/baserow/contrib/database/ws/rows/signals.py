@@ -175,6 +175,23 @@ def row_orders_recalculated(sender, table, **kwargs):
     )
 
 
+@receiver(row_signals.row_orders_rebalanced)
+def row_orders_rebalanced(sender, table, rows, **kwargs):
+    if not rows:
+        return
+
+    table_page_type = page_registry.get("table")
+    row_orders = {row.id: str(row.order) for row in rows}
+    transaction.on_commit(
+        lambda: table_page_type.broadcast(
+            RealtimeRowMessages.row_orders_rebalanced(
+                table_id=table.id, row_orders=row_orders
+            ),
+            table_id=table.id,
+        )
+    )
+
+
 @receiver(row_signals.rows_history_updated)
 def rows_history_updated(
     sender,
@@ -266,3 +283,13 @@ class RealtimeRowMessages:
             "type": "row_orders_recalculated",
             "table_id": table_id,
         }
+
+    @staticmethod
+    def row_orders_rebalanced(
+        table_id: int, row_orders: Dict[int, str]
+    ) -> Dict[str, Any]:
+        return {
+            "type": "row_orders_rebalanced",
+            "table_id": table_id,
+            "row_orders": row_orders,
+        }
@@ -1271,8 +1271,8 @@ class CorePeriodicServiceType(TriggerServiceTypeMixin, CoreServiceType):
             "periodic-service-type-task", terminate=True
         )
 
-    def start_listening(self, on_event: Callable):
-        super().start_listening(on_event)
+    def start_listening(self, on_event: Callable, **kwargs):
+        super().start_listening(on_event, **kwargs)
         celery_app.on_after_finalize.connect(self._setup_periodic_task)
 
     def stop_listening(self):
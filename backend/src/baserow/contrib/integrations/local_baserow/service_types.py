@@ -1,3 +1,5 @@
+import threading
+from collections import defaultdict
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,6 +14,7 @@ from typing import (
 )
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import FieldDoesNotExist as DjangoFieldDoesNotExist
 from django.core.exceptions import ValidationError
@@ -133,6 +136,12 @@ if TYPE_CHECKING:
 
 SCHEMA_CACHE_TTL = 60 * 60  # 1 hour
 
+ROWS_SIGNAL_TRIGGER_INDEX_INVALIDATE_KEY = "local_baserow_rows_signal_trigger_index"
+
+# The row events of the savepoints of the current transaction, waiting for it to be
+# committed.
+pending_rows_events = threading.local()
+
 
 class LocalBaserowServiceType(ServiceType):
     """
@@ -2264,8 +2273,12 @@ class LocalBaserowRowsSignalServiceType(
     # the `type` is set to `array` instead of `object`.
     returns_list = True
 
-    def start_listening(self, on_event: Callable):
-        super().start_listening(on_event)
+    # Whether the rows must be serialized when the signal is sent, because they
+    # can't be fetched anymore once the transaction is committed.
+    serialize_rows_on_signal = False
+
+    def start_listening(self, on_event: Callable, **kwargs):
+        super().start_listening(on_event, **kwargs)
         self.signal.connect(self._signal_receiver)
 
     def stop_listening(self):
@@ -2274,37 +2287,144 @@ class LocalBaserowRowsSignalServiceType(
     def _process_event(self, *args, **kwargs):
         return self.on_event(*args, **kwargs) if callable(self.on_event) else None
 
-    def _handle_signal(
+    @staticmethod
+    def invalidate_trigger_index():
+        """
+        Invalidates the trigger index of all the row signal service types. Must be
+        called every time a trigger starts or stops being listened to, e.g. when a
+        workflow is published or unpublished.
+        """
+
+        global_cache.invalidate(invalidate_key=ROWS_SIGNAL_TRIGGER_INDEX_INVALIDATE_KEY)
+
+    def get_trigger_index(self) -> Dict[int, List[int]]:
+        """
+        Returns the ids of the services of this type listened to, per table id. The
+        index is cached until a workflow changes, so that the tables nobody listens
+        to don't cost a query per row signal.
+        """
+
+        return global_cache.get(
+            f"local_baserow_rows_signal_trigger_index_{self.type}",
+            default=self._build_trigger_index,
+            invalidate_key=ROWS_SIGNAL_TRIGGER_INDEX_INVALIDATE_KEY,
+            timeout=settings.AUTOMATION_TRIGGER_INDEX_CACHE_TIMEOUT_SECONDS,
+        )
+
+    def _build_trigger_index(
+        self, table_id: Optional[int] = None
+    ) -> Dict[int, List[int]]:
+        services = self.model_class.objects.filter(
+            self.services_filter, table__isnull=False
+        )
+        if table_id is not None:
+            services = services.filter(table_id=table_id)
+
+        index = defaultdict(list)
+        for service_id, service_table_id in services.values_list(
+            "id", "table_id"
+        ).distinct():
+            index[service_table_id].append(service_id)
+        return dict(index)
+
+    def is_table_watched(self, table_id: int) -> bool:
+        """
+        Returns whether any service of this type listens to the events of the table.
+
+        :param table_id: The id of the table the event happened in.
+        """
+
+        if settings.AUTOMATION_TRIGGER_INDEX_CACHE_TIMEOUT_SECONDS <= 0:
+            return table_id in self._build_trigger_index(table_id)
+
+        return table_id in self.get_trigger_index()
+
+    def _signal_receiver(
         self,
         sender,
-        user: AbstractUser,
-        rows: QuerySet["GeneratedTableModel"],
+        rows: List["GeneratedTableModel"],
         table: "Table",
-        model: "GeneratedTableModel",
+        user: Optional[AbstractUser] = None,
+        model: Optional["GeneratedTableModel"] = None,
         **kwargs,
     ):
-        def get_data():
-            # Make sure we have an up to date model
-            local_model = model.baserow_table.get_model()
+        if not rows or not self.is_table_watched(table.id):
+            return
+
+        serialized_rows = None
+        if self.serialize_rows_on_signal:
+            serialized_rows = self._serialize_rows(model or table.get_model(), rows)
+
+        queue_rows_event(
+            self.type,
+            table.id,
+            [row.id for row in rows],
+            user.id if user else None,
+            serialized_rows=serialized_rows,
+        )
 
-            serializer = get_row_serializer_class(
-                local_model, RowSerializer, is_response=True, user_field_names=True
+    def _serialize_rows(
+        self, model: "GeneratedTableModel", rows: List["GeneratedTableModel"]
+    ) -> List[Dict]:
+        serializer = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=True
+        )
+        return serializer(rows, many=True).data
+
+    def handle_rows_event(
+        self,
+        table_id: int,
+        row_ids: List[int],
+        user_id: Optional[int] = None,
+        serialized_rows: Optional[List[Dict]] = None,
+    ):
+        """
+        Calls the listener with the rows of a, possibly coalesced, row event. This is
+        executed by a celery task once the transaction of the event is committed.
+        Unless they were already serialized when the event happened, the rows are
+        fetched again, and only serialized if a trigger needs them. Nothing happens
+        if none of the rows exist anymore.
+
+        :param table_id: The id of the table the rows belong to.
+        :param row_ids: The ids of the rows of the event.
+        :param user_id: The id of the user who caused the event, if any.
+        :param serialized_rows: The rows serialized when the event happened, if they
+            can't be fetched anymore afterwards.
+        """
+
+        try:
+            table = TableHandler().get_table(table_id)
+        except TableDoesNotExist:
+            return
+
+        if serialized_rows is None:
+            model = table.get_model()
+            # Deleted rows are still in the trash, so they can be serialized too.
+            rows_by_id = (
+                model.objects_and_trash.all().enhance_by_fields().in_bulk(row_ids)
             )
+            rows = [rows_by_id[row_id] for row_id in row_ids if row_id in rows_by_id]
+            if not rows:
+                return
 
+        user = get_user_model().objects.filter(id=user_id).first() if user_id else None
+
+        def get_data():
             return {
-                "results": serializer(rows, many=True).data,
+                "results": (
+                    serialized_rows
+                    if serialized_rows is not None
+                    else self._serialize_rows(model, rows)
+                ),
                 "has_next_page": False,
             }
 
         self._process_event(
-            self.model_class.objects.filter(table=table),
+            self.model_class.objects.filter(table_id=table_id),
             get_data,
             user=user,
         )
 
-    def _signal_receiver(self, *args, **kwargs):
-        transaction.on_commit(lambda: self._handle_signal(*args, **kwargs))
-
     def import_context_path(
         self, path: List[str], id_mapping: Dict[int, int], **kwargs
     ):
@@ -2341,6 +2461,88 @@ class LocalBaserowRowsSignalServiceType(
         return [index, imported_field_dbname]
 
 
+class PendingRowsEvents:
+    """
+    The row events queued in one savepoint of a transaction. It's registered as the
+    `on_commit` callback of that savepoint, so that if the savepoint or the
+    transaction is rolled back, its events are discarded together with it.
+    """
+
+    def __init__(self):
+        self.events = {}
+
+    def __call__(self):
+        dispatch_rows_events(self.events)
+
+
+def _get_pending_rows_events(connection) -> PendingRowsEvents:
+    savepoint_key = tuple(connection.savepoint_ids)
+    registered_callbacks = set(func for _, func, _ in connection.run_on_commit)
+    pending = getattr(pending_rows_events, "by_savepoint", {})
+
+    if pending.get(savepoint_key) not in registered_callbacks:
+        # The callbacks that are not registered anymore have either been called or
+        # been discarded because their savepoint was rolled back.
+        pending = {
+            key: callback
+            for key, callback in pending.items()
+            if callback in registered_callbacks
+        }
+        pending[savepoint_key] = PendingRowsEvents()
+        transaction.on_commit(pending[savepoint_key])
+        pending_rows_events.by_savepoint = pending
+
+    return pending[savepoint_key]
+
+
+def queue_rows_event(
+    service_type: str,
+    table_id: int,
+    row_ids: List[int],
+    user_id: Optional[int],
+    serialized_rows: Optional[List[Dict]] = None,
+):
+    """
+    Queues a row event until the current transaction is committed, and then hands it
+    to a celery task. The events of the same type, table and user in the same
+    savepoint are coalesced, so that an import creating the rows in many chunks
+    results in a single trigger payload.
+
+    :param service_type: The type of the row signal service type.
+    :param table_id: The id of the table the rows belong to.
+    :param row_ids: The ids of the rows of the event.
+    :param user_id: The id of the user who caused the event, if any.
+    :param serialized_rows: The serialized rows, in the same order as the ids, if
+        they must be passed on to the task.
+    """
+
+    rows = dict(zip(row_ids, serialized_rows or [None] * len(row_ids)))
+
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        dispatch_rows_events({(service_type, table_id, user_id): rows})
+        return
+
+    events = _get_pending_rows_events(connection).events
+    events.setdefault((service_type, table_id, user_id), {}).update(rows)
+
+
+def dispatch_rows_events(
+    events: Dict[Tuple[str, int, Optional[int]], Dict[int, Optional[Dict]]]
+):
+    from baserow.contrib.integrations.tasks import dispatch_rows_signal_event
+
+    for (service_type, table_id, user_id), rows in events.items():
+        serialized_rows = list(rows.values())
+        dispatch_rows_signal_event.delay(
+            service_type,
+            table_id,
+            list(rows.keys()),
+            user_id,
+            serialized_rows=None if None in serialized_rows else serialized_rows,
+        )
+
+
 class LocalBaserowRowsCreatedServiceType(LocalBaserowRowsSignalServiceType):
     signal = rows_created
     type = "local_baserow_rows_created"
@@ -2357,3 +2559,5 @@ class LocalBaserowRowsDeletedServiceType(LocalBaserowRowsSignalServiceType):
     signal = rows_deleted
     type = "local_baserow_rows_deleted"
     model_class = LocalBaserowRowsDeleted
+    # Permanently deleted rows don't exist anymore when the task runs.
+    serialize_rows_on_signal = True
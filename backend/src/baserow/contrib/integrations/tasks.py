@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional
+
 from django.db import transaction
 from django.utils import timezone
 
@@ -18,3 +20,24 @@ def call_periodic_services_that_are_due(self):
         service_type_registry.get(
             CorePeriodicServiceType.type
         ).call_periodic_services_that_are_due(timezone.now())
+
+
+@app.task(
+    bind=True,
+    queue="automation_workflow",
+)
+def dispatch_rows_signal_event(
+    self,
+    service_type: str,
+    table_id: int,
+    row_ids: List[int],
+    user_id: Optional[int] = None,
+    serialized_rows: Optional[List[Dict]] = None,
+):
+    """
+    Hands the rows of a coalesced row event to the triggers listening to it.
+    """
+
+    service_type_registry.get(service_type).handle_rows_event(
+        table_id, row_ids, user_id, serialized_rows=serialized_rows
+    )
@@ -68,6 +68,19 @@ class LocalCache:
 
         return cached[key]
 
+    def set(self, key: str, value: T):
+        """
+        Store a value in the cache, replacing the existing value if there is one.
+        """
+
+        if not settings.BASEROW_USE_LOCAL_CACHE:
+            return
+
+        if not hasattr(self._local, "cache"):
+            self._local.cache = {}
+
+        self._local.cache[key] = value
+
     def delete(self, key: str):
         """
         Delete a value from the cache. If the key does not exist, no action is taken.
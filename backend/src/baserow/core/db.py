@@ -1,10 +1,13 @@
 import contextlib
+import io
+import json
 import random
 import time
 from collections import defaultdict
+from datetime import timedelta
 from decimal import Decimal
 from functools import cache, wraps
-from math import ceil
+from math import ceil, floor
 from typing import (
     Any,
     Callable,
@@ -15,13 +18,34 @@ from typing import (
     Optional,
     Set,
     Tuple,
+    Type,
     TypeVar,
 )
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import DEFAULT_DB_ALIAS, OperationalError, connection, transaction
-from django.db.models import ForeignKey, ManyToManyField, Max, Model, Prefetch, QuerySet
+from django.contrib.postgres.fields import ArrayField
+from django.core.exceptions import EmptyResultSet
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    OperationalError,
+    connection,
+    connections,
+    transaction,
+)
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+from django.db.backends.utils import CursorWrapper
+from django.db.models import (
+    Field,
+    ForeignKey,
+    JSONField,
+    ManyToManyField,
+    Max,
+    Model,
+    Prefetch,
+    Q,
+    QuerySet,
+)
 from django.db.models.functions import Collate
 from django.db.models.query import ModelIterable
 from django.db.models.sql.query import LOOKUP_SEP
@@ -29,7 +53,7 @@ from django.db.transaction import Atomic, get_connection
 
 from loguru import logger
 
-from baserow.core.exceptions import DeadlockException
+from baserow.core.exceptions import CannotCalculateIntermediateOrder, DeadlockException
 from baserow.core.psycopg import is_deadlock_error, sql
 
 from .utils import find_intermediate_order
@@ -305,6 +329,29 @@ def transaction_atomic(
         yield a
 
 
+def estimate_queryset_count(queryset: QuerySet) -> int:
+    """
+    Asks the query planner how many rows the queryset is expected to return. This is
+    much cheaper than a `COUNT(*)` on large tables, but only an estimate based on the
+    table statistics.
+
+    :param queryset: The queryset to estimate the number of rows for.
+    :return: The estimated number of rows.
+    """
+
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 def get_unique_orders_before_item(
     before: Model,
     queryset: QuerySet,
@@ -343,6 +390,84 @@ def get_unique_orders_before_item(
     return new_orders
 
 
+def rebalance_orders_before_item(
+    before: Model,
+    queryset: QuerySet,
+    field: str = "order",
+    window_size: int = 32,
+    max_window_size: int = 1024,
+    max_decimal_places: int = 4,
+) -> List[Model]:
+    """
+    Spreads the orders of a window of items directly before the provided `before`
+    over the range between the item below the window and `before`. This makes room
+    to calculate new intermediate orders before `before` again, without changing
+    the position of any item and without touching the items outside the window.
+
+    The new orders are multiples of the coarsest possible step (1, 0.1, 0.01, ...),
+    so that they can be represented by simple fractions. If the items don't fit,
+    the window is doubled until `max_window_size` is reached.
+
+    id     old_order                  new_order
+    1      1.00000000000000000000     1.00000000000000000000 (below the window)
+    2      1.00000000000000000001     1.30000000000000000000
+    3      1.00000000000000000002     1.60000000000000000000
+    4      2.00000000000000000000     2.00000000000000000000 (before)
+
+    :param before: The model instance where the before orders must be
+        rebalanced for.
+    :param queryset: The queryset selecting all the items that share the order,
+        including the ones that are not visible, like trashed ones.
+    :param field: The order field name.
+    :param window_size: The initial number of items that are rebalanced.
+    :param max_window_size: The maximum number of items that can be rebalanced.
+    :param max_decimal_places: The maximum number of decimal places of the new
+        orders.
+    :raises CannotCalculateIntermediateOrder: If the items before `before` can't be
+        rebalanced within the maximum window size. The full order of the items must
+        be recalculated in this case.
+    :return: The rebalanced items with their new order.
+    """
+
+    upper = getattr(before, field)
+    preceding_items = queryset.filter(
+        Q(**{f"{field}__lt": upper}) | Q(**{field: upper, "id__lt": before.id})
+    ).order_by(f"-{field}", "-id")
+
+    while window_size <= max_window_size:
+        items = list(preceding_items[: window_size + 1])
+        if len(items) > window_size:
+            lower = getattr(items.pop(), field)
+        else:
+            lower = Decimal("0")
+        items.reverse()
+
+        for decimal_places in range(0, max_decimal_places + 1):
+            first = floor(lower.scaleb(decimal_places)) + 1
+            last = ceil(upper.scaleb(decimal_places)) - 1
+            # The number of steps between the new orders, leaving at least the same
+            # free space between the last item and `before`.
+            spacing = (last - first + 1) // (len(items) + 1)
+            if spacing < 1:
+                continue
+
+            for index, item in enumerate(items, start=1):
+                new_order = Decimal(first - 1 + index * spacing).scaleb(-decimal_places)
+                setattr(item, field, round(new_order, 20))
+            queryset.bulk_update(items, [field])
+            return items
+
+        if len(items) < window_size:
+            # The window already contains all the preceding items, so increasing it
+            # won't make a difference.
+            break
+        window_size *= 2
+
+    raise CannotCalculateIntermediateOrder(
+        "The orders before the item could not be rebalanced."
+    )
+
+
 def get_highest_order_of_queryset(
     queryset: QuerySet,
     amount: int = 1,
@@ -868,3 +993,125 @@ def atomic_with_retry_on_deadlock(
         return wrapper
 
     return decorator
+
+
+def _to_copy_csv_array(values: List[Any]) -> str:
+    elements = []
+    for value in values:
+        if value is None:
+            elements.append("NULL")
+        else:
+            escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+            elements.append(f'"{escaped}"')
+    return "{" + ",".join(elements) + "}"
+
+
+def _to_copy_csv_text(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    elif isinstance(value, timedelta):
+        # The default string representation, like `1 day, 0:00:05`, is not a valid
+        # PostgreSQL interval.
+        value = f"{value.days} days {value.seconds}.{value.microseconds:06d} seconds"
+    else:
+        value = str(value)
+
+    escaped = value.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def _get_copy_value(field: Field, instance: Model) -> Any:
+    value = field.pre_save(instance, True)
+    if value is None:
+        return None
+    elif isinstance(field, JSONField):
+        return json.dumps(value, cls=field.encoder)
+
+    value = field.get_prep_value(value)
+    if value is not None and isinstance(field, ArrayField):
+        value = _to_copy_csv_array(value)
+    return value
+
+
+def copy_rows_into_table(
+    cursor: CursorWrapper,
+    table_name: str,
+    column_names: List[str],
+    rows: Iterable[Iterable[Any]],
+):
+    """
+    Writes the provided rows into the table using `COPY`. The values are sent as
+    text and converted to the type of their column by PostgreSQL.
+
+    :param cursor: The cursor used to execute the `COPY` statement.
+    :param table_name: The name of the table where the rows must be written.
+    :param column_names: The names of the columns, in the same order as the values
+        of every row.
+    :param rows: The rows to write, where every row is an iterable of values.
+    """
+
+    data = io.StringIO()
+    for row in rows:
+        data.write(",".join(_to_copy_csv_text(value) for value in row))
+        data.write("\n")
+
+    copy_sql = sql.SQL(
+        "COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    ).format(
+        table=sql.Identifier(table_name),
+        columns=sql.SQL(", ").join(sql.Identifier(name) for name in column_names),
+    )
+
+    # The copy methods are called on the underlying cursor, so their errors must be
+    # wrapped explicitly to be raised as Django database errors, like an `INSERT`.
+    with cursor.db.wrap_database_errors:
+        if is_psycopg3:
+            with cursor.copy(copy_sql) as copy:
+                copy.write(data.getvalue())
+        else:
+            data.seek(0)
+            cursor.copy_expert(copy_sql.as_string(cursor.connection), data)
+
+
+def bulk_insert_with_copy(
+    model: Type[Model], instances: List[Model], using: str = DEFAULT_DB_ALIAS
+) -> List[Model]:
+    """
+    Inserts the provided instances using `COPY`, which has a lot less overhead than
+    `INSERT` for a large number of rows. The primary keys are reserved upfront from
+    the sequence of the table, so that they're set on the instances afterwards, like
+    `bulk_create` does.
+
+    :param model: The model of the instances.
+    :param instances: The instances that must be inserted.
+    :param using: The database alias to insert into.
+    :return: The inserted instances with their primary key set.
+    """
+
+    if not instances:
+        return instances
+
+    opts = model._meta
+    fields = opts.concrete_fields
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+            "FROM generate_series(1, %s)",
+            [opts.db_table, opts.pk.column, len(instances)],
+        )
+        for instance, (pk,) in zip(instances, cursor.fetchall()):
+            instance.pk = pk
+
+        copy_rows_into_table(
+            cursor,
+            opts.db_table,
+            [f.column for f in fields],
+            ([_get_copy_value(f, instance) for f in fields] for instance in instances),
+        )
+
+    for instance in instances:
+        instance._state.adding = False
+        instance._state.db = using
+
+    return instances
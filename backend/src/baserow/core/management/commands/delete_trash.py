@@ -15,13 +15,43 @@ class Command(BaseCommand):
             action="store_true",
             help="Delete all items from trash regardless of their marked status.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="The maximum number of trash entries deleted per transaction.",
+        )
+        parser.add_argument(
+            "--max-locks-per-batch",
+            type=int,
+            default=None,
+            help="The maximum estimated number of tables locked per transaction.",
+        )
+        parser.add_argument(
+            "--max-rows-per-second",
+            type=int,
+            default=None,
+            help="Throttles the deletion to this number of trashed rows per second.",
+        )
 
     def handle(self, *args, **options):
         delete_all = options.get("delete_all", False)
         try:
             if delete_all:
                 TrashHandler().mark_all_trash_for_permanent_deletion()
-            TrashHandler().permanently_delete_marked_trash()
+            progress = TrashHandler().permanently_delete_marked_trash(
+                batch_size=options.get("batch_size"),
+                max_locks_per_batch=options.get("max_locks_per_batch"),
+                max_rows_per_second=options.get("max_rows_per_second"),
+            )
         except PermanentDeletionMaxLocksExceededException as e:
             self.stdout.write(self.style.ERROR(e.message))
             sys.exit(1)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deleted {progress.entries_deleted} trash entries, including "
+                f"{progress.rows_deleted} rows, in {progress.batches} batches "
+                f"(throttled for {progress.throttled_seconds:.1f} seconds)."
+            )
+        )
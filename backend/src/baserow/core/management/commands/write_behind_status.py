@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from baserow.core.write_behind.handler import WriteBehindHandler
+from baserow.core.write_behind.registries import write_behind_buffer_type_registry
+
+
+class Command(BaseCommand):
+    help = (
+        "Reports how far behind the consumer of every write-behind buffer is, so the "
+        "number of pending messages and the age of the oldest one."
+    )
+
+    def handle(self, *args, **options):
+        handler = WriteBehindHandler()
+        for buffer_type in write_behind_buffer_type_registry.get_all():
+            lag = handler.get_lag(buffer_type)
+            enabled = "enabled" if handler.is_enabled(buffer_type) else "disabled"
+            self.stdout.write(
+                f"{buffer_type.type} ({enabled}): {lag.pending_messages} pending "
+                f"messages, oldest {lag.oldest_message_age_seconds:.1f} seconds ago"
+            )
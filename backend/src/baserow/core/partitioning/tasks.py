@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from celery_singleton import Singleton
+
+from baserow.config.celery import app
+
+
+@app.task(
+    base=Singleton,
+    raise_on_duplicate=False,
+    bind=True,
+    queue="export",
+    lock_expiry=60 * 30,
+)
+def create_future_partitions(self):
+    """
+    Creates the monthly partitions of all the partitioned tables ahead of time.
+    """
+
+    from .utils import create_monthly_partitions, get_monthly_partitioned_tables
+
+    for table_name in get_monthly_partitioned_tables():
+        create_monthly_partitions(
+            table_name, settings.BASEROW_PARTITIONS_CREATE_MONTHS_AHEAD
+        )
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_partitioning_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        timedelta(minutes=settings.BASEROW_PARTITIONS_CREATE_INTERVAL_MINUTES),
+        create_future_partitions.s(),
+    )
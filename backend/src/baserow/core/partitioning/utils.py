@@ -0,0 +1,387 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from django.db import connection as default_connection
+from django.db import transaction
+from django.utils import timezone as django_timezone
+from django.utils.dateparse import parse_datetime
+
+from loguru import logger
+
+LEGACY_PARTITION_SUFFIX = "legacy"
+DEFAULT_PARTITION_SUFFIX = "default"
+MONTHLY_PARTITION_SUFFIX_FORMAT = "p%Y%m"
+
+PARTITION_BOUND_REGEX = re.compile(r"FROM \((.+)\) TO \((.+)\)")
+
+
+@dataclass
+class Partition:
+    name: str
+    start: Optional[datetime]
+    """The inclusive lower bound, or `None` if unbounded."""
+
+    end: Optional[datetime]
+    """The exclusive upper bound, or `None` if unbounded."""
+
+    is_default: bool = False
+
+
+def get_month_start(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def add_months(month_start: datetime, months: int) -> datetime:
+    month_index = month_start.month - 1 + months
+    return month_start.replace(
+        year=month_start.year + month_index // 12, month=month_index % 12 + 1
+    )
+
+
+def _quote_literal(value: datetime) -> str:
+    return f"'{value.isoformat()}'"
+
+
+def is_partitioned(table_name: str, connection=None) -> bool:
+    """
+    Checks whether the table is a natively partitioned Postgres table.
+
+    :param table_name: The name of the table to check.
+    :param connection: The connection to use, defaults to the default connection.
+    """
+
+    connection = connection or default_connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)",
+            [connection.ops.quote_name(table_name)],
+        )
+        row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def _parse_bound(value: str) -> Optional[datetime]:
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return parse_datetime(value.strip("'"))
+
+
+def get_partitions(table_name: str, connection=None) -> List[Partition]:
+    """
+    Returns the partitions of the range partitioned table ordered by their lower
+    bound.
+
+    :param table_name: The name of the partitioned table.
+    :param connection: The connection to use, defaults to the default connection.
+    """
+
+    connection = connection or default_connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            INNER JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            """,
+            [connection.ops.quote_name(table_name)],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        match = PARTITION_BOUND_REGEX.search(bound)
+        if match is None:
+            partitions.append(Partition(name, None, None, is_default=True))
+        else:
+            partitions.append(
+                Partition(name, _parse_bound(match[1]), _parse_bound(match[2]))
+            )
+
+    min_datetime = datetime.min.replace(tzinfo=timezone.utc)
+    return sorted(partitions, key=lambda p: p.start or min_datetime)
+
+
+def _is_month_covered(partitions: List[Partition], month_start: datetime) -> bool:
+    return any(
+        (partition.start is None or partition.start <= month_start)
+        and (partition.end is None or partition.end > month_start)
+        for partition in partitions
+        if not partition.is_default
+    )
+
+
+def create_monthly_partition(table_name: str, month_start: datetime, connection=None):
+    """
+    Creates the partition that holds the rows of the month starting at
+    `month_start`. Rows of that month that ended up in the default partition
+    because the partition didn't exist yet are moved into the new partition.
+
+    :param table_name: The name of the partitioned table.
+    :param month_start: The first moment of the month in UTC.
+    :param connection: The connection to use, defaults to the default connection.
+    """
+
+    connection = connection or default_connection
+    qn = connection.ops.quote_name
+
+    month_end = add_months(month_start, 1)
+    partition_name = (
+        f"{table_name}_{month_start.strftime(MONTHLY_PARTITION_SUFFIX_FORMAT)}"
+    )
+    default_partition_name = f"{table_name}_{DEFAULT_PARTITION_SUFFIX}"
+    partition_key = _get_partition_key(table_name, connection)
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {qn(partition_name)} (LIKE {qn(table_name)} "
+            f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE)"
+        )
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {qn(default_partition_name)}
+                WHERE {qn(partition_key)} >= {_quote_literal(month_start)}
+                AND {qn(partition_key)} < {_quote_literal(month_end)}
+                RETURNING *
+            )
+            INSERT INTO {qn(partition_name)} SELECT * FROM moved
+            """
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(table_name)} ATTACH PARTITION {qn(partition_name)} "
+            f"FOR VALUES FROM ({_quote_literal(month_start)}) "
+            f"TO ({_quote_literal(month_end)})"
+        )
+
+
+def _get_partition_key(table_name: str, connection) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT attribute.attname
+            FROM pg_partitioned_table
+            INNER JOIN pg_attribute attribute
+                ON attribute.attrelid = pg_partitioned_table.partrelid
+                AND attribute.attnum = pg_partitioned_table.partattrs[0]
+            WHERE pg_partitioned_table.partrelid = to_regclass(%s)
+            """,
+            [connection.ops.quote_name(table_name)],
+        )
+        return cursor.fetchone()[0]
+
+
+def create_monthly_partitions(
+    table_name: str,
+    months_ahead: int,
+    now: Optional[datetime] = None,
+    connection=None,
+):
+    """
+    Makes sure that a partition exists for the current month and the next
+    `months_ahead` months, so that new rows never end up in the default partition.
+
+    :param table_name: The name of the partitioned table.
+    :param months_ahead: The number of future months to create partitions for.
+    :param now: The current datetime, defaults to now.
+    :param connection: The connection to use, defaults to the default connection.
+    """
+
+    current_month_start = get_month_start(now or datetime.now(tz=timezone.utc))
+    partitions = get_partitions(table_name, connection)
+
+    for months in range(months_ahead + 1):
+        month_start = add_months(current_month_start, months)
+        if not _is_month_covered(partitions, month_start):
+            create_monthly_partition(table_name, month_start, connection)
+
+
+def drop_partitions_older_than(
+    table_name: str, cutoff: datetime, connection=None
+) -> List[str]:
+    """
+    Detaches and drops all the partitions that only contain rows older than the
+    cutoff. This doesn't touch the rows of the partition that the cutoff falls in,
+    those must still be deleted separately.
+
+    :param table_name: The name of the partitioned table.
+    :param cutoff: The datetime before which all rows can be removed.
+    :param connection: The connection to use, defaults to the default connection.
+    :return: The names of the dropped partitions.
+    """
+
+    connection = connection or default_connection
+    qn = connection.ops.quote_name
+
+    if django_timezone.is_naive(cutoff):
+        cutoff = django_timezone.make_aware(cutoff, timezone.utc)
+
+    dropped = []
+    for partition in get_partitions(table_name, connection):
+        if partition.is_default or partition.end is None or partition.end > cutoff:
+            continue
+
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {qn(table_name)} DETACH PARTITION {qn(partition.name)}"
+            )
+            cursor.execute(f"DROP TABLE {qn(partition.name)}")
+        dropped.append(partition.name)
+
+    if dropped:
+        logger.info(f"Dropped expired partitions of {table_name}: {dropped}")
+
+    return dropped
+
+
+def get_monthly_partitioned_tables(connection=None) -> List[str]:
+    """
+    Returns the names of all the range partitioned tables in the current schema.
+    """
+
+    connection = connection or default_connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT pg_class.relname
+            FROM pg_partitioned_table
+            INNER JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid
+            WHERE pg_partitioned_table.partstrat = 'r'
+            AND pg_class.relnamespace = current_schema()::regnamespace
+            """
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def convert_to_monthly_partitioned_table(
+    table_name: str,
+    partition_key: str,
+    months_ahead: int,
+    connection=None,
+):
+    """
+    Converts an existing table into a table that is range partitioned by month on
+    the `partition_key` column, without copying the existing rows. The original
+    table is attached as the `{table_name}_legacy` partition covering everything up
+    to the month of its newest row, so that it's dropped as a whole once all of its
+    rows have expired. A default partition catches rows that don't fall in any
+    monthly partition.
+
+    The primary key becomes `(id, partition_key)` because Postgres requires the
+    partition key to be part of every unique constraint. The `id` column keeps
+    getting its values from a sequence, so ids are still unique in practice.
+
+    :param table_name: The name of the table to convert.
+    :param partition_key: The timestamp column to partition by.
+    :param months_ahead: The number of future months to create partitions for.
+    :param connection: The connection to use, defaults to the default connection.
+    """
+
+    connection = connection or default_connection
+    qn = connection.ops.quote_name
+
+    if is_partitioned(table_name, connection):
+        return
+
+    legacy_name = f"{table_name}_{LEGACY_PARTITION_SUFFIX}"
+    sequence_name = f"{table_name}_id_seq"
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {qn(table_name)} IN ACCESS EXCLUSIVE MODE")
+
+        cursor.execute(
+            """
+            SELECT index_class.relname, pg_get_indexdef(pg_index.indexrelid),
+                pg_index.indisprimary, pg_index.indisunique
+            FROM pg_index
+            INNER JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid
+            WHERE pg_index.indrelid = to_regclass(%s)
+            """,
+            [qn(table_name)],
+        )
+        indexes = cursor.fetchall()
+        if any(is_unique and not is_primary for _, _, is_primary, is_unique in indexes):
+            raise ValueError(
+                f"The table {table_name} can't be partitioned because it has unique "
+                f"indexes that don't include {partition_key}."
+            )
+
+        cursor.execute(
+            """
+            SELECT conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE conrelid = to_regclass(%s) AND contype = 'f'
+            """,
+            [qn(table_name)],
+        )
+        foreign_keys = cursor.fetchall()
+
+        cursor.execute(
+            f"SELECT pg_get_serial_sequence(%s, 'id'), MAX(id), "
+            f"MAX({qn(partition_key)}) FROM {qn(table_name)}",
+            [qn(table_name)],
+        )
+        old_sequence_name, max_id, max_timestamp = cursor.fetchone()
+
+        # The id of the legacy table must not be generated anymore, the partitioned
+        # table gets a new sequence that continues after the highest id.
+        cursor.execute(
+            f"ALTER TABLE {qn(table_name)} ALTER COLUMN id DROP IDENTITY IF EXISTS"
+        )
+        cursor.execute(f"ALTER TABLE {qn(table_name)} ALTER COLUMN id DROP DEFAULT")
+        if old_sequence_name:
+            cursor.execute(f"DROP SEQUENCE IF EXISTS {old_sequence_name}")
+
+        # Index names are unique per schema, so the indexes of the legacy table are
+        # renamed to free up the original names for the partitioned indexes.
+        cursor.execute(f"ALTER TABLE {qn(table_name)} RENAME TO {qn(legacy_name)}")
+        for index_name, _, _, _ in indexes:
+            legacy_index_name = f"{index_name[:56]}_{LEGACY_PARTITION_SUFFIX}"
+            cursor.execute(
+                f"ALTER INDEX {qn(index_name)} RENAME TO {qn(legacy_index_name)}"
+            )
+
+        cursor.execute(
+            f"CREATE TABLE {qn(table_name)} (LIKE {qn(legacy_name)} "
+            f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING STORAGE "
+            f"INCLUDING COMMENTS) PARTITION BY RANGE ({qn(partition_key)})"
+        )
+        cursor.execute(
+            f"CREATE SEQUENCE {qn(sequence_name)} START WITH {(max_id or 0) + 1} "
+            f"OWNED BY {qn(table_name)}.id"
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(table_name)} ALTER COLUMN id "
+            f"SET DEFAULT nextval('{qn(sequence_name)}'::regclass)"
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(table_name)} ADD PRIMARY KEY (id, {qn(partition_key)})"
+        )
+        for _, index_definition, is_primary, _ in indexes:
+            if not is_primary:
+                cursor.execute(index_definition)
+        for constraint_name, constraint_definition in foreign_keys:
+            cursor.execute(
+                f"ALTER TABLE {qn(table_name)} ADD CONSTRAINT {qn(constraint_name)} "
+                f"{constraint_definition}"
+            )
+
+        if max_timestamp is None:
+            cursor.execute(f"DROP TABLE {qn(legacy_name)}")
+        else:
+            legacy_end = add_months(get_month_start(max_timestamp), 1)
+            cursor.execute(
+                f"ALTER TABLE {qn(table_name)} ATTACH PARTITION {qn(legacy_name)} "
+                f"FOR VALUES FROM (MINVALUE) TO ({_quote_literal(legacy_end)})"
+            )
+
+        cursor.execute(
+            f"CREATE TABLE {qn(f'{table_name}_{DEFAULT_PARTITION_SUFFIX}')} "
+            f"PARTITION OF {qn(table_name)} DEFAULT"
+        )
+
+    create_monthly_partitions(table_name, months_ahead, connection=connection)
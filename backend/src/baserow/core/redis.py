@@ -73,6 +73,17 @@ class RedisQueue:
 
             return result != 0
 
+    def push_front(self, task_object: Any):
+        """
+        Adds a task to the front of the queue, so that it's the next one to be popped.
+        This is used to put back a task that was already popped from the queue, which
+        is why the `max_length` is not respected.
+
+        :param task_object: The object that must be added to the queue.
+        """
+
+        self.redis_connection.lpush(self.queue_key, json.dumps(task_object))
+
     def get_and_pop_next(self) -> Any:
         """
         Returns the first object from the queue.
@@ -109,6 +120,9 @@ class WebhookRedisQueue(RedisQueue):
         self.queues[self.queue_key].append(task_object)
         return True
 
+    def push_front(self, task_object):
+        self.queues[self.queue_key].insert(0, task_object)
+
     def get_and_pop_next(self):
         try:
             return self.queues[self.queue_key].pop(0)
@@ -358,6 +358,21 @@ class ApplicationType(
         :type application: Application
         """
 
+    def get_permanent_deletion_lock_counts(
+        self, application_ids: List[int]
+    ) -> Dict[int, int]:
+        """
+        Estimates the number of tables that are dropped or locked when permanently
+        deleting the applications of this type, so that the deletion of the trash
+        can be split into transactions that don't exceed the PostgreSQL lock limit.
+
+        :param application_ids: The ids of the applications about to be deleted.
+        :return: A dict with the application ids as keys and the estimated number of
+            locked tables as values.
+        """
+
+        return {application_id: 1 for application_id in application_ids}
+
     def export_safe_transaction_context(self, application: "Application") -> Atomic:
         """
         Should return an Atomic context (such as transaction.atomic or
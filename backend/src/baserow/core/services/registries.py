@@ -5,6 +5,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
+from django.db.models import Q
 
 from loguru import logger
 from rest_framework.exceptions import ValidationError as DRFValidationError
@@ -564,6 +565,9 @@ class TriggerServiceTypeMixin(ABC):
     # The callable function which should be called when the event occurs.
     on_event: Callable = lambda *args: None
 
+    # Matches the services the listener is interested in.
+    services_filter: Q = Q()
+
     # The service is always dispatched by an event.
     dispatch_types = [DispatchTypes.EVENT]
 
@@ -590,7 +594,9 @@ class TriggerServiceTypeMixin(ABC):
     def dispatch_transform(self, data):
         return DispatchResult(data=data)
 
-    def start_listening(self, on_event: Callable) -> None:
+    def start_listening(
+        self, on_event: Callable, services_filter: Optional[Q] = None
+    ) -> None:
         """
         Triggers, a type of service which respond to internal and external events and
         trigger their own dispatch, need the ability to "start" listening to their
@@ -598,9 +604,14 @@ class TriggerServiceTypeMixin(ABC):
 
         :param on_event: A callable function which should be called when
             the internal or external event occurs.
+        :param services_filter: An optional filter matching the services the
+            listener is interested in. It allows the trigger to skip the events that
+            no listener is interested in before doing any work.
         """
 
         self.on_event = on_event
+        if services_filter is not None:
+            self.services_filter = services_filter
 
     def stop_listening(self) -> None:
         """
@@ -5,6 +5,10 @@ from celery_singleton import Singleton
 from baserow.config.celery import app
 
 from .action.tasks import cleanup_old_actions, setup_periodic_action_tasks
+from .partitioning.tasks import (
+    create_future_partitions,
+    setup_periodic_partitioning_tasks,
+)
 from .snapshots.tasks import delete_expired_snapshots
 from .telemetry.tasks import initialize_otel
 from .trash.tasks import (
@@ -17,6 +21,10 @@ from .user.tasks import (
     check_pending_account_deletion,
     share_onboarding_details_with_baserow,
 )
+from .write_behind.tasks import (
+    flush_write_behind_buffers,
+    setup_periodic_write_behind_tasks,
+)
 
 
 @app.task(
@@ -45,4 +53,8 @@ __all__ = [
     "delete_expired_snapshots",
     "initialize_otel",
     "share_onboarding_details_with_baserow",
+    "flush_write_behind_buffers",
+    "setup_periodic_write_behind_tasks",
+    "create_future_partitions",
+    "setup_periodic_partitioning_tasks",
 ]
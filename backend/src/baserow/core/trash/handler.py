@@ -1,9 +1,12 @@
+import time
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.db import IntegrityError, OperationalError, transaction
 from django.db.models import Q, QuerySet
 
@@ -39,9 +42,13 @@ from baserow.core.trash.registries import (
     trash_operation_type_registry,
 )
 from baserow.core.trash.signals import before_permanently_deleted, permanently_deleted
+from baserow.core.trash.types import PermanentDeletionProgress
 
 User = get_user_model()
 
+TRASH_PERMANENT_DELETION_PROGRESS_CACHE_KEY = "trash_permanent_deletion_progress"
+TRASH_PERMANENT_DELETION_PROGRESS_CACHE_TIMEOUT = 60 * 60 * 24
+
 tracer = trace.get_tracer(__name__)
 
 
@@ -283,6 +290,8 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
         Responsible for finding the trash item type for this `TrashEntry`, then finding
         the model to destroy and passing it into `_permanently_delete_and_signal`
         for it to be permanently deleted.
+
+        :return: The deleted item, or None if it didn't exist anymore.
         """ ""
 
         trash_item_type = trash_item_type_registry.get(trash_entry.trash_item_type)
@@ -297,12 +306,13 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
                 trash_entry.parent_trash_item_id,
                 trash_item_lookup_cache,
             )
+            return to_delete
         except TrashItemDoesNotExist:
             # When a parent item is deleted it should also delete all of its
             # children. Hence we expect that many of these TrashEntries to no
             # longer point to an existing item. In such a situation we just want
             # to delete the entry as the item itself has been correctly deleted.
-            pass
+            return None
         except OperationalError as e:
             # Detect if this `OperationalError` is due to us exceeding the
             # lock count in `max_locks_per_transaction`. If it is, we'll
@@ -312,36 +322,254 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
             raise e
 
     @staticmethod
-    def permanently_delete_marked_trash():
+    def permanently_delete_marked_trash(
+        batch_size: Optional[int] = None,
+        max_locks_per_batch: Optional[int] = None,
+        max_rows_per_second: Optional[int] = None,
+    ) -> PermanentDeletionProgress:
         """
         Looks up every trash item marked for permanent deletion and removes them
         irreversibly from the database along with their corresponding trash entries.
+
+        The entries are deleted type by type, following the
+        `permanent_deletion_priority` of the trashable item types, so that the
+        cascading deletion of a workspace or an application removes the entries of
+        its children before they're looked up. Every transaction deletes a batch of
+        entries of the same type, limited by the number of entries and by the
+        estimated number of tables it drops or locks.
+
+        :param batch_size: The maximum number of entries deleted per transaction.
+            Defaults to BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE.
+        :param max_locks_per_batch: The maximum estimated number of tables dropped or
+            locked per transaction. A single entry exceeding it is still deleted in
+            its own transaction. Defaults to
+            BASEROW_TRASH_PERMANENT_DELETION_MAX_LOCKS_PER_BATCH.
+        :param max_rows_per_second: If set, sleeps between the transactions to not
+            delete more than this number of trashed rows per second on average.
+            Defaults to BASEROW_TRASH_PERMANENT_DELETION_MAX_ROWS_PER_SECOND.
+        :return: The progress counters of the deletion.
         """
 
+        if batch_size is None:
+            batch_size = settings.BASEROW_TRASH_PERMANENT_DELETION_BATCH_SIZE
+        if max_locks_per_batch is None:
+            max_locks_per_batch = (
+                settings.BASEROW_TRASH_PERMANENT_DELETION_MAX_LOCKS_PER_BATCH
+            )
+        if max_rows_per_second is None:
+            max_rows_per_second = (
+                settings.BASEROW_TRASH_PERMANENT_DELETION_MAX_ROWS_PER_SECOND
+            )
+
+        progress = PermanentDeletionProgress()
+        started_at = time.monotonic()
         trash_item_lookup_cache = {}
-        deleted_count = 0
-        while True:
-            with transaction.atomic():
-                # Perm deleting a workspace or application can cause cascading deletion
-                # of other trash entries hence we only look up one a time. If we instead
-                # looped over a single queryset lookup of all TrashEntries then we could
-                # end up trying to delete TrashEntries which have already been deleted
-                # by a previous cascading delete of a workspace or application.
-                trash_entry = TrashEntry.objects.filter(
-                    should_be_permanently_deleted=True
-                ).first()
-                if not trash_entry:
+        # Only the types that have marked entries are visited, so that the empty
+        # types don't each cost a query.
+        marked_types = set(
+            TrashEntry.objects.filter(should_be_permanently_deleted=True)
+            .values_list("trash_item_type", flat=True)
+            .distinct()
+        )
+        trash_item_types = sorted(
+            (
+                trash_item_type
+                for trash_item_type in trash_item_type_registry.get_all()
+                if trash_item_type.type in marked_types
+            ),
+            key=lambda trash_item_type: trash_item_type.permanent_deletion_priority,
+        )
+        for trash_item_type in trash_item_types:
+            while True:
+                # Ordering by parent keeps the rows of the same table together.
+                trash_entries = list(
+                    TrashEntry.objects.filter(
+                        should_be_permanently_deleted=True,
+                        trash_item_type=trash_item_type.type,
+                    ).order_by("parent_trash_item_id", "id")[:batch_size]
+                )
+                if not trash_entries:
                     break
 
-                TrashHandler.try_perm_delete_trash_entry(
-                    trash_entry, trash_item_lookup_cache
-                )
-                trash_entry.delete()
-                deleted_count += 1
+                for batch in TrashHandler._split_trash_entries_by_lock_budget(
+                    trash_item_type, trash_entries, max_locks_per_batch
+                ):
+                    rows_deleted = TrashHandler._permanently_delete_trash_entries(
+                        trash_item_type, batch, trash_item_lookup_cache
+                    )
+                    progress.add_batch(trash_item_type.type, len(batch), rows_deleted)
+                    cache.set(
+                        TRASH_PERMANENT_DELETION_PROGRESS_CACHE_KEY,
+                        asdict(progress),
+                        timeout=TRASH_PERMANENT_DELETION_PROGRESS_CACHE_TIMEOUT,
+                    )
+                    TrashHandler._throttle_permanent_deletion(
+                        progress, started_at, max_rows_per_second
+                    )
+
         logger.info(
-            f"Successfully deleted {deleted_count} trash entries and their associated "
-            "trashed items."
+            f"Successfully deleted {progress.entries_deleted} trash entries and their "
+            f"associated trashed items, including {progress.rows_deleted} rows, in "
+            f"{progress.batches} batches."
         )
+        return progress
+
+    @staticmethod
+    def get_permanent_deletion_progress() -> Optional[PermanentDeletionProgress]:
+        """
+        Returns the progress counters of the running, or last, permanent deletion
+        of the marked trash, if any.
+        """
+
+        progress = cache.get(TRASH_PERMANENT_DELETION_PROGRESS_CACHE_KEY)
+        return PermanentDeletionProgress(**progress) if progress else None
+
+    @staticmethod
+    def _split_trash_entries_by_lock_budget(
+        trash_item_type: TrashableItemType,
+        trash_entries: List[TrashEntry],
+        max_locks_per_batch: int,
+    ) -> List[List[TrashEntry]]:
+        """
+        Splits the trash entries in batches that each lock at most the provided
+        estimated number of tables.
+        """
+
+        lock_counts = trash_item_type.get_permanent_deletion_lock_counts(trash_entries)
+        batches, batch, batch_locks = [], [], 0
+        for trash_entry in trash_entries:
+            locks = lock_counts.get(trash_entry.id, 1)
+            if batch and batch_locks + locks > max_locks_per_batch:
+                batches.append(batch)
+                batch, batch_locks = [], 0
+            batch.append(trash_entry)
+            batch_locks += locks
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _permanently_delete_trash_entries(
+        trash_item_type: TrashableItemType,
+        trash_entries: List[TrashEntry],
+        trash_item_lookup_cache: Dict[str, Any],
+    ) -> int:
+        """
+        Permanently deletes the items of the provided trash entries and the entries
+        in a single transaction. If the estimation was wrong and the lock limit is
+        exceeded, every entry is retried in its own transaction.
+
+        :return: The number of trashed rows that have been deleted.
+        """
+
+        try:
+            with transaction.atomic():
+                if trash_item_type.supports_batch_permanent_deletion:
+                    return TrashHandler._permanently_delete_trash_entries_at_once(
+                        trash_item_type, trash_entries, trash_item_lookup_cache
+                    )
+
+                rows_deleted = 0
+                for trash_entry in trash_entries:
+                    deleted_item = TrashHandler.try_perm_delete_trash_entry(
+                        trash_entry, trash_item_lookup_cache
+                    )
+                    trash_entry.delete()
+                    if deleted_item is not None:
+                        rows_deleted += (
+                            trash_item_type.get_permanent_deletion_row_count(
+                                deleted_item
+                            )
+                        )
+                return rows_deleted
+        except PermanentDeletionMaxLocksExceededException:
+            if len(trash_entries) == 1:
+                raise
+            return sum(
+                TrashHandler._permanently_delete_trash_entries(
+                    trash_item_type, [trash_entry], trash_item_lookup_cache
+                )
+                for trash_entry in trash_entries
+            )
+
+    @staticmethod
+    def _permanently_delete_trash_entries_at_once(
+        trash_item_type: TrashableItemType,
+        trash_entries: List[TrashEntry],
+        trash_item_lookup_cache: Dict[str, Any],
+    ) -> int:
+        """
+        Looks up and deletes all the items of the trash entries at once, using the
+        set-based methods of the trashable item type, while still sending the
+        permanent deletion signals for every item.
+
+        :return: The number of trashed rows that have been deleted.
+        """
+
+        trashed_items = trash_item_type.lookup_trashed_items(
+            trash_entries, trash_item_lookup_cache
+        )
+        to_delete = [
+            (trash_entry, trashed_items[trash_entry.id])
+            for trash_entry in trash_entries
+            if trash_entry.id in trashed_items
+        ]
+
+        for trash_entry, trashed_item in to_delete:
+            _check_parent_id_valid(trash_entry.parent_trash_item_id, trash_item_type)
+            before_permanently_deleted.send(
+                sender=trash_item_type.type,
+                trash_item_id=trashed_item.id,
+                trash_item=trashed_item,
+                parent_id=trash_entry.parent_trash_item_id,
+            )
+
+        try:
+            trash_item_type.permanently_delete_items(
+                [trashed_item for _, trashed_item in to_delete],
+                trash_item_lookup_cache,
+            )
+        except OperationalError as e:
+            if is_max_lock_exceeded_exception(e):
+                raise PermanentDeletionMaxLocksExceededException()
+            raise e
+
+        for trash_entry, trashed_item in to_delete:
+            permanently_deleted.send(
+                sender=trash_item_type.type,
+                trash_item_id=trashed_item.id,
+                trash_item=trashed_item,
+                parent_id=trash_entry.parent_trash_item_id,
+            )
+
+        TrashEntry.objects.filter(
+            id__in=[trash_entry.id for trash_entry in trash_entries]
+        ).delete()
+
+        return sum(
+            trash_item_type.get_permanent_deletion_row_count(trashed_item)
+            for _, trashed_item in to_delete
+        )
+
+    @staticmethod
+    def _throttle_permanent_deletion(
+        progress: PermanentDeletionProgress,
+        started_at: float,
+        max_rows_per_second: int,
+    ):
+        """
+        Sleeps long enough to keep the average number of deleted rows per second
+        since the start of the deletion under the provided limit.
+        """
+
+        if not max_rows_per_second:
+            return
+
+        expected_duration = progress.rows_deleted / max_rows_per_second
+        delay = expected_duration - (time.monotonic() - started_at)
+        if delay > 0:
+            time.sleep(delay)
+            progress.throttled_seconds += delay
 
     @staticmethod
     def _permanently_delete_and_signal(
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.registry import (
@@ -20,6 +20,20 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
     A TrashableItemType specifies a baserow model which can be trashed.
     """
 
+    """
+    The trash entries are permanently deleted type by type in ascending priority
+    order. Parents must come first so that their cascading deletion removes the items
+    of their children before they're looked up.
+    """
+    permanent_deletion_priority: int = 100
+
+    """
+    Whether all the items of a batch can be looked up at once with
+    `lookup_trashed_items` and deleted at once with `permanently_delete_items`. This
+    is only possible if deleting one item never deletes another item of this type.
+    """
+    supports_batch_permanent_deletion: bool = False
+
     def lookup_trashed_item(
         self, trashed_entry, trash_item_lookup_cache: Dict[str, Any] = None
     ):
@@ -57,6 +71,74 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
 
         pass
 
+    def lookup_trashed_items(
+        self,
+        trashed_entries: List["TrashEntry"],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ) -> Dict[int, Any]:
+        """
+        Returns the actual instances of the trashed items of the provided entries.
+        Only used if `supports_batch_permanent_deletion` is True, and should be
+        overridden to look them up with a single query.
+
+        :param trashed_entries: The entries to get the real trashed instances for.
+        :param trash_item_lookup_cache: See `lookup_trashed_item`.
+        :return: A dict with the trash entry ids as keys and the trashed instances as
+            values. The entries whose item doesn't exist anymore are left out.
+        """
+
+        trashed_items = {}
+        for trashed_entry in trashed_entries:
+            try:
+                trashed_items[trashed_entry.id] = self.lookup_trashed_item(
+                    trashed_entry, trash_item_lookup_cache
+                )
+            except TrashItemDoesNotExist:
+                pass
+        return trashed_items
+
+    def permanently_delete_items(
+        self,
+        trashed_items: List[Any],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ):
+        """
+        Deletes all the specified trashed items from the database. Only used if
+        `supports_batch_permanent_deletion` is True, and should be overridden to
+        delete them with set-based statements.
+
+        :param trashed_items: The items to delete permanently.
+        :param trash_item_lookup_cache: See `permanently_delete_item`.
+        """
+
+        for trashed_item in trashed_items:
+            self.permanently_delete_item(trashed_item, trash_item_lookup_cache)
+
+    def get_permanent_deletion_lock_counts(
+        self, trashed_entries: List["TrashEntry"]
+    ) -> Dict[int, int]:
+        """
+        Estimates the number of tables that are dropped or locked when permanently
+        deleting the items of the provided entries, so that the deletion can be split
+        into transactions that don't exceed the PostgreSQL lock limit.
+
+        :param trashed_entries: The entries that are about to be deleted.
+        :return: A dict with the trash entry ids as keys and the estimated number of
+            locked tables as values.
+        """
+
+        return {trashed_entry.id: 1 for trashed_entry in trashed_entries}
+
+    def get_permanent_deletion_row_count(self, trashed_item: Any) -> int:
+        """
+        Returns the number of trashed rows deleted with the provided item, used to
+        throttle the permanent deletion.
+
+        :param trashed_item: The item that has been permanently deleted.
+        """
+
+        return 0
+
     @property
     def requires_parent_id(self) -> bool:
         """
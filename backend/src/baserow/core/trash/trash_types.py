@@ -1,4 +1,5 @@
-from typing import Any, Optional
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
 
 from baserow.core.models import Application, TrashEntry, Workspace
 from baserow.core.operations import (
@@ -11,9 +12,37 @@ from baserow.core.snapshots.handler import SnapshotHandler
 from baserow.core.trash.registries import TrashableItemType, trash_item_type_registry
 
 
+def get_applications_permanent_deletion_lock_counts(
+    applications: Iterable[Application],
+) -> Dict[int, int]:
+    """
+    Returns the estimated number of tables locked when permanently deleting each of
+    the provided applications, as computed by their application type.
+
+    :param applications: The applications about to be deleted.
+    :return: A dict with the application ids as keys and the estimated number of
+        locked tables as values.
+    """
+
+    application_ids_per_type = defaultdict(list)
+    for application in applications:
+        application_type = application_type_registry.get_by_model(
+            application.specific_class
+        )
+        application_ids_per_type[application_type].append(application.id)
+
+    lock_counts = {}
+    for application_type, application_ids in application_ids_per_type.items():
+        lock_counts.update(
+            application_type.get_permanent_deletion_lock_counts(application_ids)
+        )
+    return lock_counts
+
+
 class ApplicationTrashableItemType(TrashableItemType):
     type = "application"
     model_class = Application
+    permanent_deletion_priority = 10
 
     def get_parent(self, trashed_item: Any) -> Optional[Any]:
         return trashed_item.workspace
@@ -33,6 +62,22 @@ class ApplicationTrashableItemType(TrashableItemType):
             user=None,
         )
 
+    def get_permanent_deletion_lock_counts(
+        self, trashed_entries: List[TrashEntry]
+    ) -> Dict[int, int]:
+        """
+        The application type knows how many tables are dropped with an application.
+        """
+
+        applications = Application.objects_and_trash.filter(
+            id__in=[entry.trash_item_id for entry in trashed_entries]
+        )
+        lock_counts = get_applications_permanent_deletion_lock_counts(applications)
+        return {
+            entry.id: lock_counts.get(entry.trash_item_id, 1)
+            for entry in trashed_entries
+        }
+
     def permanently_delete_item(
         self, trashed_item: Application, trash_item_lookup_cache=None
     ):
@@ -55,6 +100,7 @@ class ApplicationTrashableItemType(TrashableItemType):
 class WorkspaceTrashableItemType(TrashableItemType):
     type = "workspace"
     model_class = Workspace
+    permanent_deletion_priority = 0
 
     def get_parent(self, trashed_item: Any) -> Optional[Any]:
         return None
@@ -71,6 +117,29 @@ class WorkspaceTrashableItemType(TrashableItemType):
         for workspace_user in trashed_item.workspaceuser_set.all():
             workspace_restored.send(self, workspace_user=workspace_user, user=None)
 
+    def get_permanent_deletion_lock_counts(
+        self, trashed_entries: List[TrashEntry]
+    ) -> Dict[int, int]:
+        """
+        Deleting a workspace also deletes all of its applications and their tables.
+        """
+
+        applications = Application.objects_and_trash.filter(
+            workspace_id__in=[entry.trash_item_id for entry in trashed_entries]
+        )
+        application_lock_counts = get_applications_permanent_deletion_lock_counts(
+            applications
+        )
+
+        lock_counts_per_workspace = defaultdict(lambda: 1)
+        for application in applications:
+            lock_count = application_lock_counts[application.id]
+            lock_counts_per_workspace[application.workspace_id] += lock_count
+        return {
+            entry.id: lock_counts_per_workspace[entry.trash_item_id]
+            for entry in trashed_entries
+        }
+
     def permanently_delete_item(
         self, trashed_workspace: Workspace, trash_item_lookup_cache=None
     ):
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class PermanentDeletionProgress:
+    """
+    The counters of a permanent deletion of the marked trash entries.
+    """
+
+    entries_deleted: int = 0
+    rows_deleted: int = 0
+    batches: int = 0
+    throttled_seconds: float = 0.0
+    entries_deleted_per_type: Dict[str, int] = field(default_factory=dict)
+
+    def add_batch(self, trash_item_type: str, entries_deleted: int, rows_deleted: int):
+        self.batches += 1
+        self.entries_deleted += entries_deleted
+        self.rows_deleted += rows_deleted
+        self.entries_deleted_per_type[trash_item_type] = (
+            self.entries_deleted_per_type.get(trash_item_type, 0) + entries_deleted
+        )
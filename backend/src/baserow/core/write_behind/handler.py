@@ -0,0 +1,246 @@
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import Model
+
+from django_redis import get_redis_connection
+from loguru import logger
+from redis.exceptions import ResponseError
+
+from baserow.core.db import bulk_insert_with_copy
+from baserow.core.encoders import JSONEncoderSupportingDataClasses
+
+from .registries import WriteBehindBufferType, write_behind_buffer_type_registry
+
+WRITE_BEHIND_STREAM_KEY_PREFIX = "write_behind"
+WRITE_BEHIND_CONSUMER_GROUP = "baserow"
+# The flush task is a singleton, so there is only ever one consumer reading from the
+# stream. Using a fixed name means that entries read by a consumer that crashed before
+# acknowledging them are picked up again by the next flush.
+WRITE_BEHIND_CONSUMER_NAME = "baserow"
+# Messages of which the instances can't be inserted are moved to this stream, so that
+# they don't block the buffer.
+WRITE_BEHIND_DEAD_LETTER_SUFFIX = "dead_letter"
+
+
+@dataclass
+class WriteBehindLag:
+    pending_messages: int
+    """The number of transactions of which the instances are not inserted yet."""
+
+    oldest_message_age_seconds: float
+    """How long ago the oldest pending message was buffered."""
+
+
+def _get_redis_client():
+    return get_redis_connection("default")
+
+
+class WriteBehindHandler:
+    def is_enabled(self, buffer_type: WriteBehindBufferType) -> bool:
+        return buffer_type.type in settings.BASEROW_WRITE_BEHIND_BUFFERS
+
+    def _get_stream_key(self, buffer_type: WriteBehindBufferType) -> str:
+        return f"{WRITE_BEHIND_STREAM_KEY_PREFIX}_{buffer_type.type}"
+
+    def _serialize_instance(self, instance: Model) -> Dict:
+        return {
+            field.attname: getattr(instance, field.attname)
+            for field in instance._meta.concrete_fields
+            if not field.primary_key
+        }
+
+    def _deserialize_instance(
+        self, buffer_type: WriteBehindBufferType, values: Dict
+    ) -> Model:
+        model_class = buffer_type.model_class
+        return model_class(
+            **{
+                field.attname: field.to_python(values[field.attname])
+                for field in model_class._meta.concrete_fields
+                if field.attname in values
+            }
+        )
+
+    def add(self, buffer_type: WriteBehindBufferType, instances: List[Model]):
+        """
+        Appends the unsaved instances to the buffer once the current transaction
+        commits, so that nothing is buffered if the transaction is rolled back.
+
+        :param buffer_type: The buffer to add the instances to.
+        :param instances: The instances that must eventually be inserted.
+        """
+
+        if not instances:
+            return
+
+        payload = json.dumps(
+            [self._serialize_instance(instance) for instance in instances],
+            cls=JSONEncoderSupportingDataClasses,
+        )
+        stream_key = self._get_stream_key(buffer_type)
+
+        transaction.on_commit(
+            lambda: _get_redis_client().xadd(stream_key, {"instances": payload})
+        )
+
+    def _get_dead_letter_stream_key(self, buffer_type: WriteBehindBufferType) -> str:
+        return f"{self._get_stream_key(buffer_type)}_{WRITE_BEHIND_DEAD_LETTER_SUFFIX}"
+
+    def _ensure_consumer_group(self, redis_client, stream_key: str):
+        try:
+            redis_client.xgroup_create(
+                stream_key, WRITE_BEHIND_CONSUMER_GROUP, id="0", mkstream=True
+            )
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    def _read_messages(self, redis_client, stream_key: str, count: int):
+        # Entries that were read before but never acknowledged come first, because
+        # the previous flush must have failed before inserting them.
+        for last_id in ["0", ">"]:
+            response = redis_client.xreadgroup(
+                WRITE_BEHIND_CONSUMER_GROUP,
+                WRITE_BEHIND_CONSUMER_NAME,
+                {stream_key: last_id},
+                count=count,
+            )
+            messages = [
+                (message_id, values)
+                for _, stream_messages in response or []
+                for message_id, values in stream_messages
+            ]
+            if messages:
+                return messages
+        return []
+
+    def _insert_instances(
+        self, buffer_type: WriteBehindBufferType, instances: List[Model]
+    ):
+        with transaction.atomic():
+            bulk_insert_with_copy(buffer_type.model_class, instances)
+            buffer_type.after_flush(instances)
+
+    def flush(self, buffer_type: WriteBehindBufferType, max_messages: int) -> int:
+        """
+        Inserts the oldest buffered instances in the database using `COPY`. The
+        entries are only removed from the buffer after the insert has been committed.
+        Messages that can't be inserted are moved to the dead letter stream of the
+        buffer.
+
+        :param buffer_type: The buffer to flush.
+        :param max_messages: The maximum number of buffered messages to insert. Every
+            message contains all the instances of one transaction.
+        :return: The number of flushed messages.
+        """
+
+        redis_client = _get_redis_client()
+        stream_key = self._get_stream_key(buffer_type)
+        self._ensure_consumer_group(redis_client, stream_key)
+
+        messages = self._read_messages(redis_client, stream_key, max_messages)
+        if not messages:
+            return 0
+
+        # The values of a pending message that was deleted in the meantime are empty.
+        instances_per_message = [
+            (
+                message,
+                [
+                    self._deserialize_instance(buffer_type, values)
+                    for values in json.loads(message[b"instances"])
+                ],
+            )
+            for _, message in messages
+            if message
+        ]
+
+        try:
+            self._insert_instances(
+                buffer_type,
+                [
+                    instance
+                    for _, instances in instances_per_message
+                    for instance in instances
+                ],
+            )
+        except DatabaseError:
+            # One instance that can't be inserted, for example because the table of a
+            # row history entry has been deleted in the meantime, fails the whole
+            # `COPY`. The messages are then inserted one by one, and the ones that
+            # still fail are moved to the dead letter stream so that the others can
+            # be acknowledged.
+            for message, instances in instances_per_message:
+                try:
+                    self._insert_instances(buffer_type, instances)
+                except DatabaseError as exc:
+                    logger.warning(
+                        f"Moving a message of the {buffer_type.type} write-behind "
+                        f"buffer to the dead letter stream because it can't be "
+                        f"inserted: {exc}"
+                    )
+                    redis_client.xadd(
+                        self._get_dead_letter_stream_key(buffer_type),
+                        {"instances": message[b"instances"], "error": str(exc)},
+                    )
+
+        message_ids = [message_id for message_id, _ in messages]
+        redis_client.xack(stream_key, WRITE_BEHIND_CONSUMER_GROUP, *message_ids)
+        redis_client.xdel(stream_key, *message_ids)
+
+        return len(messages)
+
+    def flush_all(self):
+        """
+        Flushes all the enabled buffers until they're empty, and warns if a buffer
+        is still behind more than `BASEROW_WRITE_BEHIND_MAX_LAG_SECONDS` afterwards.
+        """
+
+        batch_size = settings.BASEROW_WRITE_BEHIND_FLUSH_BATCH_SIZE
+        for buffer_type in write_behind_buffer_type_registry.get_all():
+            if not self.is_enabled(buffer_type):
+                continue
+
+            while self.flush(buffer_type, batch_size) >= batch_size:
+                pass
+
+            lag = self.get_lag(buffer_type)
+            if (
+                lag.oldest_message_age_seconds
+                > settings.BASEROW_WRITE_BEHIND_MAX_LAG_SECONDS
+            ):
+                logger.warning(
+                    f"The {buffer_type.type} write-behind buffer is "
+                    f"{lag.oldest_message_age_seconds:.0f} seconds behind with "
+                    f"{lag.pending_messages} pending messages."
+                )
+
+    def get_lag(self, buffer_type: WriteBehindBufferType) -> WriteBehindLag:
+        """
+        Reports how far the consumer of the buffer is behind.
+
+        :param buffer_type: The buffer to report the lag of.
+        :return: The number of pending messages and the age of the oldest one.
+        """
+
+        redis_client = _get_redis_client()
+        stream_key = self._get_stream_key(buffer_type)
+
+        # Flushed messages are deleted, so the stream only contains pending ones.
+        pending_messages = redis_client.xlen(stream_key)
+        oldest_message = redis_client.xrange(stream_key, count=1)
+
+        oldest_message_age_seconds = 0.0
+        if oldest_message:
+            message_id = oldest_message[0][0]
+            if isinstance(message_id, bytes):
+                message_id = message_id.decode()
+            timestamp_ms = int(message_id.split("-")[0])
+            oldest_message_age_seconds = max(0.0, time.time() - timestamp_ms / 1000)
+
+        return WriteBehindLag(pending_messages, oldest_message_age_seconds)
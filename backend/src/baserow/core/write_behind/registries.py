@@ -0,0 +1,32 @@
+from typing import List, Type
+
+from django.db.models import Model
+
+from baserow.core.registry import Instance, Registry
+
+
+class WriteBehindBufferType(Instance):
+    """
+    A write-behind buffer collects model instances that don't have to be inserted
+    in the transaction of the request that creates them. If the buffer is enabled, the
+    instances are appended to a durable Redis stream after the transaction commits,
+    and a background task bulk inserts them in the database later.
+    """
+
+    model_class: Type[Model]
+    """The model of the instances collected in this buffer."""
+
+    def after_flush(self, instances: List[Model]):
+        """
+        Hook that's called after the buffered instances have been inserted in the
+        database, for example to notify the clients of the new instances.
+
+        :param instances: The inserted instances. Their primary key is set.
+        """
+
+
+class WriteBehindBufferTypeRegistry(Registry[WriteBehindBufferType]):
+    name = "write_behind_buffer"
+
+
+write_behind_buffer_type_registry = WriteBehindBufferTypeRegistry()
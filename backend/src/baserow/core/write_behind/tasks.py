@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from celery_singleton import Singleton
+
+from baserow.config.celery import app
+
+
+@app.task(
+    base=Singleton,
+    raise_on_duplicate=False,
+    bind=True,
+    queue="export",
+    lock_expiry=60 * 5,
+)
+def flush_write_behind_buffers(self):
+    from .handler import WriteBehindHandler
+
+    WriteBehindHandler().flush_all()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_write_behind_tasks(sender, **kwargs):
+    if not settings.BASEROW_WRITE_BEHIND_BUFFERS:
+        return
+
+    sender.add_periodic_task(
+        timedelta(seconds=settings.BASEROW_WRITE_BEHIND_FLUSH_INTERVAL_SECONDS),
+        flush_write_behind_buffers.s(),
+    )
@@ -0,0 +1,151 @@
+import gc
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    wall_time: float
+    query_count: int
+    peak_memory: int
+
+    def get_regressions(self, baseline: Dict, tolerance: float) -> List[str]:
+        """
+        Compares the result with the baseline of the same benchmark. The number of
+        queries is deterministic, so any extra query is a regression. The wall time
+        and the peak memory can vary between runs, so they're only regressions if
+        they exceed the baseline by more than the tolerance factor. They depend on
+        the machine, so they're not compared if they're missing from the baseline.
+
+        :param baseline: The baseline result of this benchmark.
+        :param tolerance: The factor by which the wall time and peak memory can
+            exceed the baseline.
+        :return: A description of every regression.
+        """
+
+        regressions = []
+        if self.query_count > baseline["query_count"]:
+            regressions.append(
+                f"{self.name}: {self.query_count} queries, expected at most "
+                f"{baseline['query_count']}"
+            )
+        for metric in ["wall_time", "peak_memory"]:
+            value, baseline_value = getattr(self, metric), baseline.get(metric)
+            if baseline_value and value > baseline_value * tolerance:
+                regressions.append(
+                    f"{self.name}: {metric} is {value / baseline_value:.2f} times "
+                    f"the baseline ({value} > {baseline_value})"
+                )
+        return regressions
+
+
+class BenchmarkRecorder:
+    """
+    Measures the wall time, the number of queries and the peak memory of blocks of
+    code and compares them with a baseline stored in a JSON file. The results of
+    the session can be written back to that file to become the new baseline.
+    """
+
+    def __init__(
+        self,
+        baseline_path: Path,
+        tolerance: float,
+        update_baseline: bool = False,
+    ):
+        """
+        :param baseline_path: The path of the JSON file containing the baseline.
+        :param tolerance: The factor by which the wall time and peak memory can
+            exceed the baseline before they're considered a regression.
+        :param update_baseline: If True, the results are not compared with the
+            baseline, but `save_baseline` stores them as the new baseline.
+        """
+
+        self.baseline_path = baseline_path
+        self.tolerance = tolerance
+        self.update_baseline = update_baseline
+        self.results: Dict[str, BenchmarkResult] = {}
+
+        if baseline_path.exists():
+            self.baseline = json.loads(baseline_path.read_text())
+        else:
+            self.baseline = {}
+
+    @contextmanager
+    def measure(self, name: str):
+        """
+        Measures the code executed in the context. The peak memory is the highest
+        amount of memory allocated by Python at once during the measure. Because
+        tracing the allocations slows down the code, the wall time is only
+        comparable with results measured the same way.
+
+        :param name: The unique name of the benchmark.
+        """
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                yield
+                wall_time = time.perf_counter() - start
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = BenchmarkResult(
+            name=name,
+            wall_time=round(wall_time, 4),
+            query_count=len(captured.captured_queries),
+            peak_memory=peak_memory,
+        )
+        self.results[name] = result
+        print(
+            f"\nBenchmark {name}: {result.wall_time}s, "
+            f"{result.query_count} queries, {result.peak_memory / 1024:.0f} KiB peak"
+        )
+
+    def get_regressions(self, name: str) -> List[str]:
+        """
+        Returns the regressions of the result of the benchmark compared to its
+        baseline. There can't be any if the baseline is being updated. A benchmark
+        without a baseline is reported as well, because it can't be compared.
+
+        :param name: The name of the benchmark.
+        :return: A description of every regression.
+        """
+
+        if self.update_baseline:
+            return []
+
+        baseline: Optional[Dict] = self.baseline.get(name)
+        if baseline is None:
+            return [
+                f"{name}: no baseline in {self.baseline_path}, run `make "
+                "benchmark-update-baseline` to store one"
+            ]
+        return self.results[name].get_regressions(baseline, self.tolerance)
+
+    def save_baseline(self):
+        """
+        Stores the results of the session as the new baseline, while keeping the
+        baseline of the benchmarks that didn't run.
+        """
+
+        baseline = {
+            **self.baseline,
+            **{name: asdict(result) for name, result in self.results.items()},
+        }
+        for result in baseline.values():
+            result.pop("name", None)
+        self.baseline_path.write_text(
+            json.dumps(dict(sorted(baseline.items())), indent=2) + "\n"
+        )
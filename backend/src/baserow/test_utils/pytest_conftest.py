@@ -43,10 +43,12 @@ from baserow.core.services.utils import ServiceAdhocRefinements
 from baserow.core.trash.trash_types import WorkspaceTrashableItemType
 from baserow.core.user_sources.registries import UserSourceCount
 from baserow.core.utils import get_value_at_path
+from baserow.test_utils.benchmark import BenchmarkRecorder
 from baserow.test_utils.setup_formulas import iter_formula_pgsql_functions
 
-SKIP_FLAGS = ["disabled-in-ci", "once-per-day-in-ci"]
+SKIP_FLAGS = ["disabled-in-ci", "once-per-day-in-ci", "benchmark"]
 COMMAND_LINE_FLAG_PREFIX = "--run-"
+DEFAULT_BENCHMARK_BASELINE = "tests/baserow/performance/benchmark_baseline.json"
 
 
 # Provides a new fake instance for each class. Solve uniqueness problem sometimes.
@@ -148,6 +150,11 @@ def clear_cache():
     _generate_search_table_model.cache_clear()
     _workspace_search_table_exists.cache_clear()
 
+    # Process wide generated table models cache
+    from baserow.contrib.database.table.cache import generated_model_lru_cache
+
+    generated_model_lru_cache.clear()
+
     # Thread-local cache
     with local_cache.context():
         yield
@@ -487,6 +494,25 @@ def pytest_addoption(parser):
                 default=False,
                 help=f"run {flag} tests",
             )
+        parser.addoption(
+            "--benchmark-baseline",
+            default=None,
+            help="path of the JSON file with the baseline of the benchmarks, "
+            f"defaults to {DEFAULT_BENCHMARK_BASELINE}",
+        )
+        parser.addoption(
+            "--benchmark-tolerance",
+            type=float,
+            default=1.5,
+            help="factor by which the wall time and peak memory of a benchmark can "
+            "exceed its baseline",
+        )
+        parser.addoption(
+            "--benchmark-update-baseline",
+            action="store_true",
+            default=False,
+            help="store the results of the benchmarks as the new baseline",
+        )
         pytest_addoption.already_run = True
 
 
@@ -565,6 +591,40 @@ def profiler():
     return profile_this
 
 
+@pytest.fixture(scope="session")
+def benchmark_recorder(request):
+    config = request.config
+    baseline_path = config.getoption("--benchmark-baseline")
+    recorder = BenchmarkRecorder(
+        Path(baseline_path or config.rootpath / DEFAULT_BENCHMARK_BASELINE),
+        tolerance=config.getoption("--benchmark-tolerance"),
+        update_baseline=config.getoption("--benchmark-update-baseline"),
+    )
+
+    yield recorder
+
+    if recorder.update_baseline and recorder.results:
+        recorder.save_baseline()
+
+
+@pytest.fixture()
+def benchmark(benchmark_recorder):
+    """
+    A fixture to measure the wall time, number of queries and peak memory of a block
+    of code. The test fails if the results regress compared to the stored baseline.
+    """
+
+    @contextlib.contextmanager
+    def measure(name: str):
+        with benchmark_recorder.measure(name):
+            yield
+
+        regressions = benchmark_recorder.get_regressions(name)
+        assert not regressions, "\n".join(regressions)
+
+    return measure
+
+
 class BaseMaxLocksPerTransactionStub:
     # Determines whether we raise an `OperationalError` about
     # `max_locks_per_transaction` or something else.
@@ -6,6 +6,7 @@ from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
 from baserow.ws.registries import PageType, page_registry
+from baserow.ws.utils import ALL_USERS_CHANNEL_GROUP_NAME, get_user_channel_group_name
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -147,11 +148,26 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
             return
 
         self.scope["pages"] = SubscribedPages()
-        await self.channel_layer.group_add("users", self.channel_name)
+        await self.channel_layer.group_add(
+            ALL_USERS_CHANNEL_GROUP_NAME, self.channel_name
+        )
+
+        # Messages targeting specific users are sent to the channel group of each
+        # user, so that they don't have to be delivered to every connected consumer.
+        user_group_name = get_user_channel_group_name(user.id)
+        if user_group_name:
+            await self.channel_layer.group_add(user_group_name, self.channel_name)
 
     async def disconnect(self, message):
         await self._remove_all_page_scopes(send_confirmation=False)
-        await self.channel_layer.group_discard("users", self.channel_name)
+        await self.channel_layer.group_discard(
+            ALL_USERS_CHANNEL_GROUP_NAME, self.channel_name
+        )
+
+        user = self.scope.get("user")
+        user_group_name = get_user_channel_group_name(user.id) if user else None
+        if user_group_name:
+            await self.channel_layer.group_discard(user_group_name, self.channel_name)
 
     async def receive_json(self, content, **parameters):
         """
@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+from django.core.management.base import BaseCommand
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+BENCHMARK_GROUP_PREFIX = "benchmark-ws-broadcast"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures how many targeted websocket messages per second can be delivered "
+        "through the configured channel layer for a number of connected sockets. It "
+        "compares sending every message to one group containing all sockets, where "
+        "every consumer must filter the message itself, with sending it to the channel "
+        "group of the recipient only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sockets",
+            type=int,
+            nargs="+",
+            default=[10, 100, 1000],
+            help="The numbers of connected sockets to benchmark with.",
+        )
+        parser.add_argument(
+            "--messages",
+            type=int,
+            default=500,
+            help="The number of messages sent to a single user per run.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="The number of messages to send before draining the sockets. Must "
+            "be below the capacity of the channel layer.",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            f"{'sockets':>8} | {'mode':>10} | {'messages/s':>12} | {'deliveries':>10}"
+        )
+        for sockets in options["sockets"]:
+            for mode in ["global", "per_user"]:
+                messages_per_second, deliveries = async_to_sync(self.run_benchmark)(
+                    sockets, options["messages"], options["batch_size"], mode
+                )
+                self.stdout.write(
+                    f"{sockets:>8} | {mode:>10} | {messages_per_second:>12.1f} | "
+                    f"{deliveries:>10}"
+                )
+
+    async def run_benchmark(
+        self, sockets: int, messages: int, batch_size: int, mode: str
+    ):
+        """
+        Registers `sockets` channels in the channel layer like the `CoreConsumer` does,
+        sends `messages` messages to every socket in turn and drains every channel
+        until all the delivered messages have been received.
+
+        :return: The number of messages per second and the number of deliveries.
+        """
+
+        channel_layer = get_channel_layer()
+        all_group_name = f"{BENCHMARK_GROUP_PREFIX}-all"
+        channel_names = [await channel_layer.new_channel() for _ in range(sockets)]
+        for index, channel_name in enumerate(channel_names):
+            await channel_layer.group_add(all_group_name, channel_name)
+            await channel_layer.group_add(
+                f"{BENCHMARK_GROUP_PREFIX}-user-{index}", channel_name
+            )
+
+        deliveries = 0
+        start = time.perf_counter()
+        for batch_start in range(0, messages, batch_size):
+            targets = [
+                index % sockets
+                for index in range(batch_start, min(batch_start + batch_size, messages))
+            ]
+            expected = [0] * sockets
+            for target in targets:
+                message = {"type": "benchmark", "user_ids": [target]}
+                if mode == "global":
+                    await channel_layer.group_send(all_group_name, message)
+                    expected = [count + 1 for count in expected]
+                else:
+                    await channel_layer.group_send(
+                        f"{BENCHMARK_GROUP_PREFIX}-user-{target}", message
+                    )
+                    expected[target] += 1
+
+            # Every delivered message wakes up the receiving consumer, so receiving
+            # them is part of the cost of broadcasting.
+            for channel_name, count in zip(channel_names, expected):
+                for _ in range(count):
+                    await asyncio.wait_for(channel_layer.receive(channel_name), 5)
+                    deliveries += 1
+        duration = time.perf_counter() - start
+
+        for index, channel_name in enumerate(channel_names):
+            await channel_layer.group_discard(all_group_name, channel_name)
+            await channel_layer.group_discard(
+                f"{BENCHMARK_GROUP_PREFIX}-user-{index}", channel_name
+            )
+        if hasattr(channel_layer, "close_pools"):
+            await channel_layer.close_pools()
+
+        return messages / duration, deliveries
@@ -1,6 +1,7 @@
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from baserow.config.celery import app
+from baserow.ws.utils import ALL_USERS_CHANNEL_GROUP_NAME, get_user_channel_group_name
 
 
 @app.task(bind=True)
@@ -20,14 +21,19 @@ def force_disconnect_users(
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
+    async_to_sync(send_messages_to_channel_groups)(
         channel_layer,
-        "users",
-        {
-            "type": "force_disconnect_users",
-            "user_ids": user_ids,
-            "ignore_web_socket_ids": ignore_web_socket_ids,
-        },
+        [
+            (
+                get_user_channel_group_name(user_id),
+                {
+                    "type": "force_disconnect_users",
+                    "user_ids": [user_id],
+                    "ignore_web_socket_ids": ignore_web_socket_ids,
+                },
+            )
+            for user_id in set(user_ids)
+        ],
     )
 
 
@@ -47,7 +53,25 @@ async def send_message_to_channel_group(
     :param messsage: JSON to send.
     """
 
-    await channel_layer.group_send(channel_group_name, message)
+    await send_messages_to_channel_groups(
+        channel_layer, [(channel_group_name, message)]
+    )
+
+
+async def send_messages_to_channel_groups(
+    channel_layer, messages: Iterable[Tuple[str, dict]]
+):
+    """
+    Sends every message to the channel group it's paired with and closes the pools
+    only once after all the messages have been sent.
+
+    :param channel_layer: The channel layer instance to use.
+    :param messages: An iterable of pairs: the channel group name and the JSON
+        message to send to that group.
+    """
+
+    for channel_group_name, message in messages:
+        await channel_layer.group_send(channel_group_name, message)
     if hasattr(channel_layer, "close_pools"):
         # The inmemory channel layer in tests does not have this function.
         await channel_layer.close_pools()
@@ -79,17 +103,39 @@ def broadcast_to_users(
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
-        channel_layer,
-        "users",
-        {
-            "type": "broadcast_to_users",
-            "user_ids": user_ids,
-            "payload": payload,
-            "ignore_web_socket_id": ignore_web_socket_id,
-            "send_to_all_users": send_to_all_users,
-        },
-    )
+
+    if send_to_all_users:
+        messages = [
+            (
+                ALL_USERS_CHANNEL_GROUP_NAME,
+                {
+                    "type": "broadcast_to_users",
+                    "user_ids": [],
+                    "payload": payload,
+                    "ignore_web_socket_id": ignore_web_socket_id,
+                    "send_to_all_users": True,
+                },
+            )
+        ]
+    else:
+        # Sending to the channel group of every recipient means that the message is
+        # only delivered to the consumers of those users, instead of every connected
+        # consumer having to check whether the message is meant for them.
+        messages = [
+            (
+                get_user_channel_group_name(user_id),
+                {
+                    "type": "broadcast_to_users",
+                    "user_ids": [user_id],
+                    "payload": payload,
+                    "ignore_web_socket_id": ignore_web_socket_id,
+                    "send_to_all_users": False,
+                },
+            )
+            for user_id in set(user_ids)
+        ]
+
+    async_to_sync(send_messages_to_channel_groups)(channel_layer, messages)
 
 
 @app.task(bind=True)
@@ -167,8 +213,8 @@ def broadcast_to_users_individual_payloads(
     self, payload_map: Dict[str, any], ignore_web_socket_id: Optional[int] = None
 ):
     """
-    This task will broadcast different payloads to different users by just using one
-    message.
+    This task will broadcast different payloads to different users by sending every
+    payload only to the channel group of the user it's meant for.
 
     :param payload_map: A mapping from user_id to the payload that should be sent to
         the user. The id has to be stringified to not violate redis channel policy
@@ -181,14 +227,19 @@ def broadcast_to_users_individual_payloads(
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
+    async_to_sync(send_messages_to_channel_groups)(
         channel_layer,
-        "users",
-        {
-            "type": "broadcast_to_users_individual_payloads",
-            "payload_map": payload_map,
-            "ignore_web_socket_id": ignore_web_socket_id,
-        },
+        [
+            (
+                get_user_channel_group_name(user_id),
+                {
+                    "type": "broadcast_to_users_individual_payloads",
+                    "payload_map": {user_id: payload},
+                    "ignore_web_socket_id": ignore_web_socket_id,
+                },
+            )
+            for user_id, payload in payload_map.items()
+        ],
     )
 
 
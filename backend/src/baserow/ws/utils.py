@@ -0,0 +1,21 @@
+from typing import Optional
+
+# Every authenticated connection is added to this channel group. It's only used for
+# messages that really must reach every connected client.
+ALL_USERS_CHANNEL_GROUP_NAME = "users"
+
+
+def get_user_channel_group_name(user_id: Optional[int]) -> Optional[str]:
+    """
+    Returns the name of the channel group that all the connections of the user are
+    added to. Messages targeting specific users are sent to these groups, so that they
+    are only delivered to the consumers of the recipients instead of every connected
+    consumer. Anonymous users don't have a user channel group.
+
+    :param user_id: The id of the user.
+    :return: The name of the channel group of the user.
+    """
+
+    if user_id is None:
+        return None
+    return f"user-{user_id}"
@@ -552,6 +552,7 @@ def test_get_workflow_history(api_client, data_fixture):
                 "is_test_run": False,
                 "message": "",
                 "status": "success",
+                "node_timings": [],
             },
         ],
     }
@@ -1,10 +1,17 @@
+import threading
+from unittest.mock import patch
+
+from django.test import override_settings
+
 import pytest
 
 from baserow.contrib.automation.automation_dispatch_context import (
     AutomationDispatchContext,
 )
 from baserow.contrib.automation.nodes.handler import AutomationNodeHandler
+from baserow.contrib.automation.nodes.node_types import CoreHttpRequestNodeType
 from baserow.contrib.automation.workflows.constants import WorkflowState
+from baserow.core.services.types import DispatchResult
 
 
 @pytest.mark.django_db
@@ -192,6 +199,9 @@ def test_run_workflow_with_router_action(data_fixture):
         router_node.id,
         edge2_output_node.id,
     ]
+    assert [
+        timing["node_id"] for timing in dispatch_context.node_timings
+    ] == dispatch_context.dispatch_history
 
 
 @pytest.fixture
@@ -409,3 +419,59 @@ def test_run_workflow_with_iterator_action_simulate(iterator_graph_fixture):
 
     rows3 = list(action3_table.get_model().objects.all())
     assert len(rows3) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(AUTOMATION_WORKFLOW_MAX_PARALLEL_BRANCHES=2)
+def test_run_workflow_dispatches_iterations_concurrently(data_fixture):
+    user = data_fixture.create_user()
+    trigger_table = data_fixture.create_database_table(user=user)
+    integration = data_fixture.create_local_baserow_integration(user=user)
+    workflow = data_fixture.create_automation_workflow(
+        user=user,
+        state=WorkflowState.LIVE,
+        trigger_type="local_baserow_rows_created",
+        trigger_service_kwargs={"table": trigger_table, "integration": integration},
+    )
+    trigger = workflow.get_trigger()
+    iterator_node = data_fixture.create_core_iterator_action_node(
+        workflow=workflow,
+        reference_node=trigger,
+        position="south",
+        output="",
+        service_kwargs={
+            "source": f'get("previous_node.{trigger.id}")',
+            "integration": integration,
+        },
+    )
+    http_node = data_fixture.create_automation_node(
+        type=CoreHttpRequestNodeType.type,
+        workflow=workflow,
+        reference_node=iterator_node,
+        position="child",
+        output="",
+    )
+
+    # Both iterations must be waiting at the same time to get through the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+    dispatched_items = []
+
+    def dispatch(node, dispatch_context):
+        barrier.wait()
+        dispatched_items.append(dispatch_context.current_iterations[iterator_node.id])
+        return DispatchResult(data={"status": 200})
+
+    dispatch_context = AutomationDispatchContext(
+        workflow, {"results": [{"field_1": "value 1"}, {"field_1": "value 2"}]}
+    )
+    with patch.object(CoreHttpRequestNodeType, "dispatch", side_effect=dispatch):
+        AutomationNodeHandler().dispatch_node(trigger, dispatch_context)
+
+    assert sorted(dispatched_items) == [0, 1]
+    assert dispatch_context.dispatch_history == [trigger.id, iterator_node.id]
+    timed_node_ids = [timing["node_id"] for timing in dispatch_context.node_timings]
+    assert sorted(timed_node_ids) == sorted(
+        [trigger.id, iterator_node.id, http_node.id, http_node.id]
+    )
+    # All the branch slots have been released.
+    assert dispatch_context.branch_slots.acquire(blocking=False)
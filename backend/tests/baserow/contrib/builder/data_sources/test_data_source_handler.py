@@ -1,8 +1,10 @@
 from decimal import Decimal
 from unittest.mock import patch
 
+from django.contrib.auth.models import AnonymousUser
 from django.http import HttpRequest
 from django.shortcuts import reverse
+from django.test import override_settings
 
 import pytest
 
@@ -12,11 +14,13 @@ from baserow.contrib.builder.data_sources.builder_dispatch_context import (
 from baserow.contrib.builder.data_sources.exceptions import DataSourceDoesNotExist
 from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowGetRow,
     LocalBaserowListRows,
 )
 from baserow.core.exceptions import CannotCalculateIntermediateOrder
+from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.registries import service_type_registry
 from baserow.core.user_sources.user_source_user import UserSourceUser
 from baserow.test_utils.helpers import AnyStr
@@ -356,6 +360,147 @@ def test_dispatch_data_sources(data_fixture):
     assert isinstance(result[data_source3.id], Exception)
 
 
+@pytest.mark.django_db
+def test_get_data_source_dependencies(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user, page=page, integration=integration, table=table, row_id="1"
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        table=table,
+        row_id=f"get('data_source.{data_source.id}.id')",
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user, page=page, integration=integration, table=table, row_id="2"
+    )
+
+    assert DataSourceHandler().get_data_source_dependencies(
+        [data_source, data_source2, data_source3]
+    ) == {
+        data_source.id: set(),
+        data_source2.id: {data_source.id},
+        data_source3.id: set(),
+    }
+
+
+@pytest.mark.django_db
+@override_settings(BUILDER_DISPATCH_DATA_SOURCES_MAX_WORKERS=3)
+def test_dispatch_data_sources_concurrently_respects_dependencies(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user, page=page, integration=integration, table=table, row_id="1"
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        table=table,
+        row_id=f"get('data_source.{data_source.id}.id')",
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user, page=page, integration=integration, table=table, row_id="2"
+    )
+
+    dispatched = []
+
+    def dispatch_data_source(data_source, dispatch_context):
+        dispatched.append(data_source.id)
+        if data_source.id == data_source3.id:
+            raise Exception("Failed")
+        return {"id": data_source.id}
+
+    dispatch_context = BuilderDispatchContext(
+        HttpRequest(), page, only_expose_public_allowed_properties=False
+    )
+    with patch.object(
+        DataSourceHandler, "dispatch_data_source", side_effect=dispatch_data_source
+    ):
+        result = DataSourceHandler().dispatch_data_sources(
+            [data_source, data_source2, data_source3], dispatch_context
+        )
+
+    assert list(result.keys()) == [data_source.id, data_source2.id, data_source3.id]
+    assert result[data_source.id] == {"id": data_source.id}
+    assert result[data_source2.id] == {"id": data_source2.id}
+    assert isinstance(result[data_source3.id], Exception)
+    assert sorted(dispatched) == sorted(result.keys())
+    assert dispatched.index(data_source.id) < dispatched.index(data_source2.id)
+
+
+@pytest.mark.django_db
+def test_dispatch_data_source_with_public_cache(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"]],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user, page=page, integration=integration, table=table, row_id="1"
+    )
+    data_source.public_cache_ttl = 60
+    data_source.save()
+
+    builder.workspace = None
+    builder.save()
+
+    def dispatch():
+        request = HttpRequest()
+        request.user_source_user = AnonymousUser()
+        return DataSourceHandler().dispatch_data_source(
+            data_source, BuilderDispatchContext(request, page)
+        )
+
+    original_dispatch_service = ServiceHandler.dispatch_service
+    with patch.object(
+        ServiceHandler,
+        "dispatch_service",
+        side_effect=original_dispatch_service,
+        autospec=True,
+    ) as mock_dispatch_service:
+        first_result = dispatch()
+        assert dispatch() == first_result
+        assert mock_dispatch_service.call_count == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            RowHandler().update_row_by_id(
+                user, table, rows[0].id, {fields[0].db_column: "Tesla"}
+            )
+
+        dispatch()
+        assert mock_dispatch_service.call_count == 2
+
+        # The cache is not used when the data source hasn't opted in.
+        data_source.public_cache_ttl = 0
+        data_source.save()
+
+        dispatch()
+        dispatch()
+        assert mock_dispatch_service.call_count == 4
+
+
 @pytest.mark.django_db
 def test_update_data_source_invalid_values(data_fixture):
     data_source = data_fixture.create_builder_local_baserow_get_row_data_source()
@@ -211,6 +211,7 @@ def test_builder_application_export(data_fixture):
                 "id": datasource2.id,
                 "name": "source 2",
                 "order": "1.00000000000000000000",
+                "public_cache_ttl": 0,
                 "service": {
                     "id": datasource2.service.id,
                     "sample_data": None,
@@ -228,6 +229,7 @@ def test_builder_application_export(data_fixture):
                 "id": datasource3.id,
                 "name": "source 3",
                 "order": "2.00000000000000000000",
+                "public_cache_ttl": 0,
                 "service": {
                     "id": datasource3.service.id,
                     "sample_data": None,
@@ -378,6 +380,7 @@ def test_builder_application_export(data_fixture):
                         "id": shared_datasource.id,
                         "name": shared_datasource.name,
                         "order": "1.00000000000000000000",
+                        "public_cache_ttl": 0,
                         "service": {
                             "id": shared_datasource.service.id,
                             "sample_data": None,
@@ -422,6 +425,7 @@ def test_builder_application_export(data_fixture):
                         "id": datasource1.id,
                         "name": "source 1",
                         "order": "1.00000000000000000000",
+                        "public_cache_ttl": 0,
                         "service": {
                             "id": datasource1.service.id,
                             "sample_data": None,
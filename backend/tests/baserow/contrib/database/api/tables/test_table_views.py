@@ -1,4 +1,3 @@
-import json
 from unittest.mock import patch
 
 from django.db import connection
@@ -17,6 +16,7 @@ from rest_framework.status import (
 
 from baserow.contrib.database.data_sync.handler import DataSyncHandler
 from baserow.contrib.database.file_import.models import FileImportJob
+from baserow.contrib.database.file_import.utils import read_import_data_file
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.tokens.handler import TokenHandler
 from baserow.core.jobs.models import Job
@@ -474,8 +474,9 @@ def test_create_table_with_data(
 
     with patch_filefield_storage():
         with job.data_file.open("r") as fin:
-            data = json.load(fin)
-            assert data.get("data") == [
+            _, row_count, rows = read_import_data_file(fin)
+            assert row_count == 4
+            assert list(rows) == [
                 ["A", "B", "C", "D"],
                 ["1-1", "1-2", "1-3", "1-4", "1-5"],
                 ["2-1", "2-2", "2-3"],
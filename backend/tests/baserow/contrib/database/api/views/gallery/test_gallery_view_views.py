@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 from django.shortcuts import reverse
 
@@ -602,6 +603,60 @@ def test_list_rows_include_field_options(api_client, data_fixture):
     assert "filters_disabled" not in response_json
 
 
+@pytest.mark.django_db
+def test_list_rows_include_fields_uses_projected_model(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    gallery = data_fixture.create_gallery_view(table=table)
+    data_fixture.create_view_filter(
+        view=gallery, field=boolean_field, type="boolean", value="1"
+    )
+
+    model = table.get_model()
+    row = model.objects.create(
+        **{
+            f"field_{text_field.id}": "a",
+            f"field_{number_field.id}": 1,
+            f"field_{boolean_field.id}": True,
+        }
+    )
+    model.objects.create(
+        **{
+            f"field_{text_field.id}": "b",
+            f"field_{number_field.id}": 2,
+            f"field_{boolean_field.id}": False,
+        }
+    )
+
+    url = reverse("api:database:views:gallery:list", kwargs={"view_id": gallery.id})
+    with patch.object(
+        table.__class__,
+        "get_projected_model",
+        autospec=True,
+        side_effect=table.__class__.get_projected_model,
+    ) as mock_get_projected_model:
+        response = api_client.get(
+            url,
+            {"include_fields": f"field_{text_field.id}"},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+
+    assert response.status_code == HTTP_200_OK
+    assert mock_get_projected_model.call_count == 1
+    assert set(mock_get_projected_model.call_args[0][1]) == {
+        text_field.id,
+        boolean_field.id,
+    }
+    response_json = response.json()
+    assert response_json["count"] == 1
+    assert response_json["results"] == [
+        {"id": row.id, "order": "1.00000000000000000000", f"field_{text_field.id}": "a"}
+    ]
+
+
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.parametrize("search_mode", ALL_SEARCH_MODES)
 def test_list_rows_search(api_client, data_fixture, search_mode):
@@ -1,7 +1,7 @@
 import json
 from decimal import Decimal
 from typing import Any, Dict, List
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from django.core.cache import cache
 from django.shortcuts import reverse
@@ -25,7 +25,7 @@ from baserow.contrib.database.rows.registries import (
     row_metadata_registry,
 )
 from baserow.contrib.database.search.handler import ALL_SEARCH_MODES
-from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.handler import TableHandler, TableUsageHandler
 from baserow.contrib.database.table.models import TableModelQuerySet
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GridView
@@ -211,6 +211,72 @@ def test_list_rows(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_list_rows_with_count_mode(api_client, data_fixture, settings):
+    settings.BASEROW_ROW_COUNT_CAP = 2
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().force_create_rows(
+        user,
+        table,
+        [{f"field_{text_field.id}": value} for value in ["a", "a", "a", "b"]],
+    )
+    TableUsageHandler.update_tables_usage()
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+
+    response = api_client.get(
+        url, data={"count_mode": "capped"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    # The view isn't filtered, so the exact row count of the table is used.
+    assert response_json["count"] == 4
+    assert response_json["count_mode"] == "exact"
+    assert len(response_json["results"]) == 4
+
+    response = api_client.get(
+        url,
+        data={"count_mode": "capped", f"filter__field_{text_field.id}__equal": "a"},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 2
+    assert response_json["count_mode"] == "capped"
+    assert len(response_json["results"]) == 3
+
+    data_fixture.create_view_filter(
+        view=grid, field=text_field, type="equal", value="b"
+    )
+    response = api_client.get(
+        url,
+        data={"count_mode": "capped", "count": ""},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.json() == {"count": 1, "count_mode": "exact"}
+
+    response = api_client.get(
+        url, data={"count_mode": "estimate"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert isinstance(response_json["count"], int)
+    assert response_json["count_mode"] == "estimate"
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    response_json = response.json()
+    assert response_json["count"] == 1
+    assert "count_mode" not in response_json
+
+    response = api_client.get(
+        url, data={"count_mode": "unknown"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+
 @pytest.mark.django_db
 def test_list_rows_with_group_by(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -962,11 +1028,13 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": None,
         "version": 1,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") is None
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 0,
         "version": 1,
+        "computation_id": ANY,
     }
     assert (
         cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") is None
@@ -1064,11 +1132,13 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": 1210.0,
         "version": 4,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 4
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 6
 
@@ -1117,10 +1187,12 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1210),
         "version": 4,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 7
@@ -1141,10 +1213,12 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1200),
         "version": 5,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 1,
         "version": 7,
+        "computation_id": ANY,
     }
 
     # Let's update the filter
@@ -1443,7 +1517,7 @@ def test_view_aggregations_adhoc_filtering_invalid_advanced_filters(
 
 @pytest.mark.django_db
 def test_view_aggregations_cache_invalidation_with_dependant_fields(
-    api_client, data_fixture
+    api_client, data_fixture, django_capture_on_commit_callbacks
 ):
     """
     Here we want a complex situation where we need to invalidate the cache of a
@@ -1589,6 +1663,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "computation_id": ANY,
     }
     assert (
         cache.get(
@@ -1604,10 +1679,11 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "computation_id": ANY,
     }
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
-    ) == {"value": None, "version": 5}
+    ) == {"value": None, "version": 5, "computation_id": ANY}
 
     cache.set(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}",
@@ -1628,6 +1704,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "computation_id": ANY,
     }
 
     check_table_2_aggregation_values(
@@ -1637,26 +1714,33 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "computation_id": ANY,
     }
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
     ) == {
         "value": Decimal(2221),
         "version": 9,
+        "computation_id": ANY,
     }
 
-    update_value_of_table1(row2, 10000)
+    # The sum of table 1 is updated incrementally once the change is committed.
+    with django_capture_on_commit_callbacks(execute=True):
+        update_value_of_table1(row2, 10000)
 
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
-        "value": Decimal(1111),
+        "value": Decimal(11101),
         "version": 5,
+        "computation_id": ANY,
+        "incremental_updates": 1,
     }
-    assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 6
+    assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
     ) == {
         "value": Decimal(2221),
         "version": 9,
+        "computation_id": ANY,
     }
     assert (
         cache.get(
@@ -1670,20 +1754,23 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     )
 
     # Delete row3 from table1
-    api_client.delete(
-        reverse(
-            "api:database:rows:item",
-            kwargs={"table_id": table.id, "row_id": row3["id"]},
-        ),
-        format="json",
-        HTTP_AUTHORIZATION=f"JWT {token}",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.delete(
+            reverse(
+                "api:database:rows:item",
+                kwargs={"table_id": table.id, "row_id": row3["id"]},
+            ),
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
 
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
-        "value": Decimal("1111"),
+        "value": Decimal("11001"),
         "version": 5,
+        "computation_id": ANY,
+        "incremental_updates": 2,
     }
-    assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 7
+    assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
 
     # Should increment cache version
     assert (
@@ -1698,15 +1785,18 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     )
 
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
-        "value": Decimal("1111"),
+        "value": Decimal("11001"),
         "version": 5,
+        "computation_id": ANY,
+        "incremental_updates": 2,
     }
-    assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 7
+    assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
     ) == {
         "value": Decimal(22001),
         "version": 11,
+        "computation_id": ANY,
     }
 
     # Restore delete row
@@ -1740,6 +1830,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 12,
+        "computation_id": ANY,
     }
 
     # Update number field
@@ -1770,6 +1861,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 12,
+        "computation_id": ANY,
     }
 
     # Delete number field
@@ -1787,6 +1879,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 12,
+        "computation_id": ANY,
     }
     assert (
         cache.get(
@@ -1803,6 +1896,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 12,
+        "computation_id": ANY,
     }
     assert (
         cache.get(
@@ -1839,6 +1933,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 12,
+        "computation_id": ANY,
     }
     assert (
         cache.get(
@@ -2100,11 +2195,13 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": None,
         "version": 1,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") is None
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 0,
         "version": 1,
+        "computation_id": ANY,
     }
     assert (
         cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") is None
@@ -2200,11 +2297,13 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": 1210.0,
         "version": 4,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 4
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 6
 
@@ -2251,10 +2350,12 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1210),
         "version": 4,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 7
@@ -2274,10 +2375,12 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1200),
         "version": 5,
+        "computation_id": ANY,
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 1,
         "version": 7,
+        "computation_id": ANY,
     }
 
     # Let's update the filter
@@ -4296,6 +4399,86 @@ def test_grid_view_link_row_lookup_view(api_client, data_fixture):
     assert response_json["results"][0]["value"] == "Test 2"
 
 
+@pytest.mark.django_db
+def test_list_rows_include_fields_uses_projected_model_with_view_filter_fields(
+    api_client, data_fixture
+):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid, field=boolean_field, type="boolean", value="1"
+    )
+    data_fixture.create_view_sort(view=grid, field=number_field, order="DESC")
+
+    model = table.get_model()
+    model.objects.create(
+        **{
+            f"field_{text_field.id}": "a",
+            f"field_{number_field.id}": 1,
+            f"field_{boolean_field.id}": True,
+        }
+    )
+    model.objects.create(
+        **{
+            f"field_{text_field.id}": "b",
+            f"field_{number_field.id}": 2,
+            f"field_{boolean_field.id}": True,
+        }
+    )
+    model.objects.create(
+        **{
+            f"field_{text_field.id}": "c",
+            f"field_{number_field.id}": 3,
+            f"field_{boolean_field.id}": False,
+        }
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    with patch.object(
+        table.__class__,
+        "get_projected_model",
+        autospec=True,
+        side_effect=table.__class__.get_projected_model,
+    ) as mock_get_projected_model:
+        response = api_client.get(
+            url,
+            {"include_fields": f"field_{text_field.id}"},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+
+    assert response.status_code == HTTP_200_OK
+    assert mock_get_projected_model.call_count == 1
+    assert set(mock_get_projected_model.call_args[0][1]) == {
+        text_field.id,
+        number_field.id,
+        boolean_field.id,
+    }
+    response_json = response.json()
+    assert response_json["count"] == 2
+    assert [row[f"field_{text_field.id}"] for row in response_json["results"]] == [
+        "b",
+        "a",
+    ]
+    assert f"field_{number_field.id}" not in response_json["results"][0]
+
+    # Searching can reference any field, so the full model must be used.
+    with patch.object(
+        table.__class__, "get_projected_model"
+    ) as mock_get_projected_model:
+        response = api_client.get(
+            url,
+            {"include_fields": f"field_{text_field.id}", "search": "a"},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+
+    assert response.status_code == HTTP_200_OK
+    mock_get_projected_model.assert_not_called()
+
+
 @pytest.mark.django_db
 def test_list_rows_include_fields(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
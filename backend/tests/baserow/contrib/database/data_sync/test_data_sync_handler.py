@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from django.core.cache import cache
 from django.db import connection
+from django.test import override_settings
 
 import pytest
 import responses
@@ -11,6 +12,7 @@ from freezegun import freeze_time
 from baserow.contrib.database.data_sync.exceptions import (
     PropertyNotFound,
     SyncDataSyncTableAlreadyRunning,
+    SyncError,
     UniquePrimaryPropertyNotFound,
 )
 from baserow.contrib.database.data_sync.handler import DataSyncHandler
@@ -20,6 +22,7 @@ from baserow.contrib.database.data_sync.ical_data_sync_type import (
 )
 from baserow.contrib.database.data_sync.models import (
     DataSync,
+    DataSyncRowFingerprint,
     DataSyncSyncedProperty,
     ICalCalendarDataSync,
 )
@@ -655,6 +658,155 @@ def test_sync_data_sync_table_create_update_delete_row(data_fixture):
     assert getattr(sync_3_rows[0], f"field_{fields['summary'].id}") == "Test event 0"
 
 
+@pytest.mark.django_db
+@responses.activate
+@override_settings(BASEROW_DATA_SYNC_CHUNK_SIZE=1)
+def test_sync_data_sync_table_in_chunks(data_fixture):
+    responses.add(
+        responses.GET,
+        "https://baserow.io/ical.ics",
+        status=200,
+        body=ICAL_FEED_WITH_THREE_ITEMS,
+    )
+
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+
+    handler = DataSyncHandler()
+
+    data_sync = handler.create_data_sync_table(
+        user=user,
+        database=database,
+        table_name="Test",
+        type_name="ical_calendar",
+        synced_properties=["uid", "dtstart", "dtend", "summary"],
+        ical_url="https://baserow.io/ical.ics",
+    )
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    uid_field = DataSyncSyncedProperty.objects.get(data_sync=data_sync, key="uid").field
+    model = data_sync.table.get_model()
+    sync_1_rows = list(model.objects.all())
+    assert len(sync_1_rows) == 3
+
+    # A row with the same unique primary is a duplicate, and a row without unique
+    # primary is dangling. Both must be deleted.
+    model.objects.create(
+        **{uid_field.db_column: "1725220374375-34056@ical.marudot.com"}
+    )
+    model.objects.create(**{uid_field.db_column: ""})
+
+    responses.add(
+        responses.GET,
+        "https://baserow.io/ical.ics",
+        status=200,
+        body=ICAL_FEED_WITH_ONE_ITEMS,
+    )
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    sync_2_rows = list(model.objects.all())
+    assert len(sync_2_rows) == 1
+    assert sync_2_rows[0].id == sync_1_rows[0].id
+    assert (
+        getattr(sync_2_rows[0], uid_field.db_column)
+        == "1725220374375-34056@ical.marudot.com"
+    )
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.data_sync.ical_data_sync_type.ICalCalendarDataSyncType"
+    ".get_all_rows"
+)
+@override_settings(BASEROW_DATA_SYNC_CHUNK_SIZE=1)
+def test_sync_data_sync_table_does_not_write_rows_if_streaming_fails(
+    mock_get_all_rows, data_fixture
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    handler = DataSyncHandler()
+
+    mock_get_all_rows.return_value = []
+    data_sync = handler.create_data_sync_table(
+        user=user,
+        database=database,
+        table_name="Test",
+        type_name="ical_calendar",
+        synced_properties=["uid", "dtstart", "dtend", "summary"],
+        ical_url="https://baserow.io/ical.ics",
+    )
+    uid_field = DataSyncSyncedProperty.objects.get(data_sync=data_sync, key="uid").field
+    model = data_sync.table.get_model()
+    existing_row = model.objects.create(**{uid_field.db_column: "existing"})
+
+    def get_all_rows(*args, **kwargs):
+        yield {"uid": "new", "dtstart": None, "dtend": None, "summary": ""}
+        raise SyncError("Connection lost.")
+
+    mock_get_all_rows.side_effect = get_all_rows
+    data_sync = handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    assert data_sync.last_error == "Connection lost."
+    assert data_sync.last_sync is None
+    assert model.objects.filter(id=existing_row.id).exists()
+    # The rows written before the error are rolled back.
+    assert not model.objects.filter(**{uid_field.db_column: "new"}).exists()
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.data_sync.ical_data_sync_type.ICalCalendarDataSyncType"
+    ".get_all_rows"
+)
+def test_sync_data_sync_table_skips_rows_with_unchanged_fingerprint(
+    mock_get_all_rows, data_fixture
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    handler = DataSyncHandler()
+
+    rows = [
+        {"uid": "1", "dtstart": None, "dtend": None, "summary": "A"},
+        {"uid": "2", "dtstart": None, "dtend": None, "summary": "B"},
+    ]
+    mock_get_all_rows.side_effect = lambda *args, **kwargs: iter(rows)
+    data_sync = handler.create_data_sync_table(
+        user=user,
+        database=database,
+        table_name="Test",
+        type_name="ical_calendar",
+        synced_properties=["uid", "dtstart", "dtend", "summary"],
+        ical_url="https://baserow.io/ical.ics",
+    )
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+    assert DataSyncRowFingerprint.objects.filter(data_sync=data_sync).count() == 2
+
+    with patch(
+        "baserow.contrib.database.data_sync.handler.RowHandler.update_rows"
+    ) as mock_update_rows:
+        handler.sync_data_sync_table(user=user, data_sync=data_sync)
+        mock_update_rows.assert_not_called()
+
+    rows[1] = {"uid": "2", "dtstart": None, "dtend": None, "summary": "C"}
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    summary_field = DataSyncSyncedProperty.objects.get(
+        data_sync=data_sync, key="summary"
+    ).field
+    model = data_sync.table.get_model()
+    assert list(model.objects.values_list(summary_field.db_column, flat=True)) == [
+        "A",
+        "C",
+    ]
+
+    # Removing a property invalidates the fingerprints, because they were computed
+    # for the old set of fields.
+    handler.set_data_sync_synced_properties(
+        user=user, data_sync=data_sync, synced_properties=["uid", "summary"]
+    )
+    assert DataSyncRowFingerprint.objects.filter(data_sync=data_sync).count() == 0
+
+
 @pytest.mark.django_db
 @responses.activate
 def test_sync_data_sync_table_property_removed_from_data_sync_type(data_fixture):
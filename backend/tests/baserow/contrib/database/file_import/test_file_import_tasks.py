@@ -1,8 +1,10 @@
 import json
 from datetime import datetime, timedelta, timezone
+from io import BytesIO
 from typing import NamedTuple
 
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.test.utils import override_settings
 
 import pytest
@@ -17,6 +19,7 @@ from baserow.contrib.database.fields.field_constraints import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption, TextField
+from baserow.contrib.database.file_import.utils import write_import_data_file
 from baserow.contrib.database.rows.exceptions import InvalidRowLength
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.core.exceptions import UserNotInWorkspace
@@ -528,6 +531,38 @@ def test_run_file_import_test_chunk(data_fixture, patch_filefield_storage):
     assert job.progress_percentage == 100
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_with_json_lines_data_file(
+    data_fixture, patch_filefield_storage
+):
+    user = data_fixture.create_user()
+    table, fields, _ = data_fixture.build_table(
+        columns=[("col1", "text"), ("col2", "number")], rows=[], user=user
+    )
+
+    data = [["row 1", 1], ["row 2", "bad"], ["row 3", 3]]
+    data_file = BytesIO()
+    write_import_data_file(data_file, data)
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            table=table,
+            user=user,
+            data_file=ContentFile(data_file.getvalue()),
+        )
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert list(job.report["failing_rows"].keys()) == ["1"]
+
+    model = table.get_model()
+    assert list(
+        model.objects.order_by("id").values_list(fields[0].db_column, flat=True)
+    ) == ["row 1", "row 3"]
+
+
 @pytest.mark.django_db()
 def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     row_count = 2000
@@ -1117,3 +1117,69 @@ def test_csv_is_escaped(get_storage_mock, data_fixture):
     bom = "\ufeff"
     expected = bom + "id,text_field\r\n1,'=1+2\r\n"
     assert contents == expected
+
+
+@pytest.mark.django_db
+@patch("baserow.core.storage.get_default_storage")
+@patch(
+    "baserow.contrib.database.export.file_writer.StreamingExportJobFileWriter"
+    ".CHUNK_SIZE",
+    2,
+)
+def test_export_walks_all_rows_by_keyset_over_multiple_chunks(
+    get_storage_mock, data_fixture
+):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    # Rows with the same order must be ordered by id and must not be skipped when
+    # they are split over two chunks.
+    model.objects.create(order=1, **{f"field_{text_field.id}": "a"})
+    model.objects.create(order=2, **{f"field_{text_field.id}": "b"})
+    model.objects.create(order=2, **{f"field_{text_field.id}": "c"})
+    model.objects.create(order=2, **{f"field_{text_field.id}": "d"})
+    model.objects.create(order=3, **{f"field_{text_field.id}": "e"})
+
+    job, contents = run_export_job_with_mock_storage(
+        table, grid_view, storage_mock, user
+    )
+    bom = "\ufeff"
+    expected = bom + "id,text_field\r\n1,a\r\n2,b\r\n3,c\r\n4,d\r\n5,e\r\n"
+    assert contents == expected
+    job.refresh_from_db()
+    assert job.progress_percentage == 100
+
+
+@pytest.mark.django_db
+@patch("baserow.core.storage.get_default_storage")
+@patch(
+    "baserow.contrib.database.export.file_writer.StreamingExportJobFileWriter"
+    ".CHUNK_SIZE",
+    2,
+)
+def test_export_of_sorted_view_is_streamed_over_multiple_chunks(
+    get_storage_mock, data_fixture
+):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for value in ["b", "e", "a", "d", "c"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="ASC")
+
+    job, contents = run_export_job_with_mock_storage(
+        table, grid_view, storage_mock, user, {"exporter_type": "csv"}
+    )
+    bom = "\ufeff"
+    expected = bom + "id,text_field\r\n3,a\r\n1,b\r\n5,c\r\n4,d\r\n2,e\r\n"
+    assert contents == expected
+    job.refresh_from_db()
+    assert job.progress_percentage == 100
@@ -29,6 +29,8 @@ from baserow.contrib.database.trash.trash_types import RowTrashableItemType
 from baserow.core.action.handler import ActionHandler
 from baserow.core.action.registries import ActionType, action_type_registry
 from baserow.core.trash.actions import RestoreFromTrashActionType
+from baserow.core.write_behind.handler import WriteBehindHandler, _get_redis_client
+from baserow.core.write_behind.registries import write_behind_buffer_type_registry
 from baserow.test_utils.helpers import setup_interesting_test_table
 
 
@@ -1880,3 +1882,94 @@ def test_restore_rows_action_with_related_tables(
             assert check_metadata["linked_rows"] == {
                 str(row.id): {"value": primary_value}
             }
+
+
+@pytest.mark.django_db
+@pytest.mark.row_history
+def test_row_history_write_behind_buffer(
+    settings, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    model = table.get_model()
+    row = model.objects.create()
+
+    settings.BASEROW_WRITE_BEHIND_BUFFERS = ["row_history"]
+    handler = WriteBehindHandler()
+    buffer_type = write_behind_buffer_type_registry.get("row_history")
+    _get_redis_client().delete(handler._get_stream_key(buffer_type))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        UpdateRowsActionType.do(
+            user,
+            table,
+            [{"id": row.id, f"field_{name_field.id}": "changed"}],
+            model,
+        )
+
+    # The entry is only buffered, not inserted in the same transaction.
+    assert RowHistory.objects.count() == 0
+    assert handler.get_lag(buffer_type).pending_messages == 1
+
+    with patch(
+        "baserow.contrib.database.rows.history.rows_history_updated.send"
+    ) as mock_send:
+        handler.flush_all()
+
+    assert handler.get_lag(buffer_type).pending_messages == 0
+    entry = RowHistory.objects.get()
+    assert entry.row_id == row.id
+    assert entry.table_id == table.id
+    assert entry.after_values == {f"field_{name_field.id}": "changed"}
+    assert entry.field_names == [f"field_{name_field.id}"]
+    assert mock_send.call_args[1]["row_history_entries"][0].id == entry.id
+
+
+@pytest.mark.django_db
+@pytest.mark.row_history
+def test_row_history_write_behind_buffer_moves_failing_messages_to_dead_letter(
+    settings, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    model = table.get_model()
+    row = model.objects.create()
+    deleted_table = data_fixture.create_database_table(user=user)
+    deleted_name_field = data_fixture.create_text_field(
+        table=deleted_table, name="Name"
+    )
+    deleted_model = deleted_table.get_model()
+    deleted_row = deleted_model.objects.create()
+
+    settings.BASEROW_WRITE_BEHIND_BUFFERS = ["row_history"]
+    handler = WriteBehindHandler()
+    buffer_type = write_behind_buffer_type_registry.get("row_history")
+    redis_client = _get_redis_client()
+    redis_client.delete(handler._get_stream_key(buffer_type))
+    redis_client.delete(handler._get_dead_letter_stream_key(buffer_type))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        UpdateRowsActionType.do(
+            user,
+            deleted_table,
+            [{"id": deleted_row.id, f"field_{deleted_name_field.id}": "changed"}],
+            deleted_model,
+        )
+        UpdateRowsActionType.do(
+            user,
+            table,
+            [{"id": row.id, f"field_{name_field.id}": "changed"}],
+            model,
+        )
+
+    # The history entry of this table can't be inserted anymore.
+    deleted_table.delete()
+
+    with patch("baserow.contrib.database.rows.history.rows_history_updated.send"):
+        handler.flush_all()
+
+    assert handler.get_lag(buffer_type).pending_messages == 0
+    assert RowHistory.objects.get().table_id == table.id
+    assert redis_client.xlen(handler._get_dead_letter_stream_key(buffer_type)) == 1
@@ -1354,7 +1354,7 @@ def test_import_rows_respects_primary_priority_sorting(data_fixture):
 
     data = [["N", "A", "text"]]
 
-    created_rows, error_report = ImportRowsActionType.do(
+    created_row_ids, error_report = ImportRowsActionType.do(
         user,
         table,
         data={"data": data, "configuration": None},
@@ -1362,11 +1362,10 @@ def test_import_rows_respects_primary_priority_sorting(data_fixture):
     )
 
     assert error_report == {}
-    assert len(created_rows) == 1
+    assert len(created_row_ids) == 1
 
-    row = created_rows[0]
     model = table.get_model()
-    stored = model.objects.get(id=row.id)
+    stored = model.objects.get(id=created_row_ids[0])
 
     assert getattr(stored, name_field.db_column) == "N"
     assert getattr(stored, text_field.db_column) == "text"
@@ -18,7 +18,8 @@ from baserow.contrib.database.api.utils import (
 )
 from baserow.contrib.database.fields.models import SelectOption
 from baserow.contrib.database.rows.exceptions import RowDoesNotExist
-from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.handler import RowHandler, UpsertRowsMappingHandler
+from baserow.core.db import bulk_insert_with_copy
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.trash.handler import TrashHandler
 
@@ -1054,6 +1055,84 @@ def test_import_rows(
     assert sorted(report.keys()) == sorted([1, 2])
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.handler.BATCH_SIZE", 2)
+def test_import_rows_in_chunks_from_iterator(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(
+        table=table, name="Name", primary=True, order=1
+    )
+    speed_field = data_fixture.create_number_field(
+        table=table, name="Max speed", order=2
+    )
+
+    data = [
+        ["Tesla", 240],
+        ["Giulietta", 210.888],
+        ["Panda", 160],
+        ["Fiat", 120, "too many values"],
+        ["Mini"],
+    ]
+    read_indexes = []
+
+    def read_rows():
+        for index, row in enumerate(data):
+            read_indexes.append(index)
+            yield row
+
+    with patch(
+        "baserow.contrib.database.rows.handler.bulk_insert_with_copy",
+        wraps=bulk_insert_with_copy,
+    ) as mocked_copy:
+        row_ids, report = RowHandler().import_rows_in_chunks(
+            user=user,
+            table=table,
+            data=read_rows(),
+            row_count=len(data),
+            send_realtime_update=False,
+        )
+
+    assert read_indexes == [0, 1, 2, 3, 4]
+    assert sorted(report.keys()) == [1, 3]
+    assert len(row_ids) == 3
+    # Every chunk with valid rows is inserted with `COPY`.
+    assert mocked_copy.call_count == 3
+
+    model = table.get_model()
+    assert list(
+        model.objects.order_by("id").values_list(
+            name_field.db_column, speed_field.db_column
+        )
+    ) == [("Tesla", 240), ("Panda", 160), ("Mini", None)]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_upsert_rows_mapping_handler(data_fixture, use_copy):
+    table, fields, rows = data_fixture.build_table(
+        columns=[("Name", "text"), ("Count", "number")],
+        rows=[["a", 1], ["b", 2], ["a", 1], ["c", 3]],
+    )
+
+    handler = UpsertRowsMappingHandler(
+        table=table,
+        upsert_fields=[fields[0].id, fields[1].id],
+        upsert_values=[
+            ["a", 1],
+            ["z", 1],
+            ["a", "1"],
+            # There are only two matching rows in the table, so this one is created.
+            ["a", 1],
+            ["c", None],
+            ["c", 3],
+        ],
+        use_copy=use_copy,
+    )
+
+    assert handler.process_map == {0: rows[0].id, 2: rows[2].id, 5: rows[3].id}
+
+
 @pytest.mark.django_db
 def test_import_rows_with_read_only_field(
     data_fixture,
@@ -1442,7 +1521,11 @@ def test_get_unique_orders_first_before_row(data_fixture):
 
 
 @pytest.mark.django_db
-def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fixture):
+@patch("baserow.contrib.database.rows.signals.row_orders_recalculated.send")
+@patch("baserow.contrib.database.rows.signals.row_orders_rebalanced.send")
+def test_get_unique_orders_before_row_triggering_local_order_rebalance(
+    rebalanced_send_mock, recalculated_send_mock, data_fixture
+):
     user = data_fixture.create_user()
     database = data_fixture.create_database_application(user=user)
     table = data_fixture.create_database_table(
@@ -1451,25 +1534,69 @@ def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fix
 
     model = table.get_model()
     row_1 = model.objects.create(order=Decimal("1.00000000000000000000"))
-    row_2 = model.objects.create(order=Decimal("1.00000000000000001000"))
+    row_2 = model.objects.create(order=Decimal("1.00000000000000001000"), trashed=True)
     row_3 = model.objects.create(order=Decimal("2.99999999999999999999"))
     row_4 = model.objects.create(order=Decimal("2.99999999999999999998"))
+    row_5 = model.objects.create(order=Decimal("3.00000000000000000001"))
 
     handler = RowHandler()
     assert handler.get_unique_orders_before_row(row_3, model, 2) == [
-        Decimal("3.50000000000000000000"),
-        Decimal("3.66666666666666651864"),
+        Decimal("2.50000000000000000000"),
+        Decimal("2.66666666666666651864"),
     ]
 
     row_1.refresh_from_db()
     row_2.refresh_from_db()
     row_3.refresh_from_db()
     row_4.refresh_from_db()
+    row_5.refresh_from_db()
+
+    # Only the rows before `row_3`, including the trashed one, have been rebalanced.
+    assert row_1.order == Decimal("0.70000000000000000000")
+    assert row_2.order == Decimal("1.40000000000000000000")
+    assert row_4.order == Decimal("2.10000000000000000000")
+    assert row_3.order == Decimal("2.99999999999999999999")
+    assert row_5.order == Decimal("3.00000000000000000001")
+
+    recalculated_send_mock.assert_not_called()
+    rebalanced_send_mock.assert_called_once()
+    assert rebalanced_send_mock.call_args[1]["table"].id == table.id
+    assert [row.id for row in rebalanced_send_mock.call_args[1]["rows"]] == [
+        row_1.id,
+        row_4.id,
+    ]
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.row_orders_recalculated.send")
+def test_get_unique_orders_before_row_triggering_full_table_order_reset(
+    recalculated_send_mock, data_fixture
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(
+        name="Table", user=user, database=database
+    )
+
+    model = table.get_model()
+    row_1 = model.objects.create(order=Decimal("0.00000000000000000001"))
+    row_2 = model.objects.create(order=Decimal("0.00000000000000000003"))
+    row_3 = model.objects.create(order=Decimal("0.00000000000000000002"))
+
+    handler = RowHandler()
+    assert handler.get_unique_orders_before_row(row_2, model, 2) == [
+        Decimal("2.50000000000000000000"),
+        Decimal("2.66666666666666651864"),
+    ]
+
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    row_3.refresh_from_db()
 
     assert row_1.order == Decimal("1.00000000000000000000")
-    assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("4.00000000000000000000")
-    assert row_4.order == Decimal("3.00000000000000000000")
+    assert row_2.order == Decimal("3.00000000000000000000")
+    assert row_3.order == Decimal("2.00000000000000000000")
+    recalculated_send_mock.assert_called_once()
 
 
 @pytest.mark.django_db
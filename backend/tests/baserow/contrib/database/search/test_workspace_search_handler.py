@@ -279,6 +279,7 @@ def test_workspace_row_search_handler_with_interesting_database(data_fixture):
             "baserow.contrib.database.search.tasks.schedule_update_search_data.delay",
             "baserow.contrib.database.search.tasks.update_search_data.delay",
             "baserow.contrib.database.table.tasks.update_table_usage.delay",
+            "baserow.contrib.database.table.tasks.refresh_tables_usage.delay",
         ]
     ):
         database = setup_interesting_test_database(
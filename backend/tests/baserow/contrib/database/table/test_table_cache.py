@@ -3,7 +3,12 @@ from django.test.utils import override_settings
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    generated_model_lru_cache,
+    get_cached_model_field_attrs,
+)
+from baserow.contrib.database.table.models import Table
+from baserow.core.cache import local_cache
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +209,80 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+def test_table_model_is_reused_from_lru_cache(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+
+    model = table.get_model()
+    local_cache.clear()
+
+    # Only the version of the table must be checked.
+    table = Table.objects.get(id=table.id)
+    with django_assert_num_queries(1):
+        assert table.get_model() is model
+    assert model.baserow_table is table
+
+    text_field = data_fixture.create_text_field(table=table)
+    local_cache.clear()
+
+    new_model = table.get_model()
+    assert new_model is not model
+    assert text_field.id in new_model._field_objects
+
+
+@pytest.mark.django_db
+def test_table_model_in_lru_cache_is_regenerated_if_related_table_changes(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+
+    model = table_a.get_model()
+    local_cache.clear()
+
+    FieldHandler().create_field(user, table_b, "text", name="new")
+    local_cache.clear()
+
+    assert table_a.get_model() is not model
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_TABLE_MODEL_LRU_CACHE_SIZE=1)
+def test_table_model_lru_cache_evicts_least_recently_used_models(data_fixture):
+    table_a = data_fixture.create_database_table()
+    table_b = data_fixture.create_database_table()
+
+    model_a = table_a.get_model()
+    table_b.get_model()
+    local_cache.clear()
+
+    assert generated_model_lru_cache._get_entry((table_a.id, None)) is None
+    assert generated_model_lru_cache._get_entry((table_b.id, None)) is not None
+    assert table_a.get_model() is not model_a
+
+
+@pytest.mark.django_db
+def test_projected_table_model_only_contains_requested_fields_and_is_cached(
+    data_fixture, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+
+    model = table.get_projected_model([text_field.id])
+    assert list(model._field_objects.keys()) == [text_field.id]
+    assert table.get_projected_model([text_field.id]) is model
+    assert table.get_model() is not model
+    local_cache.clear()
+
+    table = Table.objects.get(id=table.id)
+    with django_assert_num_queries(1):
+        assert table.get_projected_model([text_field.id]) is model
+    assert generated_model_lru_cache._get_entry((table.id, (text_field.id,)))
+
+    number_field.delete()
+
+    assert generated_model_lru_cache._get_entry((table.id, (text_field.id,))) is None
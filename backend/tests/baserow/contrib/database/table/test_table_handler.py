@@ -525,6 +525,47 @@ def test_count_rows(data_fixture):
     assert table.usage.row_count == count_expected
 
 
+@pytest.mark.django_db
+def test_get_table_row_count_includes_pending_row_count_changes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+
+    assert TableUsageHandler.get_table_row_count(table.id) is None
+
+    RowHandler().force_create_rows(user, table, [{}, {}, {}])
+    TableUsageHandler.update_tables_usage()
+    assert TableUsageHandler.get_table_row_count(table.id) == 3
+
+    # The row count changes are recorded in the same transaction as the rows, so
+    # the count is exact before the table usage is updated again.
+    rows = RowHandler().force_create_rows(user, table, [{}, {}]).created_rows
+    assert TableUsageHandler.get_table_row_count(table.id) == 5
+
+    RowHandler().delete_rows(user, table, [rows[0].id])
+    assert TableUsageHandler.get_table_row_count(table.id) == 4
+
+    TableUsageHandler.update_tables_usage()
+    assert TableUsageHandler.get_table_row_count(table.id) == 4
+
+
+@pytest.mark.django_db
+def test_counting_the_rows_consumes_the_pending_row_count_changes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+
+    # The rows are created before the table usage exists, so the changes must be
+    # consumed when the usage is created to not count the rows twice.
+    RowHandler().force_create_rows(user, table, [{}, {}])
+    assert TableUsageUpdate.objects.filter(table=table).count() == 1
+
+    TableUsageHandler.update_tables_usage()
+
+    assert TableUsageUpdate.objects.filter(table=table).count() == 0
+    assert TableUsageHandler.get_table_row_count(table.id) == 2
+
+
 @pytest.mark.django_db
 def test_count_rows_ignores_templates(data_fixture, tmpdir):
     old_templates = settings.APPLICATION_TEMPLATES_DIR
@@ -958,20 +999,29 @@ def test_table_usage_handler_create_updates_for_all_tables_in_database(data_fixt
 
     TableUsageHandler.create_tables_usage_for_new_database(database.id)
 
-    assert TableUsage.objects.count() == 0
-    assert TableUsageUpdate.objects.count() == 2
     assert list(
-        TableUsageUpdate.objects.order_by("table_id").values_list("table_id", flat=True)
+        TableUsage.objects.order_by("table_id").values_list("table_id", flat=True)
     ) == [table.id, table_2.id]
+    assert TableUsageUpdate.objects.count() == 0
 
-    # create the correct entries in the TableUsage table
+
+@pytest.mark.django_db(transaction=True)
+def test_table_usage_is_refreshed_after_duplicating_a_table(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table, _, _ = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["a"], ["b"], ["c"]],
+        database=database,
+    )
     TableUsageHandler.update_tables_usage()
 
-    assert TableUsage.objects.count() == 2
-    assert list(
-        TableUsage.objects.order_by("table_id").values_list("table_id", flat=True)
-    ) == [table.id, table_2.id]
-    assert TableUsageUpdate.objects.count() == 0
+    duplicated_table = TableHandler().duplicate_table(user, table)
+
+    assert TableUsageHandler.get_table_row_count(duplicated_table.id) == 3
+    assert TableUsage.objects.get(table=duplicated_table).row_count == 3
+    assert not TableUsageUpdate.objects.filter(table=duplicated_table).exists()
 
 
 @pytest.mark.django_db
@@ -1101,12 +1151,11 @@ def test_usage_is_calculated_correctly_when_a_template_is_installed(
     ]
     assert (
         list(
-            TableUsageUpdate.objects.order_by("table_id").values_list(
-                "row_count", flat=True
-            )
+            TableUsage.objects.order_by("table_id").values_list("row_count", flat=True)
         )
         == row_counts
     )
+    assert TableUsageUpdate.objects.count() == 0
 
     subq = UsageHandler.get_workspace_row_count_annotation()
     workspace = Workspace.objects.filter(id=workspace.id).annotate(row_count=subq).get()
@@ -1,5 +1,6 @@
 import random
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from faker import Faker
@@ -7,6 +8,7 @@ from faker import Faker
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_types import SingleSelectFieldType
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
@@ -627,3 +629,214 @@ class TestViewDistributionAggregation:
         # the boolean field distribution:
         for value, count in result[f"field_{boolean_formula_field.id}"]:
             assert self.expected_distributions[boolean_field].get(value) == count
+
+
+@pytest.mark.django_db
+def test_incremental_aggregations_are_updated_on_rows_changes(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="0"
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"},
+            text_field.id: {
+                "aggregation_type": "empty_count",
+                "aggregation_raw_type": "empty_count",
+            },
+        },
+    )
+
+    row_handler = RowHandler()
+    rows = row_handler.create_rows(
+        user,
+        table,
+        [
+            {number_field.db_column: 1, text_field.db_column: "a"},
+            {number_field.db_column: 2},
+            {number_field.db_column: 0},
+        ],
+    ).created_rows
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3,
+        text_field.db_column: 1,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        (created_row,) = row_handler.create_rows(
+            user, table, [{number_field.db_column: 10}]
+        ).created_rows
+        row_handler.update_rows(
+            user,
+            table,
+            [
+                {"id": rows[0].id, text_field.db_column: ""},
+                {"id": rows[2].id, number_field.db_column: 5},
+            ],
+        )
+        row_handler.delete_rows(user, table, [rows[1].id])
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as mock_get_field_aggregations:
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: 16,
+            text_field.db_column: 3,
+        }
+        mock_get_field_aggregations.assert_not_called()
+
+    assert view_handler.get_field_aggregations(
+        user, grid_view, [(number_field, "sum"), (text_field, "empty_count")]
+    ) == {number_field.db_column: 16, text_field.db_column: 3}
+
+
+@pytest.mark.django_db
+def test_non_incremental_aggregations_are_recomputed_on_rows_changes(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "max", "aggregation_raw_type": "max"},
+        },
+    )
+
+    row_handler = RowHandler()
+    row_handler.create_rows(user, table, [{number_field.db_column: 1}])
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 1
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_rows(user, table, [{number_field.db_column: 3}])
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3
+    }
+
+
+@pytest.mark.django_db
+def test_incremental_aggregations_are_recomputed_after_max_updates(
+    data_fixture, django_capture_on_commit_callbacks, settings
+):
+    settings.BASEROW_VIEW_AGGREGATION_MAX_INCREMENTAL_UPDATES = 1
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"},
+        },
+    )
+
+    row_handler = RowHandler()
+    view_handler.get_view_field_aggregations(user, grid_view)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_rows(user, table, [{number_field.db_column: 1}])
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_rows(user, table, [{number_field.db_column: 2}])
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as mock_get_field_aggregations:
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: 3
+        }
+        mock_get_field_aggregations.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_incremental_aggregations_are_recomputed_with_time_sensitive_filters(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    date_field = data_fixture.create_date_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=date_field, type="date_is", value="UTC??today"
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"},
+        },
+    )
+    view_handler.get_view_field_aggregations(user, grid_view)
+
+    # The rows matching the filter change over time, so the aggregation can't be
+    # updated incrementally.
+    assert (
+        view_handler.get_cached_incremental_aggregations(table, table.get_model()) == {}
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().create_rows(user, table, [{number_field.db_column: 1}])
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as mock_get_field_aggregations:
+        view_handler.get_view_field_aggregations(user, grid_view)
+        mock_get_field_aggregations.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_incremental_aggregations_are_not_applied_to_recomputed_values(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"},
+        },
+    )
+    row_handler = RowHandler()
+    row_handler.create_rows(user, table, [{number_field.db_column: 1}])
+    view_handler.get_view_field_aggregations(user, grid_view)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        row_handler.create_rows(user, table, [{number_field.db_column: 2}])
+
+    # The aggregations are computed again, including the new row, before the
+    # incremental update is applied.
+    view_handler.clear_aggregation_cache(grid_view, [number_field.db_column])
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3
+    }
+
+    for callback in callbacks:
+        callback()
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3
+    }
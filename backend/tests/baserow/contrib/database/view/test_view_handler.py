@@ -2179,14 +2179,14 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         updated_field_ids=[filtered_field.id, unfiltered_field.id],
     )
     specific_another_view = another_public_grid_view.view_ptr.specific
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Still a single query that checks all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific,
             specific_another_view,
         ]
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Still a single query that checks all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
 
@@ -4454,3 +4454,73 @@ def test_can_duplicate_views_with_multiple_collaborator_has_filter(data_fixture)
     assert list(
         getattr(new_results[0], field.db_column).values_list("id", flat=True)
     ) == [user_1.id]
+
+
+@pytest.mark.django_db
+def test_public_views_row_checker_checks_all_views_in_one_query(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=multiple_select_field)
+    option_b = data_fixture.create_select_option(field=multiple_select_field)
+    view_a = data_fixture.create_grid_view(table=table, public=True)
+    data_fixture.create_view_filter(
+        view=view_a, field=text_field, type="equal", value="a"
+    )
+    view_b = data_fixture.create_grid_view(table=table, public=True)
+    data_fixture.create_view_filter(
+        view=view_b,
+        field=multiple_select_field,
+        type="multiple_select_has",
+        value=option_b.id,
+    )
+    view_without_rows = data_fixture.create_grid_view(table=table, public=True)
+    data_fixture.create_view_filter(
+        view=view_without_rows, field=text_field, type="equal", value="c"
+    )
+    view_without_filters = data_fixture.create_grid_view(table=table, public=True)
+
+    row_1, row_2, row_3 = (
+        RowHandler()
+        .force_create_rows(
+            user,
+            table,
+            [
+                {text_field.db_column: "a", multiple_select_field.db_column: []},
+                {
+                    text_field.db_column: "b",
+                    multiple_select_field.db_column: [option_a.id, option_b.id],
+                },
+                {
+                    text_field.db_column: "a",
+                    multiple_select_field.db_column: [option_b.id],
+                },
+            ],
+        )
+        .created_rows
+    )
+
+    model = table.get_model()
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table, model, only_include_views_which_want_realtime_events=True
+    )
+
+    with django_assert_num_queries(1):
+        visible_views_rows = row_checker.get_public_views_where_rows_are_visible(
+            [row_1, row_2, row_3]
+        )
+    assert visible_views_rows == [
+        PublicViewRows(view_a, {row_1.id, row_3.id}),
+        PublicViewRows(view_b, {row_2.id, row_3.id}),
+        PublicViewRows(view_without_filters, PublicViewRows.ALL_ROWS_ALLOWED),
+    ]
+
+    # None of the fields are going to be updated, so the results are cached.
+    with django_assert_num_queries(0):
+        assert row_checker.get_public_views_where_row_is_visible(row_2) == [
+            view_b,
+            view_without_filters,
+        ]
@@ -0,0 +1,70 @@
+import pytest
+
+from baserow.contrib.database.views.row_id_set import CompactRowIdSet
+
+
+def test_compact_row_id_set_from_ids_builds_runs():
+    row_id_set = CompactRowIdSet.from_ids([5, 1, 2, 3, 3, 10, 11, 7])
+
+    assert list(row_id_set) == [1, 2, 3, 5, 7, 10, 11]
+    assert len(row_id_set) == 7
+    assert repr(row_id_set) == "CompactRowIdSet([(1, 3), (5, 5), (7, 7), (10, 11)])"
+
+
+def test_compact_row_id_set_bytes_round_trip():
+    row_ids = list(range(1, 100_000)) + [200_000, 300_000, 300_001]
+    row_id_set = CompactRowIdSet.from_ids(row_ids)
+    data = row_id_set.to_bytes()
+
+    assert len(data) < 20
+    assert CompactRowIdSet.from_bytes(data) == row_id_set
+    assert list(CompactRowIdSet.from_bytes(data)) == row_ids
+
+
+def test_compact_row_id_set_empty():
+    assert list(CompactRowIdSet.from_bytes(b"")) == []
+    assert list(CompactRowIdSet.from_bytes(None)) == []
+    assert list(CompactRowIdSet.from_bytes(CompactRowIdSet().to_bytes())) == []
+
+
+def test_compact_row_id_set_unknown_version():
+    with pytest.raises(ValueError):
+        CompactRowIdSet.from_bytes(b"\x7f\x00\x00")
+
+
+def test_compact_row_id_set_add_merges_runs():
+    row_id_set = CompactRowIdSet.from_ids([1, 2, 4, 5, 8])
+
+    row_id_set.add(3)
+    assert row_id_set == CompactRowIdSet([(1, 5), (8, 8)])
+
+    row_id_set.add(7)
+    assert row_id_set == CompactRowIdSet([(1, 5), (7, 8)])
+
+    row_id_set.add(9)
+    assert row_id_set == CompactRowIdSet([(1, 5), (7, 9)])
+
+    row_id_set.add(20)
+    row_id_set.add(0)
+    assert row_id_set == CompactRowIdSet([(0, 5), (7, 9), (20, 20)])
+
+    row_id_set.add(4)
+    assert row_id_set == CompactRowIdSet([(0, 5), (7, 9), (20, 20)])
+
+
+def test_compact_row_id_set_discard_splits_runs():
+    row_id_set = CompactRowIdSet.from_ids(range(1, 11))
+
+    row_id_set.discard(5)
+    assert row_id_set == CompactRowIdSet([(1, 4), (6, 10)])
+
+    row_id_set.discard(1)
+    row_id_set.discard(10)
+    assert row_id_set == CompactRowIdSet([(2, 4), (6, 9)])
+
+    row_id_set.difference_update([2, 3, 4, 100])
+    assert row_id_set == CompactRowIdSet([(6, 9)])
+
+    assert 6 in row_id_set
+    assert 5 not in row_id_set
+    assert 10 not in row_id_set
@@ -9,6 +9,7 @@ from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.tasks import run_periodic_fields_updates
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.handler import ViewHandler, ViewSubscriptionHandler
+from baserow.contrib.database.views.models import ViewRows
 from baserow.contrib.database.views.signals import (
     view_loaded_create_indexes_and_columns,
 )
@@ -218,6 +219,54 @@ def test_rows_enter_and_exit_view_are_called_when_rows_created_or_deleted(
         p.assert_not_called()
 
 
+@pytest.mark.django_db
+def test_rows_enter_and_exit_view_only_checks_the_changed_rows(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=view, field=text_field, type="equal", value="visible"
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    rows = row_handler.force_create_rows(
+        user,
+        table,
+        [{text_field.db_column: "visible"} for _ in range(3)],
+        model=model,
+    ).created_rows
+
+    ViewSubscriptionHandler.subscribe_to_views(user, [view])
+    assert ViewRows.objects.get(view=view).row_ids == [row.id for row in rows]
+
+    with patch(
+        "baserow.contrib.database.views.models.ViewRows.get_diff",
+        autospec=True,
+        side_effect=ViewRows.get_diff,
+    ) as get_diff, patch(
+        "baserow.contrib.database.views.signals.rows_exited_view.send"
+    ) as p:
+        row_handler.force_update_rows(
+            user, table, [{"id": rows[1].id, text_field.db_column: "hidden"}], model
+        )
+        assert get_diff.call_args[1]["row_ids"] == [rows[1].id]
+        p.assert_called_once()
+        assert p.call_args[1]["row_ids"] == [rows[1].id]
+
+    assert ViewRows.objects.get(view=view).row_ids == [rows[0].id, rows[2].id]
+
+    with patch("baserow.contrib.database.views.signals.rows_entered_view.send") as p:
+        row_handler.force_update_rows(
+            user, table, [{"id": rows[1].id, text_field.db_column: "visible"}], model
+        )
+        p.assert_called_once()
+        assert p.call_args[1]["row_ids"] == [rows[1].id]
+
+    assert ViewRows.objects.get(view=view).row_ids == [row.id for row in rows]
+
+
 @pytest.mark.django_db
 def test_rows_enter_and_exit_view_are_called_when_view_filters_change(
     data_fixture,
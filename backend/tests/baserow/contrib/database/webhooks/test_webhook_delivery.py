@@ -0,0 +1,248 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ipaddress import ip_network
+from threading import Thread
+from unittest.mock import patch
+
+from django.test import override_settings
+
+import pytest
+from asgiref.sync import async_to_sync
+from django_redis import get_redis_connection
+
+from baserow.contrib.database.webhooks.delivery import (
+    WEBHOOK_DELIVERY_RETRIES_KEY,
+    WebhookDeliveryQueue,
+    WebhookDeliveryWorker,
+)
+from baserow.contrib.database.webhooks.models import TableWebhookCall
+from baserow.contrib.database.webhooks.validators import get_advocate_address_validator
+
+
+class StubWebhookReceiver(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append(
+            {"payload": json.loads(body), "client_port": self.client_address[1]}
+        )
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        content = b"{}"
+        self.send_response(status)
+        if 300 <= status < 400:
+            self.send_header("Location", self.path)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def webhook_receiver():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWebhookReceiver)
+    server.received = []
+    server.statuses = []
+    server.url = f"http://127.0.0.1:{server.server_port}/webhook"
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def delivery_queue():
+    redis_connection = get_redis_connection("default")
+    redis_connection.flushdb()
+    return WebhookDeliveryQueue(redis_connection)
+
+
+def enqueue_calls(queue, webhook, url, count):
+    for index in range(count):
+        queue.enqueue(
+            {
+                "webhook_id": webhook.id,
+                "event_id": f"00000000-0000-0000-0000-00000000000{index}",
+                "event_type": "rows.created",
+                "method": "POST",
+                "url": url,
+                "headers": {"Baserow-header-1": "Value 1"},
+                "payload": {"type": "rows.created", "index": index},
+            }
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True)
+def test_webhook_delivery_worker_delivers_calls_in_order(
+    data_fixture, webhook_receiver, delivery_queue
+):
+    webhook = data_fixture.create_table_webhook(failed_triggers=1)
+    enqueue_calls(delivery_queue, webhook, webhook_receiver.url, 3)
+
+    async_to_sync(WebhookDeliveryWorker(queue=delivery_queue).run_until_idle)()
+
+    received = webhook_receiver.received
+    assert [request["payload"]["index"] for request in received] == [0, 1, 2]
+    # The keep-alive connection is reused for all the calls.
+    assert len({request["client_port"] for request in received}) == 1
+
+    calls = TableWebhookCall.objects.filter(webhook=webhook)
+    assert calls.count() == 3
+    assert all(call.response_status == 200 for call in calls)
+    assert all(call.error == "" for call in calls)
+    assert all(f"POST {webhook_receiver.url}" in call.request for call in calls)
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 0
+    assert delivery_queue.get_pending_webhook_ids() == []
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL=0,
+    BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES=0,
+)
+def test_webhook_delivery_worker_cant_call_private_addresses(
+    data_fixture, webhook_receiver, delivery_queue
+):
+    webhook = data_fixture.create_table_webhook()
+    enqueue_calls(delivery_queue, webhook, webhook_receiver.url, 1)
+
+    async_to_sync(WebhookDeliveryWorker(queue=delivery_queue).run_until_idle)()
+
+    assert webhook_receiver.received == []
+    call = TableWebhookCall.objects.get(webhook=webhook)
+    assert call.error.startswith("UnacceptableAddressException")
+    assert call.response_status is None
+    webhook.refresh_from_db()
+    assert not webhook.active
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_WEBHOOKS_IP_WHITELIST=[ip_network("127.0.0.1/32")])
+def test_webhook_delivery_worker_can_call_whitelisted_addresses(
+    data_fixture, webhook_receiver, delivery_queue
+):
+    webhook = data_fixture.create_table_webhook()
+    enqueue_calls(delivery_queue, webhook, webhook_receiver.url, 1)
+    # Only the common HTTP ports are allowed by default, so the random port of the
+    # receiver must be allowed as well.
+    validator = get_advocate_address_validator()
+    validator.port_whitelist.add(webhook_receiver.server_port)
+
+    with patch(
+        "baserow.contrib.database.webhooks.delivery.get_advocate_address_validator",
+        return_value=validator,
+    ):
+        async_to_sync(WebhookDeliveryWorker(queue=delivery_queue).run_until_idle)()
+
+    assert len(webhook_receiver.received) == 1
+    call = TableWebhookCall.objects.get(webhook=webhook)
+    assert call.error == ""
+    assert call.response_status == 200
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True,
+    BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL=0,
+)
+def test_webhook_delivery_worker_records_too_many_redirects(
+    data_fixture, webhook_receiver, delivery_queue
+):
+    webhook = data_fixture.create_table_webhook()
+    # The receiver redirects to itself more times than the client follows.
+    webhook_receiver.statuses = [307] * 30
+    enqueue_calls(delivery_queue, webhook, webhook_receiver.url, 1)
+
+    async_to_sync(WebhookDeliveryWorker(queue=delivery_queue).run_until_idle)()
+
+    call = TableWebhookCall.objects.get(webhook=webhook)
+    assert "redirects" in call.error
+    assert call.response_status is None
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True,
+    BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL=1,
+)
+def test_webhook_delivery_worker_schedules_retry_without_blocking(
+    data_fixture, webhook_receiver, delivery_queue
+):
+    webhook = data_fixture.create_table_webhook()
+    webhook_receiver.statuses = [500]
+    enqueue_calls(delivery_queue, webhook, webhook_receiver.url, 2)
+    worker = WebhookDeliveryWorker(queue=delivery_queue, preserve_order=False)
+
+    async_to_sync(worker.run_until_idle)()
+
+    # The second call is delivered while the first one waits for its retry.
+    received = webhook_receiver.received
+    assert [request["payload"]["index"] for request in received] == [0, 1]
+    redis_connection = delivery_queue.redis_connection
+    assert redis_connection.zcard(WEBHOOK_DELIVERY_RETRIES_KEY) == 1
+
+    # Make the retry due.
+    for member in redis_connection.zrange(WEBHOOK_DELIVERY_RETRIES_KEY, 0, -1):
+        redis_connection.zadd(WEBHOOK_DELIVERY_RETRIES_KEY, {member: 0})
+    async_to_sync(worker.run_until_idle)()
+
+    assert [request["payload"]["index"] for request in received] == [0, 1, 0]
+    assert redis_connection.zcard(WEBHOOK_DELIVERY_RETRIES_KEY) == 0
+    assert TableWebhookCall.objects.filter(webhook=webhook).count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True,
+    BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL=1,
+)
+def test_webhook_delivery_worker_preserves_order_on_retry(
+    data_fixture, webhook_receiver, delivery_queue
+):
+    webhook = data_fixture.create_table_webhook()
+    webhook_receiver.statuses = [500]
+    enqueue_calls(delivery_queue, webhook, webhook_receiver.url, 2)
+    worker = WebhookDeliveryWorker(queue=delivery_queue, preserve_order=True)
+
+    async_to_sync(worker.run_until_idle)()
+
+    # The webhook is paused until the failed call is retried first.
+    assert [request["payload"]["index"] for request in webhook_receiver.received] == [0]
+    assert delivery_queue.acquire_slot(webhook.id, 1) is None
+    next_call = delivery_queue.pop_next(webhook.id)
+    assert next_call["payload"]["index"] == 0
+    assert next_call["retries"] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_webhook_delivery_worker_clears_queue_of_inactive_webhook(
+    data_fixture, webhook_receiver, delivery_queue
+):
+    webhook = data_fixture.create_table_webhook(active=False)
+    enqueue_calls(delivery_queue, webhook, webhook_receiver.url, 2)
+
+    async_to_sync(WebhookDeliveryWorker(queue=delivery_queue).run_until_idle)()
+
+    assert webhook_receiver.received == []
+    assert TableWebhookCall.objects.count() == 0
+    assert delivery_queue.get_pending_webhook_ids() == []
+
+
+def test_webhook_delivery_queue_slots(delivery_queue):
+    slot_1 = delivery_queue.acquire_slot(1, 2)
+    slot_2 = delivery_queue.acquire_slot(1, 2)
+
+    assert slot_1 is not None
+    assert slot_2 is not None
+    assert delivery_queue.acquire_slot(1, 2) is None
+    assert delivery_queue.acquire_slot(2, 2) is not None
+
+    delivery_queue.release_slot(slot_1)
+    assert delivery_queue.acquire_slot(1, 2) == slot_1
@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from decimal import Decimal
 from typing import Any, Dict, List
 from unittest.mock import call, patch
 
@@ -250,6 +251,29 @@ def test_row_orders_recalculated(mock_broadcast_to_channel_group, data_fixture):
     assert args[0][1]["table_id"] == table.id
 
 
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_row_orders_rebalanced(mock_broadcast_to_channel_group, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    row_1 = model.objects.create(order=Decimal("1.00000000000000000000"))
+    row_2 = model.objects.create(order=Decimal("1.00000000000000000001"))
+    row_3 = model.objects.create(order=Decimal("1.00000000000000000002"))
+
+    RowHandler().rebalance_row_orders_before(table, row_3, model)
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "row_orders_rebalanced"
+    assert args[0][1]["table_id"] == table.id
+    assert args[0][1]["row_orders"] == {
+        row_1.id: "0.30000000000000000000",
+        row_2.id: "0.60000000000000000000",
+    }
+
+
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.websockets
 @patch("baserow.ws.registries.broadcast_many_to_channel_group")
@@ -1,10 +1,18 @@
 from unittest.mock import Mock
 
 from django.db import transaction
+from django.test import override_settings
 
 import pytest
 from rest_framework.exceptions import ValidationError as DRFValidationError
 
+from baserow.contrib.automation.nodes.node_types import (
+    LocalBaserowRowsCreatedNodeTriggerType,
+    LocalBaserowRowsDeletedNodeTriggerType,
+    LocalBaserowRowsUpdatedNodeTriggerType,
+)
+from baserow.contrib.automation.workflows.constants import WorkflowState
+from baserow.contrib.automation.workflows.handler import AutomationWorkflowHandler
 from baserow.contrib.database.api.fields.serializers import FieldSerializer
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.registries import field_type_registry
@@ -2059,8 +2067,11 @@ def test_local_baserow_rows_created_trigger_service_type_handler(data_fixture):
     service_type.on_event = mocked_on_event
     table = data_fixture.create_database_table(user=user)
     field = data_fixture.create_text_field(user, table=table)
-    data_fixture.create_local_baserow_rows_created_service(
-        table=table,
+    data_fixture.create_automation_workflow(
+        user,
+        state=WorkflowState.LIVE,
+        trigger_type=LocalBaserowRowsCreatedNodeTriggerType.type,
+        trigger_service_kwargs={"table": table},
     )
     RowHandler().create_rows(
         user=user,
@@ -2086,8 +2097,11 @@ def test_local_baserow_rows_updated_trigger_service_type_handler(data_fixture):
     model = table.get_model()
     row1 = model.objects.create()
     row2 = model.objects.create()
-    data_fixture.create_local_baserow_rows_updated_service(
-        table=table,
+    data_fixture.create_automation_workflow(
+        user,
+        state=WorkflowState.LIVE,
+        trigger_type=LocalBaserowRowsUpdatedNodeTriggerType.type,
+        trigger_service_kwargs={"table": table},
     )
     with transaction.atomic():
         RowHandler().update_rows(
@@ -2113,8 +2127,11 @@ def test_local_baserow_rows_deleted_trigger_service_type_handler(data_fixture):
     model = table.get_model()
     row1 = model.objects.create()
     row2 = model.objects.create()
-    data_fixture.create_local_baserow_rows_updated_service(
-        table=table,
+    data_fixture.create_automation_workflow(
+        user,
+        state=WorkflowState.LIVE,
+        trigger_type=LocalBaserowRowsDeletedNodeTriggerType.type,
+        trigger_service_kwargs={"table": table},
     )
     RowHandler().delete_rows(
         user=user,
@@ -2123,3 +2140,178 @@ def test_local_baserow_rows_deleted_trigger_service_type_handler(data_fixture):
         row_ids=[row1.id, row2.id],
     )
     mocked_on_event.assert_called_once()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_baserow_rows_deleted_trigger_service_type_permanently_deleted_rows(
+    data_fixture,
+):
+    mocked_on_event = Mock()
+    user = data_fixture.create_user()
+    service_type = service_type_registry.get(LocalBaserowRowsDeletedServiceType.type)
+    service_type.on_event = mocked_on_event
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table)
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{field.id}": "a"})
+    data_fixture.create_automation_workflow(
+        user,
+        state=WorkflowState.LIVE,
+        trigger_type=LocalBaserowRowsDeletedNodeTriggerType.type,
+        trigger_service_kwargs={"table": table},
+    )
+
+    RowHandler().delete_rows(
+        user=user,
+        table=table,
+        model=model,
+        row_ids=[row.id],
+        permanently_delete=True,
+    )
+
+    # The rows don't exist anymore, so they're serialized when they're deleted.
+    mocked_on_event.assert_called_once()
+    _, get_data = mocked_on_event.call_args.args
+    assert [r[field.name] for r in get_data()["results"]] == ["a"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_baserow_rows_signal_service_type_skips_rows_that_no_longer_exist(
+    data_fixture,
+):
+    mocked_on_event = Mock()
+    user = data_fixture.create_user()
+    service_type = service_type_registry.get(LocalBaserowRowsCreatedServiceType.type)
+    service_type.on_event = mocked_on_event
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_automation_workflow(
+        user,
+        state=WorkflowState.LIVE,
+        trigger_type=LocalBaserowRowsCreatedNodeTriggerType.type,
+        trigger_service_kwargs={"table": table},
+    )
+
+    service_type.handle_rows_event(table.id, [9999])
+
+    mocked_on_event.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_baserow_rows_signal_service_type_discards_rolled_back_savepoints(
+    data_fixture,
+):
+    mocked_on_event = Mock()
+    user = data_fixture.create_user()
+    service_type = service_type_registry.get(LocalBaserowRowsDeletedServiceType.type)
+    service_type.on_event = mocked_on_event
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table)
+    model = table.get_model()
+    row1 = model.objects.create(**{f"field_{field.id}": "a"})
+    row2 = model.objects.create(**{f"field_{field.id}": "rolled back"})
+    data_fixture.create_automation_workflow(
+        user,
+        state=WorkflowState.LIVE,
+        trigger_type=LocalBaserowRowsDeletedNodeTriggerType.type,
+        trigger_service_kwargs={"table": table},
+    )
+
+    with transaction.atomic():
+        RowHandler().delete_rows(user=user, table=table, model=model, row_ids=[row1.id])
+        try:
+            with transaction.atomic():
+                RowHandler().delete_rows(
+                    user=user, table=table, model=model, row_ids=[row2.id]
+                )
+                raise ValueError()
+        except ValueError:
+            pass
+
+    mocked_on_event.assert_called_once()
+    _, get_data = mocked_on_event.call_args.args
+    assert [row[field.name] for row in get_data()["results"]] == ["a"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_baserow_rows_signal_service_type_skips_unwatched_tables(data_fixture):
+    mocked_on_event = Mock()
+    user = data_fixture.create_user()
+    service_type = service_type_registry.get(LocalBaserowRowsCreatedServiceType.type)
+    service_type.on_event = mocked_on_event
+    table = data_fixture.create_database_table(user=user)
+    # The workflow is neither published nor waiting for a test run.
+    data_fixture.create_automation_workflow(
+        user,
+        trigger_type=LocalBaserowRowsCreatedNodeTriggerType.type,
+        trigger_service_kwargs={"table": table},
+    )
+
+    RowHandler().create_rows(
+        user=user, table=table, rows_values=[{}], skip_search_update=True
+    )
+
+    assert not service_type.is_table_watched(table.id)
+    mocked_on_event.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_baserow_rows_signal_service_type_coalesces_events(data_fixture):
+    mocked_on_event = Mock()
+    user = data_fixture.create_user()
+    service_type = service_type_registry.get(LocalBaserowRowsCreatedServiceType.type)
+    service_type.on_event = mocked_on_event
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table)
+    data_fixture.create_automation_workflow(
+        user,
+        state=WorkflowState.LIVE,
+        trigger_type=LocalBaserowRowsCreatedNodeTriggerType.type,
+        trigger_service_kwargs={"table": table},
+    )
+
+    with transaction.atomic():
+        for value in ["a", "b", "c"]:
+            RowHandler().create_rows(
+                user=user,
+                table=table,
+                rows_values=[{f"field_{field.id}": value}],
+                skip_search_update=True,
+            )
+
+    mocked_on_event.assert_called_once()
+    services, get_data = mocked_on_event.call_args.args
+    assert list(services) == list(
+        LocalBaserowRowsCreatedServiceType.model_class.objects.filter(table=table)
+    )
+    assert [row[field.name] for row in get_data()["results"]] == ["a", "b", "c"]
+    assert mocked_on_event.call_args.kwargs["user"] == user
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(AUTOMATION_TRIGGER_INDEX_CACHE_TIMEOUT_SECONDS=60)
+def test_local_baserow_rows_signal_service_type_trigger_index_invalidation(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    service_type = service_type_registry.get(LocalBaserowRowsCreatedServiceType.type)
+    table = data_fixture.create_database_table(user=user)
+    workflow = data_fixture.create_automation_workflow(
+        user,
+        trigger_type=LocalBaserowRowsCreatedNodeTriggerType.type,
+        trigger_service_kwargs={"table": table},
+    )
+    service_type.invalidate_trigger_index()
+
+    assert not service_type.is_table_watched(table.id)
+
+    # Waiting for a test run makes the workflow listen to the events of the table.
+    AutomationWorkflowHandler().toggle_test_run(workflow)
+
+    assert service_type.is_table_watched(table.id)
+    assert service_type.get_trigger_index()[table.id] == [
+        workflow.get_trigger().service_id
+    ]
+
+    AutomationWorkflowHandler().toggle_test_run(workflow)
+
+    assert not service_type.is_table_watched(table.id)
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest.mock import MagicMock
 
 from django.contrib.contenttypes.models import ContentType
@@ -28,9 +29,11 @@ from baserow.core.db import (
     LockedAtomicTransaction,
     MultiFieldPrefetchQuerysetMixin,
     QuerySet,
+    rebalance_orders_before_item,
     specific_iterator,
     specific_queryset,
 )
+from baserow.core.exceptions import CannotCalculateIntermediateOrder
 from baserow.core.models import Settings, Workspace
 
 
@@ -655,3 +658,58 @@ def test_multiple_field_prefetch__many_to_many_missing_source(data_fixture):
     )
     row = rows[0]
     assert len(row.field.all()) == 1
+
+
+@pytest.mark.django_db
+def test_rebalance_orders_before_item(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    row_1 = model.objects.create(order=Decimal("1.00000000000000000000"))
+    row_2 = model.objects.create(order=Decimal("1.00000000000000000001"))
+    row_3 = model.objects.create(order=Decimal("1.00000000000000000002"))
+    row_4 = model.objects.create(order=Decimal("1.00000000000000000002"))
+    row_5 = model.objects.create(order=Decimal("1.00000000000000000003"))
+    row_6 = model.objects.create(order=Decimal("2.00000000000000000000"))
+
+    rebalanced = rebalance_orders_before_item(row_5, model.objects, window_size=2)
+
+    # The window of two rows doesn't fit between row_2 and row_5, so it's doubled.
+    assert [row.id for row in rebalanced] == [row_1.id, row_2.id, row_3.id, row_4.id]
+    assert [row.order for row in rebalanced] == [
+        Decimal("0.2"),
+        Decimal("0.4"),
+        Decimal("0.6"),
+        Decimal("0.8"),
+    ]
+    assert list(model.objects.values_list("id", "order")) == [
+        (row_1.id, Decimal("0.20000000000000000000")),
+        (row_2.id, Decimal("0.40000000000000000000")),
+        (row_3.id, Decimal("0.60000000000000000000")),
+        (row_4.id, Decimal("0.80000000000000000000")),
+        (row_5.id, Decimal("1.00000000000000000003")),
+        (row_6.id, Decimal("2.00000000000000000000")),
+    ]
+
+    rebalanced = rebalance_orders_before_item(row_6, model.objects, window_size=2)
+
+    # Only the window is rebalanced, between row_3 and row_6.
+    assert [row.id for row in rebalanced] == [row_4.id, row_5.id]
+    assert list(model.objects.values_list("id", "order")) == [
+        (row_1.id, Decimal("0.20000000000000000000")),
+        (row_2.id, Decimal("0.40000000000000000000")),
+        (row_3.id, Decimal("0.60000000000000000000")),
+        (row_4.id, Decimal("1.00000000000000000000")),
+        (row_5.id, Decimal("1.40000000000000000000")),
+        (row_6.id, Decimal("2.00000000000000000000")),
+    ]
+
+
+@pytest.mark.django_db
+def test_rebalance_orders_before_item_not_possible(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    model.objects.create(order=Decimal("0.00000000000000000001"))
+    row_2 = model.objects.create(order=Decimal("0.00000000000000000002"))
+
+    with pytest.raises(CannotCalculateIntermediateOrder):
+        rebalance_orders_before_item(row_2, model.objects)
@@ -0,0 +1,114 @@
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
+
+import pytest
+
+from baserow.config import db_routers
+from baserow.config.db_routers import (
+    DEFAULT_DB_ALIAS,
+    ReadReplicaRouter,
+    ReplicaMonitor,
+    ReplicaState,
+    clear_db_state,
+    set_db_state_user,
+)
+
+
+def mock_states(monitor, states):
+    def check_replica(alias):
+        return ReplicaState(checked_at=time.monotonic(), **states[alias])
+
+    return patch.object(monitor, "_check_replica", side_effect=check_replica)
+
+
+@override_settings(
+    DATABASE_READ_REPLICA_MAX_LAG_SECONDS=5,
+    DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS=60,
+)
+def test_replica_monitor_excludes_unhealthy_and_lagging_replicas():
+    monitor = ReplicaMonitor()
+    states = {
+        "read_1": {"healthy": True, "lag": 0, "replay_lsn": 100},
+        "read_2": {"healthy": True, "lag": 3, "replay_lsn": 90},
+        "read_3": {"healthy": True, "lag": 10, "replay_lsn": 50},
+        "read_4": {"healthy": False},
+    }
+
+    with mock_states(monitor, states):
+        assert monitor.get_eligible_replicas(list(states.keys())) == {
+            "read_1": 1,
+            "read_2": 0.25,
+        }
+        assert monitor.get_eligible_replicas(list(states.keys()), min_lsn=95) == {
+            "read_1": 1
+        }
+
+
+@override_settings(DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS=60)
+def test_replica_monitor_checks_replicas_once_per_interval():
+    monitor = ReplicaMonitor()
+    states = {"read_1": {"healthy": True}}
+
+    with mock_states(monitor, states) as mock_check_replica, patch(
+        "baserow.config.db_routers.time.monotonic", return_value=100
+    ):
+        monitor.get_state("read_1")
+        monitor.get_state("read_1")
+
+    assert mock_check_replica.call_count == 1
+
+
+@override_settings(
+    DATABASE_READ_REPLICA_MAX_LAG_SECONDS=5,
+    DATABASE_READ_REPLICA_LAG_CHECK_INTERVAL_SECONDS=60,
+    DATABASE_READ_YOUR_WRITES_TTL_SECONDS=60,
+)
+def test_read_replica_router_reads_own_writes_from_up_to_date_nodes():
+    monitor = ReplicaMonitor()
+    states = {
+        "read_1": {"healthy": True, "lag": 0, "replay_lsn": 100},
+        "read_2": {"healthy": True, "lag": 1, "replay_lsn": 50},
+    }
+    router = ReadReplicaRouter()
+
+    with mock_states(monitor, states), patch.object(
+        db_routers, "replica_monitor", monitor
+    ), patch.object(db_routers, "DATABASE_READ_REPLICAS", ["read_1", "read_2"]):
+        set_db_state_user(1)
+        assert router.db_for_read(None) in ["read_1", "read_2"]
+        assert router.db_for_write(None) == DEFAULT_DB_ALIAS
+        assert router.db_for_read(None) == DEFAULT_DB_ALIAS
+
+        with patch.object(db_routers, "connections") as mock_connections:
+            cursor = mock_connections[
+                DEFAULT_DB_ALIAS
+            ].cursor.return_value.__enter__.return_value
+            cursor.fetchone.return_value = [80]
+            clear_db_state()
+
+        assert cache.get(db_routers._get_user_min_lsn_cache_key(1)) == 80
+
+        # The next request of the same user only reads from replicas that have
+        # replayed their writes.
+        set_db_state_user(1)
+        assert router.db_for_read(None) == "read_1"
+        clear_db_state()
+
+        # Other users can still read from all replicas.
+        set_db_state_user(2)
+        assert router.db_for_read(None) in ["read_1", "read_2"]
+        clear_db_state()
+
+    cache.delete(db_routers._get_user_min_lsn_cache_key(1))
+
+
+@pytest.mark.django_db
+def test_read_replica_router_without_replicas():
+    router = ReadReplicaRouter()
+
+    set_db_state_user(1)
+    assert router.db_for_read(None) == DEFAULT_DB_ALIAS
+    clear_db_state()
@@ -0,0 +1,123 @@
+from datetime import datetime, timezone
+
+from django.db import connection
+
+import pytest
+
+from baserow.contrib.database.rows.models import RowHistory
+from baserow.core.partitioning.utils import (
+    add_months,
+    convert_to_monthly_partitioned_table,
+    create_monthly_partitions,
+    drop_partitions_older_than,
+    get_monthly_partitioned_tables,
+    get_partitions,
+    is_partitioned,
+)
+
+
+def create_row_history(table, action_timestamp):
+    return RowHistory.objects.create(
+        table=table,
+        row_id=1,
+        action_uuid="uuid",
+        action_command_type="DO",
+        action_type="type",
+        field_names=[],
+        fields_metadata={},
+        before_values={},
+        after_values={},
+        action_timestamp=action_timestamp,
+    )
+
+
+@pytest.fixture
+def partitioned_row_history(db, settings):
+    # The tables are converted by a migration, which doesn't run when the test
+    # database is created from the models.
+    convert_to_monthly_partitioned_table(
+        RowHistory._meta.db_table,
+        "action_timestamp",
+        settings.BASEROW_PARTITIONS_CREATE_MONTHS_AHEAD,
+    )
+
+
+def count_partition_rows(partition_name):
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {partition_name}")
+        return cursor.fetchone()[0]
+
+
+def test_add_months():
+    month_start = datetime(2021, 11, 1, tzinfo=timezone.utc)
+
+    assert add_months(month_start, 1) == datetime(2021, 12, 1, tzinfo=timezone.utc)
+    assert add_months(month_start, 2) == datetime(2022, 1, 1, tzinfo=timezone.utc)
+    assert add_months(month_start, 14) == datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.django_db
+def test_convert_to_monthly_partitioned_table(settings):
+    table_name = RowHistory._meta.db_table
+
+    convert_to_monthly_partitioned_table(
+        table_name, "action_timestamp", settings.BASEROW_PARTITIONS_CREATE_MONTHS_AHEAD
+    )
+
+    assert is_partitioned(table_name)
+    assert table_name in get_monthly_partitioned_tables()
+    assert f"{table_name}_default" in [p.name for p in get_partitions(table_name)]
+
+    # Converting it again must not fail.
+    convert_to_monthly_partitioned_table(
+        table_name, "action_timestamp", settings.BASEROW_PARTITIONS_CREATE_MONTHS_AHEAD
+    )
+
+
+@pytest.mark.django_db
+def test_create_monthly_partitions_moves_rows_out_of_default_partition(
+    data_fixture, partitioned_row_history
+):
+    table = data_fixture.create_database_table()
+    table_name = RowHistory._meta.db_table
+
+    create_row_history(table, datetime(2021, 1, 15, tzinfo=timezone.utc))
+    create_row_history(table, datetime(2021, 2, 15, tzinfo=timezone.utc))
+    assert count_partition_rows(f"{table_name}_default") == 2
+
+    create_monthly_partitions(
+        table_name, 1, now=datetime(2021, 1, 10, tzinfo=timezone.utc)
+    )
+
+    partition_names = [partition.name for partition in get_partitions(table_name)]
+    assert f"{table_name}_p202101" in partition_names
+    assert f"{table_name}_p202102" in partition_names
+    assert count_partition_rows(f"{table_name}_default") == 0
+    assert count_partition_rows(f"{table_name}_p202101") == 1
+    assert count_partition_rows(f"{table_name}_p202102") == 1
+    assert RowHistory.objects.count() == 2
+
+    # Creating them again must not fail.
+    create_monthly_partitions(
+        table_name, 1, now=datetime(2021, 1, 10, tzinfo=timezone.utc)
+    )
+
+
+@pytest.mark.django_db
+def test_drop_partitions_older_than(data_fixture, partitioned_row_history):
+    table = data_fixture.create_database_table()
+    table_name = RowHistory._meta.db_table
+
+    create_monthly_partitions(
+        table_name, 1, now=datetime(2021, 1, 10, tzinfo=timezone.utc)
+    )
+    create_row_history(table, datetime(2021, 1, 15, tzinfo=timezone.utc))
+    create_row_history(table, datetime(2021, 2, 15, tzinfo=timezone.utc))
+
+    dropped = drop_partitions_older_than(
+        table_name, datetime(2021, 2, 20, tzinfo=timezone.utc)
+    )
+
+    assert dropped == [f"{table_name}_p202101"]
+    assert RowHistory.objects.count() == 1
+    assert f"{table_name}_default" in [p.name for p in get_partitions(table_name)]
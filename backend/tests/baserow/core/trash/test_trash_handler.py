@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 from django.db import OperationalError, connection
 
 import pytest
 from freezegun import freeze_time
 
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.models import Table
@@ -16,6 +18,7 @@ from baserow.core.trash.exceptions import (
     PermanentDeletionMaxLocksExceededException,
 )
 from baserow.core.trash.handler import TrashHandler, _get_trash_entry
+from baserow.core.trash.registries import trash_item_type_registry
 
 
 @pytest.mark.django_db
@@ -517,3 +520,107 @@ def test_permanently_delete_item_raises_operationalerror(
             TrashHandler.try_perm_delete_trash_entry(
                 trash_entry, trash_item_lookup_cache
             )
+
+
+@pytest.mark.django_db
+def test_permanently_delete_marked_trash_deletes_rows_in_batches(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(user=user, workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    model = table.get_model()
+    rows = [model.objects.create() for _ in range(5)]
+    for row in rows:
+        TrashHandler.trash(user, workspace, database, row)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    progress = TrashHandler.permanently_delete_marked_trash(batch_size=2)
+
+    assert progress.entries_deleted == 5
+    assert progress.rows_deleted == 5
+    assert progress.batches == 3
+    assert progress.entries_deleted_per_type == {"row": 5}
+    assert TrashEntry.objects.count() == 0
+    assert model.objects_and_trash.count() == 0
+    assert TrashHandler.get_permanent_deletion_progress() == progress
+
+
+@pytest.mark.django_db
+def test_permanently_delete_marked_trash_splits_batches_by_lock_budget(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(user=user, workspace=workspace)
+    tables = [data_fixture.create_database_table(database=database) for _ in range(2)]
+    for table in tables:
+        model = table.get_model()
+        for _ in range(2):
+            TrashHandler.trash(user, workspace, database, model.objects.create())
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    progress = TrashHandler.permanently_delete_marked_trash(
+        batch_size=10, max_locks_per_batch=1
+    )
+
+    # The rows of the same table only lock it once, so every table gets a batch.
+    assert progress.entries_deleted == 4
+    assert progress.batches == 2
+    assert TrashEntry.objects.count() == 0
+    for table in tables:
+        assert table.get_model().objects_and_trash.count() == 0
+
+
+@pytest.mark.django_db
+def test_permanent_deletion_lock_counts_include_the_tables_of_applications(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(user=user, workspace=workspace)
+    table_1 = data_fixture.create_database_table(database=database)
+    table_2 = data_fixture.create_database_table(database=database)
+    # Creates a link row field in both tables, each with its own through table.
+    FieldHandler().create_field(
+        user, table_1, "link_row", name="Link", link_row_table=table_2
+    )
+    data_fixture.create_database_application(user=user, workspace=workspace)
+
+    database_entry = TrashHandler.trash(user, workspace, database, database)
+    workspace_entry = TrashHandler.trash(user, workspace, None, workspace)
+
+    application_lock_counts = trash_item_type_registry.get(
+        "application"
+    ).get_permanent_deletion_lock_counts([database_entry])
+    workspace_lock_counts = trash_item_type_registry.get(
+        "workspace"
+    ).get_permanent_deletion_lock_counts([workspace_entry])
+
+    # The database itself, its two tables and the two link row fields.
+    assert application_lock_counts == {database_entry.id: 5}
+    # The workspace, the database above and the empty database.
+    assert workspace_lock_counts == {workspace_entry.id: 1 + 5 + 1}
+
+
+@pytest.mark.django_db
+def test_permanently_delete_marked_trash_is_throttled(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(user=user, workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    model = table.get_model()
+    for _ in range(2):
+        TrashHandler.trash(user, workspace, database, model.objects.create())
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    with patch("baserow.core.trash.handler.time.sleep") as mock_sleep:
+        progress = TrashHandler.permanently_delete_marked_trash(
+            batch_size=1, max_rows_per_second=1
+        )
+
+    assert progress.rows_deleted == 2
+    assert mock_sleep.call_count == 2
+    assert progress.throttled_seconds == pytest.approx(
+        sum(call.args[0] for call in mock_sleep.call_args_list)
+    )
+    assert TrashEntry.objects.count() == 0
@@ -0,0 +1,177 @@
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from django.urls import reverse
+
+import pytest
+from rest_framework.status import HTTP_200_OK
+
+from baserow.contrib.database.export.handler import ExportHandler
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+from baserow.contrib.database.rows.handler import RowHandler
+
+# You must add --run-benchmark -s to pytest to run these benchmarks, or use
+# `make benchmark`. Use `make benchmark-update-baseline` to store the results as the
+# new baseline in `benchmark_baseline.json` after an intended change.
+pytestmark = [pytest.mark.django_db, pytest.mark.benchmark]
+
+ROW_COUNT = 10000
+# The maximum number of rows that can be changed in a single batch API request.
+BATCH_SIZE = 200
+
+
+@pytest.fixture
+def benchmark_table(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, _ = data_fixture.build_table(
+        user=user,
+        columns=[
+            ("Name", "text"),
+            ("Notes", "long_text"),
+            ("Count", "number"),
+            ("Done", "boolean"),
+            ("Due", "date"),
+        ],
+        rows=[],
+    )
+    fill_table_rows(ROW_COUNT, table)
+    model = table.get_model()
+    row_ids = list(model.objects.order_by("id").values_list("id", flat=True))
+    data_fixture.warm_cache_before_counting_queries()
+    return user, table, fields, row_ids
+
+
+def test_benchmark_create_rows_batch(benchmark, benchmark_table):
+    user, table, fields, _ = benchmark_table
+    rows_values = [
+        {fields[0].db_column: f"Row {index}", fields[2].db_column: index}
+        for index in range(BATCH_SIZE)
+    ]
+
+    with benchmark("create_rows_batch"):
+        RowHandler().create_rows(user, table, rows_values)
+
+
+def test_benchmark_update_rows_batch(benchmark, benchmark_table):
+    user, table, fields, row_ids = benchmark_table
+    rows_values = [
+        {"id": row_id, fields[0].db_column: f"Row {row_id}", fields[3].db_column: True}
+        for row_id in row_ids[:BATCH_SIZE]
+    ]
+
+    with benchmark("update_rows_batch"):
+        RowHandler().update_rows(user, table, rows_values)
+
+
+def test_benchmark_delete_rows_batch(benchmark, benchmark_table):
+    user, table, _, row_ids = benchmark_table
+
+    with benchmark("delete_rows_batch"):
+        RowHandler().delete_rows(user, table, row_ids[:BATCH_SIZE])
+
+
+def test_benchmark_list_grid_view_rows(
+    benchmark, benchmark_table, data_fixture, api_client
+):
+    user, table, fields, _ = benchmark_table
+    token = data_fixture.generate_token(user)
+    grid_view = data_fixture.create_grid_view(user=user, table=table)
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid_view.id})
+
+    with benchmark("list_grid_view_rows"):
+        response = api_client.get(
+            url,
+            {
+                f"filter__field_{fields[1].id}__contains": "a",
+                "order_by": f"-field_{fields[2].id},field_{fields[0].id}",
+                "search": "e",
+                "limit": 200,
+            },
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+
+    assert response.status_code == HTTP_200_OK
+
+
+def test_benchmark_update_rows_with_dependant_fields(
+    benchmark, benchmark_table, data_fixture
+):
+    user, table, fields, row_ids = benchmark_table
+    linking_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    field_handler = FieldHandler()
+    link_field = field_handler.create_field(
+        user, linking_table, "link_row", name="Link", link_row_table=table
+    )
+    field_handler.create_field(
+        user,
+        linking_table,
+        "lookup",
+        name="Counts",
+        through_field_id=link_field.id,
+        target_field_id=fields[2].id,
+    )
+    field_handler.create_field(
+        user,
+        linking_table,
+        "formula",
+        name="Total",
+        formula="sum(lookup('Link', 'Count'))",
+    )
+    RowHandler().create_rows(
+        user,
+        linking_table,
+        [
+            {link_field.db_column: row_ids[index : index + 10]}
+            for index in range(0, ROW_COUNT, 10)
+        ],
+    )
+    rows_values = [
+        {"id": row_id, fields[2].db_column: row_id} for row_id in row_ids[:BATCH_SIZE]
+    ]
+
+    with benchmark("update_rows_with_dependant_fields"):
+        RowHandler().update_rows(user, table, rows_values)
+
+
+def test_benchmark_generate_table_model(benchmark, benchmark_table):
+    _, table, _, _ = benchmark_table
+
+    with benchmark("generate_table_model"):
+        for _ in range(10):
+            table.get_model(use_cache=False)
+
+
+@patch("baserow.core.storage.get_default_storage")
+def test_benchmark_export_table_to_csv(get_storage_mock, benchmark, benchmark_table):
+    user, table, _, _ = benchmark_table
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, None, {"exporter_type": "csv", "export_charset": "utf-8"}
+    )
+
+    with benchmark("export_table_to_csv"):
+        handler.run_export_job(job)
+
+    assert stub_file.getvalue()
+
+
+def test_benchmark_import_rows(benchmark, benchmark_table):
+    user, table, _, _ = benchmark_table
+    data = [
+        [f"Row {index}", "Some notes", index, index % 2 == 0, "2024-01-01"]
+        for index in range(ROW_COUNT)
+    ]
+
+    with benchmark("import_rows"):
+        _, report = RowHandler().import_rows_in_chunks(user, table, data)
+
+    assert report == {}
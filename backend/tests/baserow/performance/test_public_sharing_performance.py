@@ -1,3 +1,6 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import pytest
 from pyinstrument import Profiler
 
@@ -177,3 +180,58 @@ def test_updating_many_rows_in_public_filtered_views(
          [11 frames hidden]  django
 
     """
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_updating_rows_in_table_with_many_public_filtered_views(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+
+    num_public_views = 30
+    num_fields = 10
+    num_rows = 100
+    num_row_updates_to_profile = 100
+
+    fields = [
+        data_fixture.create_text_field(table=table, name=f"field{i}")
+        for i in range(num_fields)
+    ]
+    for i in range(num_public_views):
+        view = data_fixture.create_grid_view(user=user, table=table, public=True)
+        data_fixture.create_view_filter(
+            view=view, field=fields[i % num_fields], type="contains", value=i
+        )
+
+    model = table.get_model()
+    rows = (
+        RowHandler()
+        .force_create_rows(
+            user,
+            table,
+            [{field.db_column: str(i) for field in fields} for i in range(num_rows)],
+            model=model,
+        )
+        .created_rows
+    )
+
+    profiler = Profiler()
+    profiler.start()
+    with CaptureQueriesContext(connection) as captured:
+        for i in range(num_row_updates_to_profile):
+            RowHandler().update_row_by_id(
+                user,
+                table,
+                rows[i % num_rows].id,
+                {fields[i % num_fields].db_column: str(i + 1)},
+                model=model,
+            )
+    profiler.stop()
+    print(profiler.output_text(unicode=True, color=True))
+    print(
+        f"{len(captured.captured_queries) / num_row_updates_to_profile} queries per "
+        f"row update with {num_public_views} public filtered views."
+    )
@@ -1,12 +1,14 @@
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from channels.layers import get_channel_layer
 from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
 from baserow.ws.auth import ANONYMOUS_USER_TOKEN
 from baserow.ws.consumers import CoreConsumer, PageContext, PageScope, SubscribedPages
 from baserow.ws.registries import PageType, page_registry
+from baserow.ws.utils import ALL_USERS_CHANNEL_GROUP_NAME, get_user_channel_group_name
 
 
 class AcceptingTestPageType(PageType):
@@ -99,6 +101,33 @@ async def test_core_consumer_connect_authenticated(data_fixture):
     await communicator.disconnect()
 
 
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.websockets
+async def test_core_consumer_connect_joins_and_leaves_user_channel_group(
+    data_fixture,
+):
+    user_1, token_1 = data_fixture.create_user_and_token()
+    channel_layer = get_channel_layer()
+    user_group_name = get_user_channel_group_name(user_1.id)
+
+    communicator = WebsocketCommunicator(
+        application,
+        f"ws/core/?jwt_token={token_1}",
+        headers=[(b"origin", b"http://localhost")],
+    )
+    await communicator.connect()
+    await communicator.receive_json_from()
+
+    assert len(channel_layer.groups.get(user_group_name, {})) == 1
+    assert len(channel_layer.groups.get(ALL_USERS_CHANNEL_GROUP_NAME, {})) == 1
+
+    await communicator.disconnect()
+
+    assert len(channel_layer.groups.get(user_group_name, {})) == 0
+    assert len(channel_layer.groups.get(ALL_USERS_CHANNEL_GROUP_NAME, {})) == 0
+
+
 @pytest.mark.asyncio
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.websockets
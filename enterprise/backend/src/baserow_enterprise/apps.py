@@ -16,6 +16,15 @@ class BaserowEnterpriseConfig(AppConfig):
 
         job_type_registry.register(AuditLogExportJobType())
 
+        from baserow.core.write_behind.registries import (
+            write_behind_buffer_type_registry,
+        )
+        from baserow_enterprise.audit_log.handler import (
+            AuditLogWriteBehindBufferType,
+        )
+
+        write_behind_buffer_type_registry.register(AuditLogWriteBehindBufferType())
+
         from baserow.api.user.registries import member_data_registry
         from baserow.core.action.registries import (
             action_scope_registry,
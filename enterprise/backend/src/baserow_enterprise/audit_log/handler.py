@@ -7,6 +7,12 @@ from baserow.api.sessions import get_user_remote_addr_ip
 from baserow.core.action.registries import ActionType
 from baserow.core.action.signals import ActionCommandType
 from baserow.core.models import Workspace
+from baserow.core.partitioning.utils import drop_partitions_older_than
+from baserow.core.write_behind.handler import WriteBehindHandler
+from baserow.core.write_behind.registries import (
+    WriteBehindBufferType,
+    write_behind_buffer_type_registry,
+)
 
 from .models import AuditLogEntry
 
@@ -41,6 +47,8 @@ class AuditLogHandler:
             is sent so it can be used to identify other resources created at the
             same time (i.e. row_history entries).
         :param workspace: The workspace that the action was performed on.
+        :return: The audit log entry. It's not saved yet if the audit log
+            write-behind buffer is enabled.
         """
 
         workspace_id, workspace_name = None, None
@@ -50,7 +58,7 @@ class AuditLogHandler:
 
         ip_address = get_user_remote_addr_ip(user)
 
-        return AuditLogEntry.objects.create(
+        entry = AuditLogEntry(
             user_id=getattr(user, "id", None),
             user_email=getattr(user, "email", None),
             workspace_id=workspace_id,
@@ -66,12 +74,31 @@ class AuditLogHandler:
             ip_address=ip_address,
         )
 
+        buffer_type = write_behind_buffer_type_registry.get(
+            AuditLogWriteBehindBufferType.type
+        )
+        write_behind_handler = WriteBehindHandler()
+        if write_behind_handler.is_enabled(buffer_type):
+            write_behind_handler.add(buffer_type, [entry])
+        else:
+            entry.save()
+
+        return entry
+
     @classmethod
     def delete_entries_older_than(cls, cutoff: datetime):
         """
         Deletes all audit log entries that are older than the given number of days.
+        The monthly partitions that are entirely older than the cutoff are dropped
+        instead of deleting their entries.
 
         :param cutoff: The date and time before which all entries will be deleted.
         """
 
+        drop_partitions_older_than(AuditLogEntry._meta.db_table, cutoff)
         AuditLogEntry.objects.filter(action_timestamp__lt=cutoff).delete()
+
+
+class AuditLogWriteBehindBufferType(WriteBehindBufferType):
+    type = "audit_log"
+    model_class = AuditLogEntry
@@ -35,6 +35,13 @@ def setup(settings):
         os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_RETENTION_DAYS", "") or 365
     )
 
+    # The compiled role permissions of an actor in a workspace are cached for this
+    # number of seconds, unless the permissions of the workspace change before.
+    # Set to 0 to disable the cache.
+    settings.BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS = int(
+        os.getenv("BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS", "") or 3600
+    )
+
     # Set this to True to enable users to login with auth providers different than
     # the one they were originally created with.
     settings.BASEROW_ALLOW_MULTIPLE_SSO_PROVIDERS_FOR_SAME_ACCOUNT = bool(
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
 from baserow_premium.license.handler import LicenseHandler
@@ -237,7 +237,6 @@ class GitHubIssuesDataSyncType(DataSyncType):
             "X-GitHub-Api-Version": "2022-11-28",
         }
         page, per_page = 1, 50
-        issues = []
         progress = None
         try:
             while True:
@@ -273,19 +272,16 @@ class GitHubIssuesDataSyncType(DataSyncType):
                 if not data:
                     break
 
-                issues.extend(data)
+                yield from data
                 page += 1
         except RequestException as e:
             raise SyncError(f"Error fetching GitHub Issues: {str(e)}")
 
-        return issues
-
     def get_all_rows(
         self,
         instance,
         progress_builder: Optional[ChildProgressBuilder] = None,
-    ) -> List[Dict]:
-        issues = []
+    ) -> Iterator[Dict]:
         for issue in self._fetch_issues(instance, progress_builder):
             issue_id = get_value_at_path(issue, "number")
             created_at = self._parse_datetime(get_value_at_path(issue, "created_at"))
@@ -303,7 +299,7 @@ class GitHubIssuesDataSyncType(DataSyncType):
                 f"{issue_id}"
             )
 
-            issues.append(
+            yield (
                 {
                     "id": issue_id,
                     "title": get_value_at_path(issue, "title", ""),
@@ -321,5 +317,3 @@ class GitHubIssuesDataSyncType(DataSyncType):
                     "url": url,
                 }
             )
-
-        return issues
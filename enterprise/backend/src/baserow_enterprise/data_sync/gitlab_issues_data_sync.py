@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
 from baserow_premium.license.handler import LicenseHandler
@@ -275,7 +275,6 @@ class GitLabIssuesDataSyncType(DataSyncType):
         )
         headers = {"PRIVATE-TOKEN": f"{instance.gitlab_access_token}"}
         page, per_page = 1, 50
-        issues = []
         progress = None
         try:
             while True:
@@ -311,19 +310,16 @@ class GitLabIssuesDataSyncType(DataSyncType):
                 if not data:
                     break
 
-                issues.extend(data)
+                yield from data
                 page += 1
         except RequestException as e:
             raise SyncError(f"Error fetching GitLab Issues: {str(e)}")
 
-        return issues
-
     def get_all_rows(
         self,
         instance,
         progress_builder: Optional[ChildProgressBuilder] = None,
-    ) -> List[Dict]:
-        issues = []
+    ) -> Iterator[Dict]:
         for issue in self._fetch_issues(instance, progress_builder):
             issue_id = get_value_at_path(issue, "id")
             created_at = self._parse_datetime(get_value_at_path(issue, "created_at"))
@@ -337,7 +333,7 @@ class GitLabIssuesDataSyncType(DataSyncType):
                 [label for label in get_value_at_path(issue, "labels", [])]
             )
 
-            issues.append(
+            yield (
                 {
                     "id": issue_id,
                     "iid": get_value_at_path(issue, "iid", ""),
@@ -359,5 +355,3 @@ class GitLabIssuesDataSyncType(DataSyncType):
                     "url": get_value_at_path(issue, "web_url", ""),
                 }
             )
-
-        return issues
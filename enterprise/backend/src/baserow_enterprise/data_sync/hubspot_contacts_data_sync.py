@@ -258,7 +258,6 @@ class HubspotContactsDataSyncType(DataSyncType):
         )
         progress.increment(by=1)
 
-        all_contacts = []
         query_params = {
             "limit": page_limit,
             "archived": "false",
@@ -277,7 +276,8 @@ class HubspotContactsDataSyncType(DataSyncType):
                 raise SyncError(f"Error fetching HubSpot contacts: {str(e)}")
 
             data = response.json()
-            all_contacts.extend(data.get("results", []))
+            for contact in data.get("results", []):
+                yield self._contact_to_row(contact, properties, synced_properties)
 
             progress.increment(by=1)
 
@@ -289,25 +289,20 @@ class HubspotContactsDataSyncType(DataSyncType):
             else:
                 break
 
-        rows = []
-        for contact in all_contacts:
-            row = {"id": Decimal(contact["id"])}
-            for enabled_property in synced_properties:
-                if enabled_property.key == "id":
-                    continue
-
-                property_instance = next(
-                    p
-                    for p in properties
-                    if p.key != "id" and p.key == enabled_property.key
-                )
-                # The property type instance sometimes has to modify the value,
-                # like with the `enumeration` type, it must be mapped to a select
-                # option.
-                row[enabled_property.key] = property_instance.prepare_value(
-                    contact["properties"][enabled_property.key],
-                    enabled_property.metadata,
-                )
-            rows.append(row)
+    def _contact_to_row(self, contact, properties, synced_properties):
+        row = {"id": Decimal(contact["id"])}
+        for enabled_property in synced_properties:
+            if enabled_property.key == "id":
+                continue
 
-        return rows
+            property_instance = next(
+                p for p in properties if p.key != "id" and p.key == enabled_property.key
+            )
+            # The property type instance sometimes has to modify the value,
+            # like with the `enumeration` type, it must be mapped to a select
+            # option.
+            row[enabled_property.key] = property_instance.prepare_value(
+                contact["properties"][enabled_property.key],
+                enabled_property.metadata,
+            )
+        return row
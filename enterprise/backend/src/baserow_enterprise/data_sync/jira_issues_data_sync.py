@@ -1,6 +1,6 @@
 import math
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import advocate
 from advocate import UnacceptableAddressException
@@ -234,7 +234,6 @@ class JiraIssuesDataSyncType(DataSyncType):
                 instance.jira_username, instance.jira_api_token
             )
 
-        issues = []
         start_at = 0
         max_results = 50
         progress = None
@@ -279,21 +278,18 @@ class JiraIssuesDataSyncType(DataSyncType):
                         "details are wrong."
                     )
 
-                issues.extend(data["issues"])
+                yield from data["issues"]
                 start_at += max_results
                 if data["total"] <= start_at:
                     break
         except (RequestException, UnacceptableAddressException, ConnectionError) as e:
             raise SyncError(f"Error connecting to Jira: {str(e)}")
 
-        return issues
-
     def get_all_rows(
         self,
         instance,
         progress_builder: Optional[ChildProgressBuilder] = None,
-    ) -> List[Dict]:
-        issue_list = []
+    ) -> Iterator[Dict]:
         progress = ChildProgressBuilder.build(progress_builder, child_total=10)
         fetched_issues = self._fetch_issues(
             instance,
@@ -334,7 +330,5 @@ class JiraIssuesDataSyncType(DataSyncType):
                 "project": project,
                 "url": issue_url,
             }
-            issue_list.append(issue_dict)
+            yield issue_dict
         progress.increment(by=1)
-
-        return issue_list
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.db import migrations
+
+from baserow.core.partitioning.utils import convert_to_monthly_partitioned_table
+
+
+def forward(apps, schema_editor):
+    AuditLogEntry = apps.get_model("baserow_enterprise", "AuditLogEntry")
+
+    convert_to_monthly_partitioned_table(
+        AuditLogEntry._meta.db_table,
+        "action_timestamp",
+        settings.BASEROW_PARTITIONS_CREATE_MONTHS_AHEAD,
+        connection=schema_editor.connection,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("baserow_enterprise", "0055_assistantchatmessage_action_group_id_and_more"),
+    ]
+
+    operations = [
+        # The partitioned table is compatible with the model, so it's not converted
+        # back when reversing.
+        migrations.RunPython(forward, migrations.RunPython.noop),
+    ]
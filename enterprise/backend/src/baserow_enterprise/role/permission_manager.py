@@ -21,6 +21,7 @@ from baserow.core.subjects import UserSubjectType
 from baserow.core.types import PermissionCheck
 from baserow_enterprise.features import RBAC
 from baserow_enterprise.role.handler import RoleAssignmentHandler
+from baserow_enterprise.role.permission_snapshot import PermissionSnapshotHandler
 
 from .models import Role
 
@@ -80,15 +81,32 @@ class RolePermissionManagerType(PermissionManagerType):
         if workspace is None or not self.is_enabled(workspace):
             return {}
 
-        # Workspace actor by subject_type
-        actors_by_subject_type = defaultdict(set)
         checks_by_actor_and_context = defaultdict(lambda: defaultdict(list))
         for check in checks:
             actor, _, context = check
-            s_type = subject_type_registry.get_by_model(actor)
-            actors_by_subject_type[s_type].add(actor)
             checks_by_actor_and_context[actor][context].append(check)
 
+        # The roles computed for a context are reused from the snapshot of the actor
+        # if it has already been checked since the last permissions change.
+        snapshot_handler = PermissionSnapshotHandler()
+        snapshots = {}
+        if snapshot_handler.is_enabled(workspace):
+            snapshots = snapshot_handler.get_snapshots(
+                workspace, checks_by_actor_and_context.keys(), include_trash
+            )
+
+        # Workspace actor by subject_type, only for the actors that have at least one
+        # context missing from their snapshot.
+        actors_by_subject_type = defaultdict(set)
+        for actor, context_and_checks in checks_by_actor_and_context.items():
+            snapshot = snapshots.get(actor)
+            if snapshot is None or any(
+                snapshot.get_role_uids(context) is None
+                for context in context_and_checks
+            ):
+                s_type = subject_type_registry.get_by_model(actor)
+                actors_by_subject_type[s_type].add(actor)
+
         result = {}
         roles_per_scope_by_actor = {}
         for actor_subject_type, actors in actors_by_subject_type.items():
@@ -99,18 +117,32 @@ class RolePermissionManagerType(PermissionManagerType):
             )
 
         scope_includes_cache = {}
+        permitted_operations_per_role_uids = {}
         for actor, context_and_checks in checks_by_actor_and_context.items():
+            snapshot = snapshots.get(actor)
             for context, checks in context_and_checks.items():
-                computed_roles = RoleAssignmentHandler().get_computed_roles(
-                    roles_per_scope_by_actor[actor], context, scope_includes_cache
-                )
-                permitted_operations = set(
-                    [
-                        operation_name
-                        for r in computed_roles
-                        for operation_name in self.get_role_operations(r)
-                    ]
+                role_uids = (
+                    snapshot.get_role_uids(context) if snapshot is not None else None
                 )
+                if role_uids is None:
+                    computed_roles = RoleAssignmentHandler().get_computed_roles(
+                        roles_per_scope_by_actor[actor], context, scope_includes_cache
+                    )
+                    role_uids = tuple(r.uid for r in computed_roles)
+                    if snapshot is not None:
+                        snapshot.set_role_uids(context, role_uids)
+
+                if role_uids not in permitted_operations_per_role_uids:
+                    permitted_operations_per_role_uids[role_uids] = set(
+                        [
+                            operation_name
+                            for uid in role_uids
+                            for operation_name in self.get_role_operations(
+                                RoleAssignmentHandler().get_role_by_uid(uid)
+                            )
+                        ]
+                    )
+                permitted_operations = permitted_operations_per_role_uids[role_uids]
                 check_results = {
                     check: (
                         True
@@ -121,6 +153,8 @@ class RolePermissionManagerType(PermissionManagerType):
                 }
                 result.update(check_results)
 
+        snapshot_handler.save_snapshots(snapshots.values())
+
         return result
 
     def get_operation_policy(
@@ -243,6 +277,41 @@ class RolePermissionManagerType(PermissionManagerType):
         if workspace is None or not self.is_enabled(workspace):
             return None
 
+        snapshot_handler = PermissionSnapshotHandler()
+        if not snapshot_handler.is_enabled(workspace):
+            return self.compute_permissions_object(
+                actor, workspace, for_operation_types, use_object_scope
+            )
+
+        operation_names = (
+            tuple(sorted(o.type for o in for_operation_types))
+            if for_operation_types
+            else None
+        )
+        key = (use_object_scope, operation_names)
+        snapshot = snapshot_handler.get_snapshots(workspace, [actor])[actor]
+        permissions_object = snapshot.get_permissions_object(key)
+        if permissions_object is None:
+            permissions_object = self.compute_permissions_object(
+                actor, workspace, for_operation_types, use_object_scope
+            )
+            snapshot.set_permissions_object(key, permissions_object)
+            snapshot_handler.save_snapshots([snapshot])
+
+        return permissions_object
+
+    def compute_permissions_object(
+        self,
+        actor: AbstractUser,
+        workspace: Workspace,
+        for_operation_types=None,
+        use_object_scope=False,
+    ) -> Dict[str, OperationPermissionContent]:
+        """
+        Computes the permission object described in `get_permissions_object` from the
+        role assignments of the actor, without using the permission snapshot.
+        """
+
         # Get all role assignments for this actor into this workspace
         roles_by_scope = RoleAssignmentHandler().get_roles_per_scope(workspace, actor)
 
@@ -0,0 +1,161 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from baserow.core.cache import local_cache
+from baserow.core.models import Workspace
+from baserow.core.registries import subject_type_registry
+from baserow.core.types import Subject
+from baserow.version import VERSION as BASEROW_VERSION
+
+PERMISSION_SNAPSHOT_VERSION_KEY_TTL = 60 * 60 * 24 * 10  # 10 days
+
+
+def get_permission_snapshot_version_key(workspace_id: int) -> str:
+    return f"rbac_permission_snapshot_version_{workspace_id}"
+
+
+def get_permission_snapshot_invalidated_key(workspace_id: int) -> str:
+    return f"rbac_permission_snapshot_invalidated_{workspace_id}"
+
+
+@dataclass
+class PermissionSnapshot:
+    """
+    The compiled permissions of an actor in a workspace. It contains the uids of the
+    computed roles for every context that has already been checked and the
+    permission objects that have already been generated, so that they can be
+    reused by the next requests until the workspace permissions change.
+    """
+
+    cache_key: str
+    roles_per_context: Dict[Tuple[str, int], Tuple[str, ...]] = field(
+        default_factory=dict
+    )
+    permissions_objects: Dict[Tuple, Dict[str, Any]] = field(default_factory=dict)
+    changed: bool = False
+
+    @staticmethod
+    def get_context_key(context: Any) -> Tuple[str, int]:
+        return type(context).__name__, context.id
+
+    def get_role_uids(self, context: Any) -> Optional[Tuple[str, ...]]:
+        return self.roles_per_context.get(self.get_context_key(context))
+
+    def set_role_uids(self, context: Any, role_uids: Tuple[str, ...]):
+        self.roles_per_context[self.get_context_key(context)] = role_uids
+        self.changed = True
+
+    def get_permissions_object(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        return self.permissions_objects.get(key)
+
+    def set_permissions_object(self, key: Tuple, permissions_object: Dict[str, Any]):
+        self.permissions_objects[key] = permissions_object
+        self.changed = True
+
+    def to_cache_value(self) -> Dict[str, Any]:
+        return {
+            "roles_per_context": self.roles_per_context,
+            "permissions_objects": self.permissions_objects,
+        }
+
+
+class PermissionSnapshotHandler:
+    """
+    Stores the compiled permission snapshots of the actors in the cache. All the
+    snapshots of a workspace share a version that is bumped every time something
+    changing the permissions in this workspace happens, which invalidates them at
+    once.
+    """
+
+    def is_enabled(self, workspace: Workspace) -> bool:
+        """
+        The snapshots are disabled if the TTL is 0. They're also ignored for the rest
+        of the request or task once the permissions of the workspace have changed,
+        because the snapshots computed from the uncommitted changes must not be
+        shared with the other requests.
+
+        :param workspace: The workspace the permissions are checked for.
+        """
+
+        if settings.BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS <= 0:
+            return False
+
+        return not local_cache.get(
+            get_permission_snapshot_invalidated_key(workspace.id)
+        )
+
+    def get_snapshots(
+        self,
+        workspace: Workspace,
+        actors: Iterable[Subject],
+        include_trash: bool = False,
+    ) -> Dict[Subject, PermissionSnapshot]:
+        """
+        Returns the permission snapshots of the given actors in the workspace. An
+        empty snapshot is returned for the actors that don't have one yet.
+
+        :param workspace: The workspace the snapshots belong to.
+        :param actors: The actors for whom we want the snapshots.
+        :param include_trash: Whether the snapshots include the trashed workspace
+            users.
+        :return: A dict with the actors as keys and their snapshot as value.
+        """
+
+        # The version is read once before computing anything, so that a snapshot
+        # computed concurrently with a change is saved under the outdated version.
+        version = cache.get(get_permission_snapshot_version_key(workspace.id), 0)
+        cache_keys = {
+            actor: (
+                f"rbac_permission_snapshot_{BASEROW_VERSION}_{workspace.id}_{version}_"
+                f"{subject_type_registry.get_by_model(actor).type}_{actor.id}_"
+                f"{include_trash}"
+            )
+            for actor in actors
+        }
+        cached = cache.get_many(list(cache_keys.values()))
+
+        return {
+            actor: PermissionSnapshot(cache_key, **cached.get(cache_key, {}))
+            for actor, cache_key in cache_keys.items()
+        }
+
+    def save_snapshots(self, snapshots: Iterable[PermissionSnapshot]):
+        """
+        Stores the snapshots that have been completed in the cache.
+
+        :param snapshots: The snapshots to store.
+        """
+
+        changed = {
+            snapshot.cache_key: snapshot.to_cache_value()
+            for snapshot in snapshots
+            if snapshot.changed
+        }
+        if changed:
+            ttl = settings.BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS
+            cache.set_many(changed, timeout=ttl)
+
+    def _bump_version(self, workspace_id: int):
+        version_key = get_permission_snapshot_version_key(workspace_id)
+        try:
+            cache.incr(version_key, 1)
+        except ValueError:
+            # If the version key does not exist yet, we initialize it.
+            cache.set(version_key, 1, timeout=PERMISSION_SNAPSHOT_VERSION_KEY_TTL)
+
+    def invalidate(self, workspace_id: int):
+        """
+        Invalidates all the permission snapshots of the workspace. The version is
+        bumped immediately, and again once the transaction is committed because other
+        requests can compute new snapshots from the previous data in the meantime.
+
+        :param workspace_id: The id of the workspace whose permissions changed.
+        """
+
+        local_cache.set(get_permission_snapshot_invalidated_key(workspace_id), True)
+        self._bump_version(workspace_id)
+        transaction.on_commit(lambda: self._bump_version(workspace_id))
@@ -4,19 +4,30 @@ from django.db import transaction
 from django.db.models.signals import post_delete
 from django.dispatch import receiver
 
-from baserow.core.models import Workspace, WorkspaceUser
+from baserow.core.models import Application, Workspace, WorkspaceUser
 from baserow.core.registries import subject_type_registry
-from baserow.core.signals import permissions_updated, workspace_user_updated
+from baserow.core.signals import (
+    application_created,
+    application_deleted,
+    permissions_updated,
+    workspace_user_added,
+    workspace_user_deleted,
+    workspace_user_updated,
+)
 from baserow.core.types import Subject
 from baserow.ws.tasks import broadcast_to_users
+from baserow_enterprise.role.permission_snapshot import PermissionSnapshotHandler
 from baserow_enterprise.signals import (
     role_assignment_created,
     role_assignment_deleted,
     role_assignment_updated,
     team_deleted,
     team_restored,
+    team_subject_created,
+    team_subject_deleted,
+    team_subject_restored,
 )
-from baserow_enterprise.teams.models import Team
+from baserow_enterprise.teams.models import Team, TeamSubject
 
 User = get_user_model()
 
@@ -65,6 +76,41 @@ def notify_users_about_updated_permissions(
     )
 
 
+@receiver(permissions_updated)
+def invalidate_permission_snapshots_when_permissions_updated(
+    sender, subject: Subject, workspace: Workspace, **kwargs
+):
+    PermissionSnapshotHandler().invalidate(workspace.id)
+
+
+@receiver(workspace_user_added)
+@receiver(workspace_user_deleted)
+def invalidate_permission_snapshots_when_workspace_members_changed(
+    sender, workspace_user: WorkspaceUser, **kwargs
+):
+    PermissionSnapshotHandler().invalidate(workspace_user.workspace_id)
+
+
+@receiver(team_subject_created)
+@receiver(team_subject_deleted)
+@receiver(team_subject_restored)
+def invalidate_permission_snapshots_when_team_members_changed(
+    sender, subject: TeamSubject, **kwargs
+):
+    PermissionSnapshotHandler().invalidate(subject.team.workspace_id)
+
+
+@receiver(application_created)
+@receiver(application_deleted)
+def invalidate_permission_snapshots_when_application_created_or_deleted(
+    sender, application: Application, **kwargs
+):
+    # The role assignments of a trashed application are ignored, and they apply
+    # again when it's restored.
+    if application.workspace_id is not None:
+        PermissionSnapshotHandler().invalidate(application.workspace_id)
+
+
 def cascade_subject_delete(sender, instance, **kwargs):
     """
     Delete role assignments linked to deleted subjects.
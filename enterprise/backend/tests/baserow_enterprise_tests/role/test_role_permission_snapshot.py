@@ -0,0 +1,192 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from baserow.contrib.database.table.operations import (
+    CreateRowDatabaseTableOperationType,
+    UpdateDatabaseTableOperationType,
+)
+from baserow.core.cache import local_cache
+from baserow.core.handler import CoreHandler
+from baserow.core.types import PermissionCheck
+from baserow_enterprise.role.handler import RoleAssignmentHandler
+from baserow_enterprise.role.models import Role
+from baserow_enterprise.role.permission_manager import RolePermissionManagerType
+from baserow_enterprise.teams.handler import TeamHandler
+
+
+@pytest.fixture(autouse=True)
+def enable_enterprise_and_roles_for_all_tests_here(enable_enterprise, synced_roles):
+    pass
+
+
+def _count_role_assignment_queries(captured):
+    return len(
+        [
+            query
+            for query in captured.captured_queries
+            if "baserow_enterprise_roleassignment" in query["sql"]
+        ]
+    )
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS=60)
+def test_check_multiple_permissions_uses_the_permission_snapshot(data_fixture):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    checks = [PermissionCheck(user, UpdateDatabaseTableOperationType.type, table)]
+    perm_manager = RolePermissionManagerType()
+
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="BUILDER")
+    )
+
+    with CaptureQueriesContext(connection) as captured, local_cache.context():
+        result = perm_manager.check_multiple_permissions(checks, workspace)
+
+    assert result[checks[0]] is True
+    assert _count_role_assignment_queries(captured) > 0
+
+    # The roles computed for the table are now in the snapshot of the user.
+    with CaptureQueriesContext(connection) as captured, local_cache.context():
+        result = perm_manager.check_multiple_permissions(checks, workspace)
+
+    assert result[checks[0]] is True
+    assert _count_role_assignment_queries(captured) == 0
+
+    # Changing the role of the user invalidates all the snapshots of the workspace.
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="VIEWER")
+    )
+
+    with local_cache.context():
+        result = perm_manager.check_multiple_permissions(checks, workspace)
+
+    assert result[checks[0]] is not True
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS=60)
+def test_get_permissions_object_uses_the_permission_snapshot(data_fixture):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    perm_manager = RolePermissionManagerType()
+    operation_type = CreateRowDatabaseTableOperationType.type
+
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="EDITOR")
+    )
+
+    with local_cache.context():
+        perms = perm_manager.get_permissions_object(user, workspace=workspace)
+
+    assert perms[operation_type] == {"default": True, "exceptions": []}
+
+    with CaptureQueriesContext(connection) as captured, local_cache.context():
+        assert perm_manager.get_permissions_object(user, workspace=workspace) == perms
+
+    assert _count_role_assignment_queries(captured) == 0
+
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="NO_ACCESS"), scope=table
+    )
+
+    with local_cache.context():
+        perms = perm_manager.get_permissions_object(user, workspace=workspace)
+
+    assert perms[operation_type] == {"default": True, "exceptions": [table.id]}
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS=60)
+def test_permission_snapshot_invalidated_when_team_members_change(
+    data_fixture, enterprise_data_fixture
+):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    team = enterprise_data_fixture.create_team(workspace=workspace)
+    checks = [PermissionCheck(user, UpdateDatabaseTableOperationType.type, table)]
+    perm_manager = RolePermissionManagerType()
+
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="NO_ROLE_LOW_PRIORITY")
+    )
+    RoleAssignmentHandler().assign_role(
+        team, workspace, role=Role.objects.get(uid="BUILDER")
+    )
+
+    with local_cache.context():
+        result = perm_manager.check_multiple_permissions(checks, workspace)
+
+    assert result[checks[0]] is not True
+
+    TeamHandler().create_subject(admin, {"pk": user.id}, "auth.User", team)
+
+    with local_cache.context():
+        result = perm_manager.check_multiple_permissions(checks, workspace)
+
+    assert result[checks[0]] is True
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS=60)
+def test_permission_snapshot_invalidated_when_workspace_user_is_removed(data_fixture):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    checks = [PermissionCheck(user, UpdateDatabaseTableOperationType.type, table)]
+    perm_manager = RolePermissionManagerType()
+
+    with local_cache.context():
+        result = perm_manager.check_multiple_permissions(checks, workspace)
+
+    assert result[checks[0]] is True
+
+    workspace_user = user.workspaceuser_set.get(workspace=workspace)
+    CoreHandler().delete_workspace_user(admin, workspace_user)
+
+    with local_cache.context():
+        result = perm_manager.check_multiple_permissions(checks, workspace)
+
+    assert result[checks[0]] is not True
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ENTERPRISE_RBAC_PERMISSION_SNAPSHOT_TTL_SECONDS=60)
+def test_permission_snapshot_ignored_after_change_in_same_request(data_fixture):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    checks = [PermissionCheck(user, UpdateDatabaseTableOperationType.type, table)]
+    perm_manager = RolePermissionManagerType()
+
+    with local_cache.context():
+        perm_manager.check_multiple_permissions(checks, workspace)
+
+        RoleAssignmentHandler().assign_role(
+            user, workspace, role=Role.objects.get(uid="VIEWER")
+        )
+
+        # The uncommitted changes must not be cached, so the snapshot is bypassed
+        # for the rest of the request.
+        with CaptureQueriesContext(connection) as captured:
+            result = perm_manager.check_multiple_permissions(checks, workspace)
+
+        assert result[checks[0]] is not True
+        assert _count_role_assignment_queries(captured) > 0
@@ -17,6 +17,16 @@ def setup(settings):
     # How many row comments can be requested at once.
     settings.ROW_COMMENT_PAGE_SIZE_LIMIT = 200
 
+    # The maximum number of AI field prompts that a single generate AI values job
+    # sends to the generative AI model at the same time.
+    settings.BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS = int(
+        os.getenv("BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS", "") or 5
+    )
+    # The number of generated AI field values that are written to the table at once.
+    settings.BASEROW_AI_FIELD_UPDATE_BATCH_SIZE = int(
+        os.getenv("BASEROW_AI_FIELD_UPDATE_BATCH_SIZE", "") or 20
+    )
+
     settings.BASEROW_PREMIUM_GROUPED_AGGREGATE_SERVICE_MAX_SERIES = int(
         os.getenv("BASEROW_PREMIUM_GROUPED_AGGREGATE_SERVICE_MAX_SERIES", "") or 3
     )
@@ -1,3 +1,7 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.conf import settings
 from django.db.models import QuerySet
 
 from baserow_premium.generative_ai.managers import AIFileManager
@@ -30,11 +34,15 @@ from baserow.core.handler import CoreHandler
 from baserow.core.job_types import _empty_transaction_context
 from baserow.core.jobs.exceptions import MaxJobCountExceeded
 from baserow.core.jobs.registries import JobType
-from baserow.core.utils import ChildProgressBuilder
+from baserow.core.utils import ChildProgressBuilder, grouper
 
 from .models import AIField, GenerateAIValuesJob
 from .registries import ai_field_output_registry
 
+# The maximum number of distinct prompts for which the output is remembered during a
+# job, so that identical prompts are only sent to the model once.
+PROMPT_CACHE_SIZE = 1000
+
 
 class GenerateAIValuesJobType(JobType):
     type = "generate_ai_values"
@@ -180,8 +188,10 @@ class GenerateAIValuesJobType(JobType):
 
         return FieldHandler().get_field(
             field_id,
+            # The file field is selected because it's accessed while the prompts are
+            # being sent concurrently in other threads.
             base_queryset=AIField.objects.all()
-            .select_related("table__database__workspace")
+            .select_related("table__database__workspace", "ai_file_field")
             .prefetch_related("select_options"),
         )
 
@@ -262,75 +272,152 @@ class GenerateAIValuesJobType(JobType):
         )
         rows_progress = ChildProgressBuilder.build(progress_builder, rows.count())
 
-        for row in rows.iterator(chunk_size=200):
-            context = HumanReadableRowContext(row, exclude_field_ids=[ai_field.id])
-            message = str(
-                resolve_formula(
-                    ai_field.ai_prompt, formula_runtime_function_registry, context
-                )
-            )
-
-            # The AI output type should be able to format the prompt because it can add
-            # additional instructions to it. The choice output type for example adds
-            # additional prompt trying to force the out, for example.
-            message = ai_output_type.format_prompt(message, ai_field)
-
-            try:
-                if ai_field.ai_file_field_id is not None and isinstance(
-                    generative_ai_model_type, GenerativeAIWithFilesModelType
-                ):
-                    file_ids = AIFileManager.upload_files_from_file_field(
-                        ai_field, row, generative_ai_model_type, workspace=workspace
+        # The prompts are sent concurrently because most of the time is spent waiting
+        # for the generative AI model to respond. Identical prompts are only sent
+        # once, and the values are written in batches to reduce the number of
+        # transactions and signals.
+        prompt_cache = OrderedDict()
+        with ThreadPoolExecutor(
+            max_workers=settings.BASEROW_AI_FIELD_MAX_CONCURRENT_PROMPTS
+        ) as executor:
+            for batch in grouper(
+                settings.BASEROW_AI_FIELD_UPDATE_BATCH_SIZE,
+                rows.iterator(chunk_size=200),
+            ):
+                futures = [
+                    self._submit_prompt(
+                        executor,
+                        prompt_cache,
+                        row,
+                        ai_field,
+                        ai_output_type,
+                        generative_ai_model_type,
                     )
-                    try:
-                        value = generative_ai_model_type.prompt_with_files(
-                            ai_field.ai_generative_ai_model,
-                            message,
-                            file_ids=file_ids,
-                            workspace=workspace,
-                            temperature=ai_field.ai_temperature,
-                        )
-                    except Exception as exc:
-                        raise exc
-                    finally:
-                        generative_ai_model_type.delete_files(
-                            file_ids, workspace=workspace
-                        )
-                else:
-                    value = generative_ai_model_type.prompt(
-                        ai_field.ai_generative_ai_model,
-                        message,
-                        workspace=workspace,
-                        temperature=ai_field.ai_temperature,
+                    for row in batch
+                ]
+
+                rows_values = []
+                try:
+                    for row, future in zip(batch, futures):
+                        # Because the AI output type can change the prompt to try to
+                        # force the output a certain way, then it should give the
+                        # opportunity to parse the output when it's given. With the
+                        # choice output type, it will try to match it to a
+                        # `SelectOption`, for example.
+                        value = ai_output_type.parse_output(future.result(), ai_field)
+                        rows_values.append({"id": row.id, ai_field.db_column: value})
+                except Exception as exc:
+                    # If the prompt fails once, we should not continue with the other
+                    # rows, but the values that have already been generated are kept.
+                    for future in futures:
+                        future.cancel()
+                    self._update_rows(user, table, model, rows_values)
+                    # Note: rows might be a generator, so we can't slice it
+                    rows_ai_values_generation_error.send(
+                        self,
+                        user=user,
+                        rows=[],
+                        field=ai_field,
+                        table=table,
+                        error_message=str(exc),
                     )
+                    raise exc
+
+                self._update_rows(user, table, model, rows_values)
+                rows_progress.increment(by=len(rows_values))
+
+    def _submit_prompt(
+        self,
+        executor: ThreadPoolExecutor,
+        prompt_cache: OrderedDict,
+        row: GeneratedTableModel,
+        ai_field: AIField,
+        ai_output_type,
+        generative_ai_model_type,
+    ) -> Future:
+        """
+        Resolves the prompt of the AI field for the given row, and submits it to the
+        executor. If an identical prompt has recently been submitted, then the future of
+        that prompt is returned instead, so that it's only sent to the model once.
+        Prompts including files are never deduplicated because the files can differ.
+
+        :param executor: The executor that sends the prompts concurrently.
+        :param prompt_cache: The recently submitted prompts, keyed by the prompt text.
+        :param row: The row for which the value must be generated.
+        :param ai_field: The AI field for which the value must be generated.
+        :param ai_output_type: The output type of the AI field.
+        :param generative_ai_model_type: The model type used to generate the value.
+        :return: A future resolving to the unparsed output of the model.
+        """
 
-                # Because the AI output type can change the prompt to try to force the
-                # output a certain way, then it should give the opportunity to parse the
-                # output when it's given. With the choice output type, it will try to
-                # match it to a `SelectOption`, for example.
-                value = ai_output_type.parse_output(value, ai_field)
-            except Exception as exc:
-                # If the prompt fails once, we should not continue with the other rows.
-                # Note: rows might be a generator, so we can't slice it
-                rows_ai_values_generation_error.send(
-                    self,
-                    user=user,
-                    rows=[],
-                    field=ai_field,
-                    table=table,
-                    error_message=str(exc),
-                )
-                raise exc
-
-            # FIXME: manually set the websocket_id to None for now because the frontend
-            # needs to receive the update to stop the loading state
-            user.web_socket_id = None
-            RowHandler().update_row_by_id(
-                user,
-                table,
-                row.id,
-                {ai_field.db_column: value},
-                model=model,
-                values_already_prepared=True,
+        workspace = ai_field.table.database.workspace
+        context = HumanReadableRowContext(row, exclude_field_ids=[ai_field.id])
+        message = str(
+            resolve_formula(
+                ai_field.ai_prompt, formula_runtime_function_registry, context
+            )
+        )
+
+        # The AI output type should be able to format the prompt because it can add
+        # additional instructions to it. The choice output type for example adds
+        # additional prompt trying to force the out, for example.
+        message = ai_output_type.format_prompt(message, ai_field)
+
+        if ai_field.ai_file_field_id is not None and isinstance(
+            generative_ai_model_type, GenerativeAIWithFilesModelType
+        ):
+            return executor.submit(
+                self._prompt_with_files,
+                generative_ai_model_type,
+                ai_field,
+                row,
+                message,
+                workspace,
             )
-            rows_progress.increment()
+
+        if message in prompt_cache:
+            prompt_cache.move_to_end(message)
+            return prompt_cache[message]
+
+        future = executor.submit(
+            generative_ai_model_type.prompt,
+            ai_field.ai_generative_ai_model,
+            message,
+            workspace=workspace,
+            temperature=ai_field.ai_temperature,
+        )
+        prompt_cache[message] = future
+        if len(prompt_cache) > PROMPT_CACHE_SIZE:
+            prompt_cache.popitem(last=False)
+        return future
+
+    def _prompt_with_files(
+        self, generative_ai_model_type, ai_field, row, message, workspace
+    ) -> str:
+        """
+        Uploads the files of the row, prompts the model with them, and deletes the
+        files again afterwards.
+        """
+
+        file_ids = AIFileManager.upload_files_from_file_field(
+            ai_field, row, generative_ai_model_type, workspace=workspace
+        )
+        try:
+            return generative_ai_model_type.prompt_with_files(
+                ai_field.ai_generative_ai_model,
+                message,
+                file_ids=file_ids,
+                workspace=workspace,
+                temperature=ai_field.ai_temperature,
+            )
+        finally:
+            generative_ai_model_type.delete_files(file_ids, workspace=workspace)
+
+    def _update_rows(self, user, table, model, rows_values):
+        if len(rows_values) == 0:
+            return
+
+        # FIXME: manually set the websocket_id to None for now because the frontend
+        # needs to receive the update to stop the loading state
+        user.web_socket_id = None
+        RowHandler().update_rows(user, table, rows_values, model=model)
@@ -3,11 +3,14 @@ Tests for GenerateAIValuesJob execution in all modes.
 """
 from unittest.mock import patch
 
+from django.test import override_settings
+
 import pytest
 from baserow_premium.fields.models import GenerateAIValuesJob
 
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.jobs.handler import JobHandler
+from baserow.test_utils.fixtures.generative_ai import TestGenerativeAIModelType
 
 
 @pytest.mark.django_db
@@ -32,8 +35,9 @@ def test_job_execution_rows_mode(patched_rows_updated, premium_data_fixture):
     assert job.state == "finished"
     assert job.progress_percentage == 100
 
-    # Verify only specified rows were updated
-    assert patched_rows_updated.call_count == 2  # One call per row
+    # Verify only specified rows were updated, in one batch
+    assert patched_rows_updated.call_count == 1
+    assert len(patched_rows_updated.call_args[1]["rows"]) == 2
 
     # Refresh rows and check values
     model = table.get_model()
@@ -65,7 +69,8 @@ def test_job_execution_table_mode(patched_rows_updated, premium_data_fixture):
     assert job.mode == GenerateAIValuesJob.MODES.TABLE
 
     # Verify all rows were updated
-    assert patched_rows_updated.call_count == 3
+    assert patched_rows_updated.call_count == 1
+    assert len(patched_rows_updated.call_args[1]["rows"]) == 3
 
     model = table.get_model()
     for row in model.objects.all():
@@ -113,7 +118,8 @@ def test_job_execution_view_mode(patched_rows_updated, premium_data_fixture):
     assert job.mode == GenerateAIValuesJob.MODES.VIEW
 
     # Verify only filtered rows were updated (2 rows)
-    assert patched_rows_updated.call_count == 2
+    assert patched_rows_updated.call_count == 1
+    assert len(patched_rows_updated.call_args[1]["rows"]) == 2
 
     model = table.get_model()
     for row in model.objects.filter(**{f"field_{text_field.id}": "show"}):
@@ -161,7 +167,8 @@ def test_job_execution_only_empty_rows_mode(patched_rows_updated, premium_data_f
     assert job.only_empty is True
 
     # Verify only 2 rows were updated (empty ones)
-    assert patched_rows_updated.call_count == 2
+    assert patched_rows_updated.call_count == 1
+    assert len(patched_rows_updated.call_args[1]["rows"]) == 2
 
     # Check that pre-filled row kept its value
     rows_refreshed = model.objects.all().order_by("id")
@@ -203,7 +210,8 @@ def test_job_execution_only_empty_table_mode(
     )
 
     assert job.state == "finished"
-    assert patched_rows_updated.call_count == 2  # Only 2 empty rows
+    assert patched_rows_updated.call_count == 1
+    assert len(patched_rows_updated.call_args[1]["rows"]) == 2  # Only 2 empty rows
 
 
 @pytest.mark.django_db
@@ -237,7 +245,9 @@ def test_job_execution_only_empty_view_mode(patched_rows_updated, premium_data_f
     )
 
     assert job.state == "finished"
-    assert patched_rows_updated.call_count == 2  # Only empty rows in view
+    assert patched_rows_updated.call_count == 1
+    # Only empty rows in view
+    assert len(patched_rows_updated.call_args[1]["rows"]) == 2
 
 
 @pytest.mark.django_db
@@ -350,3 +360,76 @@ def test_job_progress_tracking(premium_data_fixture):
     # After completion, should be at 100%
     assert job.progress_percentage == 100
     assert job.state == "finished"
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+@override_settings(BASEROW_AI_FIELD_UPDATE_BATCH_SIZE=2)
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_job_execution_updates_rows_in_batches(
+    patched_rows_updated, premium_data_fixture
+):
+    """Test that the generated values are written in batches."""
+
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user()
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    text_field = premium_data_fixture.create_text_field(table=table, name="text")
+    field = premium_data_fixture.create_ai_field(
+        table=table, ai_prompt=f"get('fields.field_{text_field.id}')"
+    )
+
+    RowHandler().create_rows(
+        user,
+        table,
+        rows_values=[{text_field.db_column: str(i)} for i in range(5)],
+    )
+
+    job = JobHandler().create_and_start_job(
+        user, "generate_ai_values", sync=True, field_id=field.id
+    )
+
+    assert job.state == "finished"
+    assert job.progress_percentage == 100
+    assert [len(c[1]["rows"]) for c in patched_rows_updated.call_args_list] == [
+        2,
+        2,
+        1,
+    ]
+
+    model = table.get_model()
+    for row in model.objects.all():
+        text = getattr(row, text_field.db_column)
+        assert (
+            getattr(row, field.db_column) == f"Generated with temperature None: {text}"
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+def test_job_execution_sends_identical_prompts_once(premium_data_fixture):
+    """Test that an identical prompt is only sent once to the model."""
+
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user()
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    field = premium_data_fixture.create_ai_field(table=table, ai_prompt="'Same'")
+
+    RowHandler().create_rows(user, table, rows_values=[{} for _ in range(4)])
+
+    with patch.object(
+        TestGenerativeAIModelType, "prompt", return_value="Value"
+    ) as patched_prompt:
+        job = JobHandler().create_and_start_job(
+            user, "generate_ai_values", sync=True, field_id=field.id
+        )
+
+    assert job.state == "finished"
+    assert patched_prompt.call_count == 1
+
+    model = table.get_model()
+    assert [getattr(row, field.db_column) for row in model.objects.all()] == [
+        "Value"
+    ] * 4
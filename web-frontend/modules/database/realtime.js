@@ -261,6 +261,18 @@ export const registerRealtimeEvents = (realtime) => {
     }
   })
 
+  realtime.registerEvent('row_orders_rebalanced', (context, data) => {
+    const { app } = context
+    for (const viewType of Object.values(app.$registry.getAll('view'))) {
+      viewType.rowOrdersRebalanced(
+        context,
+        data.table_id,
+        data.row_orders,
+        'page/'
+      )
+    }
+  })
+
   realtime.registerEvent('row_history_updated', ({ store }, data) => {
     const rowHistoryEntry = data.row_history_entry
     store.dispatch('rowHistory/forceCreate', {
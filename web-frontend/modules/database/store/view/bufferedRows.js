@@ -242,6 +242,16 @@ export default ({ service, customPopulateRow, fieldOptions }) => {
         existingRowState._.fullyLoaded = !value
       }
     },
+    UPDATE_ROW_ORDERS(state, rowOrders) {
+      state.rows.forEach((row) => {
+        if (
+          row !== null &&
+          Object.prototype.hasOwnProperty.call(rowOrders, row.id)
+        ) {
+          row.order = rowOrders[row.id]
+        }
+      })
+    },
     UPDATE_ROW_AT_INDEX(state, { index, values }) {
       Object.assign(state.rows[index], values)
     },
@@ -932,6 +942,13 @@ export default ({ service, customPopulateRow, fieldOptions }) => {
         updateRequestValues,
       })
     },
+    /**
+     * When the backend has rebalanced the orders of some rows, their position stays
+     * the same, so only the orders of the rows in the store must be replaced.
+     */
+    afterRowOrdersRebalanced({ commit }, { rowOrders }) {
+      commit('UPDATE_ROW_ORDERS', rowOrders)
+    },
     /**
      * When an existing row is updated, the state in the store must also be updated.
      * Because we always receive the old and new state we can calculate if the row
@@ -578,6 +578,17 @@ export const mutations = {
 
     this.state.rows = stateRowsCopy
   },
+  /**
+   * Replaces the orders of the rows in the buffer that are in the provided object,
+   * mapping the row ids to their new order.
+   */
+  UPDATE_ROW_ORDERS_IN_BUFFER(state, rowOrders) {
+    state.rows.forEach((row) => {
+      if (Object.prototype.hasOwnProperty.call(rowOrders, row.id)) {
+        row.order = rowOrders[row.id]
+      }
+    })
+  },
   /**
    * Deletes a row of which we are sure that it is in the buffer right now.
    */
@@ -2905,6 +2916,13 @@ export const actions = {
     })
     dispatch('fetchAllFieldAggregationData', { view })
   },
+  /**
+   * Called when the backend has rebalanced the orders of some rows. Their position
+   * stays the same, so the orders of the rows in the buffer can just be replaced.
+   */
+  rebalancedRowOrders({ commit }, { rowOrders }) {
+    commit('UPDATE_ROW_ORDERS_IN_BUFFER', rowOrders)
+  },
   /**
    * Called after an existing row has been updated, which could be by the user or
    * via another channel. It will make sure that the row has the correct position or
@@ -288,6 +288,19 @@ export class ViewType extends Registerable {
     storePrefix
   ) {}
 
+  /**
+   * Event that is called when the orders of some rows are rebalanced by the backend
+   * to make room for new orders. The position of the rows doesn't change, so only
+   * the `order` of the rows in the store must be updated. View types that don't
+   * update the orders in place refresh the whole table, so that they don't keep
+   * outdated orders.
+   */
+  rowOrdersRebalanced({ store, app }, tableId, rowOrders, storePrefix) {
+    if (this.isCurrentView(store, tableId)) {
+      app.$bus.$emit('table-refresh', { tableId })
+    }
+  }
+
   /**
    * Event that is called when something went wrong while generating AI values
    * for a field. This can be used to show an error message to the user.
@@ -823,6 +836,14 @@ export class GridViewType extends ViewType {
     }
   }
 
+  rowOrdersRebalanced({ store }, tableId, rowOrders, storePrefix = '') {
+    if (this.isCurrentView(store, tableId)) {
+      store.dispatch(storePrefix + 'view/grid/rebalancedRowOrders', {
+        rowOrders,
+      })
+    }
+  }
+
   AIValuesGenerationError(
     context,
     tableId,
@@ -1081,6 +1102,15 @@ export const BaseBufferedRowViewTypeMixin = (Base) =>
       }
     }
 
+    rowOrdersRebalanced({ store }, tableId, rowOrders, storePrefix = '') {
+      if (this.isCurrentView(store, tableId)) {
+        store.dispatch(
+          storePrefix + 'view/' + this.getType() + '/afterRowOrdersRebalanced',
+          { rowOrders }
+        )
+      }
+    }
+
     async rowDeleted({ store }, tableId, fields, row, storePrefix = '') {
       if (this.isCurrentView(store, tableId)) {
         await store.dispatch(